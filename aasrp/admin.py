@@ -19,7 +19,15 @@ from allianceauth.framework.api.user import get_main_character_name_from_user
 # AA SRP
 from aasrp.form import SettingAdminForm
 from aasrp.helper.numbers import l10n_number_format
-from aasrp.models import FleetType, RequestComment, Setting, SrpLink, SrpRequest
+from aasrp.models import (
+    FleetType,
+    Killmail,
+    RequestComment,
+    Setting,
+    SrpLink,
+    SrpRequest,
+)
+from aasrp.tasks import prewarm_killmail_cache
 
 
 @admin.register(SrpLink)
@@ -52,6 +60,7 @@ class SrpLinkAdmin(admin.ModelAdmin):
         "srp_status",
     )
     exclude = ("creator",)
+    actions = ("prewarm_killmails",)
 
     @classmethod
     @admin.display(description=_("Creator"), ordering="creator")
@@ -67,6 +76,44 @@ class SrpLinkAdmin(admin.ModelAdmin):
 
         return get_main_character_name_from_user(obj.creator)
 
+    @admin.action(description=_("Pre-warm killmail cache for selected SRP links"))
+    def prewarm_killmails(
+        self, request: HttpRequest, queryset: QuerySet[SrpLink]
+    ) -> None:
+        """
+        Queue the killmails of all SRP requests of the selected SRP links for caching.
+
+        :param request: The HTTP request object.
+        :type request: HttpRequest
+        :param queryset: The queryset of SrpLink objects.
+        :type queryset: QuerySet[SrpLink]
+        """
+
+        killboard_links = SrpRequest.objects.filter(srp_link__in=queryset).values_list(
+            "killboard_link", flat=True
+        )
+        killmail_ids = list(
+            dict.fromkeys(
+                int(kill_id)
+                for kill_id in (
+                    SrpRequest.objects.get_kill_id(killboard_link=killboard_link)
+                    for killboard_link in killboard_links
+                )
+                if kill_id
+            )
+        )
+
+        prewarm_killmail_cache.delay(killmail_ids=killmail_ids)
+
+        messages.success(
+            request=request,
+            message=ngettext(
+                singular="Queued {killmails_count} killmail for caching",
+                plural="Queued {killmails_count} killmails for caching",
+                number=len(killmail_ids),
+            ).format(killmails_count=len(killmail_ids)),
+        )
+
 
 @admin.register(SrpRequest)
 class SrpRequestAdmin(admin.ModelAdmin):
@@ -183,6 +230,48 @@ class SrpRequestAdmin(admin.ModelAdmin):
         return f"{localized_amount} ISK"
 
 
+@admin.register(Killmail)
+class KillmailAdmin(admin.ModelAdmin):
+    """
+    Admin interface for the killmail cache.
+    Cached killmails are read-only, they are only added when a killmail is fetched.
+    """
+
+    list_display = (
+        "killmail_id",
+        "killmail_time",
+        "ship_type_id",
+        "victim_character_id",
+        "created",
+    )
+    ordering = ("-killmail_id",)
+    search_fields = ("killmail_id",)
+    readonly_fields = (
+        "killmail_id",
+        "killmail_hash",
+        "killmail_time",
+        "victim_character_id",
+        "victim_corporation_id",
+        "victim_alliance_id",
+        "ship_type_id",
+        "items",
+        "zkb",
+        "created",
+    )
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        """
+        Killmails can't be added manually.
+
+        :param request: The HTTP request object.
+        :type request: HttpRequest
+        :return: False
+        :rtype: bool
+        """
+
+        return False
+
+
 @admin.register(RequestComment)
 class RequestCommentAdmin(admin.ModelAdmin):
     """
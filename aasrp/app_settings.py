@@ -17,6 +17,36 @@ DISCORDPROXY_HOST = getattr(settings, "DISCORDPROXY_HOST", "localhost")
 # Timeout for Discord Proxy communication
 DISCORDPROXY_TIMEOUT = getattr(settings, "DISCORDPROXY_TIMEOUT", 300)
 
+# Seconds the number of pending SRP requests is cached, in case an invalidation was missed
+AASRP_PENDING_REQUESTS_COUNT_CACHE_TTL = getattr(
+    settings, "AASRP_PENDING_REQUESTS_COUNT_CACHE_TTL", 60 * 5
+)
+
+# Seconds after which the in-memory insurance price table is reloaded from the database
+AASRP_INSURANCE_PRICE_TABLE_TTL = getattr(
+    settings, "AASRP_INSURANCE_PRICE_TABLE_TTL", 60 * 60
+)
+
+# Seconds the rendered HTML of an SRP request is cached for the SRP request tables
+AASRP_FRAGMENT_CACHE_TTL = getattr(settings, "AASRP_FRAGMENT_CACHE_TTL", 60 * 60)
+
+# Seconds the configuration (settings, enabled fleet types) is kept in the shared cache,
+# in case an invalidation was missed
+AASRP_CONFIG_CACHE_TTL = getattr(settings, "AASRP_CONFIG_CACHE_TTL", 60 * 60)
+
+# Seconds a process uses its in-memory copy of the configuration before checking the
+# shared cache again, i.e. how long other processes may take to pick up a change
+AASRP_CONFIG_LOCAL_CACHE_TTL = getattr(settings, "AASRP_CONFIG_LOCAL_CACHE_TTL", 10)
+
+# Maximum number of killmails that are fetched concurrently by the killmail import
+AASRP_KILLMAIL_IMPORT_MAX_WORKERS = getattr(
+    settings, "AASRP_KILLMAIL_IMPORT_MAX_WORKERS", 4
+)
+
+# Additional killboards, in the same format as `aasrp.constants.KILLBOARD_DATA`.
+# Entries with the name of a built-in killboard replace the built-in one.
+AASRP_KILLBOARDS = getattr(settings, "AASRP_KILLBOARDS", {})
+
 
 def allianceauth_discordbot_installed() -> bool:
     """
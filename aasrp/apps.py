@@ -26,3 +26,16 @@ class AaSrpConfig(AppConfig):
     verbose_name = format_lazy(
         "{app_title} v{version}", app_title=__title_translated__, version=__version__
     )
+
+    def ready(self) -> None:
+        """
+        Connect the signals of the app.
+
+        :return:
+        :rtype:
+        """
+
+        # AA SRP
+        from aasrp import (  # noqa: F401 pylint: disable=import-outside-toplevel, unused-import
+            signals,
+        )
@@ -17,6 +17,15 @@ from aasrp import __version__ as app_version
 # All internal URLs need to start with this prefix
 INTERNAL_URL_PREFIX = "-"
 
+# Cache key for the number of pending SRP requests (menu badge)
+PENDING_REQUESTS_COUNT_CACHE_KEY = "aasrp-pending-requests-count"
+
+# Cache key prefix for the rendered HTML of SRP requests (SRP request tables)
+SRP_REQUEST_FRAGMENT_CACHE_KEY_PREFIX = "aasrp-srp-request-fragment"
+
+# Cache key prefix for the configuration (settings, enabled fleet types)
+CONFIG_CACHE_KEY_PREFIX = "aasrp-config"
+
 
 class UserAgent(Enum):
     """
@@ -34,24 +43,26 @@ SRP_REQUEST_NOTIFICATION_INQUIRY_NOTE = (
 )
 
 # Killboard URLs and regex
+# The killmail URL regex has to provide the killmail ID as named group `killmail_id`,
+# and can provide the killmail hash as named group `killmail_hash`.
 KILLBOARD_DATA = {
     "zKillboard": {
         "base_url": "https://zkillboard.com/",
         "api_url": "https://zkillboard.com/api/",
         "base_url_regex": r"^http[s]?:\/\/zkillboard\.com\/",
-        "killmail_url_regex": r"^http[s]?:\/\/zkillboard\.com\/kill\/\d+\/",
+        "killmail_url_regex": r"^http[s]?:\/\/zkillboard\.com\/kill\/(?P<killmail_id>\d+)(?:[\/?#]|$)",
         "requires_trailing_slash": True,
     },
     "EveTools": {
         "base_url": "https://kb.evetools.org",
         "base_url_regex": r"^http[s]?:\/\/kb\.evetools\.org\/",
-        "killmail_url_regex": r"^http[s]?:\/\/kb\.evetools\.org\/kill\/\d+",
+        "killmail_url_regex": r"^http[s]?:\/\/kb\.evetools\.org\/kill\/(?P<killmail_id>\d+)(?:[\/?#]|$)",
         "requires_trailing_slash": False,
     },
     "EVE-KILL": {
         "base_url": "https://eve-kill.com",
         "base_url_regex": r"^http[s]?:\/\/eve-kill\.com\/",
-        "killmail_url_regex": r"^http[s]?:\/\/eve-kill\.com\/kill\/\d+",
+        "killmail_url_regex": r"^http[s]?:\/\/eve-kill\.com\/kill\/(?P<killmail_id>\d+)(?:[\/?#]|$)",
         "requires_trailing_slash": False,
     },
 }
@@ -165,7 +165,8 @@ def _discordproxy_send_channel_message(
         # Log the exception and fall back to allianceauth-discordbot
         logger.debug(
             "Something went wrong with discordproxy, cannot send a channel message. "
-            f"Trying allianceauth-discordbot. Error: {ex}"
+            "Trying allianceauth-discordbot. Error: %s",
+            ex,
         )
         # Use the allianceauth-discordbot method as a fallback
         _aadiscordbot_send_channel_message(
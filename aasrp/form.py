@@ -17,7 +17,7 @@ from django.utils.translation import gettext_lazy as _
 from allianceauth.services.hooks import get_extension_logger
 
 # AA SRP
-from aasrp.constants import KILLBOARD_DATA
+from aasrp.helper.killboard import get_killboard, get_killboard_base_urls
 from aasrp.models import (
     FleetType,
     RequestComment,
@@ -28,37 +28,6 @@ from aasrp.models import (
 )
 from aasrp.providers.applogger import AppLogger
 
-# Killboard URLs
-zkillboard_base_url: str = KILLBOARD_DATA["zKillboard"][  # pylint: disable=invalid-name
-    "base_url"
-]
-evetools_base_url: str = KILLBOARD_DATA["EveTools"][  # pylint: disable=invalid-name
-    "base_url"
-]
-eve_kill_base_url: str = KILLBOARD_DATA["EVE-KILL"][  # pylint: disable=invalid-name
-    "base_url"
-]
-
-# Killboard regex
-zkillboard_base_url_regex: str = KILLBOARD_DATA[  # pylint: disable=invalid-name
-    "zKillboard"
-]["base_url_regex"]
-zkillboard_killmail_url_regex: str = KILLBOARD_DATA[  # pylint: disable=invalid-name
-    "zKillboard"
-]["killmail_url_regex"]
-evetools_base_url_regex: str = KILLBOARD_DATA[  # pylint: disable=invalid-name
-    "EveTools"
-]["base_url_regex"]
-evetools_killmail_url_regex: str = KILLBOARD_DATA[  # pylint: disable=invalid-name
-    "EveTools"
-]["killmail_url_regex"]
-eve_kill_base_url_regex: str = KILLBOARD_DATA[  # pylint: disable=invalid-name
-    "EVE-KILL"
-]["base_url_regex"]
-eve_kill_killmail_url_regex: str = KILLBOARD_DATA[  # pylint: disable=invalid-name
-    "EVE-KILL"
-]["killmail_url_regex"]
-
 # Initialize a logger with a custom tag for the AA-SRP module
 logger = AppLogger(my_logger=get_extension_logger(__name__))
 
@@ -119,7 +88,7 @@ def sanitize_cleaned_data(cleaned_data: dict[str, Any] | None) -> dict[str, Any]
             cleaned = "\n".join(processed_lines)
 
             if cleaned != value:
-                logger.debug(f"Sanitized field: {field}")
+                logger.debug("Sanitized field: %s", field)
 
             cleaned_data[field] = cleaned
 
@@ -145,9 +114,6 @@ class SrpLinkForm(ModelForm):
             "fleet_doctrine": get_mandatory_form_label_text(text=_("Doctrine")),
             "aar_link": _("After action report link"),
         }
-        querysets = {
-            "fleet_type": FleetType.objects.filter(is_enabled=True),
-        }
         widgets = {
             "srp_name": forms.TextInput(attrs={"placeholder": _("Fleet name")}),
             "fleet_time": forms.DateTimeInput(
@@ -160,6 +126,31 @@ class SrpLinkForm(ModelForm):
             ),
         }
 
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the form and limit the fleet types to the enabled ones.
+
+        The choices are rendered from the cached enabled fleet types, the queryset is
+        only evaluated to validate a submitted fleet type.
+
+        :param args:
+        :type args:
+        :param kwargs:
+        :type kwargs:
+        """
+
+        super().__init__(*args, **kwargs)
+
+        fleet_type_field = self.fields["fleet_type"]
+        fleet_type_field.queryset = FleetType.objects.filter(is_enabled=True)
+        fleet_type_field.choices = [
+            ("", fleet_type_field.empty_label),
+            *[
+                (fleet_type.pk, str(fleet_type))
+                for fleet_type in FleetType.objects.enabled()
+            ],
+        ]
+
     def clean(self):
         """
         Clean all input from HTML tags and other nefarious things.
@@ -200,6 +191,40 @@ class SrpLinkUpdateForm(ModelForm):
         return sanitize_cleaned_data(cleaned_data)
 
 
+class SrpLinkKillmailImportForm(forms.Form):
+    """
+    Form for importing killmails as SRP requests into an SRP link.
+    """
+
+    killmails = forms.CharField(
+        label=get_mandatory_form_label_text(text=_("Killmails")),
+        widget=forms.Textarea(attrs={"rows": 10}),
+        help_text=_(
+            "One killboard link or killmail ID per line. Killmail IDs are looked up "
+            "on zKillboard. Accepted killboards: {killboard_urls}"
+        ).format(killboard_urls=", ".join(get_killboard_base_urls())),
+    )
+
+    additional_info = forms.CharField(
+        label=_("Additional information"),
+        widget=forms.Textarea(attrs={"rows": 3}),
+        required=False,
+        help_text=_("Added as a comment to every imported SRP request."),
+    )
+
+    def clean(self):
+        """
+        Clean all input from HTML tags and other nefarious things.
+
+        :return: cleaned_data
+        :rtype: dict
+        """
+
+        cleaned_data = super().clean()
+
+        return sanitize_cleaned_data(cleaned_data)
+
+
 class SrpRequestForm(ModelForm):
     """
     Form for submitting a new SRP request.
@@ -214,12 +239,8 @@ class SrpRequestForm(ModelForm):
         fields = ["killboard_link", "additional_info"]
         help_texts = {
             "killboard_link": _(
-                "Find your kill mail on {zkillboard_base_url}, {evetools_base_url} or {eve_kill_base_url} and paste the link here."
-            ).format(
-                zkillboard_base_url=zkillboard_base_url,
-                evetools_base_url=evetools_base_url,
-                eve_kill_base_url=eve_kill_base_url,
-            ),
+                "Find your kill mail on one of {killboard_base_urls} and paste the link here."
+            ).format(killboard_base_urls=", ".join(get_killboard_base_urls())),
             "additional_info": _(
                 "Please tell us about the circumstances of your untimely demise. "
                 "Who was the FC, what doctrine was called, have changes to the fit "
@@ -268,73 +289,57 @@ class SrpRequestForm(ModelForm):
 
         killboard_link = self.cleaned_data["killboard_link"]
 
-        # Ensure the link ends with a trailing slash if required by the kill board
-        for board, data in KILLBOARD_DATA.items():
-            if (
-                data["requires_trailing_slash"]
-                and re.match(data["base_url_regex"], killboard_link)
-                and not killboard_link.endswith("/")
-            ):
-                logger.debug(
-                    f"Adding trailing slash to killboard link for {board}: {killboard_link}"
-                )
-
-                killboard_link += "/"
-                self.cleaned_data["killboard_link"] = killboard_link
-
-        logger.debug(f"Validating killboard link: {killboard_link}")
-
-        # Define regex patterns for accepted kill boards and killmails
-        killboard_patterns = [
-            zkillboard_base_url_regex,
-            evetools_base_url_regex,
-            eve_kill_base_url_regex,
-        ]
-        killmail_patterns = [
-            zkillboard_killmail_url_regex,
-            evetools_killmail_url_regex,
-            eve_kill_killmail_url_regex,
-        ]
+        logger.debug("Validating killboard link: %s", killboard_link)
 
         # Check if it's a link from one of the accepted kill boards
-        if not any(re.match(pattern, killboard_link) for pattern in killboard_patterns):
+        killboard = get_killboard(killboard_link=killboard_link)
+
+        if killboard is None:
             logger.debug(
-                f"Killboard link does not match any accepted kill board patterns: {killboard_link}"
+                "Killboard link does not match any accepted kill board patterns: %s",
+                killboard_link,
             )
 
             raise forms.ValidationError(
-                message=_(
-                    "Invalid link. Please use {zkillboard_base_url}, {evetools_base_url} or {eve_kill_base_url}"
-                ).format(
-                    zkillboard_base_url=zkillboard_base_url,
-                    evetools_base_url=evetools_base_url,
-                    eve_kill_base_url=eve_kill_base_url,
+                message=_("Invalid link. Please use {killboard_base_urls}").format(
+                    killboard_base_urls=", ".join(get_killboard_base_urls())
                 )
             )
 
-        # Check if it's an actual killmail
-        if not any(re.match(pattern, killboard_link) for pattern in killmail_patterns):
+        # Ensure the link ends with a trailing slash if required by the kill board
+        if killboard.requires_trailing_slash and not killboard_link.endswith("/"):
             logger.debug(
-                f"Killboard link does not match any accepted killmail patterns: {killboard_link}"
+                "Adding trailing slash to killboard link for %s: %s",
+                killboard.name,
+                killboard_link,
             )
 
-            raise forms.ValidationError(
-                message=_("Invalid link. Please post a link to a kill mail.")
-            )
+            killboard_link += "/"
+            self.cleaned_data["killboard_link"] = killboard_link
 
-        # Check if there is already an SRP request for this kill mail
+        # Check if it's an actual killmail
         try:
             killmail_id = SrpRequest.objects.get_kill_id(killboard_link=killboard_link)
         except ValueError as e:
             raise forms.ValidationError(str(e))
 
-        logger.debug(f"Extracted killmail ID: {killmail_id}")
+        if not killmail_id:
+            logger.debug(
+                "Killboard link does not match any accepted killmail patterns: %s",
+                killboard_link,
+            )
+
+            raise forms.ValidationError(
+                message=_("Invalid link. Please post a link to a kill mail.")
+            )
+
+        logger.debug("Extracted killmail ID: %s", killmail_id)
 
-        if SrpRequest.objects.filter(
-            killboard_link__icontains=f"/kill/{killmail_id}"
-        ).exists():
+        if SrpRequest.objects.filter(killmail_id=killmail_id).exists():
             logger.debug(
-                f"SRP request already exists for killmail ID {killmail_id} and link {killboard_link}"
+                "SRP request already exists for killmail ID %s and link %s",
+                killmail_id,
+                killboard_link,
             )
 
             raise forms.ValidationError(
@@ -344,7 +349,7 @@ class SrpRequestForm(ModelForm):
                 )
             )
 
-        logger.debug(f"Killboard link validated: {killboard_link}")
+        logger.debug("Killboard link validated: %s", killboard_link)
 
         return killboard_link
 
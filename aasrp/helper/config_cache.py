@@ -0,0 +1,120 @@
+"""
+Configuration cache helper module.
+
+This module caches configuration (the settings, the enabled fleet types) in two tiers:
+in the memory of the process, and in the shared cache. Reads within
+`AASRP_CONFIG_LOCAL_CACHE_TTL` seconds are answered from memory without any I/O,
+later reads check the shared cache before falling back to the database.
+
+Invalidating a configuration entry deletes it from the memory of the process and from
+the shared cache. Other processes pick up the change once their in-memory copy is
+older than `AASRP_CONFIG_LOCAL_CACHE_TTL` seconds.
+"""
+
+# Standard Library
+import time
+from collections.abc import Callable
+from typing import Any
+
+# Django
+from django.core.cache import cache
+from django.db import transaction
+
+# AA SRP
+from aasrp.app_settings import AASRP_CONFIG_CACHE_TTL, AASRP_CONFIG_LOCAL_CACHE_TTL
+from aasrp.constants import CONFIG_CACHE_KEY_PREFIX
+
+_MISSING = object()
+
+# In-memory tier: cache key -> (time it was loaded, value)
+_local_cache: dict[str, tuple[float, Any]] = {}
+
+
+def get_config_cache_key(name: str) -> str:
+    """
+    Get the cache key of a configuration entry.
+
+    :param name: The name of the configuration entry.
+    :type name: str
+    :return: The cache key.
+    :rtype: str
+    """
+
+    return f"{CONFIG_CACHE_KEY_PREFIX}-{name}"
+
+
+def get_cached_config(name: str, loader: Callable[[], Any]) -> Any:
+    """
+    Get a configuration entry from the cache, loading it on a cache miss.
+
+    :param name: The name of the configuration entry.
+    :type name: str
+    :param loader: Loads the configuration entry, the result has to be picklable.
+    :type loader: Callable[[], Any]
+    :return: The configuration entry.
+    :rtype: Any
+    """
+
+    cache_key = get_config_cache_key(name=name)
+    now = time.monotonic()
+    entry = _local_cache.get(cache_key)
+
+    if entry is not None and now - entry[0] < AASRP_CONFIG_LOCAL_CACHE_TTL:
+        return entry[1]
+
+    value = cache.get(key=cache_key, default=_MISSING)
+
+    if value is _MISSING:
+        value = loader()
+
+        cache.set(key=cache_key, value=value, timeout=AASRP_CONFIG_CACHE_TTL)
+
+    _local_cache[cache_key] = (now, value)
+
+    return value
+
+
+def _delete_config(cache_keys: list[str]) -> None:
+    """
+    Delete configuration entries from both cache tiers.
+
+    :param cache_keys: The cache keys.
+    :type cache_keys: list[str]
+    :return:
+    :rtype:
+    """
+
+    for cache_key in cache_keys:
+        _local_cache.pop(cache_key, None)
+
+    cache.delete_many(keys=cache_keys)
+
+
+def invalidate_cached_config(*names: str) -> None:
+    """
+    Invalidate configuration entries.
+
+    The entries are deleted right away and again after the current transaction has
+    been committed, so a concurrent request can't cache an outdated entry.
+
+    :param names: The names of the configuration entries.
+    :type names: str
+    :return:
+    :rtype:
+    """
+
+    cache_keys = [get_config_cache_key(name=name) for name in names]
+
+    _delete_config(cache_keys=cache_keys)
+    transaction.on_commit(lambda: _delete_config(cache_keys=cache_keys))
+
+
+def clear_local_config_cache() -> None:
+    """
+    Clear the in-memory tier of the configuration cache of this process.
+
+    :return:
+    :rtype:
+    """
+
+    _local_cache.clear()
@@ -0,0 +1,650 @@
+"""
+Fake data helper module.
+
+This module generates realistic fake data (users with alts, fleet types, SRP links,
+SRP requests with their comment history and insurance) for development, load tests
+and benchmarks.
+
+All rows are created with `bulk_create` in batches, and all random choices come from
+a seeded random generator, so the same seed always generates the same data (relative
+to the time of the run), and even millions of SRP requests are generated in minutes.
+"""
+
+# Standard Library
+import random
+import string
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import NamedTuple
+
+# Third Party
+from eve_sde.models import ItemType
+
+# Django
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+# Alliance Auth
+from allianceauth.authentication.models import (
+    CharacterOwnership,
+    User,
+    UserProfile,
+    get_guest_state_pk,
+)
+from allianceauth.eveonline.models import EveCharacter
+from allianceauth.services.hooks import get_extension_logger
+
+# AA SRP
+from aasrp.managers import SrpRequestManager
+from aasrp.models import FleetType, Insurance, RequestComment, SrpLink, SrpRequest
+from aasrp.providers.applogger import AppLogger
+
+logger = AppLogger(my_logger=get_extension_logger(__name__))
+
+# Rows per INSERT statement
+BATCH_SIZE = 2000
+
+# Generated character IDs and killmail IDs start at least here, so they don't
+# collide with real ones
+CHARACTER_ID_OFFSET = 90_000_000
+KILLMAIL_ID_OFFSET = 10_000_000_000
+
+# Characters of the SRP codes and request codes, like `get_random_string`
+CODE_CHARACTERS = string.ascii_letters + string.digits
+CODE_LENGTH = 16
+
+# Ship types: name, hull value, loss amount range and how often the ship is lost
+SHIPS = {
+    587: ("Rifter", 500_000, (2_000_000, 15_000_000), 30),
+    24690: ("Hurricane", 40_000_000, (60_000_000, 150_000_000), 25),
+    11379: ("Hawk", 20_000_000, (40_000_000, 90_000_000), 15),
+    22456: ("Sabre", 50_000_000, (60_000_000, 120_000_000), 10),
+    11987: ("Guardian", 150_000_000, (200_000_000, 350_000_000), 12),
+    17738: ("Machariel", 350_000_000, (600_000_000, 1_500_000_000), 8),
+}
+
+# Insurance levels: name, cost and payout relative to the hull value
+INSURANCE_LEVELS = (
+    ("Basic", 0.05, 0.5),
+    ("Standard", 0.1, 0.6),
+    ("Bronze", 0.15, 0.7),
+    ("Silver", 0.2, 0.8),
+    ("Gold", 0.25, 0.9),
+    ("Platinum", 0.3, 1.0),
+)
+
+FLEET_TYPE_NAMES = (
+    "Strategic Operation",
+    "Home Defense",
+    "Roam",
+    "Structure Timer",
+    "Mining Defense",
+    "Capital Escalation",
+    "Incursion",
+    "Call to Arms",
+)
+
+DOCTRINES = ("Hurricanes", "Machariels", "Hawks", "Rifters", "Kitchen sink")
+
+CORPORATIONS = (
+    (2001, "Wayne Technologies Inc.", "WTE"),
+    (2002, "Wayne Foods Inc.", "WFO"),
+    (2003, "Wayne Logistics Inc.", "WLO"),
+)
+
+ADDITIONAL_INFORMATION = (
+    "Tackled on the gate, logi was out of range.",
+    "Bumped off the anchor.",
+    "Primaried right after the warp in.",
+    "Capacitor ran dry in the bubble.",
+    "Stayed behind to hold tackle.",
+)
+
+REJECT_REASONS = (
+    "Not a doctrine fit.",
+    "Loss is not on the fleet.",
+    "Duplicate request.",
+    "Please add the fleet comp screenshot.",
+)
+
+REVISER_COMMENTS = (
+    "Payout capped at the doctrine value.",
+    "Thanks for the fleet!",
+    "Approved after checking the fleet log.",
+)
+
+# Weights of the statuses of SRP requests (pending, approved, rejected) by the
+# status of their SRP link. Fleets still accepting requests are mostly pending,
+# completed fleets have been fully processed.
+REQUEST_STATUS_WEIGHTS = {
+    SrpLink.Status.ACTIVE: (70, 20, 10),
+    SrpLink.Status.CLOSED: (30, 60, 10),
+    SrpLink.Status.COMPLETED: (0, 88, 12),
+}
+
+
+class FakeDataResult(NamedTuple):
+    """
+    The result of a fake data generation
+    """
+
+    users: list[User]
+    fleet_types: list[FleetType]
+    srp_links: list[SrpLink]
+    srp_requests: int
+    comments: int
+    insurances: int
+
+
+def _random_code(rng: random.Random) -> str:
+    """
+    Get a random SRP code or request code
+
+    :param rng:
+    :type rng:
+    :return:
+    :rtype:
+    """
+
+    return "".join(rng.choices(CODE_CHARACTERS, k=CODE_LENGTH))
+
+
+def _next_id(model: type, field: str, offset: int) -> int:
+    """
+    Get the first free ID above all existing ones, starting at `offset`
+
+    :param model:
+    :type model:
+    :param field:
+    :type field:
+    :param offset:
+    :type offset:
+    :return:
+    :rtype:
+    """
+
+    highest = model.objects.aggregate(highest=Max(field))["highest"]
+
+    return max(offset, (highest or 0) + 1)
+
+
+def _create_users(
+    rng: random.Random, count: int, alts: int, prefix: str, batch_size: int
+) -> list[User]:
+    """
+    Create users with a main character and alts.
+
+    :param rng: The random generator.
+    :type rng: random.Random
+    :param count: The number of users.
+    :type count: int
+    :param alts: The number of alts per user.
+    :type alts: int
+    :param prefix: The prefix of the usernames.
+    :type prefix: str
+    :param batch_size: Rows per INSERT statement.
+    :type batch_size: int
+    :return: The users, with their characters in `characters`.
+    :rtype: list[User]
+    """
+
+    usernames = [f"{prefix}-{index}" for index in range(count)]
+
+    User.objects.bulk_create(
+        [User(username=username) for username in usernames], batch_size=batch_size
+    )
+
+    # Not every database returns the primary keys of bulk created rows
+    users = list(User.objects.filter(username__in=usernames).order_by("pk"))
+    character_id_start = _next_id(
+        model=EveCharacter, field="character_id", offset=CHARACTER_ID_OFFSET
+    )
+    character_ids = range(character_id_start, character_id_start + count * (alts + 1))
+    corporations = [rng.choice(CORPORATIONS) for _ in users]
+
+    EveCharacter.objects.bulk_create(
+        [
+            EveCharacter(
+                character_id=character_id,
+                character_name=f"{prefix} Pilot {character_id - character_id_start}",
+                corporation_id=corporation[0],
+                corporation_name=corporation[1],
+                corporation_ticker=corporation[2],
+                alliance_id=3001,
+                alliance_name="Wayne Enterprises",
+                alliance_ticker="WE",
+            )
+            for character_id, corporation in zip(
+                character_ids,
+                (corporation for corporation in corporations for _ in range(alts + 1)),
+            )
+        ],
+        batch_size=batch_size,
+    )
+
+    characters = list(
+        EveCharacter.objects.filter(
+            character_id__gte=character_ids.start, character_id__lt=character_ids.stop
+        ).order_by("character_id")
+    )
+
+    for index, user in enumerate(users):
+        user.characters = characters[index * (alts + 1) : (index + 1) * (alts + 1)]
+
+    # Bulk creates don't send signals, so the profiles are created here
+    guest_state_pk = get_guest_state_pk()
+
+    UserProfile.objects.bulk_create(
+        [
+            UserProfile(
+                user=user, main_character=user.characters[0], state_id=guest_state_pk
+            )
+            for user in users
+        ],
+        batch_size=batch_size,
+    )
+    CharacterOwnership.objects.bulk_create(
+        [
+            CharacterOwnership(
+                user=user,
+                character=character,
+                owner_hash=f"{prefix}-{character.character_id}",
+            )
+            for user in users
+            for character in user.characters
+        ],
+        batch_size=batch_size,
+    )
+
+    return users
+
+
+def _create_fleet_types(count: int) -> list[FleetType]:
+    """
+    Get or create the fleet types.
+
+    :param count: The number of fleet types.
+    :type count: int
+    :return: The fleet types.
+    :rtype: list[FleetType]
+    """
+
+    names = [
+        (
+            FLEET_TYPE_NAMES[index]
+            if index < len(FLEET_TYPE_NAMES)
+            else f"{FLEET_TYPE_NAMES[index % len(FLEET_TYPE_NAMES)]} {index}"
+        )
+        for index in range(count)
+    ]
+
+    return [FleetType.objects.get_or_create(name=name)[0] for name in names]
+
+
+def _create_srp_links(  # pylint: disable=too-many-arguments
+    rng: random.Random,
+    count: int,
+    users: list[User],
+    fleet_types: list[FleetType],
+    days: int,
+    batch_size: int,
+) -> list[SrpLink]:
+    """
+    Create SRP links, spread over the last days, newest first.
+
+    The newest fleets still accept SRP requests, older ones are closed, and most of
+    them have been completed.
+
+    :param rng: The random generator.
+    :type rng: random.Random
+    :param count: The number of SRP links.
+    :type count: int
+    :param users: The users who create the SRP links.
+    :type users: list[User]
+    :param fleet_types: The fleet types.
+    :type fleet_types: list[FleetType]
+    :param days: The number of days the fleets are spread over.
+    :type days: int
+    :param batch_size: Rows per INSERT statement.
+    :type batch_size: int
+    :return: The SRP links, newest first.
+    :rtype: list[SrpLink]
+    """
+
+    now = timezone.now()
+    srp_codes = [_random_code(rng) for _ in range(count)]
+    srp_links = []
+
+    for index, srp_code in enumerate(srp_codes):
+        if index < max(1, count // 20):
+            srp_status = SrpLink.Status.ACTIVE
+        elif index < max(2, count // 20 + count // 10):
+            srp_status = SrpLink.Status.CLOSED
+        else:
+            srp_status = SrpLink.Status.COMPLETED
+
+        creator = rng.choice(users)
+        fleet_type = rng.choice(fleet_types) if fleet_types else None
+        fleet_doctrine = rng.choice(DOCTRINES)
+
+        srp_links.append(
+            SrpLink(
+                srp_name=(
+                    f"{fleet_type.name if fleet_type else 'Fleet'}: {fleet_doctrine}"
+                ),
+                srp_code=srp_code,
+                srp_status=srp_status,
+                fleet_commander=creator.characters[0],
+                fleet_doctrine=fleet_doctrine,
+                fleet_type=fleet_type,
+                fleet_time=now
+                - timedelta(days=days * index / count, minutes=rng.randint(0, 120)),
+                creator=creator,
+            )
+        )
+
+    SrpLink.objects.bulk_create(srp_links, batch_size=batch_size)
+
+    srp_links_by_code = SrpLink.objects.in_bulk(srp_codes, field_name="srp_code")
+
+    return [srp_links_by_code[srp_code] for srp_code in srp_codes]
+
+
+def _build_srp_request(  # pylint: disable=too-many-arguments
+    rng: random.Random,
+    srp_link: SrpLink,
+    creator: User,
+    reviser: User,
+    ships: list[ItemType],
+    ship_weights: list[int],
+    killmail_id: int,
+) -> tuple[SrpRequest, list[dict]]:
+    """
+    Build an SRP request, and the history of its comments
+
+    :param rng:
+    :type rng:
+    :param srp_link:
+    :type srp_link:
+    :param creator:
+    :type creator:
+    :param reviser:
+    :type reviser:
+    :param ships:
+    :type ships:
+    :param ship_weights:
+    :type ship_weights:
+    :param killmail_id:
+    :type killmail_id:
+    :return: The SRP request, and its comments as keyword arguments of `RequestComment`
+    :rtype: tuple[SrpRequest, list[dict]]
+    """
+
+    ship = rng.choices(ships, weights=ship_weights)[0]
+    loss_amount = rng.randint(*SHIPS[ship.pk][2])
+    request_status = rng.choices(
+        list(SrpRequest.Status), weights=REQUEST_STATUS_WEIGHTS[srp_link.srp_status]
+    )[0]
+    post_time = srp_link.fleet_time + timedelta(minutes=rng.randint(5, 24 * 60))
+    review_time = post_time + timedelta(minutes=rng.randint(30, 3 * 24 * 60))
+    additional_info = rng.choice(ADDITIONAL_INFORMATION) if rng.random() < 0.4 else ""
+    payout_amount = 0
+    reject_info = ""
+
+    comments = [
+        {
+            "comment_type": RequestComment.Type.REQUEST_ADDED,
+            "creator_id": creator.pk,
+            "new_status": SrpRequest.Status.PENDING,
+            "comment_time": post_time,
+        }
+    ]
+
+    if additional_info:
+        comments.append(
+            {
+                "comment": additional_info,
+                "comment_type": RequestComment.Type.REQUEST_INFO,
+                "creator_id": creator.pk,
+                "comment_time": post_time,
+            }
+        )
+
+    if request_status == SrpRequest.Status.APPROVED:
+        # Some payouts are capped at the doctrine value
+        capped = rng.random() < 0.15
+        payout_amount = (
+            int(round(loss_amount * rng.uniform(0.5, 0.9), -5))
+            if capped
+            else loss_amount
+        )
+
+        comments.append(
+            {
+                "comment_type": RequestComment.Type.STATUS_CHANGE,
+                "creator_id": reviser.pk,
+                "new_status": SrpRequest.Status.APPROVED,
+                "comment_time": review_time,
+            }
+        )
+
+        if capped or rng.random() < 0.1:
+            comments.append(
+                {
+                    "comment": REVISER_COMMENTS[0] if capped else REVISER_COMMENTS[1],
+                    "comment_type": RequestComment.Type.REVISER_COMMENT,
+                    "creator_id": reviser.pk,
+                    "comment_time": review_time,
+                }
+            )
+    elif request_status == SrpRequest.Status.REJECTED:
+        reject_info = rng.choice(REJECT_REASONS)
+
+        comments += [
+            {
+                "comment_type": RequestComment.Type.STATUS_CHANGE,
+                "creator_id": reviser.pk,
+                "new_status": SrpRequest.Status.REJECTED,
+                "comment_time": review_time,
+            },
+            {
+                "comment": reject_info,
+                "comment_type": RequestComment.Type.REJECT_REASON,
+                "creator_id": reviser.pk,
+                "comment_time": review_time,
+            },
+        ]
+
+    srp_request = SrpRequest(
+        request_code=_random_code(rng),
+        srp_link_id=srp_link.pk,
+        creator_id=creator.pk,
+        character_id=rng.choice(creator.characters).pk,
+        ship_id=ship.pk,
+        killboard_link=f"https://zkillboard.com/kill/{killmail_id}/",
+        killmail_id=killmail_id,
+        additional_info=additional_info,
+        loss_amount=loss_amount,
+        payout_amount=payout_amount,
+        request_status=request_status,
+        reject_info=reject_info,
+        post_time=post_time,
+    )
+
+    return srp_request, comments
+
+
+def generate_fake_data(  # pylint: disable=too-many-arguments, too-many-locals
+    users: int = 100,
+    alts: int = 2,
+    fleet_types: int = 5,
+    srp_links: int = 50,
+    srp_requests: int = 1000,
+    seed: int = 42,
+    days: int = 365,
+    batch_size: int = BATCH_SIZE,
+    prefix: str = "aasrp-fake",
+    existing_users: Iterable[User] = (),
+    large_srp_link_share: float = 0.0,
+) -> FakeDataResult:
+    """
+    Generate fake data.
+
+    SRP requests are filed by the generated users with their mains and alts. About one
+    in twenty users reviews SRP requests and creates SRP links. Every SRP request gets
+    the comment history the views would have created for its status, and the
+    insurance levels of its ship.
+
+    :param users: The number of users.
+    :type users: int
+    :param alts: The number of alts per user.
+    :type alts: int
+    :param fleet_types: The number of fleet types.
+    :type fleet_types: int
+    :param srp_links: The number of SRP links.
+    :type srp_links: int
+    :param srp_requests: The number of SRP requests.
+    :type srp_requests: int
+    :param seed: The seed of the random generator.
+    :type seed: int
+    :param days: The number of days the fleets are spread over.
+    :type days: int
+    :param batch_size: Rows per INSERT statement.
+    :type batch_size: int
+    :param prefix: The prefix of the usernames, combined with the seed.
+    :type prefix: str
+    :param existing_users: Existing users with a main character, who take part like the generated users.
+    :type existing_users: Iterable[User]
+    :param large_srp_link_share: The share of the SRP requests filed for the newest SRP link, the rest is spread randomly.
+    :type large_srp_link_share: float
+    :return: The generated data.
+    :rtype: FakeDataResult
+    :raises ValueError: If fake data has been generated with the same prefix and seed before.
+    """
+
+    rng = random.Random(seed)
+    prefix = f"{prefix}-{seed}"
+
+    if User.objects.filter(username__startswith=f"{prefix}-").exists():
+        raise ValueError(f"Fake data with the prefix {prefix} exists already")
+
+    with transaction.atomic():
+        for pk, (name, *_) in SHIPS.items():
+            ItemType.objects.get_or_create(
+                id=pk, defaults={"name": name, "published": True}
+            )
+
+        ships = list(ItemType.objects.filter(pk__in=SHIPS).order_by("pk"))
+        ship_weights = [SHIPS[ship.pk][3] for ship in ships]
+
+        all_users = _create_users(
+            rng=rng, count=users, alts=alts, prefix=prefix, batch_size=batch_size
+        )
+
+        for user in existing_users:
+            user.characters = [user.profile.main_character]
+            all_users.insert(0, user)
+
+        revisers = all_users[: max(1, len(all_users) // 20)]
+        all_fleet_types = _create_fleet_types(count=fleet_types)
+        all_srp_links = _create_srp_links(
+            rng=rng,
+            count=max(1, srp_links),
+            users=revisers,
+            fleet_types=all_fleet_types,
+            days=days,
+            batch_size=batch_size,
+        )
+
+        # A few fleets are a lot larger than the others
+        srp_link_weights = [rng.paretovariate(1.5) for _ in all_srp_links]
+        killmail_id_start = _next_id(
+            model=SrpRequest, field="killmail_id", offset=KILLMAIL_ID_OFFSET
+        )
+        comment_count = 0
+        insurance_count = 0
+
+        for batch_start in range(0, srp_requests, batch_size):
+            batch = []
+
+            for index in range(
+                batch_start, min(batch_start + batch_size, srp_requests)
+            ):
+                srp_link = (
+                    all_srp_links[0]
+                    if rng.random() < large_srp_link_share
+                    else rng.choices(all_srp_links, weights=srp_link_weights)[0]
+                )
+
+                batch.append(
+                    _build_srp_request(
+                        rng=rng,
+                        srp_link=srp_link,
+                        creator=rng.choice(all_users),
+                        reviser=rng.choice(revisers),
+                        ships=ships,
+                        ship_weights=ship_weights,
+                        killmail_id=killmail_id_start + index,
+                    )
+                )
+
+            SrpRequest.objects.bulk_create(
+                [srp_request for srp_request, _ in batch], batch_size=batch_size
+            )
+
+            # Not every database returns the primary keys of bulk created rows
+            pks = dict(
+                SrpRequest.objects.filter(
+                    killmail_id__gte=killmail_id_start + batch_start,
+                    killmail_id__lt=killmail_id_start + batch_start + len(batch),
+                ).values_list("killmail_id", "pk")
+            )
+            comments = []
+            insurances = []
+
+            for srp_request, srp_request_comments in batch:
+                srp_request_pk = pks[srp_request.killmail_id]
+                hull_value = SHIPS[srp_request.ship_id][1]
+
+                comments += [
+                    RequestComment(srp_request_id=srp_request_pk, **comment)
+                    for comment in srp_request_comments
+                ]
+                insurances += [
+                    Insurance(
+                        srp_request_id=srp_request_pk,
+                        insurance_level=level,
+                        insurance_cost=hull_value * cost,
+                        insurance_payout=hull_value * payout,
+                    )
+                    for level, cost, payout in INSURANCE_LEVELS
+                ]
+
+            RequestComment.objects.bulk_create(comments, batch_size=batch_size)
+            Insurance.objects.bulk_create(insurances, batch_size=batch_size)
+
+            comment_count += len(comments)
+            insurance_count += len(insurances)
+
+            logger.debug(
+                "Generated %d of %d SRP requests",
+                batch_start + len(batch),
+                srp_requests,
+            )
+
+        # Bulk creates don't send signals
+        SrpLink.objects.filter(
+            pk__in=[srp_link.pk for srp_link in all_srp_links]
+        ).update_request_stats()
+
+    SrpRequestManager.invalidate_pending_requests_count()
+
+    return FakeDataResult(
+        users=all_users,
+        fleet_types=all_fleet_types,
+        srp_links=all_srp_links,
+        srp_requests=srp_requests,
+        comments=comment_count,
+        insurances=insurance_count,
+    )
@@ -0,0 +1,153 @@
+"""
+Fragment cache helper module.
+
+This module caches the rendered HTML of SRP requests in the SRP request tables.
+Cache keys contain the version of the SRP request, which is incremented on every
+change, so cached fragments never have to be deleted, they simply stop being used.
+
+The requester's main character can change without the SRP request changing, so
+it must not be part of a cached fragment.
+"""
+
+# Standard Library
+import hashlib
+from collections.abc import Callable, Iterable
+from typing import Any
+
+# Django
+from django.core.cache import cache
+from django.utils.translation import get_language
+
+# Alliance Auth
+from allianceauth.authentication.models import User
+
+# AA SRP
+from aasrp.app_settings import AASRP_FRAGMENT_CACHE_TTL
+from aasrp.constants import SRP_REQUEST_FRAGMENT_CACHE_KEY_PREFIX
+from aasrp.helper.viewer import ViewerCapabilities
+from aasrp.models import SrpRequest
+
+
+def get_permission_tier(user: User) -> str:
+    """
+    Get the permission tier of a user for the SRP request tables.
+
+    Users in the same permission tier see the same rendering of an SRP request.
+
+    :param user: The user viewing the SRP requests.
+    :type user: User
+    :return: The permission tier.
+    :rtype: str
+    """
+
+    return ViewerCapabilities.for_user(user=user).permission_tier
+
+
+def get_character_key(srp_request: SrpRequest) -> str:
+    """
+    Get a digest of the character shown in a rendering of an SRP request.
+
+    The name and tickers of a character can change without the SRP request changing.
+
+    :param srp_request: The SRP request, with its character.
+    :type srp_request: SrpRequest
+    :return: The digest.
+    :rtype: str
+    """
+
+    character = srp_request.character
+    identity = (
+        ""
+        if character is None
+        else (
+            f"{character.character_id}|{character.character_name}|"
+            f"{character.corporation_ticker}|{character.alliance_ticker}"
+        )
+    )
+
+    return hashlib.sha1(identity.encode(), usedforsecurity=False).hexdigest()
+
+
+def get_fragment_cache_key(
+    namespace: str, srp_request: SrpRequest, permission_tier: str
+) -> str:
+    """
+    Get the cache key for a rendering of an SRP request.
+
+    Besides the version of the SRP request, the key contains everything else the
+    rendering depends on: the status of its SRP link (which actions are available),
+    its character, the permission tier of the viewer and the active language.
+
+    :param namespace: The name of the rendering, e.g. the table it is rendered for.
+    :type namespace: str
+    :param srp_request: The SRP request.
+    :type srp_request: SrpRequest
+    :param permission_tier: The permission tier of the viewer.
+    :type permission_tier: str
+    :return: The cache key.
+    :rtype: str
+    """
+
+    return (
+        f"{SRP_REQUEST_FRAGMENT_CACHE_KEY_PREFIX}-{namespace}-{srp_request.pk}-"
+        f"{srp_request.request_code}-{srp_request.version}-"
+        f"{srp_request.srp_link.srp_status}-{get_character_key(srp_request)}-"
+        f"{permission_tier}-{get_language()}"
+    )
+
+
+def render_cached_fragments(
+    namespace: str,
+    srp_requests: Iterable[SrpRequest],
+    permission_tier: str,
+    render: Callable[[SrpRequest], Any],
+) -> dict[int, Any]:
+    """
+    Get the renderings of SRP requests from the cache, rendering the missing ones.
+
+    All renderings are read with a single cache lookup, and the missing ones are
+    rendered and cached with a single cache write.
+
+    :param namespace: The name of the rendering, e.g. the table it is rendered for.
+    :type namespace: str
+    :param srp_requests: The SRP requests, with their SRP link and character.
+    :type srp_requests: Iterable[SrpRequest]
+    :param permission_tier: The permission tier of the viewer, see `get_permission_tier`.
+    :type permission_tier: str
+    :param render: Renders an SRP request, the result has to be picklable.
+    :type render: Callable[[SrpRequest], Any]
+    :return: The renderings by SRP request primary key.
+    :rtype: dict[int, Any]
+    """
+
+    cache_keys = [
+        (
+            srp_request,
+            get_fragment_cache_key(
+                namespace=namespace,
+                srp_request=srp_request,
+                permission_tier=permission_tier,
+            ),
+        )
+        for srp_request in srp_requests
+    ]
+
+    if not cache_keys:
+        return {}
+
+    cached_fragments = cache.get_many(keys=[cache_key for _, cache_key in cache_keys])
+    fragments = {}
+    rendered_fragments = {}
+
+    for srp_request, cache_key in cache_keys:
+        if cache_key in cached_fragments:
+            fragments[srp_request.pk] = cached_fragments[cache_key]
+
+            continue
+
+        fragments[srp_request.pk] = rendered_fragments[cache_key] = render(srp_request)
+
+    if rendered_fragments:
+        cache.set_many(data=rendered_fragments, timeout=AASRP_FRAGMENT_CACHE_TTL)
+
+    return fragments
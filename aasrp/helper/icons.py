@@ -6,20 +6,40 @@ to ensure consistency across the application. These components are used for acti
 handling SRP requests, and copying data to the clipboard.
 """
 
+# Standard Library
+import re
+from functools import lru_cache
+
 # Django
 from django.core.handlers.wsgi import WSGIRequest
-from django.template.loader import render_to_string
-from django.urls import reverse
+from django.urls import get_script_prefix, reverse
 from django.utils.functional import Promise
+from django.utils.html import escape
 from django.utils.safestring import SafeString
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
-# Alliance Auth
-from allianceauth.authentication.decorators import permissions_required
-
 # AA SRP
+from aasrp.helper.html_fragments import render_html_fragment
+from aasrp.helper.viewer import ViewerCapabilities, get_viewer_capabilities
 from aasrp.models import SrpLink, SrpRequest
 
+# Placeholders in the cached button templates, substituted per row
+_PLACEHOLDER_PATTERN = re.compile(r"__aasrp_placeholder_(\w+?)__")
+
+
+def _placeholder(name: str) -> str:
+    """
+    Get the placeholder for a value in a button template.
+
+    :param name: The name of the value.
+    :type name: str
+    :return: The placeholder.
+    :rtype: str
+    """
+
+    return f"__aasrp_placeholder_{name}__"
+
 
 def _create_button(  # pylint: disable=too-many-arguments, too-many-positional-arguments
     url: str,
@@ -64,44 +84,67 @@ def _create_button(  # pylint: disable=too-many-arguments, too-many-positional-a
     )
 
 
-def dashboard_action_icons(request: WSGIRequest, srp_link: SrpLink) -> str:
+def _fill_placeholders(template: str, **values: str) -> str:
     """
-    Generate action buttons for the dashboard view.
+    Substitute the placeholders of a button template with their values.
 
-    This function creates a set of HTML action buttons based on the status of the SRP link
-    and the user's permissions. The buttons allow users to perform actions such as requesting SRP,
-    viewing SRP requests, editing SRP links, and enabling/disabling or deleting SRP links.
+    :param template: The button template, see `_placeholder`.
+    :type template: str
+    :param values: The values by placeholder name.
+    :type values: str
+    :return: The HTML string with the values substituted.
+    :rtype: str
+    """
 
-    :param request: The HTTP request object, used to check user permissions.
-    :type request: WSGIRequest
-    :param srp_link: The SRP link object containing information about the SRP status and code.
-    :type srp_link: SrpLink
-    :return: A string containing the HTML for the action buttons.
+    return _PLACEHOLDER_PATTERN.sub(lambda match: values[match.group(1)], template)
+
+
+@lru_cache(maxsize=128)
+def _dashboard_action_icons_template(
+    srp_status: str,
+    capabilities: ViewerCapabilities,
+    language: str,  # pylint: disable=unused-argument
+    script_prefix: str,  # pylint: disable=unused-argument
+) -> str:
+    """
+    Build the action buttons of an SRP link with a given status for a viewer.
+
+    The result only depends on the SRP link status and the viewer capabilities (besides
+    the language of the titles and the URL prefix, which are part of the cache key),
+    the SRP code and name are left as placeholders to be substituted per SRP link.
+
+    :param srp_status: The status of the SRP link.
+    :type srp_status: str
+    :param capabilities: The capabilities of the viewer.
+    :type capabilities: ViewerCapabilities
+    :param language: The active language.
+    :type language: str
+    :param script_prefix: The active URL script prefix.
+    :type script_prefix: str
+    :return: The button template.
     :rtype: str
     """
 
+    srp_code = _placeholder("srp_code")
+    data_name = f"{_placeholder('srp_name')} ({srp_code})"
     actions = ""
 
     # Active SRP link
-    if srp_link.srp_status == SrpLink.Status.ACTIVE:
+    if srp_status == SrpLink.Status.ACTIVE:
         # Add SRP request button
         actions += _create_button(
-            url=reverse(viewname="aasrp:request_srp", args=[srp_link.srp_code]),
+            url=reverse(viewname="aasrp:request_srp", args=[srp_code]),
             btn_class="btn btn-success",
             icon_class="fa-solid fa-hand-holding-dollar",
             title=_("Request SRP"),
         )
 
     # Check if the user has permission to manage SRP links or requests
-    if request.user.has_perm(perm="aasrp.manage_srp") or request.user.has_perm(
-        perm="aasrp.manage_srp_requests"
-    ):
+    if capabilities.can_view_srp_requests:
         # Add view SRP requests button
         actions += (
             _create_button(
-                url=reverse(
-                    viewname="aasrp:view_srp_requests", args=[srp_link.srp_code]
-                ),
+                url=reverse(viewname="aasrp:view_srp_requests", args=[srp_code]),
                 btn_class="btn btn-primary",
                 icon_class="fa-solid fa-eye",
                 title=_("View SRP requests"),
@@ -110,59 +153,97 @@ def dashboard_action_icons(request: WSGIRequest, srp_link: SrpLink) -> str:
         )
 
         # Whether the SRP link is active or closed, we can edit it
-        if srp_link.srp_status != SrpLink.Status.COMPLETED and request.user.has_perm(
-            "aasrp.manage_srp"
-        ):
+        if srp_status != SrpLink.Status.COMPLETED and capabilities.can_manage_srp:
             # Check if the SRP status is active
-            if srp_link.srp_status == SrpLink.Status.ACTIVE:
+            if srp_status == SrpLink.Status.ACTIVE:
                 # Add AAR link button
                 actions += _create_button(
-                    url=reverse(
-                        viewname="aasrp:edit_srp_link", args=[srp_link.srp_code]
-                    ),
+                    url=reverse(viewname="aasrp:edit_srp_link", args=[srp_code]),
                     btn_class="btn btn-info",
                     icon_class="fa-regular fa-newspaper",
                     title=_("Add/Change AAR link"),
                 )
+                # Add import killmails button
+                actions += _create_button(
+                    url=reverse(viewname="aasrp:import_killmails", args=[srp_code]),
+                    btn_class="btn btn-info",
+                    icon_class="fa-solid fa-file-import",
+                    title=_("Import killmails"),
+                )
                 # Add disable SRP link button
                 actions += _create_button(
-                    url=reverse(
-                        viewname="aasrp:disable_srp_link", args=[srp_link.srp_code]
-                    ),
+                    url=reverse(viewname="aasrp:disable_srp_link", args=[srp_code]),
                     btn_class="btn btn-warning",
                     icon_class="fa-solid fa-ban",
                     title=_("Disable SRP link"),
                     modal_id="disable-srp-link",
-                    data_name=f"{srp_link.srp_name} ({srp_link.srp_code})",
+                    data_name=data_name,
                 )
 
             # Check if the SRP status is closed
-            if srp_link.srp_status == SrpLink.Status.CLOSED:
+            if srp_status == SrpLink.Status.CLOSED:
                 # Add enable SRP link button
                 actions += _create_button(
-                    url=reverse(
-                        viewname="aasrp:enable_srp_link", args=[srp_link.srp_code]
-                    ),
+                    url=reverse(viewname="aasrp:enable_srp_link", args=[srp_code]),
                     btn_class="btn btn-success",
                     icon_class="fa-solid fa-check",
                     title=_("Enable SRP link"),
                     modal_id="enable-srp-link",
-                    data_name=f"{srp_link.srp_name} ({srp_link.srp_code})",
+                    data_name=data_name,
                 )
 
             # Add delete SRP link button
             actions += _create_button(
-                url=reverse(viewname="aasrp:delete_srp_link", args=[srp_link.srp_code]),
+                url=reverse(viewname="aasrp:delete_srp_link", args=[srp_code]),
                 btn_class="btn btn-danger",
                 icon_class="fa-regular fa-trash-can",
                 title=_("Remove SRP link"),
                 modal_id="delete-srp-link",
-                data_name=f"{srp_link.srp_name} ({srp_link.srp_code})",
+                data_name=data_name,
             )
 
     return actions
 
 
+def dashboard_action_icons(
+    request: WSGIRequest,
+    srp_link: SrpLink,
+    capabilities: ViewerCapabilities | None = None,
+) -> str:
+    """
+    Generate action buttons for the dashboard view.
+
+    This function creates a set of HTML action buttons based on the status of the SRP link
+    and the user's permissions. The buttons allow users to perform actions such as requesting SRP,
+    viewing SRP requests, editing SRP links, and enabling/disabling or deleting SRP links.
+
+    :param request: The HTTP request object, used to check user permissions.
+    :type request: WSGIRequest
+    :param srp_link: The SRP link object containing information about the SRP status and code.
+    :type srp_link: SrpLink
+    :param capabilities: The capabilities of the viewer, evaluated from the request if not given.
+    :type capabilities: ViewerCapabilities | None
+    :return: A string containing the HTML for the action buttons.
+    :rtype: str
+    """
+
+    if capabilities is None:
+        capabilities = get_viewer_capabilities(request=request)
+
+    template = _dashboard_action_icons_template(
+        srp_status=srp_link.srp_status,
+        capabilities=capabilities,
+        language=get_language(),
+        script_prefix=get_script_prefix(),
+    )
+
+    return _fill_placeholders(
+        template,
+        srp_code=srp_link.srp_code,
+        srp_name=escape(srp_link.srp_name),
+    )
+
+
 def get_srp_request_status_icon(
     request: WSGIRequest, srp_request: SrpRequest  # pylint: disable=unused-argument
 ) -> str:
@@ -413,9 +494,62 @@ def get_srp_request_delete_icon(
     return srp_request_delete_icon
 
 
-@permissions_required(("aasrp.manage_srp", "aasrp.manage_srp_requests"))
+@lru_cache(maxsize=128)
+def _srp_request_action_icons_template(
+    srp_status: str,
+    request_status: str,
+    capabilities: ViewerCapabilities,
+    language: str,  # pylint: disable=unused-argument
+    script_prefix: str,  # pylint: disable=unused-argument
+) -> str:
+    """
+    Build the action icons of an SRP request with a given status for a viewer.
+
+    The SRP code and request code are left as placeholders to be substituted per SRP request.
+
+    :param srp_status: The status of the SRP link.
+    :type srp_status: str
+    :param request_status: The status of the SRP request.
+    :type request_status: str
+    :param capabilities: The capabilities of the viewer.
+    :type capabilities: ViewerCapabilities
+    :param language: The active language.
+    :type language: str
+    :param script_prefix: The active URL script prefix.
+    :type script_prefix: str
+    :return: The icon template.
+    :rtype: str
+    """
+
+    srp_link = SrpLink(srp_code=_placeholder("srp_code"), srp_status=srp_status)
+    srp_request = SrpRequest(
+        request_code=_placeholder("request_code"), request_status=request_status
+    )
+    icon_kwargs = {"request": None, "srp_link": srp_link, "srp_request": srp_request}
+
+    # Generate the details icon for the SRP request
+    srp_request_action_icons = get_srp_request_details_icon(**icon_kwargs)
+
+    # Add additional action icons if the SRP link is active or closed
+    if srp_status in (SrpLink.Status.ACTIVE, SrpLink.Status.CLOSED):
+        srp_request_action_icons += "<br>"
+
+        # Add accept and reject icons for the SRP request
+        for icon_func in [get_srp_request_accept_icon, get_srp_request_reject_icon]:
+            srp_request_action_icons += icon_func(**icon_kwargs)
+
+        # Add delete icon if the user has permission to manage SRP
+        if capabilities.can_manage_srp:
+            srp_request_action_icons += get_srp_request_delete_icon(**icon_kwargs)
+
+    return srp_request_action_icons
+
+
 def get_srp_request_action_icons(
-    request: WSGIRequest, srp_link: SrpLink, srp_request: SrpRequest
+    request: WSGIRequest,
+    srp_link: SrpLink,
+    srp_request: SrpRequest,
+    capabilities: ViewerCapabilities | None = None,
 ) -> str:
     """
     Generate HTML action icons for SRP requests.
@@ -430,32 +564,32 @@ def get_srp_request_action_icons(
     :type srp_link: SrpLink
     :param srp_request: The SRP request object containing the request details.
     :type srp_request: SrpRequest
+    :param capabilities: The capabilities of the viewer, evaluated from the request if not given.
+    :type capabilities: ViewerCapabilities | None
     :return: A string containing the HTML for the action icons.
     :rtype: str
     """
 
-    # Generate the details icon for the SRP request
-    srp_request_action_icons = get_srp_request_details_icon(
-        request=request, srp_link=srp_link, srp_request=srp_request
-    )
+    if capabilities is None:
+        capabilities = get_viewer_capabilities(request=request)
 
-    # Add additional action icons if the SRP link is active or closed
-    if srp_link.srp_status in (SrpLink.Status.ACTIVE, SrpLink.Status.CLOSED):
-        srp_request_action_icons += "<br>"
+    # Only SRP managers get action icons
+    if not capabilities.can_view_srp_requests:
+        return ""
 
-        # Add accept and reject icons for the SRP request
-        for icon_func in [get_srp_request_accept_icon, get_srp_request_reject_icon]:
-            srp_request_action_icons += icon_func(
-                request=request, srp_link=srp_link, srp_request=srp_request
-            )
-
-        # Add delete icon if the user has permission to manage SRP
-        if request.user.has_perm("aasrp.manage_srp"):
-            srp_request_action_icons += get_srp_request_delete_icon(
-                request=request, srp_link=srp_link, srp_request=srp_request
-            )
+    template = _srp_request_action_icons_template(
+        srp_status=srp_link.srp_status,
+        request_status=srp_request.request_status,
+        capabilities=capabilities,
+        language=get_language(),
+        script_prefix=get_script_prefix(),
+    )
 
-    return srp_request_action_icons
+    return _fill_placeholders(
+        template,
+        srp_code=srp_link.srp_code,
+        request_code=srp_request.request_code,
+    )
 
 
 def copy_to_clipboard_icon(data: str, title: str | Promise) -> SafeString:
@@ -466,6 +600,9 @@ def copy_to_clipboard_icon(data: str, title: str | Promise) -> SafeString:
     when clicked, copies the specified data to the user's clipboard. It includes a
     tooltip with the provided title for better user experience.
 
+    The template is compiled once per process (see `aasrp.helper.html_fragments`),
+    since the icon is rendered for several cells of every table row.
+
     :param data: The data to be copied to the clipboard.
     :type data: str
     :param title: The tooltip text for the icon.
@@ -474,7 +611,8 @@ def copy_to_clipboard_icon(data: str, title: str | Promise) -> SafeString:
     :rtype: SafeString
     """
 
-    return render_to_string(
+    return render_html_fragment(
         template_name="aasrp/partials/common/copy-to-clipboard-icon.html",
-        context={"data": data, "title": title},
+        data=data,
+        title=title,
     )
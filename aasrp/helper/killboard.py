@@ -0,0 +1,118 @@
+"""
+Killboard helper module.
+
+This module provides the registry of accepted killboards and the functions to match
+killboard links against it. The built-in killboards from `KILLBOARD_DATA` can be
+extended or replaced with the `AASRP_KILLBOARDS` setting.
+"""
+
+# Standard Library
+import re
+from typing import NamedTuple
+
+# AA SRP
+from aasrp.app_settings import AASRP_KILLBOARDS
+from aasrp.constants import KILLBOARD_DATA
+
+
+class Killboard(NamedTuple):
+    """
+    A killboard with its precompiled URL patterns
+    """
+
+    name: str
+    base_url: str
+    base_url_regex: re.Pattern
+    killmail_url_regex: re.Pattern
+    requires_trailing_slash: bool
+
+
+class KillboardLink(NamedTuple):
+    """
+    The result of parsing a link to a killmail
+    """
+
+    provider: str
+    killmail_id: int
+    killmail_hash: str | None = None
+
+
+def _build_registry(killboard_data: dict) -> tuple[Killboard, ...]:
+    """
+    Compile the URL patterns of the given killboards.
+
+    :param killboard_data: The killboards in the format of `KILLBOARD_DATA`.
+    :type killboard_data: dict
+    :return: The killboards with precompiled URL patterns.
+    :rtype: tuple[Killboard, ...]
+    """
+
+    return tuple(
+        Killboard(
+            name=name,
+            base_url=data["base_url"],
+            base_url_regex=re.compile(data["base_url_regex"]),
+            killmail_url_regex=re.compile(data["killmail_url_regex"]),
+            requires_trailing_slash=data.get("requires_trailing_slash", False),
+        )
+        for name, data in {**KILLBOARD_DATA, **killboard_data}.items()
+    )
+
+
+KILLBOARDS = _build_registry(killboard_data=AASRP_KILLBOARDS)
+
+
+def get_killboard(killboard_link: str) -> Killboard | None:
+    """
+    Get the killboard a link points to.
+
+    :param killboard_link: The link to check.
+    :type killboard_link: str
+    :return: The killboard, or None if the link doesn't point to an accepted killboard.
+    :rtype: Killboard | None
+    """
+
+    for killboard in KILLBOARDS:
+        if killboard.base_url_regex.match(killboard_link):
+            return killboard
+
+    return None
+
+
+def get_killboard_base_urls() -> list[str]:
+    """
+    Get the base URLs of all accepted killboards.
+
+    :return: The base URLs.
+    :rtype: list[str]
+    """
+
+    return [killboard.base_url for killboard in KILLBOARDS]
+
+
+def parse_killboard_link(killboard_link: str) -> KillboardLink | None:
+    """
+    Parse a link to a killmail on one of the accepted killboards.
+
+    :param killboard_link: The link to parse.
+    :type killboard_link: str
+    :return: The killboard, killmail ID and (if part of the link) killmail hash,
+        or None if the link isn't a link to a killmail on an accepted killboard.
+    :rtype: KillboardLink | None
+    """
+
+    killboard = get_killboard(killboard_link=killboard_link)
+
+    if killboard is None:
+        return None
+
+    match = killboard.killmail_url_regex.match(killboard_link)
+
+    if match is None:
+        return None
+
+    return KillboardLink(
+        provider=killboard.name,
+        killmail_id=int(match.group("killmail_id")),
+        killmail_hash=match.groupdict().get("killmail_hash"),
+    )
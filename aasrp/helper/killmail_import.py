@@ -0,0 +1,284 @@
+"""
+Killmail import helper module.
+
+This module provides the bulk import of killmails as SRP requests, e.g. to file
+the losses of a whole fleet at once.
+"""
+
+# Standard Library
+from typing import NamedTuple
+
+# Third Party
+from eve_sde.models import ItemType
+
+# Django
+from django.db import transaction
+from django.utils.crypto import get_random_string
+from django.utils.translation import gettext_lazy as _
+
+# Alliance Auth
+from allianceauth.authentication.models import User
+from allianceauth.eveonline.models import EveCharacter
+from allianceauth.services.hooks import get_extension_logger
+
+# AA SRP
+from aasrp.app_settings import AASRP_KILLMAIL_IMPORT_MAX_WORKERS
+from aasrp.constants import KILLBOARD_DATA
+from aasrp.helper.killboard import get_killboard, parse_killboard_link
+from aasrp.models import (
+    Insurance,
+    InsurancePrice,
+    Killmail,
+    RequestComment,
+    Setting,
+    SrpLink,
+    SrpRequest,
+)
+from aasrp.providers.applogger import AppLogger
+
+logger = AppLogger(my_logger=get_extension_logger(__name__))
+
+
+class KillmailImportResult(NamedTuple):
+    """
+    The result of a killmail import
+    """
+
+    created: list[SrpRequest]
+    duplicates: list[int]
+    failed: dict[str, str]
+
+
+def parse_killmail_references(entries: list[str]) -> tuple[dict[int, str], list[str]]:
+    """
+    Parse killboard links and killmail IDs into killmail IDs and killboard links.
+
+    Killmail IDs get a link to zKillboard.
+
+    :param entries: The killboard links and/or killmail IDs.
+    :type entries: list[str]
+    :return: The killboard links by killmail ID (without duplicates), and the invalid entries.
+    :rtype: tuple[dict[int, str], list[str]]
+    """
+
+    killboard_links = {}
+    invalid_entries = []
+
+    for entry in (entry.strip() for entry in entries):
+        if not entry:
+            continue
+
+        if entry.isdigit():
+            killboard_links.setdefault(
+                int(entry),
+                f"{KILLBOARD_DATA['zKillboard']['base_url']}kill/{int(entry)}/",
+            )
+
+            continue
+
+        killboard = get_killboard(killboard_link=entry)
+
+        if killboard is not None and killboard.requires_trailing_slash:
+            entry = entry if entry.endswith("/") else f"{entry}/"
+
+        killmail = parse_killboard_link(killboard_link=entry)
+
+        if killmail is None:
+            invalid_entries.append(entry)
+
+            continue
+
+        killboard_links.setdefault(killmail.killmail_id, entry)
+
+    return killboard_links, invalid_entries
+
+
+def import_killmails(  # pylint: disable=too-many-locals
+    srp_link: SrpLink,
+    entries: list[str],
+    importer: User | None = None,
+    additional_info: str = "",
+) -> KillmailImportResult:
+    """
+    Create SRP requests for a list of killmails.
+
+    Killmails are resolved concurrently, killmails that already have an SRP request
+    (including ones filed while the import runs) are skipped, and all SRP requests,
+    comments and insurance entries are created with bulk inserts in a single
+    transaction.
+    The SRP requests are created on behalf of the owner of the victim character.
+
+    :param srp_link: The SRP link to create the SRP requests for.
+    :type srp_link: SrpLink
+    :param entries: The killboard links and/or killmail IDs.
+    :type entries: list[str]
+    :param importer: The user who imports the killmails, if any.
+    :type importer: User | None
+    :param additional_info: Additional information, added to every SRP request.
+    :type additional_info: str
+    :return: The created SRP requests, the killmail IDs that already have an SRP
+        request, and the reasons for entries and killmails that couldn't be imported.
+    :rtype: KillmailImportResult
+    """
+
+    killboard_links, invalid_entries = parse_killmail_references(entries=entries)
+    failed = {
+        entry: str(_("Invalid killboard link or killmail ID."))
+        for entry in invalid_entries
+    }
+
+    # Skip killmails that already have an SRP request
+    duplicates = list(
+        SrpRequest.objects.filter(killmail_id__in=killboard_links).values_list(
+            "killmail_id", flat=True
+        )
+    )
+    killmail_ids = [
+        killmail_id for killmail_id in killboard_links if killmail_id not in duplicates
+    ]
+
+    killmails, errors = Killmail.objects.get_or_fetch_many(
+        killmail_ids=killmail_ids, max_workers=AASRP_KILLMAIL_IMPORT_MAX_WORKERS
+    )
+    failed.update(
+        {
+            str(killmail_id): _("Unable to fetch the killmail: {error}").format(
+                error=error
+            )
+            for killmail_id, error in errors.items()
+        }
+    )
+
+    characters = {
+        character.character_id: character
+        for character in EveCharacter.objects.filter(
+            character_id__in=[
+                killmail.victim_character_id for killmail in killmails.values()
+            ]
+        ).select_related("character_ownership__user")
+    }
+    ships = ItemType.objects.in_bulk(
+        [killmail.ship_type_id for killmail in killmails.values()]
+    )
+    loss_value_field = Setting.objects.get_setting(Setting.Field.LOSS_VALUE_SOURCE)
+
+    srp_requests = []
+
+    for killmail_id in killmail_ids:
+        killmail = killmails.get(killmail_id)
+
+        if killmail is None:
+            continue
+
+        character = characters.get(killmail.victim_character_id)
+        ownership = getattr(character, "character_ownership", None)
+
+        if ownership is None:
+            failed[str(killmail_id)] = _(
+                "Character {character_id} does not belong to an Auth account."
+            ).format(character_id=killmail.victim_character_id)
+
+            continue
+
+        ship = ships.get(killmail.ship_type_id)
+
+        if ship is None:
+            failed[str(killmail_id)] = _("Unknown ship type {type_id}.").format(
+                type_id=killmail.ship_type_id
+            )
+
+            continue
+
+        srp_requests.append(
+            SrpRequest(
+                request_code=get_random_string(length=16),
+                creator=ownership.user,
+                character=character,
+                ship=ship,
+                killboard_link=killboard_links[killmail_id],
+                killmail_id=killmail_id,
+                srp_link=srp_link,
+                loss_amount=killmail.zkb.get(loss_value_field, 0),
+            )
+        )
+
+    if not srp_requests:
+        return KillmailImportResult(created=[], duplicates=duplicates, failed=failed)
+
+    with transaction.atomic():
+        # A killmail can get an SRP request between the duplicate check above and
+        # this insert, so conflicting rows are skipped and reported as duplicates
+        SrpRequest.objects.bulk_create(
+            srp_requests, batch_size=500, ignore_conflicts=True
+        )
+
+        # Not every database returns the primary keys of bulk inserted rows
+        created = list(
+            SrpRequest.objects.filter(
+                srp_link=srp_link,
+                request_code__in=[
+                    srp_request.request_code for srp_request in srp_requests
+                ],
+            )
+            .select_related("creator", "ship")
+            .order_by("pk")
+        )
+        created_killmail_ids = {srp_request.killmail_id for srp_request in created}
+        duplicates += [
+            srp_request.killmail_id
+            for srp_request in srp_requests
+            if srp_request.killmail_id not in created_killmail_ids
+        ]
+
+        comments = []
+
+        for srp_request in created:
+            comments.append(
+                RequestComment(
+                    srp_request=srp_request,
+                    comment_type=RequestComment.Type.REQUEST_ADDED,
+                    creator=importer or srp_request.creator,
+                    new_status=SrpRequest.Status.PENDING,
+                )
+            )
+
+            if additional_info:
+                comments.append(
+                    RequestComment(
+                        comment=additional_info,
+                        srp_request=srp_request,
+                        comment_type=RequestComment.Type.REQUEST_INFO,
+                        creator=importer or srp_request.creator,
+                    )
+                )
+
+        RequestComment.objects.bulk_create(comments, batch_size=500)
+        Insurance.objects.bulk_create(
+            [
+                Insurance(
+                    srp_request=srp_request,
+                    insurance_level=level["name"],
+                    insurance_cost=level["cost"],
+                    insurance_payout=level["payout"],
+                )
+                for srp_request in created
+                for level in InsurancePrice.objects.get_levels(
+                    type_id=killmails[srp_request.killmail_id].ship_type_id
+                )
+            ],
+            batch_size=500,
+        )
+
+        # Bulk inserts bypass `SrpRequest.save()`, so update what it would have
+        SrpLink.objects.filter(pk=srp_link.pk).update_request_stats()
+        SrpRequest.objects.invalidate_pending_requests_count()
+
+    logger.info(
+        "Imported %d SRP requests for SRP link %s (%d duplicates, %d failed)",
+        len(created),
+        srp_link.srp_code,
+        len(duplicates),
+        len(failed),
+    )
+
+    return KillmailImportResult(created=created, duplicates=duplicates, failed=failed)
@@ -2,8 +2,13 @@
 Notifications helper
 """
 
+# Standard Library
+from typing import NamedTuple
+from uuid import uuid4
+
 # Django
 from django.conf import settings
+from django.db import transaction
 from django.template.loader import render_to_string
 from django.urls import reverse
 
@@ -15,11 +20,74 @@ from allianceauth.services.hooks import get_extension_logger
 # AA SRP
 from aasrp.discord.channel_message import send_message_to_discord_channel
 from aasrp.discord.direct_message import send_user_notification
-from aasrp.models import RequestComment, Setting, SrpRequest
+from aasrp.helper.killmail_import import KillmailImportResult
+from aasrp.helper.user import get_user_settings_for_users
+from aasrp.models import RequestComment, Setting, SrpLink, SrpRequest, UserSetting
 from aasrp.providers.applogger import AppLogger
 
 logger = AppLogger(my_logger=get_extension_logger(__name__))
 
+# Most SRP requests listed in one digest, so it stays within Discord's message length limit
+NOTIFICATION_DIGEST_MAX_REQUESTS = 20
+
+# Most failed entries listed in a killmail import notification, for the same reason
+KILLMAIL_IMPORT_NOTIFICATION_MAX_FAILED = 20
+
+
+class RequesterNotificationBatch(NamedTuple):
+    """
+    Everything needed to send the requester notifications of one (bulk) action
+    """
+
+    reviser: User | None
+    srp_requests: dict[int, SrpRequest]
+    user_settings: dict[int, UserSetting]
+
+
+def prepare_requester_notifications(
+    reviser_id: int, srp_request_ids: list[int]
+) -> RequesterNotificationBatch:
+    """
+    Load the reviser, the SRP requests and the settings of their requesters for
+    sending the requester notifications of one (bulk) action.
+
+    Everything `notify_requester` needs is loaded with a constant number of queries,
+    regardless of the number of SRP requests.
+
+    :param reviser_id: The ID of the user who changed the status of the SRP requests
+    :type reviser_id: int
+    :param srp_request_ids: The IDs of the SRP requests
+    :type srp_request_ids: list[int]
+    :return: The reviser, the SRP requests by ID and the requester settings by user ID
+    :rtype: RequesterNotificationBatch
+    """
+
+    srp_request_relations = ["creator", "srp_link", "ship"]
+
+    # The Discord service adds the Discord account of a user, when it is installed
+    if hasattr(User, "discord"):
+        srp_request_relations.append("creator__discord")
+
+    reviser = (
+        User.objects.select_related("profile__main_character")
+        .filter(pk=reviser_id)
+        .first()
+    )
+    srp_requests = SrpRequest.objects.select_related(*srp_request_relations).in_bulk(
+        srp_request_ids
+    )
+    user_settings = get_user_settings_for_users(
+        users=[
+            srp_request.creator
+            for srp_request in srp_requests.values()
+            if srp_request.creator is not None
+        ]
+    )
+
+    return RequesterNotificationBatch(
+        reviser=reviser, srp_requests=srp_requests, user_settings=user_settings
+    )
+
 
 def notify_requester(
     requester: User,
@@ -79,6 +147,212 @@ def notify_requester(
     )
 
 
+def notify_requester_digest(
+    requester: User,
+    reviser: User,
+    srp_requests: list[SrpRequest],
+    comment: str,
+    message_level: str = "success",
+) -> None:
+    """
+    Send one notification to the requester for several SRP requests, which have been
+    changed to the same status in one (bulk) action
+
+    :param requester: The user who made the SRP requests
+    :type requester: User
+    :param reviser: The user who is revising the SRP requests
+    :type reviser: User
+    :param srp_requests: The SRP request objects, all with the same status
+    :type srp_requests: list[SrpRequest]
+    :param comment: The comment made by the reviser
+    :type comment: str
+    :param message_level: The level of the message (success, error, info, etc. Default: success)
+    :type message_level: str
+    :return: None
+    :rtype: None
+    """
+
+    request_status = srp_requests[0].request_status
+
+    context = {
+        "srp_requests": [
+            {
+                "ship": srp_request.ship.name_en,
+                "srp_name": srp_request.srp_link.srp_name,
+                "srp_code": srp_request.srp_link.srp_code,
+                "request_code": srp_request.request_code,
+            }
+            for srp_request in srp_requests
+        ],
+        "status": request_status.lower(),
+        "reviser": get_main_character_name_from_user(reviser),
+        "comment": comment,
+    }
+
+    allianceauth_notification = render_to_string(
+        template_name="aasrp/notifications/allianceauth/request-status-change-digest.html",
+        context=context,
+    )
+
+    discord_notification = render_to_string(
+        template_name="aasrp/notifications/discord/request-status-change-digest.html",
+        context=context,
+    )
+
+    send_user_notification(
+        user=requester,
+        level=message_level,
+        title=f"{len(srp_requests)} SRP Requests {request_status}",
+        message={
+            "allianceauth": allianceauth_notification,
+            "discord": discord_notification,
+        },
+    )
+
+
+def group_requester_notifications(
+    notifications: list[tuple[dict, SrpRequest]], digest: bool
+) -> list[list[tuple[dict, SrpRequest]]]:
+    """
+    Group the notifications of one (bulk) action into the notifications to send
+
+    Without digest, every notification is sent on its own. With digest, the
+    notifications of a requester with the same status and comment are sent as one,
+    with at most `NOTIFICATION_DIGEST_MAX_REQUESTS` SRP requests each.
+
+    :param notifications: The notifications, each with its SRP request
+    :type notifications: list[tuple[dict, SrpRequest]]
+    :param digest: Whether to group the notifications per requester
+    :type digest: bool
+    :return: The groups of notifications, in the order of their first notification
+    :rtype: list[list[tuple[dict, SrpRequest]]]
+    """
+
+    if not digest:
+        return [[notification] for notification in notifications]
+
+    groups = {}
+
+    for notification, srp_request in notifications:
+        groups.setdefault(
+            (
+                srp_request.creator_id,
+                srp_request.request_status,
+                notification["comment"],
+            ),
+            [],
+        ).append((notification, srp_request))
+
+    return [
+        group[index : index + NOTIFICATION_DIGEST_MAX_REQUESTS]
+        for group in groups.values()
+        for index in range(0, len(group), NOTIFICATION_DIGEST_MAX_REQUESTS)
+    ]
+
+
+def queue_requester_notifications(
+    srp_requests: list[SrpRequest],
+    reviser: User,
+    comment: str = "",
+    message_level: str = "success",
+) -> None:
+    """
+    Queue the notifications for a status change of one or more SRP requests
+
+    All notifications of one (bulk) action are sent by a single Celery task, which is
+    only queued once the current database transaction has been committed.
+
+    :param srp_requests: The SRP requests whose status has been changed
+    :type srp_requests: list[SrpRequest]
+    :param reviser: The user who changed the status of the SRP requests
+    :type reviser: User
+    :param comment: The comment made by the reviser
+    :type comment: str
+    :param message_level: The level of the message (success, error, info, etc. Default: success)
+    :type message_level: str
+    :return: None
+    :rtype: None
+    """
+
+    # AA SRP
+    from aasrp.tasks import (  # pylint: disable=import-outside-toplevel
+        send_requester_notifications,
+    )
+
+    # One ID per status change, so a retried task can tell which notifications have been sent
+    status_change_id = uuid4().hex
+
+    notifications = [
+        {
+            "srp_request_id": srp_request.pk,
+            "comment": comment,
+            "idempotency_key": (
+                f"aasrp-requester-notification-{srp_request.pk}-"
+                f"{srp_request.request_status}-{status_change_id}"
+            ),
+        }
+        for srp_request in srp_requests
+    ]
+
+    if not notifications:
+        return
+
+    transaction.on_commit(
+        lambda: send_requester_notifications.delay(
+            reviser_id=reviser.pk,
+            notifications=notifications,
+            message_level=message_level,
+        )
+    )
+
+
+def notify_killmail_import(
+    importer: User, srp_link: SrpLink, result: KillmailImportResult
+) -> None:
+    """
+    Send the result of a killmail import to the user who started it
+
+    :param importer: The user who imported the killmails
+    :type importer: User
+    :param srp_link: The SRP link the killmails have been imported into
+    :type srp_link: SrpLink
+    :param result: The result of the killmail import
+    :type result: KillmailImportResult
+    :return: None
+    :rtype: None
+    """
+
+    failed = list(result.failed.items())
+    context = {
+        "srp_name": srp_link.srp_name,
+        "srp_code": srp_link.srp_code,
+        "created": len(result.created),
+        "duplicates": ", ".join(str(killmail_id) for killmail_id in result.duplicates),
+        "failed": failed[:KILLMAIL_IMPORT_NOTIFICATION_MAX_FAILED],
+        "failed_omitted": max(0, len(failed) - KILLMAIL_IMPORT_NOTIFICATION_MAX_FAILED),
+    }
+
+    allianceauth_notification = render_to_string(
+        template_name="aasrp/notifications/allianceauth/killmail-import.html",
+        context=context,
+    )
+
+    discord_notification = render_to_string(
+        template_name="aasrp/notifications/discord/killmail-import.html",
+        context=context,
+    )
+
+    send_user_notification(
+        user=importer,
+        level="warning" if failed else "success",
+        title=f"Killmail Import: {len(result.created)} SRP Requests Imported",
+        message={
+            "allianceauth": allianceauth_notification,
+            "discord": discord_notification,
+        },
+    )
+
+
 def notify_srp_team(srp_request: SrpRequest) -> None:
     """
     Send SRP request notification to the SRP teams Discord channel
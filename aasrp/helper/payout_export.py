@@ -0,0 +1,199 @@
+"""
+Payout export helper module.
+
+This module provides the rows and the streamed CSV/NDJSON serialisation for the
+payout export. Rows are read with `values()` and `iterator()`, so the memory usage
+of an export doesn't grow with the number of SRP requests.
+"""
+
+# Standard Library
+import csv
+import datetime as dt
+import json
+from collections.abc import Iterable, Iterator
+from enum import Enum
+
+# Django
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+
+# AA SRP
+from aasrp.models import SrpLink, SrpRequest
+
+# Number of rows fetched from the database at once
+PAYOUT_EXPORT_CHUNK_SIZE = 2000
+
+# Exported fields, in column order, and their column names
+PAYOUT_EXPORT_FIELDS = {
+    "srp_link__srp_code": "srp_code",
+    "srp_link__srp_name": "srp_name",
+    "srp_link__fleet_time": "fleet_time",
+    "srp_link__srp_status": "srp_status",
+    "request_code": "request_code",
+    "post_time": "request_time",
+    "character__character_id": "character_id",
+    "character__character_name": "character_name",
+    "creator__profile__main_character__character_name": "main_character_name",
+    "ship__name": "ship",
+    "killmail_id": "killmail_id",
+    "killboard_link": "killboard_link",
+    "loss_amount": "loss_amount",
+    "payout_amount": "payout_amount",
+}
+
+
+class PayoutExportFormat(str, Enum):
+    """
+    Formats of the payout export
+    """
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+    @property
+    def content_type(self) -> str:
+        """
+        The content type of the export format
+
+        :return:
+        :rtype:
+        """
+
+        return {
+            PayoutExportFormat.CSV: "text/csv; charset=utf-8",
+            PayoutExportFormat.NDJSON: "application/x-ndjson",
+        }[self]
+
+
+def get_payout_export_queryset(
+    srp_link: SrpLink | None = None,
+    date_from: dt.date | None = None,
+    date_to: dt.date | None = None,
+    unpaid_only: bool = False,
+) -> QuerySet:
+    """
+    Get the approved SRP requests for the payout export.
+
+    :param srp_link: Only export the SRP requests of this SRP link.
+    :type srp_link: SrpLink | None
+    :param date_from: Only export SRP links with a fleet time on or after this date.
+    :type date_from: dt.date | None
+    :param date_to: Only export SRP links with a fleet time on or before this date.
+    :type date_to: dt.date | None
+    :param unpaid_only: Only export SRP links that are not completed yet.
+    :type unpaid_only: bool
+    :return: The exported fields of the approved SRP requests.
+    :rtype: QuerySet
+    """
+
+    srp_requests = SrpRequest.objects.filter(request_status=SrpRequest.Status.APPROVED)
+
+    if srp_link is not None:
+        srp_requests = srp_requests.filter(srp_link=srp_link)
+
+    if date_from is not None:
+        srp_requests = srp_requests.filter(srp_link__fleet_time__date__gte=date_from)
+
+    if date_to is not None:
+        srp_requests = srp_requests.filter(srp_link__fleet_time__date__lte=date_to)
+
+    if unpaid_only:
+        srp_requests = srp_requests.exclude(
+            srp_link__srp_status=SrpLink.Status.COMPLETED
+        )
+
+    return srp_requests.order_by("srp_link__fleet_time", "srp_link_id", "pk").values(
+        *PAYOUT_EXPORT_FIELDS
+    )
+
+
+def _export_rows(rows: Iterable[dict]) -> Iterator[dict]:
+    """
+    Rename the fields of the exported rows to their column names.
+
+    :param rows: The rows, as returned by `get_payout_export_queryset`.
+    :type rows: Iterable[dict]
+    :return: The rows with their column names.
+    :rtype: Iterator[dict]
+    """
+
+    for row in rows:
+        yield {column: row[field] for field, column in PAYOUT_EXPORT_FIELDS.items()}
+
+
+class _Echo:  # pylint: disable=too-few-public-methods
+    """
+    File-like object that returns what is written to it, for `csv.writer`
+    """
+
+    @staticmethod
+    def write(value: str) -> str:
+        """
+        Return the written value instead of buffering it
+
+        :param value:
+        :type value:
+        :return:
+        :rtype:
+        """
+
+        return value
+
+
+def stream_csv(rows: Iterable[dict]) -> Iterator[str]:
+    """
+    Serialise the exported rows as CSV, one line at a time.
+
+    :param rows: The rows, as returned by `get_payout_export_queryset`.
+    :type rows: Iterable[dict]
+    :return: The CSV lines, starting with the header.
+    :rtype: Iterator[str]
+    """
+
+    writer = csv.DictWriter(_Echo(), fieldnames=list(PAYOUT_EXPORT_FIELDS.values()))
+
+    yield writer.writeheader()
+
+    for row in _export_rows(rows=rows):
+        yield writer.writerow(
+            {
+                column: value.isoformat() if isinstance(value, dt.datetime) else value
+                for column, value in row.items()
+            }
+        )
+
+
+def stream_ndjson(rows: Iterable[dict]) -> Iterator[str]:
+    """
+    Serialise the exported rows as newline-delimited JSON, one line at a time.
+
+    :param rows: The rows, as returned by `get_payout_export_queryset`.
+    :type rows: Iterable[dict]
+    :return: The JSON lines.
+    :rtype: Iterator[str]
+    """
+
+    for row in _export_rows(rows=rows):
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+def stream_payout_export(
+    queryset: QuerySet, export_format: PayoutExportFormat
+) -> Iterator[str]:
+    """
+    Stream the payout export in the given format.
+
+    :param queryset: The queryset, as returned by `get_payout_export_queryset`.
+    :type queryset: QuerySet
+    :param export_format: The export format.
+    :type export_format: PayoutExportFormat
+    :return: The lines of the export.
+    :rtype: Iterator[str]
+    """
+
+    rows = queryset.iterator(chunk_size=PAYOUT_EXPORT_CHUNK_SIZE)
+
+    if export_format == PayoutExportFormat.CSV:
+        return stream_csv(rows=rows)
+
+    return stream_ndjson(rows=rows)
@@ -4,8 +4,15 @@ User helper module.
 This module provides utility functions for working with user-related data in the AA SRP application.
 """
 
+# Standard Library
+from collections.abc import Iterable
+
+# Django
+from django.core.handlers.wsgi import WSGIRequest
+
 # Alliance Auth
 from allianceauth.authentication.models import User
+from allianceauth.framework.api.user import get_sentinel_user
 
 # AA SRP
 from aasrp.models import SrpRequest, UserSetting
@@ -27,6 +34,39 @@ def get_user_settings(user: User) -> UserSetting:
     return UserSetting.objects.get_or_create(user=user)[0]
 
 
+def get_user_settings_for_users(users: Iterable[User]) -> dict[int, UserSetting]:
+    """
+    Retrieve or create the settings of several users at once.
+
+    The existing settings are fetched with one query, the missing ones are created
+    with one bulk insert.
+
+    :param users: The users for which settings are to be retrieved or created.
+    :type users: Iterable[User]
+    :return: The settings by user ID.
+    :rtype: dict[int, UserSetting]
+    """
+
+    user_ids = {user.pk for user in users}
+    user_settings = {}
+
+    # Like get_or_create, use the first settings if a user has more than one
+    for user_setting in UserSetting.objects.filter(user_id__in=user_ids).order_by("pk"):
+        user_settings.setdefault(user_setting.user_id, user_setting)
+
+    missing_user_settings = UserSetting.objects.bulk_create(
+        [
+            UserSetting(user_id=user_id)
+            for user_id in sorted(user_ids - user_settings.keys())
+        ]
+    )
+
+    for user_setting in missing_user_settings:
+        user_settings[user_setting.user_id] = user_setting
+
+    return user_settings
+
+
 def get_pending_requests_count_for_user(user: User) -> int | None:
     """
     Retrieve the count of pending SRP (Ship Replacement Program) requests for the current user.
@@ -38,3 +78,46 @@ def get_pending_requests_count_for_user(user: User) -> int | None:
     """
 
     return SrpRequest.pending_requests_count_for_user(user=user)
+
+
+def get_main_character_names(
+    user_ids: Iterable[int | None], request: WSGIRequest | None = None
+) -> dict[int | None, str]:
+    """
+    Resolve the main character names of several users with a single query.
+
+    Names are resolved like `get_main_character_name_from_user`: users without a main
+    character are represented by their username, and a missing user (`None`) by the
+    sentinel user. If an HTTP request is given, resolved names are memoized on it, so
+    repeated lookups during the same request don't query the database again.
+
+    :param user_ids: The primary keys of the users, `None` for a missing user.
+    :type user_ids: Iterable[int | None]
+    :param request: The HTTP request to memoize the names on (optional).
+    :type request: WSGIRequest | None
+    :return: The main character names by user primary key.
+    :rtype: dict[int | None, str]
+    """
+
+    memo = getattr(request, "aasrp_main_character_names", None)
+
+    if memo is None:
+        memo = {}
+
+        if request is not None:
+            request.aasrp_main_character_names = memo
+
+    user_ids = set(user_ids)
+    missing_user_ids = user_ids - memo.keys()
+
+    if None in missing_user_ids:
+        memo[None] = get_sentinel_user().username
+        missing_user_ids.discard(None)
+
+    if missing_user_ids:
+        for user_id, username, main_character_name in User.objects.filter(
+            pk__in=missing_user_ids
+        ).values_list("pk", "username", "profile__main_character__character_name"):
+            memo[user_id] = main_character_name or username
+
+    return {user_id: memo[user_id] for user_id in user_ids if user_id in memo}
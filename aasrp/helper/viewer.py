@@ -0,0 +1,92 @@
+"""
+Viewer helper module.
+
+This module provides the capabilities of the user viewing a page, evaluated once per
+HTTP request, so table rows don't have to check the user's permissions one by one.
+"""
+
+# Standard Library
+from typing import NamedTuple
+
+# Django
+from django.core.handlers.wsgi import WSGIRequest
+
+# Alliance Auth
+from allianceauth.authentication.models import User
+
+
+class ViewerCapabilities(NamedTuple):
+    """
+    What the user viewing a page is allowed to do
+    """
+
+    can_manage_srp: bool = False
+    can_manage_srp_requests: bool = False
+
+    @classmethod
+    def for_user(cls, user: User) -> "ViewerCapabilities":
+        """
+        Evaluate the capabilities of a user
+
+        :param user: The user.
+        :type user: User
+        :return: The capabilities of the user.
+        :rtype: ViewerCapabilities
+        """
+
+        return cls(
+            can_manage_srp=user.has_perm("aasrp.manage_srp"),
+            can_manage_srp_requests=user.has_perm("aasrp.manage_srp_requests"),
+        )
+
+    @property
+    def can_view_srp_requests(self) -> bool:
+        """
+        Whether the user can view the SRP requests of SRP links
+
+        :return:
+        :rtype:
+        """
+
+        return self.can_manage_srp or self.can_manage_srp_requests
+
+    @property
+    def permission_tier(self) -> str:
+        """
+        The permission tier of the user.
+
+        Users in the same permission tier see the same rendering of an SRP request.
+
+        :return:
+        :rtype:
+        """
+
+        if self.can_manage_srp:
+            return "manage_srp"
+
+        if self.can_manage_srp_requests:
+            return "manage_srp_requests"
+
+        return "basic_access"
+
+
+def get_viewer_capabilities(request: WSGIRequest) -> ViewerCapabilities:
+    """
+    Get the capabilities of the user of an HTTP request.
+
+    The capabilities are evaluated on first use and kept on the request object.
+
+    :param request: The HTTP request.
+    :type request: WSGIRequest
+    :return: The capabilities of the requesting user.
+    :rtype: ViewerCapabilities
+    """
+
+    try:
+        return request.aasrp_viewer_capabilities
+    except AttributeError:
+        request.aasrp_viewer_capabilities = ViewerCapabilities.for_user(
+            user=request.user
+        )
+
+    return request.aasrp_viewer_capabilities
@@ -0,0 +1,119 @@
+"""
+Generate fake data for development, load tests and benchmarks.
+"""
+
+# Django
+from django.core.management.base import BaseCommand, CommandError
+
+# AA SRP
+from aasrp.helper.fake_data import BATCH_SIZE, generate_fake_data
+
+
+class Command(BaseCommand):
+    """
+    Django management command to fill the database with realistic fake users, fleet
+    types, SRP links, SRP requests, comments and insurance, e.g. to test the
+    performance of the views with a large database.
+    """
+
+    help = "Generate fake users, fleet types, SRP links and SRP requests"
+
+    def add_arguments(self, parser):
+        """
+        Add arguments to the command
+
+        :param parser:
+        :type parser:
+        :return:
+        :rtype:
+        """
+
+        parser.add_argument(
+            "--users", type=int, default=100, help="Number of users (default: 100)"
+        )
+        parser.add_argument(
+            "--alts", type=int, default=2, help="Number of alts per user (default: 2)"
+        )
+        parser.add_argument(
+            "--fleet-types",
+            type=int,
+            default=5,
+            help="Number of fleet types (default: 5)",
+        )
+        parser.add_argument(
+            "--srp-links",
+            type=int,
+            default=50,
+            help="Number of SRP links (default: 50)",
+        )
+        parser.add_argument(
+            "--srp-requests",
+            type=int,
+            default=1000,
+            help="Number of SRP requests (default: 1000)",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="Number of days the fleets are spread over (default: 365)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=42,
+            help="Seed of the random generator, the same seed generates the same data (default: 42)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BATCH_SIZE,
+            help=f"Rows per INSERT statement (default: {BATCH_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle the command
+
+        :param args:
+        :type args:
+        :param options:
+        :type options:
+        :return:
+        :rtype:
+        """
+
+        for option in ("users", "srp_links", "days", "batch_size"):
+            if options[option] < 1:
+                raise CommandError(f"--{option.replace('_', '-')} must be at least 1")
+
+        for option in ("alts", "fleet_types", "srp_requests"):
+            if options[option] < 0:
+                raise CommandError(f"--{option.replace('_', '-')} must not be negative")
+
+        try:
+            result = generate_fake_data(
+                users=options["users"],
+                alts=options["alts"],
+                fleet_types=options["fleet_types"],
+                srp_links=options["srp_links"],
+                srp_requests=options["srp_requests"],
+                seed=options["seed"],
+                days=options["days"],
+                batch_size=options["batch_size"],
+            )
+        except ValueError as exc:
+            raise CommandError(
+                f"{exc}, use another --seed to generate more fake data"
+            ) from exc
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {len(result.users)} users, "
+                f"{len(result.fleet_types)} fleet types, "
+                f"{len(result.srp_links)} SRP links, "
+                f"{result.srp_requests} SRP requests, "
+                f"{result.comments} comments and "
+                f"{result.insurances} insurance entries"
+            )
+        )
@@ -0,0 +1,99 @@
+"""
+Import killmails as SRP requests into an SRP link.
+"""
+
+# Standard Library
+from pathlib import Path
+
+# Django
+from django.core.management.base import BaseCommand, CommandError
+
+# AA SRP
+from aasrp.helper.killmail_import import import_killmails
+from aasrp.models import SrpLink
+
+
+class Command(BaseCommand):
+    """
+    Django management command to file SRP requests for a list of killmails at once,
+    e.g. for all losses of a fleet.
+    """
+
+    help = "Import killmails (killboard links or killmail IDs) as SRP requests into an SRP link"
+
+    def add_arguments(self, parser):
+        """
+        Add arguments to the command
+
+        :param parser:
+        :type parser:
+        :return:
+        :rtype:
+        """
+
+        parser.add_argument("srp_code", help="The SRP code of the SRP link")
+        parser.add_argument(
+            "entries", nargs="*", help="Killboard links and/or killmail IDs"
+        )
+        parser.add_argument(
+            "--file",
+            help="Read killboard links and/or killmail IDs from a file, one per line",
+        )
+        parser.add_argument(
+            "--info",
+            default="",
+            help="Additional information, added to every imported SRP request",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle the command
+
+        :param args:
+        :type args:
+        :param options:
+        :type options:
+        :return:
+        :rtype:
+        """
+
+        try:
+            srp_link = SrpLink.objects.get(srp_code=options["srp_code"])
+        except SrpLink.DoesNotExist as exc:
+            raise CommandError(
+                f"Unable to locate SRP link using SRP code {options['srp_code']}"
+            ) from exc
+
+        entries = list(options["entries"])
+
+        if options["file"]:
+            try:
+                entries += (
+                    Path(options["file"]).read_text(encoding="utf-8").splitlines()
+                )
+            except OSError as exc:
+                raise CommandError(f"Unable to read {options['file']}: {exc}") from exc
+
+        if not entries:
+            raise CommandError("No killboard links or killmail IDs given")
+
+        result = import_killmails(
+            srp_link=srp_link, entries=entries, additional_info=options["info"]
+        )
+
+        for killmail_id in result.duplicates:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Skipped killmail {killmail_id}, it already has an SRP request"
+                )
+            )
+
+        for entry, reason in result.failed.items():
+            self.stdout.write(self.style.ERROR(f"Unable to import {entry}: {reason}"))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {len(result.created)} SRP requests into SRP link "
+                f"{srp_link.srp_code}"
+            )
+        )
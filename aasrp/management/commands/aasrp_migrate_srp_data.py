@@ -18,6 +18,7 @@ from allianceauth.srp.models import SrpFleetMain
 
 # AA SRP
 from aasrp.helper.character import get_user_for_character
+from aasrp.helper.killboard import parse_killboard_link
 from aasrp.models import RequestComment, SrpLink, SrpRequest
 
 
@@ -165,14 +166,23 @@ class Command(BaseCommand):
                     ):
                         srp_userrequest_killboard_link = srp_userrequest.killboard_link
 
-                        try:
-                            # Check if the SRP request already exists
-                            SrpRequest.objects.get(
+                        srp_userrequest_killmail = parse_killboard_link(
+                            killboard_link=srp_userrequest_killboard_link
+                        )
+
+                        # Check if the SRP request already exists
+                        if srp_userrequest_killmail is not None:
+                            srp_request_exists = SrpRequest.objects.filter(
+                                killmail_id=srp_userrequest_killmail.killmail_id
+                            ).exists()
+                        else:
+                            srp_request_exists = SrpRequest.objects.filter(
                                 killboard_link=srp_userrequest_killboard_link
-                            )
+                            ).exists()
 
+                        if srp_request_exists:
                             srp_requests_skipped += 1
-                        except SrpRequest.DoesNotExist:
+                        else:
                             # Create a new SRP request
                             srp_userrequest_additional_info = (
                                 srp_userrequest.additional_info
@@ -0,0 +1,36 @@
+"""
+Rebuild the request statistics of all SRP links.
+"""
+
+# Django
+from django.core.management.base import BaseCommand
+
+# AA SRP
+from aasrp.models import SrpLink
+
+
+class Command(BaseCommand):
+    """
+    Django management command to recalculate the stored request statistics
+    (total cost and request counts) of all SRP links from their SRP requests.
+    """
+
+    help = "Rebuild the request statistics of all SRP links"
+
+    def handle(self, *args, **options):
+        """
+        Handle the command
+
+        :param args:
+        :type args:
+        :param options:
+        :type options:
+        :return:
+        :rtype:
+        """
+
+        updated = SrpLink.objects.update_request_stats()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt the request statistics of {updated} SRP links")
+        )
@@ -0,0 +1,59 @@
+"""
+Update the insurance price table from ESI.
+"""
+
+# Django
+from django.core.management.base import BaseCommand
+
+# AA SRP
+from aasrp.models import InsurancePrice
+
+
+class Command(BaseCommand):
+    """
+    Django management command to populate or update the insurance price table from ESI.
+    """
+
+    help = "Update the insurance price table from ESI"
+
+    def add_arguments(self, parser):
+        """
+        Add command arguments
+
+        :param parser:
+        :type parser:
+        :return:
+        :rtype:
+        """
+
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Fetch the insurance prices even if they have not changed (ignore the ETag)",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle the command
+
+        :param args:
+        :type args:
+        :param options:
+        :type options:
+        :return:
+        :rtype:
+        """
+
+        updated = InsurancePrice.objects.update_from_esi(force_refresh=options["force"])
+
+        if updated is None:
+            self.stdout.write(
+                self.style.WARNING(
+                    "Insurance prices have not been updated. "
+                    "Either they have not changed or ESI is not available."
+                )
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"Updated {updated} insurance prices from ESI")
+            )
@@ -4,20 +4,31 @@ This module contains custom managers for handling SRP (Ship Replacement Program)
 """
 
 # Standard Library
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 # Third Party
 import requests
-from httpx import Response
 
 # Django
-from django.db import models
+from django.core.cache import cache
+from django.db import connections, models, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 
 # Alliance Auth
 from allianceauth.services.hooks import get_extension_logger
 
 # AA SRP
-from aasrp.constants import KILLBOARD_DATA, UserAgent
+from aasrp.app_settings import (
+    AASRP_INSURANCE_PRICE_TABLE_TTL,
+    AASRP_PENDING_REQUESTS_COUNT_CACHE_TTL,
+)
+from aasrp.constants import KILLBOARD_DATA, PENDING_REQUESTS_COUNT_CACHE_KEY
+from aasrp.helper.config_cache import get_cached_config, invalidate_cached_config
+from aasrp.helper.killboard import parse_killboard_link
+from aasrp.providers import zkillboard
 from aasrp.providers.applogger import AppLogger
 from aasrp.providers.esi import ESIHandler, esi
 
@@ -25,12 +36,322 @@ from aasrp.providers.esi import ESIHandler, esi
 logger = AppLogger(my_logger=get_extension_logger(__name__))
 
 
+# Names of the configuration cache entries
+SETTING_CONFIG_CACHE_NAME = "setting"
+ENABLED_FLEET_TYPES_CONFIG_CACHE_NAME = "enabled-fleet-types"
+
+# Fields of an SRP request that the request statistics of its SRP link depend on
+SRP_LINK_STATS_DEPENDENCIES = {
+    "request_status",
+    "payout_amount",
+    "srp_link",
+    "srp_link_id",
+}
+
+# Fields of the character of an SRP request shown in the SRP request tables
+SRP_REQUEST_CHARACTER_FIELDS = (
+    "character__character_id",
+    "character__character_name",
+    "character__corporation_ticker",
+    "character__alliance_ticker",
+)
+
+# Fields of an SRP request, and its relations, shown in the SRP request tables
+SRP_REQUEST_TABLE_FIELDS = (
+    "request_code",
+    "creator",
+    "killboard_link",
+    "request_status",
+    "payout_amount",
+    "loss_amount",
+    "post_time",
+    "version",
+    "srp_link__srp_code",
+    "srp_link__srp_name",
+    "srp_link__srp_status",
+    "ship__name",
+    *SRP_REQUEST_CHARACTER_FIELDS,
+)
+
+
+class SrpRequestQuerySet(models.QuerySet):
+    """
+    Custom queryset for SRP requests.
+
+    Bulk updates and deletes keep the request statistics of the affected SRP links up to date.
+    """
+
+    def for_manager_table(self) -> "SrpRequestQuerySet":
+        """
+        SRP requests for the SRP requests table of an SRP link.
+
+        Joins the SRP link, character and ship, and only loads the columns shown in the table.
+
+        :return: The SRP requests.
+        :rtype: SrpRequestQuerySet
+        """
+
+        return self.select_related("srp_link", "character", "ship").only(
+            *SRP_REQUEST_TABLE_FIELDS
+        )
+
+    def for_own_table(self) -> "SrpRequestQuerySet":
+        """
+        SRP requests for the table of a user's own SRP requests.
+
+        Joins the SRP link, character and ship, and only loads the columns shown in the table.
+
+        :return: The SRP requests.
+        :rtype: SrpRequestQuerySet
+        """
+
+        return self.select_related("srp_link", "character", "ship").only(
+            "request_code",
+            "killboard_link",
+            "request_status",
+            "payout_amount",
+            "loss_amount",
+            "post_time",
+            "srp_link__srp_code",
+            "srp_link__srp_name",
+            "ship__name",
+            *SRP_REQUEST_CHARACTER_FIELDS,
+        )
+
+    def for_detail(self) -> "SrpRequestQuerySet":
+        """
+        SRP requests for the SRP request details.
+
+        Joins the SRP link, character, ship and the requester's main character,
+        and only loads the columns of the relations that are shown.
+
+        :return: The SRP requests.
+        :rtype: SrpRequestQuerySet
+        """
+
+        return self.select_related(
+            "srp_link", "character", "ship", "creator__profile__main_character"
+        ).only(
+            "request_code",
+            "killboard_link",
+            "request_status",
+            "payout_amount",
+            "loss_amount",
+            "post_time",
+            "version",
+            "srp_link__srp_code",
+            "srp_link__srp_status",
+            "ship__name",
+            "creator__username",
+            "creator__profile__main_character__character_name",
+            *SRP_REQUEST_CHARACTER_FIELDS,
+        )
+
+    def _update_srp_link_stats(self, srp_link_ids: set[int]) -> None:
+        """
+        Update the request statistics of the given SRP links.
+
+        :param srp_link_ids: The IDs of the SRP links to update.
+        :type srp_link_ids: set[int]
+        :return:
+        :rtype:
+        """
+
+        # AA SRP
+        from aasrp.models import (  # pylint: disable=import-outside-toplevel
+            SrpLink,
+        )
+
+        if srp_link_ids:
+            SrpLink.objects.filter(pk__in=srp_link_ids).update_request_stats()
+
+    def bulk_update(self, objs, fields, batch_size=None) -> int:
+        """
+        Bulk update the given SRP requests and the statistics of their SRP links.
+
+        :param objs: The SRP requests to update.
+        :type objs: Iterable[SrpRequest]
+        :param fields: The fields to update.
+        :type fields: Iterable[str]
+        :param batch_size: The number of SRP requests to update per query.
+        :type batch_size: int | None
+        :return: The number of updated rows.
+        :rtype: int
+        """
+
+        objs = list(objs)
+        fields = list(fields)
+
+        # Invalidate cached renderings of the SRP requests. The versions are
+        # incremented by the database, so concurrent updates get distinct versions.
+        for obj in objs:
+            obj.version = F("version") + 1
+
+        if "version" not in fields:
+            fields.append("version")
+
+        srp_link_ids = {obj.srp_link_id for obj in objs}
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            if {"srp_link", "srp_link_id"}.intersection(fields):
+                # The SRP requests might be moved to other SRP links, whose
+                # statistics have to be updated as well
+                srp_link_ids.update(
+                    self.model.objects.filter(
+                        pk__in=[obj.pk for obj in objs]
+                    ).values_list("srp_link_id", flat=True)
+                )
+
+            rows_updated = super().bulk_update(objs, fields, batch_size=batch_size)
+
+            versions = dict(
+                self.model.objects.filter(pk__in=[obj.pk for obj in objs]).values_list(
+                    "pk", "version"
+                )
+            )
+
+            for obj in objs:
+                obj.version = versions.get(obj.pk, obj.version)
+
+            if SRP_LINK_STATS_DEPENDENCIES.intersection(fields):
+                self._update_srp_link_stats(srp_link_ids)
+
+        # Bulk updates don't send signals
+        if "request_status" in fields:
+            SrpRequestManager.invalidate_pending_requests_count()
+
+        return rows_updated
+
+    def update(self, **kwargs) -> int:
+        """
+        Update the SRP requests and the statistics of their SRP links.
+
+        :param kwargs: The fields to update.
+        :type kwargs: dict
+        :return: The number of updated rows.
+        :rtype: int
+        """
+
+        # Invalidate cached renderings of the SRP requests
+        kwargs.setdefault("version", F("version") + 1)
+
+        if not SRP_LINK_STATS_DEPENDENCIES.intersection(kwargs):
+            return super().update(**kwargs)
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            srp_link_ids = set(self.values_list("srp_link_id", flat=True))
+            rows_updated = super().update(**kwargs)
+
+            if {"srp_link", "srp_link_id"}.intersection(kwargs):
+                srp_link_ids.update(self.values_list("srp_link_id", flat=True))
+
+            self._update_srp_link_stats(srp_link_ids)
+
+        # Queryset updates don't send signals
+        if "request_status" in kwargs:
+            SrpRequestManager.invalidate_pending_requests_count()
+
+        return rows_updated
+
+    def delete(self) -> tuple[int, dict[str, int]]:
+        """
+        Delete the SRP requests and update the statistics of their SRP links.
+
+        :return: The number of deleted objects and the number of deletions per model.
+        :rtype: tuple[int, dict[str, int]]
+        """
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            srp_link_ids = set(self.values_list("srp_link_id", flat=True))
+            deleted = super().delete()
+
+            self._update_srp_link_stats(srp_link_ids)
+
+        return deleted
+
+
 class SrpRequestManager(models.Manager):
     """
     Custom manager for handling SRP requests.
     Provides methods to interact with zKillboard and ESI for retrieving killmail data.
     """
 
+    def get_queryset(self) -> SrpRequestQuerySet:
+        """
+        Retrieve the custom queryset for SRP requests.
+
+        :return: A SrpRequestQuerySet instance.
+        :rtype: SrpRequestQuerySet
+        """
+
+        return SrpRequestQuerySet(self.model, using=self._db)
+
+    def for_manager_table(self) -> SrpRequestQuerySet:
+        """
+        SRP requests for the SRP requests table of an SRP link.
+
+        :return: The SRP requests.
+        :rtype: SrpRequestQuerySet
+        """
+
+        return self.get_queryset().for_manager_table()
+
+    def for_own_table(self) -> SrpRequestQuerySet:
+        """
+        SRP requests for the table of a user's own SRP requests.
+
+        :return: The SRP requests.
+        :rtype: SrpRequestQuerySet
+        """
+
+        return self.get_queryset().for_own_table()
+
+    def for_detail(self) -> SrpRequestQuerySet:
+        """
+        SRP requests for the SRP request details.
+
+        :return: The SRP requests.
+        :rtype: SrpRequestQuerySet
+        """
+
+        return self.get_queryset().for_detail()
+
+    def pending_requests_count(self) -> int:
+        """
+        Get the number of pending SRP requests.
+
+        The number is cached and invalidated whenever an SRP request is added,
+        changes its status or is removed.
+
+        :return: The number of pending SRP requests.
+        :rtype: int
+        """
+
+        return cache.get_or_set(
+            key=PENDING_REQUESTS_COUNT_CACHE_KEY,
+            default=lambda: self.filter(
+                request_status=self.model.Status.PENDING
+            ).count(),
+            timeout=AASRP_PENDING_REQUESTS_COUNT_CACHE_TTL,
+        )
+
+    @staticmethod
+    def invalidate_pending_requests_count() -> None:
+        """
+        Invalidate the cached number of pending SRP requests.
+
+        The cache is cleared right away and again after the current transaction
+        has been committed, so a concurrent request can't cache an outdated number.
+
+        :return:
+        :rtype:
+        """
+
+        cache.delete(key=PENDING_REQUESTS_COUNT_CACHE_KEY)
+        transaction.on_commit(
+            lambda: cache.delete(key=PENDING_REQUESTS_COUNT_CACHE_KEY)
+        )
+
     @staticmethod
     def get_kill_id(killboard_link: str) -> str:
         """
@@ -38,14 +359,14 @@ class SrpRequestManager(models.Manager):
 
         :param killboard_link: The killboard link containing the killmail ID.
         :type killboard_link: str
-        :return: The extracted killmail ID.
+        :return: The extracted killmail ID, or an empty string if the link isn't
+            a link to a killmail on an accepted killboard.
         :rtype: str
         """
 
-        num_set = "0123456789"
-        kill_id = "".join(c for c in killboard_link if c in num_set)
+        killmail = parse_killboard_link(killboard_link=killboard_link)
 
-        return kill_id
+        return str(killmail.killmail_id) if killmail else ""
 
     @staticmethod
     def get_zkillboard_data(kill_id: str) -> dict | None:
@@ -63,14 +384,7 @@ class SrpRequestManager(models.Manager):
         killmail_api_url = f"{zkillboard_api_url}killID/{kill_id}/"
 
         try:
-            response = requests.get(
-                url=killmail_api_url,
-                headers={
-                    "User-Agent": UserAgent.REQUESTS.value,
-                    "Content-Type": "application/json",
-                },
-                timeout=5,
-            )
+            response = zkillboard.get_session().get(url=killmail_api_url, timeout=5)
             response.raise_for_status()
             result_killmails = response.json()
 
@@ -98,7 +412,7 @@ class SrpRequestManager(models.Manager):
             return result
 
         except (requests.HTTPError, requests.Timeout) as exc:
-            logger.warning(f"Error fetching kill mail details: {exc}", exc_info=True)
+            logger.warning("Error fetching kill mail details: %s", exc, exc_info=True)
 
             raise ValueError(str(exc)) from exc
         except Exception as exc:
@@ -109,6 +423,9 @@ class SrpRequestManager(models.Manager):
         """
         Retrieve detailed killmail data, including ship type, loss value, and victim ID.
 
+        The killmail cache is checked first, zKillboard and ESI are only called
+        for killmails that haven't been fetched before.
+
         :param killmail_id: The ID of the killmail to fetch.
         :type killmail_id: str
         :param loss_value_field: The field name for the loss value in the zKillboard data.
@@ -120,22 +437,22 @@ class SrpRequestManager(models.Manager):
         :rtype: dict[str, int | float | None]
         """
 
-        zkillboard_data = SrpRequestManager.get_zkillboard_data(kill_id=killmail_id)
-
-        esi_killmail = ESIHandler.result(
-            operation=esi.client.Killmails.GetKillmailsKillmailIdKillmailHash(
-                killmail_id=killmail_id,
-                killmail_hash=zkillboard_data.get("zkb", {}).get("hash"),
-            ),
-            use_etag=False,
+        # AA SRP
+        from aasrp.models import (  # pylint: disable=import-outside-toplevel
+            Killmail,
         )
 
-        ship_type_id = esi_killmail.victim.ship_type_id
-        ship_value = zkillboard_data.get("zkb", {}).get(loss_value_field, 0)
-        victim_id = esi_killmail.victim.character_id
+        killmail = Killmail.objects.get_or_fetch(killmail_id=killmail_id)
+
+        ship_type_id = killmail.ship_type_id
+        ship_value = killmail.zkb.get(loss_value_field, 0)
+        victim_id = killmail.victim_character_id
 
         logger.debug(
-            f"Kill ID {killmail_id}: Ship type = {ship_type_id}, Loss value = {ship_value}"
+            "Kill ID %s: Ship type = %s, Loss value = %s",
+            killmail_id,
+            ship_type_id,
+            ship_value,
         )
 
         return {
@@ -145,26 +462,429 @@ class SrpRequestManager(models.Manager):
         }
 
     @staticmethod
-    def get_insurance_for_ship_type(ship_type_id: int) -> Response | None:
+    def get_insurance_for_ship_type(ship_type_id: int) -> list[dict]:
         """
-        Retrieve insurance details for a given ship type ID from the ESI.
+        Retrieve the insurance levels for a given ship type ID from the local insurance price table.
 
         :param ship_type_id: The ID of the ship type to fetch insurance for.
         :type ship_type_id: int
-        :return: The insurance details for the ship type, or None if not found.
-        :rtype: dict | None
+        :return: The insurance levels (name, cost, payout) for the ship type, or an empty list if not found.
+        :rtype: list[dict]
+        """
+
+        # AA SRP
+        from aasrp.models import (  # pylint: disable=import-outside-toplevel
+            InsurancePrice,
+        )
+
+        return InsurancePrice.objects.get_levels(type_id=ship_type_id)
+
+
+class InsurancePriceManager(models.Manager):
+    """
+    Custom manager for the insurance price table.
+
+    The table is refreshed from ESI by a periodic task. Lookups are served from an
+    in-memory copy of the table, which is reloaded from the database when it is
+    older than `AASRP_INSURANCE_PRICE_TABLE_TTL` seconds.
+    """
+
+    _price_table: dict[int, list[dict]] | None = None
+    _price_table_loaded_at: float = 0.0
+
+    def get_levels(self, type_id: int) -> list[dict]:
+        """
+        Get the insurance levels for a ship type.
+
+        :param type_id: The ID of the ship type.
+        :type type_id: int
+        :return: The insurance levels for the ship type, or an empty list if not found.
+        :rtype: list[dict]
+        """
+
+        if (
+            InsurancePriceManager._price_table is None
+            or time.monotonic() - InsurancePriceManager._price_table_loaded_at
+            > AASRP_INSURANCE_PRICE_TABLE_TTL
+        ):
+            InsurancePriceManager._price_table = dict(
+                self.values_list("type_id", "levels")
+            )
+            InsurancePriceManager._price_table_loaded_at = time.monotonic()
+
+            logger.debug(
+                "Loaded %d insurance prices into memory",
+                len(InsurancePriceManager._price_table),
+            )
+
+        return InsurancePriceManager._price_table.get(type_id, [])
+
+    @staticmethod
+    def clear_price_table() -> None:
+        """
+        Clear the in-memory insurance price table, so it is reloaded on the next lookup.
+
+        :return:
+        :rtype:
+        """
+
+        InsurancePriceManager._price_table = None
+
+    def update_from_esi(self, force_refresh: bool = False) -> int | None:
+        """
+        Update the insurance price table from ESI.
+
+        The request uses ETags, so nothing is updated when the prices have not changed.
+
+        :param force_refresh: Ignore the ETag and always fetch the prices.
+        :type force_refresh: bool
+        :return: The number of updated insurance prices, or None if nothing was updated.
+        :rtype: int | None
         """
 
         insurance_from_esi = ESIHandler.result(
-            operation=esi.client.Insurance.GetInsurancePrices(), use_etag=False
+            operation=esi.client.Insurance.GetInsurancePrices(),
+            use_etag=True,
+            force_refresh=force_refresh,
         )
 
-        insurance = next(
-            (i for i in insurance_from_esi if i.type_id == ship_type_id),
-            None,
+        if not insurance_from_esi:
+            logger.debug("Insurance prices have not changed, nothing to update")
+
+            return None
+
+        insurance_prices = [
+            self.model(
+                type_id=insurance.type_id,
+                levels=[
+                    {
+                        "name": level.name,
+                        "cost": level.cost,
+                        "payout": level.payout,
+                    }
+                    for level in insurance.levels
+                ],
+            )
+            for insurance in insurance_from_esi
+        ]
+
+        with transaction.atomic():
+            self.all().delete()
+            self.bulk_create(insurance_prices, batch_size=500)
+
+        self.clear_price_table()
+
+        logger.info("Updated %d insurance prices from ESI", len(insurance_prices))
+
+        return len(insurance_prices)
+
+
+class KillmailManager(models.Manager):
+    """
+    Custom manager for the killmail cache.
+    """
+
+    def get_or_fetch(self, killmail_id: int | str) -> models.Model:
+        """
+        Retrieve a killmail from the cache, or fetch it from zKillboard and ESI and cache it.
+
+        :param killmail_id: The ID of the killmail.
+        :type killmail_id: int | str
+        :return: The cached killmail.
+        :rtype: Killmail
+        :raises ValueError: If the killmail can't be fetched.
+        """
+
+        try:
+            killmail_id = int(killmail_id)
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Invalid Kill ID or Hash.") from exc
+
+        killmail = self.filter(killmail_id=killmail_id).first()
+
+        if killmail is not None:
+            logger.debug("Kill ID %s: Found in killmail cache", killmail_id)
+
+            return killmail
+
+        killmail, _ = self.update_or_create(
+            killmail_id=killmail_id,
+            defaults=self._fetch_killmail_data(killmail_id=killmail_id),
+        )
+
+        return killmail
+
+    def get_or_fetch_many(
+        self, killmail_ids: list[int], max_workers: int = 4
+    ) -> tuple[dict[int, models.Model], dict[int, str]]:
+        """
+        Retrieve killmails from the cache, fetching the missing ones concurrently.
+
+        Killmails that are not cached yet are fetched from zKillboard and ESI by a
+        bounded pool of worker threads and cached with a single bulk insert.
+
+        :param killmail_ids: The IDs of the killmails.
+        :type killmail_ids: list[int]
+        :param max_workers: The maximum number of concurrent fetches.
+        :type max_workers: int
+        :return: The killmails by killmail ID, and the errors by killmail ID for
+            killmails that couldn't be fetched.
+        :rtype: tuple[dict[int, Killmail], dict[int, str]]
+        """
+
+        killmail_ids = list(dict.fromkeys(killmail_ids))
+        killmails = {
+            killmail.killmail_id: killmail
+            for killmail in self.filter(killmail_id__in=killmail_ids)
+        }
+        missing_ids = [
+            killmail_id for killmail_id in killmail_ids if killmail_id not in killmails
+        ]
+        errors = {}
+
+        if not missing_ids:
+            return killmails, errors
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(missing_ids)))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._fetch_killmail_data_in_worker, killmail_id
+                ): killmail_id
+                for killmail_id in missing_ids
+            }
+
+            for future in as_completed(futures):
+                killmail_id = futures[future]
+
+                try:
+                    killmail_data = future.result()
+                except ValueError as exc:
+                    logger.warning("Unable to fetch killmail %s: %s", killmail_id, exc)
+
+                    errors[killmail_id] = str(exc)
+                else:
+                    killmails[killmail_id] = self.model(
+                        killmail_id=killmail_id, **killmail_data
+                    )
+
+        self.bulk_create(
+            [
+                killmails[killmail_id]
+                for killmail_id in missing_ids
+                if killmail_id in killmails
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+
+        return killmails, errors
+
+    @staticmethod
+    def _fetch_killmail_data_in_worker(killmail_id: int) -> dict[str, Any]:
+        """
+        Fetch a killmail in a worker thread of `get_or_fetch_many`.
+
+        Django opens a database connection per thread, so the connections the
+        worker thread opened are closed when it's done.
+
+        :param killmail_id: The ID of the killmail.
+        :type killmail_id: int
+        :return: The killmail data, in the fields of the Killmail model.
+        :rtype: dict[str, Any]
+        :raises ValueError: If the killmail can't be fetched.
+        """
+
+        try:
+            return KillmailManager._fetch_killmail_data(killmail_id=killmail_id)
+        finally:
+            connections.close_all()
+
+    @staticmethod
+    def _fetch_killmail_data(killmail_id: int) -> dict[str, Any]:
+        """
+        Fetch a killmail from zKillboard and ESI.
+
+        :param killmail_id: The ID of the killmail.
+        :type killmail_id: int
+        :return: The killmail data, in the fields of the Killmail model.
+        :rtype: dict[str, Any]
+        :raises ValueError: If the killmail can't be fetched.
+        """
+
+        zkillboard_data = SrpRequestManager.get_zkillboard_data(
+            kill_id=str(killmail_id)
+        )
+        killmail_hash = zkillboard_data.get("zkb", {}).get("hash")
+
+        esi_killmail = ESIHandler.result(
+            operation=esi.client.Killmails.GetKillmailsKillmailIdKillmailHash(
+                killmail_id=killmail_id, killmail_hash=killmail_hash
+            ),
+            use_etag=False,
+        )
+
+        if esi_killmail is None:
+            raise ValueError("No kill mail information found on ESI.")
+
+        victim = esi_killmail.victim
+
+        return {
+            "killmail_hash": killmail_hash,
+            "killmail_time": getattr(esi_killmail, "killmail_time", None),
+            "victim_character_id": victim.character_id,
+            "victim_corporation_id": getattr(victim, "corporation_id", None),
+            "victim_alliance_id": getattr(victim, "alliance_id", None),
+            "ship_type_id": victim.ship_type_id,
+            "items": [
+                item.model_dump(mode="json") if hasattr(item, "model_dump") else item
+                for item in (getattr(victim, "items", None) or [])
+            ],
+            "zkb": zkillboard_data.get("zkb", {}),
+        }
+
+    def prewarm(self, killmail_ids: list[int]) -> tuple[int, int]:
+        """
+        Fetch and cache all given killmails that are not cached yet.
+
+        :param killmail_ids: The IDs of the killmails to cache.
+        :type killmail_ids: list[int]
+        :return: The number of newly cached killmails and the number of failures.
+        :rtype: tuple[int, int]
+        """
+
+        cached_ids = set(
+            self.filter(killmail_id__in=killmail_ids).values_list(
+                "killmail_id", flat=True
+            )
+        )
+        cached = 0
+        failed = 0
+
+        for killmail_id in dict.fromkeys(killmail_ids):
+            if killmail_id in cached_ids:
+                continue
+
+            try:
+                self.get_or_fetch(killmail_id=killmail_id)
+            except ValueError as exc:
+                logger.warning("Unable to cache killmail %s: %s", killmail_id, exc)
+
+                failed += 1
+            else:
+                cached += 1
+
+        return cached, failed
+
+
+class SrpLinkQuerySet(models.QuerySet):
+    """
+    Custom queryset for SRP links.
+    """
+
+    def for_dashboard(self) -> "SrpLinkQuerySet":
+        """
+        SRP links for the dashboard table.
+
+        Joins the fleet type, and only loads the columns shown in the table.
+
+        :return: The SRP links.
+        :rtype: SrpLinkQuerySet
+        """
+
+        return self.select_related("fleet_type").only(
+            "srp_name",
+            "srp_code",
+            "srp_status",
+            "creator",
+            "fleet_time",
+            "fleet_doctrine",
+            "aar_link",
+            "stats_total_cost",
+            "stats_pending_requests",
+            "fleet_type__name",
+        )
+
+    def update_request_stats(self) -> int:
+        """
+        Recalculate the stored request statistics of the SRP links from their SRP requests.
+
+        All SRP links of the queryset are updated with a single SQL statement.
+
+        :return: The number of updated SRP links.
+        :rtype: int
+        """
+
+        # AA SRP
+        from aasrp.models import (  # pylint: disable=import-outside-toplevel
+            SrpRequest,
+        )
+
+        def _stat(aggregate, status: str | None = None) -> Coalesce:
+            srp_requests = SrpRequest.objects.order_by().filter(srp_link=OuterRef("pk"))
+
+            if status is not None:
+                srp_requests = srp_requests.filter(request_status=status)
+
+            return Coalesce(
+                Subquery(
+                    srp_requests.values("srp_link")
+                    .annotate(value=aggregate)
+                    .values("value")
+                ),
+                0,
+            )
+
+        return self.update(
+            stats_total_cost=_stat(
+                Sum("payout_amount"), status=SrpRequest.Status.APPROVED
+            ),
+            stats_total_requests=_stat(Count("pk")),
+            stats_pending_requests=_stat(Count("pk"), status=SrpRequest.Status.PENDING),
+            stats_approved_requests=_stat(
+                Count("pk"), status=SrpRequest.Status.APPROVED
+            ),
+            stats_rejected_requests=_stat(
+                Count("pk"), status=SrpRequest.Status.REJECTED
+            ),
         )
 
-        return insurance
+
+class SrpLinkManager(models.Manager):
+    """
+    Custom manager for handling SRP links.
+    """
+
+    def get_queryset(self) -> SrpLinkQuerySet:
+        """
+        Retrieve the custom queryset for SRP links.
+
+        :return: A SrpLinkQuerySet instance.
+        :rtype: SrpLinkQuerySet
+        """
+
+        return SrpLinkQuerySet(self.model, using=self._db)
+
+    def for_dashboard(self) -> SrpLinkQuerySet:
+        """
+        SRP links for the dashboard table.
+
+        :return: The SRP links.
+        :rtype: SrpLinkQuerySet
+        """
+
+        return self.get_queryset().for_dashboard()
+
+    def update_request_stats(self) -> int:
+        """
+        Recalculate the stored request statistics of all SRP links.
+
+        :return: The number of updated SRP links.
+        :rtype: int
+        """
+
+        return self.get_queryset().update_request_stats()
 
 
 class SettingQuerySet(models.QuerySet):
@@ -184,6 +904,22 @@ class SettingQuerySet(models.QuerySet):
 
         return super().update()
 
+    def update(self, **kwargs) -> int:
+        """
+        Update the settings and invalidate the cached settings.
+
+        :param kwargs: The fields to update.
+        :type kwargs: dict
+        :return: The number of updated rows.
+        :rtype: int
+        """
+
+        rows_updated = super().update(**kwargs)
+
+        SettingManager.invalidate_cache()
+
+        return rows_updated
+
 
 class SettingManager(models.Manager):
     """
@@ -191,6 +927,31 @@ class SettingManager(models.Manager):
     Provides methods to retrieve and manage settings.
     """
 
+    def get_cached(self):
+        """
+        Retrieve the settings from the configuration cache.
+
+        The settings are cached until they are saved, see `invalidate_cache`.
+
+        :return: The settings, or None if they haven't been saved yet.
+        :rtype: Setting | None
+        """
+
+        return get_cached_config(
+            name=SETTING_CONFIG_CACHE_NAME, loader=self.get_queryset().first
+        )
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """
+        Invalidate the cached settings.
+
+        :return:
+        :rtype:
+        """
+
+        invalidate_cached_config(SETTING_CONFIG_CACHE_NAME)
+
     def get_setting(self, setting_key: str) -> Any:
         """
         Retrieve the value of a specific setting by its key.
@@ -201,7 +962,7 @@ class SettingManager(models.Manager):
         :rtype: Any
         """
 
-        instance = self.get_queryset().first()
+        instance = self.get_cached()
 
         if instance is None:
             return None
@@ -217,3 +978,71 @@ class SettingManager(models.Manager):
         """
 
         return SettingQuerySet(self.model)
+
+
+class FleetTypeQuerySet(models.QuerySet):
+    """
+    Custom queryset for fleet types.
+    Invalidates the cached enabled fleet types on bulk updates.
+    """
+
+    def update(self, **kwargs) -> int:
+        """
+        Update the fleet types and invalidate the cached enabled fleet types.
+
+        :param kwargs: The fields to update.
+        :type kwargs: dict
+        :return: The number of updated rows.
+        :rtype: int
+        """
+
+        rows_updated = super().update(**kwargs)
+
+        FleetTypeManager.invalidate_cache()
+
+        return rows_updated
+
+
+class FleetTypeManager(models.Manager):
+    """
+    Custom manager for fleet types.
+    """
+
+    def get_queryset(self) -> FleetTypeQuerySet:
+        """
+        Retrieve the custom queryset for fleet types.
+
+        :return: A FleetTypeQuerySet instance.
+        :rtype: FleetTypeQuerySet
+        """
+
+        return FleetTypeQuerySet(self.model, using=self._db)
+
+    def enabled(self) -> list:
+        """
+        Retrieve the enabled fleet types, ordered by name, from the configuration cache.
+
+        The list is cached until a fleet type is saved, updated or deleted, see
+        `invalidate_cache`.
+
+        :return: The enabled fleet types.
+        :rtype: list[FleetType]
+        """
+
+        return get_cached_config(
+            name=ENABLED_FLEET_TYPES_CONFIG_CACHE_NAME,
+            loader=lambda: list(
+                self.get_queryset().filter(is_enabled=True).order_by("name")
+            ),
+        )
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """
+        Invalidate the cached enabled fleet types.
+
+        :return:
+        :rtype:
+        """
+
+        invalidate_cached_config(ENABLED_FLEET_TYPES_CONFIG_CACHE_NAME)
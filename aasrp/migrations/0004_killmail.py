@@ -0,0 +1,105 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:27
+
+# Django
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("aasrp", "0003_alliance_auth_proxy_models"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Killmail",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "killmail_id",
+                    models.PositiveBigIntegerField(
+                        unique=True, verbose_name="Killmail ID"
+                    ),
+                ),
+                (
+                    "killmail_hash",
+                    models.CharField(max_length=64, verbose_name="Killmail hash"),
+                ),
+                (
+                    "killmail_time",
+                    models.DateTimeField(
+                        blank=True,
+                        default=None,
+                        null=True,
+                        verbose_name="Killmail time",
+                    ),
+                ),
+                (
+                    "victim_character_id",
+                    models.PositiveBigIntegerField(
+                        blank=True,
+                        default=None,
+                        null=True,
+                        verbose_name="Victim character ID",
+                    ),
+                ),
+                (
+                    "victim_corporation_id",
+                    models.PositiveBigIntegerField(
+                        blank=True,
+                        default=None,
+                        null=True,
+                        verbose_name="Victim corporation ID",
+                    ),
+                ),
+                (
+                    "victim_alliance_id",
+                    models.PositiveBigIntegerField(
+                        blank=True,
+                        default=None,
+                        null=True,
+                        verbose_name="Victim alliance ID",
+                    ),
+                ),
+                (
+                    "ship_type_id",
+                    models.PositiveIntegerField(verbose_name="Ship type ID"),
+                ),
+                (
+                    "items",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Fitted, destroyed and dropped items of the victim",
+                        verbose_name="Items",
+                    ),
+                ),
+                (
+                    "zkb",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="zKillboard data, e.g. fitted value, total value, …",
+                        verbose_name="zKillboard data",
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created"),
+                ),
+            ],
+            options={
+                "verbose_name": "Killmail",
+                "verbose_name_plural": "Killmails",
+                "default_permissions": (),
+            },
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:33
+
+# Django
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("aasrp", "0004_killmail"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InsurancePrice",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "type_id",
+                    models.PositiveIntegerField(unique=True, verbose_name="Type ID"),
+                ),
+                (
+                    "levels",
+                    models.JSONField(
+                        blank=True,
+                        default=list,
+                        help_text="Insurance levels with their name, cost and payout",
+                        verbose_name="Insurance levels",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Insurance price",
+                "verbose_name_plural": "Insurance prices",
+                "default_permissions": (),
+            },
+        ),
+    ]
@@ -0,0 +1,105 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:37
+
+# Django
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+
+def _on_migrate(apps, schema_editor):
+    """
+    Data migration to populate the request statistics of the existing SRP links.
+    """
+
+    srp_link_model = apps.get_model("aasrp", "SrpLink")
+    db_alias = schema_editor.connection.alias
+
+    srp_links = list(
+        srp_link_model.objects.using(db_alias).annotate(
+            computed_total_cost=Coalesce(
+                Sum(
+                    "srp_requests__payout_amount",
+                    filter=Q(srp_requests__request_status="Approved"),
+                ),
+                0,
+            ),
+            computed_total_requests=Count("srp_requests"),
+            computed_pending_requests=Count(
+                "srp_requests", filter=Q(srp_requests__request_status="Pending")
+            ),
+            computed_approved_requests=Count(
+                "srp_requests", filter=Q(srp_requests__request_status="Approved")
+            ),
+            computed_rejected_requests=Count(
+                "srp_requests", filter=Q(srp_requests__request_status="Rejected")
+            ),
+        )
+    )
+
+    for srp_link in srp_links:
+        srp_link.stats_total_cost = srp_link.computed_total_cost
+        srp_link.stats_total_requests = srp_link.computed_total_requests
+        srp_link.stats_pending_requests = srp_link.computed_pending_requests
+        srp_link.stats_approved_requests = srp_link.computed_approved_requests
+        srp_link.stats_rejected_requests = srp_link.computed_rejected_requests
+
+    srp_link_model.objects.using(db_alias).bulk_update(
+        srp_links,
+        [
+            "stats_total_cost",
+            "stats_total_requests",
+            "stats_pending_requests",
+            "stats_approved_requests",
+            "stats_rejected_requests",
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("aasrp", "0005_insuranceprice"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="srplink",
+            name="stats_approved_requests",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Approved requests"
+            ),
+        ),
+        migrations.AddField(
+            model_name="srplink",
+            name="stats_pending_requests",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Pending requests"
+            ),
+        ),
+        migrations.AddField(
+            model_name="srplink",
+            name="stats_rejected_requests",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Rejected requests"
+            ),
+        ),
+        migrations.AddField(
+            model_name="srplink",
+            name="stats_total_cost",
+            field=models.BigIntegerField(
+                default=0, editable=False, verbose_name="Total cost"
+            ),
+        ),
+        migrations.AddField(
+            model_name="srplink",
+            name="stats_total_requests",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Total requests"
+            ),
+        ),
+        migrations.RunPython(
+            code=_on_migrate,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:48
+
+# Django
+from django.db import migrations, models
+from django.db.models import Count
+from django.utils.crypto import get_random_string
+
+
+def _on_migrate(apps, schema_editor):
+    """
+    Data migration to give SRP links with a duplicate (or empty) SRP code a new one,
+    so the SRP code can be made unique.
+    """
+
+    srp_link_model = apps.get_model("aasrp", "SrpLink")
+    db_alias = schema_editor.connection.alias
+
+    duplicate_srp_codes = (
+        srp_link_model.objects.using(db_alias)
+        .values("srp_code")
+        .annotate(count=Count("pk"))
+        .filter(count__gt=1)
+        .values_list("srp_code", flat=True)
+    )
+    srp_codes = set(
+        srp_link_model.objects.using(db_alias).values_list("srp_code", flat=True)
+    )
+
+    for srp_code in list(duplicate_srp_codes) + [""]:
+        srp_links = srp_link_model.objects.using(db_alias).filter(srp_code=srp_code)
+
+        # Keep the SRP code on the first SRP link, unless it's empty
+        if srp_code != "":
+            srp_links = srp_links.order_by("pk")[1:]
+
+        for srp_link in srp_links:
+            new_srp_code = get_random_string(length=16)
+
+            while new_srp_code in srp_codes:
+                new_srp_code = get_random_string(length=16)
+
+            srp_codes.add(new_srp_code)
+            srp_link.srp_code = new_srp_code
+            srp_link.save(update_fields=["srp_code"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("aasrp", "0006_srplink_request_stats"),
+    ]
+
+    operations = [
+        migrations.RunPython(_on_migrate, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="srplink",
+            name="srp_code",
+            field=models.CharField(
+                default="", max_length=16, unique=True, verbose_name="SRP code"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="srprequest",
+            index=models.Index(
+                fields=["srp_link", "request_status"], name="aasrp_req_link_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="srprequest",
+            index=models.Index(
+                fields=["creator", "request_status"],
+                name="aasrp_req_creator_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="srprequest",
+            index=models.Index(fields=["request_status"], name="aasrp_req_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="srprequest",
+            index=models.Index(
+                fields=["request_code", "srp_link"], name="aasrp_req_code_link_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:50
+
+# Standard Library
+import re
+
+# Django
+from django.db import migrations, models
+
+# Killmail URL patterns of the built-in killboards (`KILLBOARD_DATA`) at the time of
+# this migration, copied so the backfill doesn't depend on later code or settings
+KILLMAIL_URL_REGEXES = tuple(
+    re.compile(regex)
+    for regex in (
+        r"^http[s]?:\/\/zkillboard\.com\/kill\/(?P<killmail_id>\d+)(?:[\/?#]|$)",
+        r"^http[s]?:\/\/kb\.evetools\.org\/kill\/(?P<killmail_id>\d+)(?:[\/?#]|$)",
+        r"^http[s]?:\/\/eve-kill\.com\/kill\/(?P<killmail_id>\d+)(?:[\/?#]|$)",
+    )
+)
+
+# Largest value of a PositiveBigIntegerField
+MAX_KILLMAIL_ID = 9223372036854775807
+
+
+def _on_migrate(apps, schema_editor):
+    """
+    Data migration to populate the killmail ID of the existing SRP requests.
+
+    If the same killmail has been requested more than once, only the oldest
+    SRP request gets the killmail ID, since it has to be unique. SRP requests whose
+    killboard link doesn't contain a valid killmail ID are left without one.
+
+    The killmail ID is extracted with the killmail URL patterns of the built-in
+    killboards, like `parse_killboard_link` does for new SRP requests.
+    """
+
+    srp_request_model = apps.get_model("aasrp", "SrpRequest")
+    db_alias = schema_editor.connection.alias
+
+    killmail_ids = set()
+    srp_requests = []
+
+    for srp_request in (
+        srp_request_model.objects.using(db_alias)
+        .only("pk", "killboard_link")
+        .order_by("pk")
+        .iterator(chunk_size=2000)
+    ):
+        match = next(
+            (
+                match
+                for regex in KILLMAIL_URL_REGEXES
+                if (match := regex.match(srp_request.killboard_link or ""))
+            ),
+            None,
+        )
+
+        if match is None:
+            continue
+
+        killmail_id = int(match.group("killmail_id"))
+
+        if killmail_id > MAX_KILLMAIL_ID or killmail_id in killmail_ids:
+            continue
+
+        killmail_ids.add(killmail_id)
+        srp_request.killmail_id = killmail_id
+        srp_requests.append(srp_request)
+
+    srp_request_model.objects.using(db_alias).bulk_update(
+        srp_requests, ["killmail_id"], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("aasrp", "0007_srprequest_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="srprequest",
+            name="killmail_id",
+            field=models.PositiveBigIntegerField(
+                blank=True,
+                default=None,
+                editable=False,
+                help_text="Killmail ID, extracted from the killboard link",
+                null=True,
+                unique=True,
+                verbose_name="Killmail ID",
+            ),
+        ),
+        migrations.RunPython(_on_migrate, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:09
+
+# Django
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("aasrp", "0008_srprequest_killmail_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="srprequest",
+            name="version",
+            field=models.PositiveIntegerField(
+                default=1,
+                editable=False,
+                help_text="Incremented on every change, so cached renderings of the SRP request can be told apart from the current one",
+                verbose_name="Version",
+            ),
+        ),
+    ]
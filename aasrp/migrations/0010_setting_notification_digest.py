@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:06
+
+# Django
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("aasrp", "0009_srprequest_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="setting",
+            name="notification_digest",
+            field=models.BooleanField(
+                default=False,
+                help_text="Send one notification per requester for all of their SRP requests that are approved or rejected in one (bulk) action, instead of one notification per SRP request. (Default: Disabled)",
+                verbose_name="Notification digest",
+            ),
+        ),
+    ]
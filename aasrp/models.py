@@ -10,7 +10,8 @@ from eve_sde.models import ItemType
 from solo.models import SingletonModel
 
 # Django
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.utils import timezone
 from django.utils.crypto import get_random_string
 from django.utils.translation import gettext_lazy as _
@@ -21,7 +22,15 @@ from allianceauth.eveonline.models import EveCharacter
 from allianceauth.framework.api.user import get_main_character_name_from_user
 
 # AA SRP
-from aasrp.managers import SettingManager, SrpRequestManager
+from aasrp.managers import (
+    SRP_LINK_STATS_DEPENDENCIES,
+    FleetTypeManager,
+    InsurancePriceManager,
+    KillmailManager,
+    SettingManager,
+    SrpLinkManager,
+    SrpRequestManager,
+)
 
 
 def get_sentinel_user():
@@ -81,6 +90,8 @@ class FleetType(models.Model):
         verbose_name=_("Is enabled"),
     )
 
+    objects: ClassVar[FleetTypeManager] = FleetTypeManager()
+
     class Meta:  # pylint: disable=too-few-public-methods
         """
         Meta options for the FleetType model.
@@ -122,7 +133,9 @@ class SrpLink(models.Model):
         default=Status.ACTIVE,
         verbose_name=_("SRP status"),
     )
-    srp_code = models.CharField(max_length=16, default="", verbose_name=_("SRP code"))
+    srp_code = models.CharField(
+        max_length=16, unique=True, default="", verbose_name=_("SRP code")
+    )
     fleet_commander = models.ForeignKey(
         to=EveCharacter,
         related_name="+",
@@ -163,6 +176,25 @@ class SrpLink(models.Model):
         verbose_name=_("Creator"),
     )
 
+    # Request statistics, maintained by the SRP requests of this link
+    stats_total_cost = models.BigIntegerField(
+        default=0, editable=False, verbose_name=_("Total cost")
+    )
+    stats_total_requests = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name=_("Total requests")
+    )
+    stats_pending_requests = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name=_("Pending requests")
+    )
+    stats_approved_requests = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name=_("Approved requests")
+    )
+    stats_rejected_requests = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name=_("Rejected requests")
+    )
+
+    objects: ClassVar[SrpLinkManager] = SrpLinkManager()
+
     class Meta:  # pylint: disable=too-few-public-methods
         """
         Meta options for the SrpLink model.
@@ -196,22 +228,28 @@ class SrpLink(models.Model):
             # Generate a unique SRP code if it is not already set
             self.srp_code = get_random_string(length=16)
 
+        # Never overwrite the request statistics with possibly outdated values,
+        # they are maintained by the SRP requests
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and not field.name.startswith("stats_")
+            ]
+
         # Call the original save method to ensure the SRP link is saved to the database
         super().save(*args, **kwargs)
 
     @property
     def total_cost(self) -> int:
         """
-        Calculate the total payout amount for approved SRP requests linked to this SRP link.
+        Get the total payout amount for approved SRP requests linked to this SRP link.
 
         :return: The total payout amount.
         :rtype: int
         """
 
-        return sum(
-            int(r.payout_amount)
-            for r in self.srp_requests.filter(request_status=SrpRequest.Status.APPROVED)
-        )
+        return self.stats_total_cost
 
     def _count_requests_by_status(self, status: str) -> int:
         """
@@ -223,7 +261,7 @@ class SrpLink(models.Model):
         :rtype: int
         """
 
-        return self.srp_requests.filter(request_status=status).count()
+        return getattr(self, f"stats_{status.lower()}_requests")
 
     @property
     def total_requests_count(self) -> int:
@@ -234,7 +272,7 @@ class SrpLink(models.Model):
         :rtype: int
         """
 
-        return self.srp_requests.count()
+        return self.stats_total_requests
 
     @property
     def pending_requests_count(self) -> int:
@@ -328,6 +366,15 @@ class SrpRequest(models.Model):
     killboard_link = models.CharField(
         max_length=254, default="", verbose_name=_("Killboard link")
     )
+    killmail_id = models.PositiveBigIntegerField(
+        null=True,
+        blank=True,
+        default=None,
+        unique=True,
+        editable=False,
+        help_text=_("Killmail ID, extracted from the killboard link"),
+        verbose_name=_("Killmail ID"),
+    )
     additional_info = models.TextField(
         blank=True, default="", verbose_name=_("Additional information")
     )
@@ -351,6 +398,15 @@ class SrpRequest(models.Model):
     reject_info = models.TextField(
         blank=True, default="", verbose_name=_("Reject reason")
     )
+    version = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        help_text=_(
+            "Incremented on every change, so cached renderings of the SRP request "
+            "can be told apart from the current one"
+        ),
+        verbose_name=_("Version"),
+    )
 
     objects: ClassVar[SrpRequestManager] = SrpRequestManager()
 
@@ -362,6 +418,20 @@ class SrpRequest(models.Model):
         default_permissions = ()
         verbose_name = _("Request")
         verbose_name_plural = _("Requests")
+        indexes = [
+            models.Index(
+                fields=["srp_link", "request_status"],
+                name="aasrp_req_link_status_idx",
+            ),
+            models.Index(
+                fields=["creator", "request_status"],
+                name="aasrp_req_creator_status_idx",
+            ),
+            models.Index(fields=["request_status"], name="aasrp_req_status_idx"),
+            models.Index(
+                fields=["request_code", "srp_link"], name="aasrp_req_code_link_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         """
@@ -401,8 +471,69 @@ class SrpRequest(models.Model):
             # Generate a unique request code if it is not already set
             self.request_code = get_random_string(length=16)
 
-        # Call the original save method to ensure the SRP request is saved to the database
-        super().save(*args, **kwargs)
+        if self._state.adding and self.killmail_id is None and self.killboard_link:
+            # Extract the killmail ID, so duplicate requests can be found by index
+            self.killmail_id = (
+                SrpRequest.objects.get_kill_id(killboard_link=self.killboard_link)
+                or None
+            )
+
+        adding = self._state.adding
+
+        if not adding:
+            # Invalidate cached renderings of the SRP request. The version is
+            # incremented by the database, so concurrent saves get distinct versions.
+            self.version = F("version") + 1
+
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "version"}
+
+        update_fields = kwargs.get("update_fields")
+        srp_link_ids = {self.srp_link_id}
+
+        with transaction.atomic():
+            if not adding and (
+                update_fields is None
+                or {"srp_link", "srp_link_id"}.intersection(update_fields)
+            ):
+                # The SRP request might be moved to another SRP link, whose
+                # statistics have to be updated as well
+                srp_link_ids.add(
+                    SrpRequest.objects.filter(pk=self.pk)
+                    .values_list("srp_link_id", flat=True)
+                    .first()
+                )
+
+            # Call the original save method to ensure the SRP request is saved to the database
+            super().save(*args, **kwargs)
+
+            if not adding:
+                self.refresh_from_db(fields=["version"])
+
+            # Keep the request statistics of the SRP links up to date
+            if update_fields is None or SRP_LINK_STATS_DEPENDENCIES.intersection(
+                update_fields
+            ):
+                SrpLink.objects.filter(pk__in=srp_link_ids).update_request_stats()
+
+    def delete(self, *args, **kwargs) -> tuple[int, dict[str, int]]:
+        """
+        Override the delete method to update the request statistics of the SRP link.
+
+        :param args: Positional arguments for the delete method.
+        :type args: tuple
+        :param kwargs: Keyword arguments for the delete method.
+        :type kwargs: dict
+        :return: The number of deleted objects and the number of deletions per model.
+        :rtype: tuple[int, dict[str, int]]
+        """
+
+        with transaction.atomic():
+            deleted = super().delete(*args, **kwargs)
+
+            SrpLink.objects.filter(pk=self.srp_link_id).update_request_stats()
+
+        return deleted
 
     @staticmethod
     def pending_requests_count_for_user(user: User) -> int | None:
@@ -419,9 +550,7 @@ class SrpRequest(models.Model):
         if user.has_perm(perm="aasrp.manage_srp") or user.has_perm(
             perm="aasrp.manage_srp_requests"
         ):
-            return SrpRequest.objects.filter(
-                request_status=SrpRequest.Status.PENDING
-            ).count()
+            return SrpRequest.objects.pending_requests_count()
 
         return None
 
@@ -453,6 +582,105 @@ class Insurance(models.Model):
         verbose_name_plural = _("Ship insurances")
 
 
+class InsurancePrice(models.Model):
+    """
+    Insurance price table
+
+    The insurance levels of all ship types, as provided by ESI.
+    The table is kept up to date by the `update_insurance_prices` task.
+    """
+
+    type_id = models.PositiveIntegerField(unique=True, verbose_name=_("Type ID"))
+    levels = models.JSONField(
+        default=list,
+        blank=True,
+        help_text=_("Insurance levels with their name, cost and payout"),
+        verbose_name=_("Insurance levels"),
+    )
+
+    objects: ClassVar[InsurancePriceManager] = InsurancePriceManager()
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """
+        Meta options for the InsurancePrice model.
+        """
+
+        default_permissions = ()
+        verbose_name = _("Insurance price")
+        verbose_name_plural = _("Insurance prices")
+
+    def __str__(self) -> str:
+        """
+        Return the objects string name
+
+        :return:
+        :rtype:
+        """
+
+        return str(self.type_id)
+
+
+class Killmail(models.Model):
+    """
+    Killmail cache
+
+    Killmails are immutable, so once a killmail has been fetched from zKillboard
+    and ESI, it is stored here (keyed by its ID and hash) and never fetched again.
+    """
+
+    killmail_id = models.PositiveBigIntegerField(
+        unique=True, verbose_name=_("Killmail ID")
+    )
+    killmail_hash = models.CharField(max_length=64, verbose_name=_("Killmail hash"))
+    killmail_time = models.DateTimeField(
+        null=True, blank=True, default=None, verbose_name=_("Killmail time")
+    )
+    victim_character_id = models.PositiveBigIntegerField(
+        null=True, blank=True, default=None, verbose_name=_("Victim character ID")
+    )
+    victim_corporation_id = models.PositiveBigIntegerField(
+        null=True, blank=True, default=None, verbose_name=_("Victim corporation ID")
+    )
+    victim_alliance_id = models.PositiveBigIntegerField(
+        null=True, blank=True, default=None, verbose_name=_("Victim alliance ID")
+    )
+    ship_type_id = models.PositiveIntegerField(verbose_name=_("Ship type ID"))
+    items = models.JSONField(
+        default=list,
+        blank=True,
+        help_text=_("Fitted, destroyed and dropped items of the victim"),
+        verbose_name=_("Items"),
+    )
+    zkb = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text=_("zKillboard data, e.g. fitted value, total value, …"),
+        verbose_name=_("zKillboard data"),
+    )
+    created = models.DateTimeField(auto_now_add=True, verbose_name=_("Created"))
+
+    objects: ClassVar[KillmailManager] = KillmailManager()
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """
+        Meta options for the Killmail model.
+        """
+
+        default_permissions = ()
+        verbose_name = _("Killmail")
+        verbose_name_plural = _("Killmails")
+
+    def __str__(self) -> str:
+        """
+        Return the objects string name
+
+        :return:
+        :rtype:
+        """
+
+        return str(self.killmail_id)
+
+
 class RequestComment(models.Model):
     """
     SRP Request Comments model
@@ -571,6 +799,8 @@ class Setting(SingletonModel):
 
         LOSS_VALUE_SOURCE = "loss_value_source", _("Loss value source")
 
+        NOTIFICATION_DIGEST = "notification_digest", _("Notification digest")
+
     class LossValueSource(models.TextChoices):
         """
         Choices for Setting.LossValueSource
@@ -599,6 +829,16 @@ class Setting(SingletonModel):
         verbose_name=Field.LOSS_VALUE_SOURCE.label,  # pylint: disable=no-member
     )
 
+    notification_digest = models.BooleanField(
+        default=False,
+        help_text=_(
+            "Send one notification per requester for all of their SRP requests "
+            "that are approved or rejected in one (bulk) action, instead of one "
+            "notification per SRP request. (Default: Disabled)"
+        ),
+        verbose_name=Field.NOTIFICATION_DIGEST.label,  # pylint: disable=no-member
+    )
+
     objects: ClassVar[SettingManager] = SettingManager()
 
     class Meta:  # pylint: disable=too-few-public-methods
@@ -4,15 +4,75 @@ AppLogger provider
 
 # Standard Library
 import logging
+from collections.abc import Callable
+from typing import Any
 
 # AA SRP
 from aasrp import __title__
 
+_UNSET = object()
+
+
+class LazyValue:
+    """
+    A log message argument that is only computed when the message is formatted.
+
+    Wrap expensive arguments, e.g. database queries, so they cost nothing when the
+    log level is disabled:
+
+        logger.debug("Found %s SRP requests", LazyValue(srp_requests.count))
+
+    The value is computed once, even if several handlers format the message.
+    """
+
+    __slots__ = ("func", "args", "kwargs", "_value")
+
+    def __init__(self, func: Callable[..., Any], *args, **kwargs):
+        """
+        Initializes the lazy value with the function that computes it.
+
+        :param func: Function computing the value
+        :type func: Callable[..., Any]
+        :param args: Positional arguments of the function
+        :type args: Any
+        :param kwargs: Keyword arguments of the function
+        :type kwargs: Any
+        """
+
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self._value = _UNSET
+
+    @property
+    def value(self) -> Any:
+        """
+        The computed value
+
+        :return:
+        :rtype:
+        """
+
+        if self._value is _UNSET:
+            self._value = self.func(*self.args, **self.kwargs)
+
+        return self._value
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
 
 class AppLogger(logging.LoggerAdapter):
     """
     Custom logger adapter that adds a prefix to log messages.
 
+    Pass the arguments of a message separately (`logger.debug("Found %s", count)`)
+    instead of formatting it in advance, so the message is only formatted when its
+    level is enabled. Use `LazyValue` for arguments that are expensive to compute.
+
     Taken from the `allianceauth-app-utils` package.
     Credits to: Erik Kalkoken
     """
@@ -74,9 +74,15 @@ class ESIHandler:
         :rtype: Any | tuple[Any, Response] | None
         """
 
-        logger.debug(f"Handling ESI operation: {operation.operation.operationId}")
+        logger.debug("Handling ESI operation: %s", operation.operation.operationId)
         logger.debug(
-            f"Operation parameters: use_etag={use_etag}, return_response={return_response}, force_refresh={force_refresh}, use_cache={use_cache}, extra={extra}"
+            "Operation parameters: use_etag=%s, return_response=%s, "
+            "force_refresh=%s, use_cache=%s, extra=%s",
+            use_etag,
+            return_response,
+            force_refresh,
+            use_cache,
+            extra,
         )
 
         response: Response | None = None
@@ -96,7 +102,9 @@ class ESIHandler:
                 )
 
                 logger.debug(
-                    f"ESI Response for operation: {operation.operation.operationId}: {response}"
+                    "ESI Response for operation: %s: %s",
+                    operation.operation.operationId,
+                    response,
                 )
             else:
                 esi_result = operation.result(
@@ -108,7 +116,8 @@ class ESIHandler:
                 )
         except HTTPNotModified:
             logger.debug(
-                f"ESI returned 304 Not Modified for operation: {operation.operation.operationId} - Skipping update."
+                "ESI returned 304 Not Modified for operation: %s - Skipping update.",
+                operation.operation.operationId,
             )
 
             esi_result = None
@@ -119,7 +128,7 @@ class ESIHandler:
 
             esi_result = None
         except (HTTPClientError, RequestError) as exc:
-            logger.error(msg=f"Error while fetching data from ESI: {str(exc)}")
+            logger.error("Error while fetching data from ESI: %s", exc)
 
             esi_result = None
 
@@ -0,0 +1,61 @@
+"""
+zKillboard provider
+"""
+
+# Standard Library
+import threading
+
+# Third Party
+import requests
+from requests.adapters import HTTPAdapter
+
+# AA SRP
+from aasrp.constants import UserAgent
+
+
+def _create_session() -> requests.Session:
+    """
+    Create the HTTP session for the zKillboard API.
+
+    The session keeps its connections alive, so consecutive requests to zKillboard
+    don't need a new TCP/TLS handshake each.
+
+    :return: The HTTP session.
+    :rtype: requests.Session
+    """
+
+    zkillboard_session = requests.Session()
+    zkillboard_session.headers.update(
+        {
+            "User-Agent": UserAgent.REQUESTS.value,
+            "Content-Type": "application/json",
+        }
+    )
+    zkillboard_session.mount(
+        prefix="https://", adapter=HTTPAdapter(pool_connections=1, pool_maxsize=10)
+    )
+
+    return zkillboard_session
+
+
+# HTTP sessions for the zKillboard API, one per thread
+_thread_local = threading.local()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the HTTP session for the zKillboard API of the current thread.
+
+    `requests.Session` isn't thread-safe, so every thread, e.g. each worker thread
+    of a killmail import, gets its own session, which it reuses for all of its requests.
+
+    :return: The HTTP session.
+    :rtype: requests.Session
+    """
+
+    zkillboard_session = getattr(_thread_local, "session", None)
+
+    if zkillboard_session is None:
+        zkillboard_session = _thread_local.session = _create_session()
+
+    return zkillboard_session
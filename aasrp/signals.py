@@ -0,0 +1,97 @@
+"""
+Signals for AA-SRP
+"""
+
+# Django
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# AA SRP
+from aasrp.models import FleetType, Setting, SrpRequest
+
+
+@receiver(signal=post_save, sender=SrpRequest)
+def srp_request_saved(
+    sender, instance: SrpRequest, created: bool, update_fields, **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Invalidate the cached number of pending SRP requests when an SRP request
+    is added or its status may have changed.
+
+    :param sender:
+    :type sender:
+    :param instance:
+    :type instance:
+    :param created:
+    :type created:
+    :param update_fields:
+    :type update_fields:
+    :param kwargs:
+    :type kwargs:
+    :return:
+    :rtype:
+    """
+
+    if created or update_fields is None or "request_status" in update_fields:
+        SrpRequest.objects.invalidate_pending_requests_count()
+
+
+@receiver(signal=post_delete, sender=SrpRequest)
+def srp_request_deleted(
+    sender, instance: SrpRequest, **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Invalidate the cached number of pending SRP requests when an SRP request is removed.
+
+    :param sender:
+    :type sender:
+    :param instance:
+    :type instance:
+    :param kwargs:
+    :type kwargs:
+    :return:
+    :rtype:
+    """
+
+    SrpRequest.objects.invalidate_pending_requests_count()
+
+
+@receiver(signal=post_save, sender=Setting)
+def setting_saved(
+    sender, instance: Setting, **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Invalidate the cached settings when the settings are saved.
+
+    :param sender:
+    :type sender:
+    :param instance:
+    :type instance:
+    :param kwargs:
+    :type kwargs:
+    :return:
+    :rtype:
+    """
+
+    Setting.objects.invalidate_cache()
+
+
+@receiver(signal=post_save, sender=FleetType)
+@receiver(signal=post_delete, sender=FleetType)
+def fleet_type_changed(
+    sender, instance: FleetType, **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Invalidate the cached enabled fleet types when a fleet type is saved or removed.
+
+    :param sender:
+    :type sender:
+    :param instance:
+    :type instance:
+    :param kwargs:
+    :type kwargs:
+    :return:
+    :rtype:
+    """
+
+    FleetType.objects.invalidate_cache()
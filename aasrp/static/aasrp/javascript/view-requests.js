@@ -52,309 +52,298 @@ $(document).ready(() => {
     /**
      * Table :: SRP Requests
      *
+     * Server-side processing, ordering, paging and searching are done in the database.
+     *
+     * Row data is an array, the indexes are:
+     *  0: Request time, 1: Requester, 2: Character, 3: Request code, 4: Ship,
+     *  5: ISK lost, 6: SRP payout, 7: Status, 8: Actions, 9: Bulk actions (request code),
+     *  10: Request status (invisible), 11: Payout amount (invisible)
+     *
      * @type {*|jQuery}
      */
+    const columnIndex = {
+        requestCode: 9,
+        requestStatus: 10,
+        payoutAmount: 11
+    };
 
-    fetchGet({url: aaSrpSettings.url.requestsForSrpLink})
-        .then((data) => {
-            if (data) {
-                const dt = new DataTable(element.srpRequestsTable, { // eslint-disable-line no-unused-vars
-                    ...aaSrpSettings.dataTables,
-                    data: data,
-                    columns: [
-                        // Column 0: Request Time
-                        {
-                            data: {
-                                display: (data) => moment(data.request_time).utc().format(aaSrpSettings.datetimeFormat),
-                                filter: (data) => data.request_time,
-                                sort: (data) => moment(data.request_time).unix()
-                            },
-                            className: 'srp-request-time'
-                        },
-                        // Column 1: Requester
-                        {
-                            data: 'requester',
-                            className: 'srp-request-requester'
-                        },
-                        // Column 2: Character
-                        {
-                            data: {
-                                display: (data) => data.character_html.display,
-                                filter: (data) => data.character_html.sort,
-                                sort: (data) => data.character_html.sort
-                            },
-                            className: 'srp-request-character'
-                        },
-                        // Column 3: Request Code
-                        {
-                            data: {
-                                display: (data) => data.request_code_html.display,
-                                filter: (data) => data.request_code_html.sort,
-                                sort: (data) => data.request_code_html.sort
-                            },
-                            className: 'srp-request-code'
-                        },
-                        // Column 4: Ship
-                        {
-                            data: {
-                                display: (data) => data.ship_html.display,
-                                filter: (data) => data.ship_html.sort,
-                                sort: (data) => data.ship_html.sort
-                            },
-                            className: 'srp-request-ship'
-                        },
-                        // {data: 'zkb_link'},
-                        // Column 5: Killboard Link
-                        {
-                            data: {
-                                display: (data) => numberFormatter({
-                                    value: data.zbk_loss_amount,
-                                    locales: aaSrpSettings.locale,
-                                    options: {
-                                        style: 'currency',
-                                        currency: 'ISK'
-                                    }
-                                }),
-                                filter: (data) => data.zbk_loss_amount,
-                                sort: (data) => data.zbk_loss_amount
-                            },
-                            className: 'srp-request-zbk-loss-amount text-end'
-                        },
-                        // Column 6: Payout Amount
-                        {
-                            data: {
-                                display: (data) => data.payout_amount_html.display.replace(
-                                    '#payout_amount_localized#',
-                                    numberFormatter({
-                                        value: data.payout_amount_html.sort,
-                                        locales: aaSrpSettings.locale,
-                                        options: {
-                                            style: 'currency',
-                                            currency: 'ISK'
-                                        }
-                                    })
-                                ),
-                                filter: (data) => data.payout_amount_html.sort,
-                                sort: (data) => data.payout_amount_html.sort
-                            },
-                            className: 'srp-request-payout text-end'
-                        },
-                        // Column 7: Request Status Icon
-                        {
-                            // data: 'request_status_icon',
-                            data: {
-                                display: (data) => data.request_status_icon,
-                                sort: (data) => data.request_status
-                            },
-                            className: 'srp-request-status text-center'
-                        },
-                        // Column 8: Actions
-                        {
-                            data: 'actions',
-                            className: 'srp-request-actions text-end'
-                        },
-                        // Column 9: Bulk Actions Checkbox
-                        {
-                            // data: 'request_code',
-                            data: {
-                                display: (data) => {
-                                    return `<div class="checkbox"><label><input class="srp-requests-bulk-action" type="checkbox" name="${data.request_code}"><span class="cr"><i class="cr-icon fas fa-check"></i></span></label></div>`;
-                                }
-                            },
-                            className: 'srp-request-bulk-actions-checkbox text-end',
-                        },
-                    ],
-                    columnDefs: [
-                        {
-                            targets: [0, 5, 6],
-                            columnControl: _removeSearchFromColumnControl(aaSrpSettings.dataTables.columnControl, 1)
-                        },
-                        {
-                            targets: [7, 8, 9],
-                            orderable: false,
-                            columnControl: [
-                                {target: 0, content: []},
-                                {target: 1, content: []}
-                            ]
-                        },
-                        {
-                            targets: [8],
-                            width: 115
-                        }
-                    ],
-                    order: [
-                        [0, 'asc']
-                    ],
-                    /**
-                     * When ever a row is created…
-                     *
-                     * @param row
-                     * @param data
-                     * @param rowIndex
-                     */
-                    createdRow: (row, data, rowIndex) => {
-                        const srpRequestCode = data.request_code;
-                        const srpRequestStatus = data.request_status.toLowerCase();
-                        const srpRequestPayoutAmount = data.payout_amount;
-
-                        // Row id attr
-                        $(row)
-                            .attr('data-row-id', rowIndex)
-                            .attr('data-srp-request-code', srpRequestCode)
-                            .addClass('srp-request-status-' + srpRequestStatus);
-
-                        $(row)
-                            .find('span.srp-payout-amount')
-                            .attr('data-value', srpRequestPayoutAmount);
-
-                        // Add class and data attribute to the payout span
-                        if (srpRequestStatus === 'pending' || srpRequestStatus === 'rejected') {
-                            $(row)
-                                .find('td.srp-request-payout')
-                                .addClass('srp-request-payout-amount-editable');
-
-                            $(row)
-                                .find('span.srp-payout-tooltip')
-                                .attr(
-                                    'data-bs-tooltip',
-                                    'aa-srp'
-                                )
-                                .attr(
-                                    'title',
-                                    aaSrpSettings.translation.changeSrpPayoutAmount
-                                );
-
-                            $(row)
-                                .find('span.srp-payout-amount')
-                                .addClass(`cursor-pointer srp-request-${srpRequestCode}`)
-                                .attr('data-pk', srpRequestCode)
-                                .attr(
-                                    'data-params',
-                                    `{csrfmiddlewaretoken:'${aaSrpSettings.csrfToken}'}`
-                                )
-                                .attr(
-                                    'data-url',
-                                    aaSrpSettings.url.changeSrpAmount.replace(
-                                        'SRP_REQUEST_CODE',
-                                        srpRequestCode
-                                    )
-                                );
+    /**
+     * Helper function: Decorate a table row according to its SRP request
+     *
+     * Used when a row is created, and when a row is patched in place with fresh data
+     * from the server, so classes from the former request status are removed first.
+     *
+     * @param row
+     * @param data
+     * @param rowIndex
+     * @private
+     */
+    const _decorateRow = (row, data, rowIndex) => {
+        const srpRequestCode = data[columnIndex.requestCode];
+        const srpRequestStatus = data[columnIndex.requestStatus].toLowerCase();
+        const srpRequestPayoutAmount = data[columnIndex.payoutAmount];
+
+        // Row id attr
+        $(row)
+            .removeClass('srp-request-status-pending srp-request-status-approved srp-request-status-rejected')
+            .attr('data-row-id', rowIndex)
+            .attr('data-srp-request-code', srpRequestCode)
+            .addClass('srp-request-status-' + srpRequestStatus);
+
+        $(row)
+            .find('td.srp-request-payout')
+            .removeClass('srp-request-payout-amount-editable');
+
+        $(row)
+            .find('span.srp-payout-amount')
+            .attr('data-value', srpRequestPayoutAmount);
+
+        // Add class and data attribute to the payout span
+        if (srpRequestStatus === 'pending' || srpRequestStatus === 'rejected') {
+            $(row)
+                .find('td.srp-request-payout')
+                .addClass('srp-request-payout-amount-editable');
+
+            $(row)
+                .find('span.srp-payout-tooltip')
+                .attr(
+                    'data-bs-tooltip',
+                    'aa-srp'
+                )
+                .attr(
+                    'title',
+                    aaSrpSettings.translation.changeSrpPayoutAmount
+                );
+
+            $(row)
+                .find('span.srp-payout-amount')
+                .addClass(`cursor-pointer srp-request-${srpRequestCode}`)
+                .attr('data-pk', srpRequestCode)
+                .attr(
+                    'data-params',
+                    `{csrfmiddlewaretoken:'${aaSrpSettings.csrfToken}'}`
+                )
+                .attr(
+                    'data-url',
+                    aaSrpSettings.url.changeSrpAmount.replace(
+                        'SRP_REQUEST_CODE',
+                        srpRequestCode
+                    )
+                );
+        }
+    };
+
+    // Request status filter, sent to the server with every draw
+    let filterRequestStatus = '';
+
+    const dt = new DataTable(element.srpRequestsTable, {
+        ...aaSrpSettings.dataTables,
+        serverSide: true,
+        ajax: {
+            url: aaSrpSettings.url.requestsForSrpLinkServerSide,
+            data: (data) => {
+                return {...data, filter_request_status: filterRequestStatus};
+            },
+            error: (xhr, error) => console.error('Error fetching SRP requests:', xhr, error)
+        },
+        columnDefs: [
+            // Column 0: Request Time
+            {
+                target: 0,
+                render: (data) => moment(data).utc().format(aaSrpSettings.datetimeFormat),
+                className: 'srp-request-time'
+            },
+            // Column 1: Requester
+            {
+                target: 1,
+                className: 'srp-request-requester'
+            },
+            // Column 2: Character
+            {
+                target: 2,
+                className: 'srp-request-character'
+            },
+            // Column 3: Request Code
+            {
+                target: 3,
+                className: 'srp-request-code'
+            },
+            // Column 4: Ship
+            {
+                target: 4,
+                className: 'srp-request-ship'
+            },
+            // Column 5: ISK lost
+            {
+                target: 5,
+                render: (data) => numberFormatter({
+                    value: data,
+                    locales: aaSrpSettings.locale,
+                    options: {
+                        style: 'currency',
+                        currency: 'ISK'
+                    }
+                }),
+                className: 'srp-request-zbk-loss-amount text-end',
+                type: 'num'
+            },
+            // Column 6: Payout Amount
+            {
+                target: 6,
+                render: (data, type, row) => data.replace(
+                    '#payout_amount_localized#',
+                    numberFormatter({
+                        value: row[columnIndex.payoutAmount],
+                        locales: aaSrpSettings.locale,
+                        options: {
+                            style: 'currency',
+                            currency: 'ISK'
                         }
-                    },
-                    initComplete: () => {
-                        const dt = element.srpRequestsTable.DataTable();
-
-                        /**
-                         * Helper function: Filter DataTable
-                         *
-                         * @param {string} selector The selector for the filter button.
-                         * @param {callback} predicate The predicate function to filter rows.
-                         * @private
-                         */
-                        const _filterDataTable = (selector, predicate) => {
-                            $(selector).click(() => {
-                                // Clear any existing custom filters before applying a new one
-                                $.fn.dataTable.ext.search = [];
-
-                                /**
-                                 * Custom filter function.
-                                 *
-                                 * @param {Object} settings DataTable settings object.
-                                 * @param {Array} searchData Search data for the row.
-                                 * @param {int} index Row index.
-                                 * @param {Object} rowData Row data object.
-                                 * @return {boolean} True if the row matches the filter, false otherwise.
-                                 */
-                                const filter = (settings, searchData, index, rowData) => {
-                                    if (!rowData) {
-                                        return true;
-                                    }
-
-                                    return predicate(rowData);
-                                };
-
-                                $.fn.dataTable.ext.search.push(filter);
-
-                                dt.draw();
-                            });
-                        };
+                    })
+                ),
+                className: 'srp-request-payout text-end',
+                type: 'num'
+            },
+            // Column 7: Request Status Icon
+            {
+                target: 7,
+                className: 'srp-request-status text-center'
+            },
+            // Column 8: Actions
+            {
+                target: 8,
+                className: 'srp-request-actions text-end',
+                width: 115
+            },
+            // Column 9: Bulk Actions Checkbox
+            {
+                target: 9,
+                render: (data) => {
+                    return `<div class="checkbox"><label><input class="srp-requests-bulk-action" type="checkbox" name="${data}"><span class="cr"><i class="cr-icon fas fa-check"></i></span></label></div>`;
+                },
+                className: 'srp-request-bulk-actions-checkbox text-end'
+            },
+            // Invisible: Request Status and Payout Amount (for internal use)
+            {
+                targets: [10, 11],
+                visible: false,
+                searchable: false
+            },
+            {
+                targets: [0, 5, 6],
+                columnControl: _removeSearchFromColumnControl(aaSrpSettings.dataTables.columnControl, 1)
+            },
+            {
+                targets: [7, 8, 9],
+                orderable: false,
+                searchable: false,
+                columnControl: [
+                    {target: 0, content: []},
+                    {target: 1, content: []}
+                ]
+            }
+        ],
+        order: [
+            [0, 'asc']
+        ],
+        /**
+         * When ever a row is created…
+         *
+         * @param row
+         * @param data
+         * @param rowIndex
+         */
+        createdRow: (row, data, rowIndex) => {
+            _decorateRow(row, data, rowIndex);
+        },
+        initComplete: () => {
+            const _filters = [
+                ['#aasrp-srp-request-filter-all', ''],
+                ['#aasrp-srp-request-filter-pending', 'Pending'],
+                ['#aasrp-srp-request-filter-approved', 'Approved'],
+                ['#aasrp-srp-request-filter-rejected', 'Rejected']
+            ];
+
+            // Redraw the table when the request status filter changes
+            _filters.forEach(([selector, requestStatus]) => {
+                $(selector).click(() => {
+                    filterRequestStatus = requestStatus;
+
+                    dt.draw();
+                });
+            });
 
-                        const _filters = [
-                            ['#aasrp-srp-request-filter-all', () => true],
-                            ['#aasrp-srp-request-filter-pending', rowData => rowData.request_status === 'Pending'],
-                            ['#aasrp-srp-request-filter-approved', rowData => rowData.request_status === 'Approved'],
-                            ['#aasrp-srp-request-filter-rejected', rowData => rowData.request_status === 'Rejected']
-                        ];
+            // Show bootstrap tooltips
+            _bootstrapTooltip({selector: '#tab_aasrp_srp_requests'});
 
-                        _filters.forEach(([selector, predicate]) => _filterDataTable(selector, predicate));
+            dt.on('draw', () => {
+                _bootstrapTooltip({selector: '#tab_aasrp_srp_requests'});
 
-                        // Show bootstrap tooltips
-                        _bootstrapTooltip({selector: '#tab_aasrp_srp_requests'});
+                // Rows have been replaced, so no checkbox is selected anymore
+                element.bulkActions.addClass('d-none');
+            });
 
-                        dt.on('draw', () => {
-                            _bootstrapTooltip({selector: '#tab_aasrp_srp_requests'});
-                        });
+            // Make the SRP payout field editable for pending and rejected requests.
+            element.srpRequestsTable.editable({
+                container: 'body',
+                selector: '.srp-request-payout-amount-editable .srp-payout-amount',
+                title: aaSrpSettings.translation.changeSrpPayoutHeader,
+                type: 'number',
+                placement: 'top',
+                highlight: 'rgb(170 255 128)',
+                /**
+                 * @returns {boolean}
+                 */
+                display: () => {
+                    return false;
+                },
+                /**
+                 * On success…
+                 *
+                 * Arrow functions don't work here since we need `$(this)`.
+                 *
+                 * @param response
+                 * @param newValue
+                 */
+                success: function (response, newValue) {
+                    _refreshSrpAmountField($(this), newValue);
+
+                    if (response && response.request_codes) {
+                        _refreshRows(response.request_codes);
+                    }
+                },
+                /**
+                 * Check if input is not empty
+                 *
+                 * @param {string} value
+                 * @returns {string}
+                 */
+                validate: (value) => {
+                    if (value === '') {
+                        return aaSrpSettings.translation.editableValidate;
+                    }
+                }
+            });
 
-                        // Make the SRP payout field editable for pending and rejected requests.
-                        element.srpRequestsTable.editable({
-                            container: 'body',
-                            selector: '.srp-request-payout-amount-editable .srp-payout-amount',
-                            title: aaSrpSettings.translation.changeSrpPayoutHeader,
-                            type: 'number',
-                            placement: 'top',
-                            highlight: 'rgb(170 255 128)',
-                            /**
-                             * @returns {boolean}
-                             */
-                            display: () => {
-                                return false;
-                            },
-                            /**
-                             * On success…
-                             *
-                             * Arrow functions don't work here since we need `$(this)`.
-                             *
-                             * @param response
-                             * @param newValue
-                             */
-                            success: function (response, newValue) {
-                                _refreshSrpAmountField($(this), newValue);
-                            },
-                            /**
-                             * Check if input is not empty
-                             *
-                             * @param {string} value
-                             * @returns {string}
-                             */
-                            validate: (value) => {
-                                if (value === '') {
-                                    return aaSrpSettings.translation.editableValidate;
-                                }
-                            }
-                        });
+            /**
+             * Bulk actions window
+             */
+            element.srpRequestsTable.on('change', 'td.srp-request-bulk-actions-checkbox input.srp-requests-bulk-action', () => {
+                if (_getSelectedSrpRequestCodes().length > 0) {
+                    element.bulkActions.removeClass('d-none');
+                } else {
+                    element.bulkActions.addClass('d-none');
+                }
+            });
+        }
+    });
 
-                        /**
-                         * Bulk actions window
-                         */
-                        const elementBulkActionsCheckboxes = $('td.srp-request-bulk-actions-checkbox input.srp-requests-bulk-action');
-                        elementBulkActionsCheckboxes.each((i, checkbox) => {
-                            $(checkbox).change(() => {
-                                const checkedCheckboxes = $(elementBulkActionsCheckboxes).filter(':checked');
-
-                                if (checkedCheckboxes.length > 0) {
-                                    element.bulkActions.removeClass('d-none');
-                                } else {
-                                    element.bulkActions.addClass('d-none');
-                                }
-                            });
-                        });
-                    }
-                });
-            }
-        })
-        .catch((error) => {
-            console.error('Error fetching SRP requests:', error);
-        });
+    // Update the SRP link statistics with every response from the server
+    dt.on('xhr', (event, settings, json) => {
+        if (json && json.srp_link_stats) {
+            _reloadSrpCalculations(json.srp_link_stats);
+        }
+    });
 
     /* Helper Functions
     --------------------------------------------------------------------------------- */
@@ -370,7 +359,6 @@ $(document).ready(() => {
         newValue = parseInt(newValue);
 
         // Update payout value formatted
-        // const newValueFormatted = `${new Intl.NumberFormat(aaSrpSettings.locale).format(newValue)} ISK`;
         const newValueFormatted = numberFormatter({
             value: newValue,
             locales: aaSrpSettings.locale,
@@ -386,20 +374,21 @@ $(document).ready(() => {
             .addClass('srp-payout-amount-changed')
             .html(newValueFormatted);
 
-        // Update fleet total SRP amount
-        let totalSrpAmount = 0;
-        const elementSrpAmount = $(
-            '#tab_aasrp_srp_requests .srp-request-status-approved .srp-payout-amount'
-        );
-
-        elementSrpAmount.each((i, payoutElement) => {
-            totalSrpAmount += parseInt(payoutElement.getAttribute('data-value'));
-        });
-
-        console.log('Element Total Cost', element.totalSrpCost);
+        // Update copy to clipboard icon value
+        const copyToClipboard = valueField.parent().parent().find('.copy-to-clipboard-icon i');
+        copyToClipboard.attr('data-clipboard-text', newValue);
+    };
 
+    /**
+     * Helper function: Reloading SRP calculation from the SRP link statistics
+     *
+     * @param {object} srpLinkStats The SRP link statistics from the server
+     * @private
+     */
+    const _reloadSrpCalculations = (srpLinkStats) => {
+        // Update fleet total SRP amount
         element.totalSrpCost.html(numberFormatter({
-            value: totalSrpAmount,
+            value: srpLinkStats.total_cost,
             locales: aaSrpSettings.locale,
             options: {
                 style: 'currency',
@@ -407,58 +396,60 @@ $(document).ready(() => {
             }
         }));
 
-        // Update copy to clipboard icon value
-        const copyToClipboard = valueField.parent().parent().find('.copy-to-clipboard-icon i');
-        copyToClipboard.attr('data-clipboard-text', newValue);
+        // Update requests counts
+        $('.srp-requests-total-count').html(srpLinkStats.requests_total);
+        $('.srp-requests-pending-count').html(srpLinkStats.requests_pending);
+        $('.srp-requests-approved-count').html(srpLinkStats.requests_approved);
+        $('.srp-requests-rejected-count').html(srpLinkStats.requests_rejected);
     };
 
     /**
-     * Helper function: Reloading SRP calculation in our DataTable
+     * Helper function: Refresh the given rows in place
+     *
+     * Only the rows of the given SRP requests are fetched from the server and patched
+     * into the table, so the current page, ordering and search are kept. If one of the
+     * SRP requests isn't on the current page anymore, the page is reloaded instead.
      *
-     * @param {object} tableData The DataTable data
+     * @param {array} requestCodes The SRP request codes of the rows to refresh
      * @private
      */
-    const _reloadSrpCalculations = (tableData) => {
-        let totalSrpAmount = 0;
-        let requestsTotal = 0;
-        let requestsPending = 0;
-        let requestsApproved = 0;
-        let requestsRejected = 0;
-
-        $.each(tableData, (i, item) => {
-            requestsTotal += 1;
-
-            if (item.request_status === 'Pending') {
-                requestsPending += 1;
-            }
+    const _refreshRows = (requestCodes) => {
+        fetchGet({
+            url: aaSrpSettings.url.requestsForSrpLinkServerSide,
+            payload: {codes: requestCodes.join(',')}
+        })
+            .then((data) => {
+                let reloadPage = false;
 
-            if (item.request_status === 'Approved') {
-                totalSrpAmount += parseInt(item.payout_amount);
-                requestsApproved += 1;
-            }
+                requestCodes.forEach((requestCode) => {
+                    const rowData = data.rows[requestCode];
+                    const row = dt.row((index, rowDataCurrent) => rowDataCurrent[columnIndex.requestCode] === requestCode);
 
-            if (item.request_status === 'Rejected') {
-                requestsRejected += 1;
-            }
-        });
+                    if (rowData === undefined || !row.any()) {
+                        reloadPage = true;
 
-        console.log('ELEMENT TOTAL COST', element.totalSrpCost);
+                        return;
+                    }
 
-        // Update fleet total SRP amount
-        element.totalSrpCost.html(numberFormatter({
-            value: totalSrpAmount,
-            locales: aaSrpSettings.locale,
-            options: {
-                style: 'currency',
-                currency: 'ISK'
-            }
-        }));
+                    row.data(rowData);
+                    _decorateRow(row.node(), rowData, row.index());
+                });
 
-        // Update requests counts
-        $('.srp-requests-total-count').html(requestsTotal);
-        $('.srp-requests-pending-count').html(requestsPending);
-        $('.srp-requests-approved-count').html(requestsApproved);
-        $('.srp-requests-rejected-count').html(requestsRejected);
+                if (reloadPage) {
+                    dt.ajax.reload(null, false);
+
+                    return;
+                }
+
+                if (data.srp_link_stats) {
+                    _reloadSrpCalculations(data.srp_link_stats);
+                }
+
+                _bootstrapTooltip({selector: '#tab_aasrp_srp_requests'});
+            })
+            .catch((error) => {
+                console.error(`Error: ${error.message}`);
+            });
     };
 
     /**
@@ -479,51 +470,25 @@ $(document).ready(() => {
      * @private
      */
     const _modalConfirmAction = (data) => {
-        // Reload datatable on success and update SRP status values
+        // Patch the changed rows in place on success, removed rows need the current page to be reloaded
         if (data.success === true) {
-            fetchGet({url: aaSrpSettings.url.requestsForSrpLink})
-                .then((newData) => {
-                    const dt = element.srpRequestsTable.DataTable();
-
-                    dt.clear().rows.add(newData).draw();
-
-                    // Attempt to call the original initComplete handler (if present)
-                    try {
-                        const settings = dt.settings()[0];
-                        const initComplete = settings && settings.oInit && settings.oInit.initComplete;
-
-                        if (initComplete) {
-                            if (Array.isArray(initComplete)) {
-                                initComplete.forEach((fn) => {
-                                    if (typeof fn === 'function') {
-                                        fn.call(dt, settings);
-                                    }
-                                });
-                            } else if (typeof initComplete === 'function') {
-                                initComplete.call(dt, settings);
-                            }
-
-                            if (data.pending_requests >= 0) {
-                                const target = $(`a[href="/ship-replacement/"] + span.badge`);
-
-                                if (data.pending_requests === 0) {
-                                    target.remove();
-                                } else {
-                                    target.text(data.pending_requests);
-                                }
-
-                                updateTotalNotificationsBadge();
-                            }
-                        }
-                    } catch (err) {
-                        console.error('Error calling initComplete:', err);
-                    }
+            if (data.request_codes) {
+                _refreshRows(data.request_codes);
+            } else {
+                dt.ajax.reload(null, false);
+            }
 
-                    _reloadSrpCalculations(newData);
-                })
-                .catch((error) => {
-                    console.error('Error reloading SRP requests:', error);
-                });
+            if (data.pending_requests >= 0) {
+                const target = $(`a[href="/ship-replacement/"] + span.badge`);
+
+                if (data.pending_requests === 0) {
+                    target.remove();
+                } else {
+                    target.text(data.pending_requests);
+                }
+
+                updateTotalNotificationsBadge();
+            }
         }
     };
 
@@ -1,2 +1,2 @@
-$(document).ready(()=>{'use strict';const e={srpRequestsTable:$('#table_aasrp_srp_requests'),bulkActions:$('div.card-srp-request-bulk-actions'),totalSrpCost:$('#srp-fleet-total-cost')},t=e.totalSrpCost.data('total-srp-cost')||0;e.totalSrpCost.html(numberFormatter({value:t,locales:aaSrpSettings.locale,options:{style:'currency',currency:'ISK'}}));const a=()=>{const e=[];let t=0;if(document.querySelectorAll('#sidebar-menu .badge').forEach(a=>{const r=a.closest('li');r&&r.querySelector('ul.collapse')||(e.push(a),t+=parseInt(a.textContent))}),e.length>0&&t>0){const e=$('span.sidemenu-total-notifications-badge');if(0===t)return void e.remove();e.text(String(t))}};fetchGet({url:aaSrpSettings.url.requestsForSrpLink}).then(t=>{if(t){new DataTable(e.srpRequestsTable,{...aaSrpSettings.dataTables,data:t,columns:[{data:{display:e=>moment(e.request_time).utc().format(aaSrpSettings.datetimeFormat),filter:e=>e.request_time,sort:e=>moment(e.request_time).unix()},className:'srp-request-time'},{data:'requester',className:'srp-request-requester'},{data:{display:e=>e.character_html.display,filter:e=>e.character_html.sort,sort:e=>e.character_html.sort},className:'srp-request-character'},{data:{display:e=>e.request_code_html.display,filter:e=>e.request_code_html.sort,sort:e=>e.request_code_html.sort},className:'srp-request-code'},{data:{display:e=>e.ship_html.display,filter:e=>e.ship_html.sort,sort:e=>e.ship_html.sort},className:'srp-request-ship'},{data:{display:e=>numberFormatter({value:e.zbk_loss_amount,locales:aaSrpSettings.locale,options:{style:'currency',currency:'ISK'}}),filter:e=>e.zbk_loss_amount,sort:e=>e.zbk_loss_amount},className:'srp-request-zbk-loss-amount text-end'},{data:{display:e=>e.payout_amount_html.display.replace('#payout_amount_localized#',numberFormatter({value:e.payout_amount_html.sort,locales:aaSrpSettings.locale,options:{style:'currency',currency:'ISK'}})),filter:e=>e.payout_amount_html.sort,sort:e=>e.payout_amount_html.sort},className:'srp-request-payout text-end'},{data:{display:e=>e.request_status_icon,sort:e=>e.request_status},className:'srp-request-status text-center'},{data:'actions',className:'srp-request-actions text-end'},{data:{display:e=>`<div class="checkbox"><label><input class="srp-requests-bulk-action" type="checkbox" name="${e.request_code}"><span class="cr"><i class="cr-icon fas fa-check"></i></span></label></div>`},className:'srp-request-bulk-actions-checkbox text-end'}],columnDefs:[{targets:[0,5,6],columnControl:_removeSearchFromColumnControl(aaSrpSettings.dataTables.columnControl,1)},{targets:[7,8,9],orderable:!1,columnControl:[{target:0,content:[]},{target:1,content:[]}]},{targets:[8],width:115}],order:[[0,'asc']],createdRow:(e,t,a)=>{const r=t.request_code,s=t.request_status.toLowerCase(),o=t.payout_amount;$(e).attr('data-row-id',a).attr('data-srp-request-code',r).addClass('srp-request-status-'+s),$(e).find('span.srp-payout-amount').attr('data-value',o),'pending'!==s&&'rejected'!==s||($(e).find('td.srp-request-payout').addClass('srp-request-payout-amount-editable'),$(e).find('span.srp-payout-tooltip').attr('data-bs-tooltip','aa-srp').attr('title',aaSrpSettings.translation.changeSrpPayoutAmount),$(e).find('span.srp-payout-amount').addClass(`cursor-pointer srp-request-${r}`).attr('data-pk',r).attr('data-params',`{csrfmiddlewaretoken:'${aaSrpSettings.csrfToken}'}`).attr('data-url',aaSrpSettings.url.changeSrpAmount.replace('SRP_REQUEST_CODE',r)))},initComplete:()=>{const t=e.srpRequestsTable.DataTable(),a=(e,a)=>{$(e).click(()=>{$.fn.dataTable.ext.search=[];const e=(e,t,r,s)=>!s||a(s);$.fn.dataTable.ext.search.push(e),t.draw()})};[['#aasrp-srp-request-filter-all',()=>!0],['#aasrp-srp-request-filter-pending',e=>'Pending'===e.request_status],['#aasrp-srp-request-filter-approved',e=>'Approved'===e.request_status],['#aasrp-srp-request-filter-rejected',e=>'Rejected'===e.request_status]].forEach(([e,t])=>a(e,t)),_bootstrapTooltip({selector:'#tab_aasrp_srp_requests'}),t.on('draw',()=>{_bootstrapTooltip({selector:'#tab_aasrp_srp_requests'})}),e.srpRequestsTable.editable({container:'body',selector:'.srp-request-payout-amount-editable .srp-payout-amount',title:aaSrpSettings.translation.changeSrpPayoutHeader,type:'number',placement:'top',highlight:'rgb(170 255 128)',display:()=>!1,success:function(e,t){r($(this),t)},validate:e=>{if(''===e)return aaSrpSettings.translation.editableValidate}});const s=$('td.srp-request-bulk-actions-checkbox input.srp-requests-bulk-action');s.each((t,a)=>{$(a).change(()=>{$(s).filter(':checked').length>0?e.bulkActions.removeClass('d-none'):e.bulkActions.addClass('d-none')})})}})}}).catch(e=>{console.error('Error fetching SRP requests:',e)});const r=(t,a)=>{a=parseInt(a);const r=numberFormatter({value:a,locales:aaSrpSettings.locale,options:{style:'currency',currency:'ISK'}});t.attr('data-value',a).addClass('srp-payout-amount-changed').html(r);let s=0;$('#tab_aasrp_srp_requests .srp-request-status-approved .srp-payout-amount').each((e,t)=>{s+=parseInt(t.getAttribute('data-value'))}),console.log('Element Total Cost',e.totalSrpCost),e.totalSrpCost.html(numberFormatter({value:s,locales:aaSrpSettings.locale,options:{style:'currency',currency:'ISK'}}));t.parent().parent().find('.copy-to-clipboard-icon i').attr('data-clipboard-text',a)},s=t=>{let a=0,r=0,s=0,o=0,n=0;$.each(t,(e,t)=>{r+=1,'Pending'===t.request_status&&(s+=1),'Approved'===t.request_status&&(a+=parseInt(t.payout_amount),o+=1),'Rejected'===t.request_status&&(n+=1)}),console.log('ELEMENT TOTAL COST',e.totalSrpCost),e.totalSrpCost.html(numberFormatter({value:a,locales:aaSrpSettings.locale,options:{style:'currency',currency:'ISK'}})),$('.srp-requests-total-count').html(r),$('.srp-requests-pending-count').html(s),$('.srp-requests-approved-count').html(o),$('.srp-requests-rejected-count').html(n)},o=e=>{e.unbind('click')},n=t=>{!0===t.success&&fetchGet({url:aaSrpSettings.url.requestsForSrpLink}).then(r=>{const o=e.srpRequestsTable.DataTable();o.clear().rows.add(r).draw();try{const e=o.settings()[0],r=e&&e.oInit&&e.oInit.initComplete;if(r&&(Array.isArray(r)?r.forEach(t=>{'function'==typeof t&&t.call(o,e)}):'function'==typeof r&&r.call(o,e),t.pending_requests>=0)){const e=$('a[href="/ship-replacement/"] + span.badge');0===t.pending_requests?e.remove():e.text(t.pending_requests),a()}}catch(e){console.error('Error calling initComplete:',e)}s(r)}).catch(e=>{console.error('Error reloading SRP requests:',e)})},l=()=>{const e=$('td.srp-request-bulk-actions-checkbox input.srp-requests-bulk-action');return $(e).filter(':checked').map((e,t)=>$(t).attr('name')).get()},c=()=>{const e=$('td.srp-request-bulk-actions-checkbox input.srp-requests-bulk-action');return $(e).filter(':checked').map((e,t)=>$(t)).get()},d=$('#srp-request-details'),u=$('#srp-request-accept'),i=$('#srp-request-bulk-accept'),p=$('#srp-request-accept-rejected'),m=$('#srp-request-reject'),f=$('#srp-request-remove'),h=$('#srp-request-bulk-remove'),b='aa-callout aa-callout-danger aasrp-form-field-errors clearfix';d.on('show.bs.modal',e=>{const t=$(e.relatedTarget).data('link');fetchGet({url:t,responseIsJson:!1}).then(e=>{d.find('.modal-body').html(e)}).catch(e=>{console.error(`Error: ${e.message}`)})}).on('hide.bs.modal',()=>{d.find('.modal-body').text('')}),u.on('show.bs.modal',e=>{const t=$(e.relatedTarget).data('link');$('#modal-button-confirm-accept-request').on('click',()=>{const e=u.find('form'),a=e.find('textarea[name="comment"]').val(),r=e.find('input[name="csrfmiddlewaretoken"]').val();fetchPost({url:t,csrfToken:r,payload:{comment:a},responseIsJson:!0}).then(e=>{n(e)}).catch(e=>{console.error(`Error: ${e.message}`)}),u.modal('hide')})}).on('hide.bs.modal',()=>{u.find('textarea[name="comment"]').val(''),o($('#modal-button-confirm-accept-request'))}),p.on('show.bs.modal',e=>{const t=$(e.relatedTarget).data('link');$('#modal-button-confirm-accept-rejected-request').on('click',()=>{const e=p.find('form'),a=e.find('textarea[name="comment"]').val(),r=e.find('input[name="csrfmiddlewaretoken"]').val();if(''===a){const t=`<div class="${b}"><p>${aaSrpSettings.translation.modal.form.error.fieldRequired}</p></div>`;e.find('.aasrp-form-field-errors').remove(),$(t).insertAfter($('textarea[name="comment"]'))}else fetchPost({url:t,csrfToken:r,payload:{comment:a},responseIsJson:!0}).then(e=>{n(e)}).catch(e=>{console.error(`Error: ${e.message}`)}),p.modal('hide')})}).on('hide.bs.modal',()=>{p.find('textarea[name="comment"]').val(''),$('.aasrp-form-field-errors').remove(),o($('#modal-button-confirm-accept-rejected-request'))}),m.on('show.bs.modal',e=>{const t=$(e.relatedTarget).data('link');$('#modal-button-confirm-reject-request').on('click',()=>{const e=m.find('form'),a=e.find('textarea[name="comment"]').val(),r=e.find('input[name="csrfmiddlewaretoken"]').val();if(''===a){const t=`<div class="${b}"><p>${aaSrpSettings.translation.modal.form.error.fieldRequired}</p></div>`;e.find('.aasrp-form-field-errors').remove(),$(t).insertAfter($('textarea[name="comment"]'))}else fetchPost({url:t,csrfToken:r,payload:{comment:a},responseIsJson:!0}).then(e=>{n(e)}).catch(e=>{console.error(`Error: ${e.message}`)}),m.modal('hide')})}).on('hide.bs.modal',()=>{m.find('textarea[name="comment"]').val(''),$('.aasrp-form-field-errors').remove(),o($('#modal-button-confirm-reject-request'))}),f.on('show.bs.modal',e=>{const t=$(e.relatedTarget).data('link');$('#modal-button-confirm-remove-request').on('click',()=>{fetchGet({url:t}).then(e=>{n(e)}).catch(e=>{console.error(`Error: ${e.message}`)}),f.modal('hide')})}).on('hide.bs.modal',()=>{f.find('textarea[name="comment"]').val(''),o($('#modal-button-confirm-remove-request'))}),i.on('show.bs.modal',t=>{const a=$(t.relatedTarget).data('link'),r=i.find('form').find('input[name="csrfmiddlewaretoken"]').val();$('#modal-button-confirm-bulk-accept-requests').on('click',()=>{const t=l();fetchPost({url:a,csrfToken:r,payload:{srp_request_codes:t},responseIsJson:!0}).then(t=>{n(t);c().forEach(e=>{$(e).prop('checked',!1)}),e.bulkActions.addClass('d-none')}).catch(e=>{console.error(`Error: ${e.message}`)}),i.modal('hide')})}).on('hide.bs.modal',()=>{o($('#modal-button-confirm-bulk-accept-requests'))}),h.on('show.bs.modal',t=>{const a=$(t.relatedTarget).data('link'),r=h.find('form').find('input[name="csrfmiddlewaretoken"]').val();$('#modal-button-confirm-bulk-remove-requests').on('click',()=>{const t=l();fetchPost({url:a,csrfToken:r,payload:{srp_request_codes:t},responseIsJson:!0}).then(t=>{n(t);c().forEach(e=>{$(e).prop('checked',!1)}),e.bulkActions.addClass('d-none')}).catch(e=>{console.error(`Error: ${e.message}`)}),h.modal('hide')})}).on('hide.bs.modal',()=>{o($('#modal-button-confirm-bulk-remove-requests'))}),$('#aasrp-bulk-action-clear-selection').on('click',()=>{c().forEach(e=>{$(e).prop('checked',!1)}),e.bulkActions.addClass('d-none')})});
+$(document).ready(()=>{'use strict';const e={srpRequestsTable:$('#table_aasrp_srp_requests'),bulkActions:$('div.card-srp-request-bulk-actions'),totalSrpCost:$('#srp-fleet-total-cost')},t=e.totalSrpCost.data('total-srp-cost')||0;e.totalSrpCost.html(numberFormatter({value:t,locales:aaSrpSettings.locale,options:{style:'currency',currency:'ISK'}}));const r=()=>{const e=[];let t=0;if(document.querySelectorAll('#sidebar-menu .badge').forEach(r=>{const a=r.closest('li');a&&a.querySelector('ul.collapse')||(e.push(r),t+=parseInt(r.textContent))}),e.length>0&&t>0){const e=$('span.sidemenu-total-notifications-badge');if(0===t)return void e.remove();e.text(String(t))}},a={requestCode:9,requestStatus:10,payoutAmount:11},s=(e,t,r)=>{const s=t[a.requestCode],o=t[a.requestStatus].toLowerCase(),n=t[a.payoutAmount];$(e).removeClass('srp-request-status-pending srp-request-status-approved srp-request-status-rejected').attr('data-row-id',r).attr('data-srp-request-code',s).addClass('srp-request-status-'+o),$(e).find('td.srp-request-payout').removeClass('srp-request-payout-amount-editable'),$(e).find('span.srp-payout-amount').attr('data-value',n),'pending'!==o&&'rejected'!==o||($(e).find('td.srp-request-payout').addClass('srp-request-payout-amount-editable'),$(e).find('span.srp-payout-tooltip').attr('data-bs-tooltip','aa-srp').attr('title',aaSrpSettings.translation.changeSrpPayoutAmount),$(e).find('span.srp-payout-amount').addClass(`cursor-pointer srp-request-${s}`).attr('data-pk',s).attr('data-params',`{csrfmiddlewaretoken:'${aaSrpSettings.csrfToken}'}`).attr('data-url',aaSrpSettings.url.changeSrpAmount.replace('SRP_REQUEST_CODE',s)))};let o='';const n=new DataTable(e.srpRequestsTable,{...aaSrpSettings.dataTables,serverSide:!0,ajax:{url:aaSrpSettings.url.requestsForSrpLinkServerSide,data:e=>({...e,filter_request_status:o}),error:(e,t)=>console.error('Error fetching SRP requests:',e,t)},columnDefs:[{target:0,render:e=>moment(e).utc().format(aaSrpSettings.datetimeFormat),className:'srp-request-time'},{target:1,className:'srp-request-requester'},{target:2,className:'srp-request-character'},{target:3,className:'srp-request-code'},{target:4,className:'srp-request-ship'},{target:5,render:e=>numberFormatter({value:e,locales:aaSrpSettings.locale,options:{style:'currency',currency:'ISK'}}),className:'srp-request-zbk-loss-amount text-end',type:'num'},{target:6,render:(e,t,r)=>e.replace('#payout_amount_localized#',numberFormatter({value:r[a.payoutAmount],locales:aaSrpSettings.locale,options:{style:'currency',currency:'ISK'}})),className:'srp-request-payout text-end',type:'num'},{target:7,className:'srp-request-status text-center'},{target:8,className:'srp-request-actions text-end',width:115},{target:9,render:e=>`<div class="checkbox"><label><input class="srp-requests-bulk-action" type="checkbox" name="${e}"><span class="cr"><i class="cr-icon fas fa-check"></i></span></label></div>`,className:'srp-request-bulk-actions-checkbox text-end'},{targets:[10,11],visible:!1,searchable:!1},{targets:[0,5,6],columnControl:_removeSearchFromColumnControl(aaSrpSettings.dataTables.columnControl,1)},{targets:[7,8,9],orderable:!1,searchable:!1,columnControl:[{target:0,content:[]},{target:1,content:[]}]}],order:[[0,'asc']],createdRow:(e,t,r)=>{s(e,t,r)},initComplete:()=>{[['#aasrp-srp-request-filter-all',''],['#aasrp-srp-request-filter-pending','Pending'],['#aasrp-srp-request-filter-approved','Approved'],['#aasrp-srp-request-filter-rejected','Rejected']].forEach(([e,t])=>{$(e).click(()=>{o=t,n.draw()})}),_bootstrapTooltip({selector:'#tab_aasrp_srp_requests'}),n.on('draw',()=>{_bootstrapTooltip({selector:'#tab_aasrp_srp_requests'}),e.bulkActions.addClass('d-none')}),e.srpRequestsTable.editable({container:'body',selector:'.srp-request-payout-amount-editable .srp-payout-amount',title:aaSrpSettings.translation.changeSrpPayoutHeader,type:'number',placement:'top',highlight:'rgb(170 255 128)',display:()=>!1,success:function(e,t){l($(this),t),e&&e.request_codes&&d(e.request_codes)},validate:e=>{if(''===e)return aaSrpSettings.translation.editableValidate}}),e.srpRequestsTable.on('change','td.srp-request-bulk-actions-checkbox input.srp-requests-bulk-action',()=>{p().length>0?e.bulkActions.removeClass('d-none'):e.bulkActions.addClass('d-none')})}});n.on('xhr',(e,t,r)=>{r&&r.srp_link_stats&&c(r.srp_link_stats)});const l=(e,t)=>{t=parseInt(t);const r=numberFormatter({value:t,locales:aaSrpSettings.locale,options:{style:'currency',currency:'ISK'}});e.attr('data-value',t).addClass('srp-payout-amount-changed').html(r);e.parent().parent().find('.copy-to-clipboard-icon i').attr('data-clipboard-text',t)},c=t=>{e.totalSrpCost.html(numberFormatter({value:t.total_cost,locales:aaSrpSettings.locale,options:{style:'currency',currency:'ISK'}})),$('.srp-requests-total-count').html(t.requests_total),$('.srp-requests-pending-count').html(t.requests_pending),$('.srp-requests-approved-count').html(t.requests_approved),$('.srp-requests-rejected-count').html(t.requests_rejected)},d=e=>{fetchGet({url:aaSrpSettings.url.requestsForSrpLinkServerSide,payload:{codes:e.join(',')}}).then(t=>{let r=!1;e.forEach(e=>{const o=t.rows[e],l=n.row((t,r)=>r[a.requestCode]===e);void 0!==o&&l.any()?(l.data(o),s(l.node(),o,l.index())):r=!0}),r?n.ajax.reload(null,!1):(t.srp_link_stats&&c(t.srp_link_stats),_bootstrapTooltip({selector:'#tab_aasrp_srp_requests'}))}).catch(e=>{console.error(`Error: ${e.message}`)})},u=e=>{e.unbind('click')},i=e=>{if(!0===e.success&&(e.request_codes?d(e.request_codes):n.ajax.reload(null,!1),e.pending_requests>=0)){const t=$('a[href="/ship-replacement/"] + span.badge');0===e.pending_requests?t.remove():t.text(e.pending_requests),r()}},p=()=>{const e=$('td.srp-request-bulk-actions-checkbox input.srp-requests-bulk-action');return $(e).filter(':checked').map((e,t)=>$(t).attr('name')).get()},m=()=>{const e=$('td.srp-request-bulk-actions-checkbox input.srp-requests-bulk-action');return $(e).filter(':checked').map((e,t)=>$(t)).get()},f=$('#srp-request-details'),b=$('#srp-request-accept'),h=$('#srp-request-bulk-accept'),q=$('#srp-request-accept-rejected'),g=$('#srp-request-reject'),k=$('#srp-request-remove'),S=$('#srp-request-bulk-remove'),v='aa-callout aa-callout-danger aasrp-form-field-errors clearfix';f.on('show.bs.modal',e=>{const t=$(e.relatedTarget).data('link');fetchGet({url:t,responseIsJson:!1}).then(e=>{f.find('.modal-body').html(e)}).catch(e=>{console.error(`Error: ${e.message}`)})}).on('hide.bs.modal',()=>{f.find('.modal-body').text('')}),b.on('show.bs.modal',e=>{const t=$(e.relatedTarget).data('link');$('#modal-button-confirm-accept-request').on('click',()=>{const e=b.find('form'),r=e.find('textarea[name="comment"]').val(),a=e.find('input[name="csrfmiddlewaretoken"]').val();fetchPost({url:t,csrfToken:a,payload:{comment:r},responseIsJson:!0}).then(e=>{i(e)}).catch(e=>{console.error(`Error: ${e.message}`)}),b.modal('hide')})}).on('hide.bs.modal',()=>{b.find('textarea[name="comment"]').val(''),u($('#modal-button-confirm-accept-request'))}),q.on('show.bs.modal',e=>{const t=$(e.relatedTarget).data('link');$('#modal-button-confirm-accept-rejected-request').on('click',()=>{const e=q.find('form'),r=e.find('textarea[name="comment"]').val(),a=e.find('input[name="csrfmiddlewaretoken"]').val();if(''===r){const t=`<div class="${v}"><p>${aaSrpSettings.translation.modal.form.error.fieldRequired}</p></div>`;e.find('.aasrp-form-field-errors').remove(),$(t).insertAfter($('textarea[name="comment"]'))}else fetchPost({url:t,csrfToken:a,payload:{comment:r},responseIsJson:!0}).then(e=>{i(e)}).catch(e=>{console.error(`Error: ${e.message}`)}),q.modal('hide')})}).on('hide.bs.modal',()=>{q.find('textarea[name="comment"]').val(''),$('.aasrp-form-field-errors').remove(),u($('#modal-button-confirm-accept-rejected-request'))}),g.on('show.bs.modal',e=>{const t=$(e.relatedTarget).data('link');$('#modal-button-confirm-reject-request').on('click',()=>{const e=g.find('form'),r=e.find('textarea[name="comment"]').val(),a=e.find('input[name="csrfmiddlewaretoken"]').val();if(''===r){const t=`<div class="${v}"><p>${aaSrpSettings.translation.modal.form.error.fieldRequired}</p></div>`;e.find('.aasrp-form-field-errors').remove(),$(t).insertAfter($('textarea[name="comment"]'))}else fetchPost({url:t,csrfToken:a,payload:{comment:r},responseIsJson:!0}).then(e=>{i(e)}).catch(e=>{console.error(`Error: ${e.message}`)}),g.modal('hide')})}).on('hide.bs.modal',()=>{g.find('textarea[name="comment"]').val(''),$('.aasrp-form-field-errors').remove(),u($('#modal-button-confirm-reject-request'))}),k.on('show.bs.modal',e=>{const t=$(e.relatedTarget).data('link');$('#modal-button-confirm-remove-request').on('click',()=>{fetchGet({url:t}).then(e=>{i(e)}).catch(e=>{console.error(`Error: ${e.message}`)}),k.modal('hide')})}).on('hide.bs.modal',()=>{k.find('textarea[name="comment"]').val(''),u($('#modal-button-confirm-remove-request'))}),h.on('show.bs.modal',t=>{const r=$(t.relatedTarget).data('link'),a=h.find('form').find('input[name="csrfmiddlewaretoken"]').val();$('#modal-button-confirm-bulk-accept-requests').on('click',()=>{const t=p();fetchPost({url:r,csrfToken:a,payload:{srp_request_codes:t},responseIsJson:!0}).then(t=>{i(t);m().forEach(e=>{$(e).prop('checked',!1)}),e.bulkActions.addClass('d-none')}).catch(e=>{console.error(`Error: ${e.message}`)}),h.modal('hide')})}).on('hide.bs.modal',()=>{u($('#modal-button-confirm-bulk-accept-requests'))}),S.on('show.bs.modal',t=>{const r=$(t.relatedTarget).data('link'),a=S.find('form').find('input[name="csrfmiddlewaretoken"]').val();$('#modal-button-confirm-bulk-remove-requests').on('click',()=>{const t=p();fetchPost({url:r,csrfToken:a,payload:{srp_request_codes:t},responseIsJson:!0}).then(t=>{i(t);m().forEach(e=>{$(e).prop('checked',!1)}),e.bulkActions.addClass('d-none')}).catch(e=>{console.error(`Error: ${e.message}`)}),S.modal('hide')})}).on('hide.bs.modal',()=>{u($('#modal-button-confirm-bulk-remove-requests'))}),$('#aasrp-bulk-action-clear-selection').on('click',()=>{m().forEach(e=>{$(e).prop('checked',!1)}),e.bulkActions.addClass('d-none')})});
 //# sourceMappingURL=view-requests.min.js.map
\ No newline at end of file
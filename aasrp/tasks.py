@@ -0,0 +1,229 @@
+"""
+Celery tasks for AA-SRP
+"""
+
+# Third Party
+from celery import shared_task
+
+# Django
+from django.core.cache import cache
+from django.utils import translation
+
+# Alliance Auth
+from allianceauth.authentication.models import User
+from allianceauth.services.hooks import get_extension_logger
+
+# AA SRP
+from aasrp.helper.killmail_import import import_killmails
+from aasrp.helper.notification import (
+    group_requester_notifications,
+    notify_killmail_import,
+    notify_requester,
+    notify_requester_digest,
+    prepare_requester_notifications,
+)
+from aasrp.models import InsurancePrice, Killmail, Setting, SrpLink
+from aasrp.providers.applogger import AppLogger
+
+logger = AppLogger(my_logger=get_extension_logger(__name__))
+
+# How long a sent notification is remembered, so a retried task doesn't send it again
+NOTIFICATION_IDEMPOTENCY_TIMEOUT = 60 * 60 * 24
+
+# Retry backoff for failed notifications: 60s, 120s, 240s, … capped at 1 hour
+NOTIFICATION_RETRY_BACKOFF = 60
+NOTIFICATION_RETRY_BACKOFF_MAX = 60 * 60
+NOTIFICATION_MAX_RETRIES = 5
+
+
+@shared_task(bind=True, max_retries=NOTIFICATION_MAX_RETRIES)
+def send_requester_notifications(
+    self, reviser_id: int, notifications: list[dict], message_level: str = "success"
+) -> None:
+    """
+    Send the SRP request status change notifications of one (bulk) action to the requesters.
+
+    Each notification carries an idempotency key for its (request, status change).
+    Notifications that have already been sent are skipped, so the task can safely be
+    retried when some of them failed. With the notification digest enabled, the
+    notifications of a requester are sent as one.
+
+    :param reviser_id: The ID of the user who changed the status of the SRP requests
+    :type reviser_id: int
+    :param notifications: The notifications to send, each a dict with `srp_request_id`, `comment` and `idempotency_key`
+    :type notifications: list[dict]
+    :param message_level: The level of the message (success, danger, info, etc. Default: success)
+    :type message_level: str
+    :return: None
+    :rtype: None
+    """
+
+    batch = prepare_requester_notifications(
+        reviser_id=reviser_id,
+        srp_request_ids=[
+            notification["srp_request_id"] for notification in notifications
+        ],
+    )
+
+    pending_notifications = []
+
+    for notification in notifications:
+        idempotency_key = notification["idempotency_key"]
+
+        if cache.get(idempotency_key):
+            logger.debug("Notification %s has already been sent", idempotency_key)
+
+            continue
+
+        srp_request = batch.srp_requests.get(notification["srp_request_id"])
+
+        # The SRP request might have been removed in the meantime
+        if srp_request is None or srp_request.creator is None:
+            continue
+
+        if batch.user_settings[srp_request.creator_id].disable_notifications:
+            cache.set(
+                key=idempotency_key,
+                value=True,
+                timeout=NOTIFICATION_IDEMPOTENCY_TIMEOUT,
+            )
+
+            continue
+
+        pending_notifications.append((notification, srp_request))
+
+    failed_exception = None
+
+    for group in group_requester_notifications(
+        notifications=pending_notifications,
+        digest=Setting.objects.get_setting(
+            setting_key=Setting.Field.NOTIFICATION_DIGEST
+        ),
+    ):
+        first_notification, first_srp_request = group[0]
+        idempotency_keys = [
+            notification["idempotency_key"] for notification, _ in group
+        ]
+
+        try:
+            if len(group) == 1:
+                notify_requester(
+                    requester=first_srp_request.creator,
+                    reviser=batch.reviser,
+                    srp_request=first_srp_request,
+                    comment=first_notification["comment"],
+                    message_level=message_level,
+                )
+            else:
+                notify_requester_digest(
+                    requester=first_srp_request.creator,
+                    reviser=batch.reviser,
+                    srp_requests=[srp_request for _, srp_request in group],
+                    comment=first_notification["comment"],
+                    message_level=message_level,
+                )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "Failed to send notification(s) %s: %s",
+                ", ".join(idempotency_keys),
+                exc,
+                exc_info=True,
+            )
+
+            failed_exception = exc
+
+            continue
+
+        cache.set_many(
+            data=dict.fromkeys(idempotency_keys, True),
+            timeout=NOTIFICATION_IDEMPOTENCY_TIMEOUT,
+        )
+
+    if failed_exception is not None:
+        countdown = min(
+            NOTIFICATION_RETRY_BACKOFF * 2**self.request.retries,
+            NOTIFICATION_RETRY_BACKOFF_MAX,
+        )
+
+        raise self.retry(exc=failed_exception, countdown=countdown)
+
+
+@shared_task
+def import_srp_link_killmails(
+    srp_link_id: int,
+    entries: list[str],
+    importer_id: int,
+    additional_info: str = "",
+    language: str | None = None,
+) -> None:
+    """
+    Import killmails as SRP requests into an SRP link and notify the importer of the result.
+
+    Fetching the killmails from zKillboard and ESI can take a while, so the import
+    runs here instead of in the HTTP request that started it.
+
+    :param srp_link_id: The ID of the SRP link to import the killmails into
+    :type srp_link_id: int
+    :param entries: The killboard links and/or killmail IDs
+    :type entries: list[str]
+    :param importer_id: The ID of the user who started the import
+    :type importer_id: int
+    :param additional_info: Additional information, added to every SRP request
+    :type additional_info: str
+    :param language: The language of the importer, for the notification (Default: the site's language)
+    :type language: str | None
+    :return: None
+    :rtype: None
+    """
+
+    try:
+        srp_link = SrpLink.objects.get(pk=srp_link_id)
+        importer = User.objects.get(pk=importer_id)
+    except (SrpLink.DoesNotExist, User.DoesNotExist):
+        logger.warning(
+            "Unable to import killmails, SRP link %s or user %s no longer exists",
+            srp_link_id,
+            importer_id,
+        )
+
+        return
+
+    with translation.override(language):
+        result = import_killmails(
+            srp_link=srp_link,
+            entries=entries,
+            importer=importer,
+            additional_info=additional_info,
+        )
+
+        notify_killmail_import(importer=importer, srp_link=srp_link, result=result)
+
+
+@shared_task
+def prewarm_killmail_cache(killmail_ids: list[int]) -> None:
+    """
+    Fetch the given killmails from zKillboard and ESI and store them in the killmail cache.
+
+    :param killmail_ids: The IDs of the killmails to cache
+    :type killmail_ids: list[int]
+    :return: None
+    :rtype: None
+    """
+
+    cached, failed = Killmail.objects.prewarm(killmail_ids=killmail_ids)
+
+    logger.info(
+        "Killmail cache pre-warmed: %s killmail(s) cached, %s failed", cached, failed
+    )
+
+
+@shared_task
+def update_insurance_prices() -> None:
+    """
+    Update the insurance price table from ESI
+
+    :return: None
+    :rtype: None
+    """
+
+    InsurancePrice.objects.update_from_esi()
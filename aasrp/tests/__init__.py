@@ -29,6 +29,7 @@ class BaseTestCase(TestCase):
     def setUpClass(cls):
         cls.socket_original = socket.socket
         socket.socket = cls.guard
+        cls.invalidate_config_cache()
         return super().setUpClass()
 
     @classmethod
@@ -36,6 +37,22 @@ class BaseTestCase(TestCase):
         socket.socket = cls.socket_original
         return super().tearDownClass()
 
+    def _post_teardown(self):
+        # Rolled back test data doesn't invalidate the configuration cache
+        self.invalidate_config_cache()
+        return super()._post_teardown()
+
+    @staticmethod
+    def invalidate_config_cache():
+        # AA SRP
+        from aasrp.models import (  # pylint: disable=import-outside-toplevel
+            FleetType,
+            Setting,
+        )
+
+        Setting.objects.invalidate_cache()
+        FleetType.objects.invalidate_cache()
+
     @staticmethod
     def guard(*args, **kwargs):
         raise SocketAccessError("Attempted to access network")
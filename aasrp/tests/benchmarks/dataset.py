@@ -0,0 +1,73 @@
+"""
+Synthetic datasets for the benchmarks.
+
+The datasets are generated with `aasrp.helper.fake_data`, which creates all rows with
+`bulk_create`, so even datasets with 100k SRP requests are seeded in seconds.
+"""
+
+# Standard Library
+from typing import NamedTuple
+
+# Alliance Auth
+from allianceauth.authentication.models import User
+
+# AA SRP
+from aasrp.helper.fake_data import generate_fake_data
+from aasrp.models import SrpLink
+from aasrp.tests.utils import create_fake_user
+
+# SRP requests per user
+REQUESTS_PER_USER = 20
+
+# SRP requests per SRP link, the first SRP link gets a tenth of all SRP requests
+REQUESTS_PER_SRP_LINK = 100
+
+
+class BenchmarkDataset(NamedTuple):
+    """
+    A seeded dataset
+    """
+
+    manager: User
+    requester: User
+    srp_link: SrpLink
+    request_count: int
+
+
+def seed_dataset(request_count: int, seed: int = 42) -> BenchmarkDataset:
+    """
+    Seed a dataset with the given number of SRP requests.
+
+    SRP requests are spread across many SRP links, users and their alts. The newest
+    SRP link is active and gets a tenth of all SRP requests, the benchmarks use it as
+    a large fleet.
+
+    :param request_count: The number of SRP requests.
+    :type request_count: int
+    :param seed: The seed of the random generator.
+    :type seed: int
+    :return: The dataset.
+    :rtype: BenchmarkDataset
+    """
+
+    manager = create_fake_user(
+        character_id=80_000_000 + request_count,
+        character_name=f"Benchmark Manager {request_count}",
+        permissions=["aasrp.basic_access", "aasrp.manage_srp"],
+    )
+    result = generate_fake_data(
+        users=max(1, request_count // REQUESTS_PER_USER),
+        srp_links=max(2, request_count // REQUESTS_PER_SRP_LINK),
+        srp_requests=request_count,
+        seed=seed,
+        prefix=f"benchmark-{request_count}",
+        existing_users=[manager],
+        large_srp_link_share=0.1,
+    )
+
+    return BenchmarkDataset(
+        manager=manager,
+        requester=result.users[1],
+        srp_link=result.srp_links[0],
+        request_count=request_count,
+    )
@@ -0,0 +1,357 @@
+"""
+Benchmarks of the AJAX endpoints.
+
+The benchmarks seed synthetic datasets and record the number of queries, the wall
+time and the response size of every AJAX endpoint. They fail when an endpoint
+exceeds its budget.
+
+The benchmarks are skipped unless `AASRP_BENCHMARK` is set, and are configured with
+environment variables:
+
+- `AASRP_BENCHMARK_SIZES`: Comma-separated numbers of SRP requests of the seeded
+  datasets (default: 1000,10000,100000)
+- `AASRP_BENCHMARK_BUDGET`: Path of a JSON file with the budgets (default: the
+  `budget.json` next to this module)
+- `AASRP_BENCHMARK_REPORT`: Path of a JSON file the results are written to (optional)
+
+Example:
+
+    AASRP_BENCHMARK=1 AASRP_BENCHMARK_SIZES=1000 python runtests.py aasrp.tests.benchmarks
+"""
+
+# Standard Library
+import json
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+from unittest import skipUnless
+
+# Django
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# AA SRP
+from aasrp.models import SrpRequest
+from aasrp.tests import BaseTestCase
+from aasrp.tests.benchmarks.dataset import BenchmarkDataset, seed_dataset
+from aasrp.urls.ajax import urls as ajax_urls
+from aasrp.views.datatables import OwnSrpRequestsView, SrpLinkRequestsView
+
+BENCHMARK_ENABLED = bool(os.environ.get("AASRP_BENCHMARK"))
+BENCHMARK_SIZES = [
+    int(size)
+    for size in os.environ.get("AASRP_BENCHMARK_SIZES", "1000,10000,100000").split(",")
+    if size.strip()
+]
+BENCHMARK_BUDGET = Path(
+    os.environ.get("AASRP_BENCHMARK_BUDGET", Path(__file__).with_name("budget.json"))
+)
+BENCHMARK_REPORT = os.environ.get("AASRP_BENCHMARK_REPORT")
+
+# Number of SRP requests the bulk endpoints are called with
+BULK_REQUEST_COUNT = 20
+
+
+class Endpoint(NamedTuple):
+    """
+    An endpoint to benchmark
+    """
+
+    url_name: str
+    # Returns the URL arguments and the request body
+    build: Callable[["BenchmarkContext"], tuple[list[str], Any]]
+    method: str = "get"
+
+
+class BenchmarkContext:
+    """
+    The seeded dataset, and the pending SRP requests the endpoints that change
+    SRP requests can use
+    """
+
+    def __init__(self, dataset: BenchmarkDataset) -> None:
+        self.dataset = dataset
+        self.srp_code = dataset.srp_link.srp_code
+        self.pending_request_codes = list(
+            SrpRequest.objects.filter(
+                srp_link=dataset.srp_link, request_status=SrpRequest.Status.PENDING
+            )
+            .order_by("pk")
+            .values_list("request_code", flat=True)
+        )
+
+    def pop_request_codes(self, count: int = 1) -> list[str]:
+        """
+        Get pending SRP requests, which no other endpoint uses
+
+        :param count:
+        :type count:
+        :return:
+        :rtype:
+        """
+
+        request_codes = self.pending_request_codes[:count]
+        del self.pending_request_codes[:count]
+
+        return request_codes
+
+
+def datatables_params(view_class: type, length: int = 50) -> dict:
+    """
+    Build the query parameters DataTables sends in server-side mode
+
+    :param view_class:
+    :type view_class:
+    :param length:
+    :type length:
+    :return:
+    :rtype:
+    """
+
+    params = {
+        "draw": 1,
+        "start": 0,
+        "length": length,
+        "search[value]": "",
+        "search[regex]": "false",
+        "order[0][column]": 0,
+        "order[0][dir]": "desc",
+    }
+
+    for index in range(len(view_class.columns)):
+        params[f"columns[{index}][searchable]"] = "false"
+        params[f"columns[{index}][orderable]"] = "true"
+        params[f"columns[{index}][search][value]"] = ""
+        params[f"columns[{index}][search][regex]"] = "false"
+
+    return params
+
+
+# The endpoints, in the order they are called. Endpoints that change SRP requests
+# come last, and each of them uses its own SRP requests.
+ENDPOINTS = [
+    Endpoint("ajax_dashboard_srp_links_data", lambda context: ([], None)),
+    Endpoint("ajax_dashboard_srp_links_all_data", lambda context: ([], None)),
+    Endpoint(
+        "ajax_dashboard_user_srp_requests_data",
+        lambda context: ([], datatables_params(view_class=OwnSrpRequestsView)),
+    ),
+    Endpoint(
+        "ajax_srp_link_view_requests_data",
+        lambda context: ([context.srp_code], None),
+    ),
+    Endpoint(
+        "ajax_srp_link_view_requests_server_side_data",
+        lambda context: (
+            [context.srp_code],
+            datatables_params(view_class=SrpLinkRequestsView),
+        ),
+    ),
+    Endpoint(
+        "ajax_srp_request_additional_information",
+        lambda context: ([context.srp_code, context.pending_request_codes[0]], None),
+    ),
+    Endpoint(
+        "ajax_srp_request_change_payout",
+        lambda context: (
+            [context.srp_code, *context.pop_request_codes()],
+            {"value": 1000000},
+        ),
+        method="post",
+    ),
+    Endpoint(
+        "ajax_srp_request_approve",
+        lambda context: (
+            [context.srp_code, *context.pop_request_codes()],
+            json.dumps({"comment": "Benchmark"}),
+        ),
+        method="post",
+    ),
+    Endpoint(
+        "ajax_srp_requests_bulk_approve",
+        lambda context: (
+            [context.srp_code],
+            json.dumps(
+                {
+                    "srp_request_codes": context.pop_request_codes(
+                        count=BULK_REQUEST_COUNT
+                    )
+                }
+            ),
+        ),
+        method="post",
+    ),
+    Endpoint(
+        "ajax_srp_request_deny",
+        lambda context: (
+            [context.srp_code, *context.pop_request_codes()],
+            json.dumps({"comment": "Benchmark"}),
+        ),
+        method="post",
+    ),
+    Endpoint(
+        "ajax_srp_request_remove",
+        lambda context: ([context.srp_code, *context.pop_request_codes()], None),
+    ),
+    Endpoint(
+        "ajax_srp_requests_bulk_remove",
+        lambda context: (
+            [context.srp_code],
+            json.dumps(
+                {
+                    "srp_request_codes": context.pop_request_codes(
+                        count=BULK_REQUEST_COUNT
+                    )
+                }
+            ),
+        ),
+        method="post",
+    ),
+]
+
+
+def get_budget_limit(budget: dict, metric: str, size: int) -> int | float | None:
+    """
+    Get the limit of a metric for a dataset size.
+
+    A limit is either a number, or an object with a number per dataset size.
+
+    :param budget: The budget of an endpoint.
+    :type budget: dict
+    :param metric: The metric.
+    :type metric: str
+    :param size: The dataset size.
+    :type size: int
+    :return: The limit, or None if the metric has no limit.
+    :rtype: int | float | None
+    """
+
+    limit = budget.get(metric)
+
+    if isinstance(limit, dict):
+        return limit.get(str(size))
+
+    return limit
+
+
+class TestBenchmarkEndpoints(BaseTestCase):
+    """
+    Test that every AJAX endpoint is benchmarked and has a budget
+    """
+
+    def test_every_ajax_endpoint_is_benchmarked(self):
+        """
+        Test every AJAX endpoint is benchmarked and has a budget
+
+        :return:
+        :rtype:
+        """
+
+        url_names = {url.name for url in ajax_urls}
+        budget = json.loads(BENCHMARK_BUDGET.read_text(encoding="utf-8"))
+
+        self.assertEqual({endpoint.url_name for endpoint in ENDPOINTS}, url_names)
+        self.assertEqual(set(budget), url_names)
+
+
+@skipUnless(BENCHMARK_ENABLED, "Set AASRP_BENCHMARK to run the benchmarks")
+class TestAjaxEndpointBenchmarks(BaseTestCase):
+    """
+    Benchmarks of the AJAX endpoints
+    """
+
+    def _benchmark(self, context: BenchmarkContext) -> dict[str, dict]:
+        """
+        Call every endpoint once and record its metrics
+
+        :param context:
+        :type context:
+        :return:
+        :rtype:
+        """
+
+        results = {}
+
+        self.client.force_login(context.dataset.manager)
+
+        for endpoint in ENDPOINTS:
+            args, data = endpoint.build(context)
+            url = reverse(f"aasrp:{endpoint.url_name}", args=args)
+            kwargs = (
+                {"data": data, "content_type": "application/json"}
+                if endpoint.method == "post" and isinstance(data, str)
+                else {"data": data}
+            )
+
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = getattr(self.client, endpoint.method)(url, **kwargs)
+                wall_time_ms = (time.perf_counter() - start) * 1000
+
+            self.assertEqual(response.status_code, 200, endpoint.url_name)
+
+            # The endpoints that change SRP requests report whether they succeeded
+            if response["Content-Type"] == "application/json" and isinstance(
+                payload := response.json(), dict
+            ):
+                self.assertTrue(payload.get("success", True), endpoint.url_name)
+
+            results[endpoint.url_name] = {
+                "queries": len(queries.captured_queries),
+                "wall_time_ms": round(wall_time_ms, 1),
+                "response_bytes": len(response.content),
+            }
+
+        return results
+
+    def test_ajax_endpoints_stay_within_budget(self):
+        """
+        Test the AJAX endpoints stay within their budget for every dataset size
+
+        :return:
+        :rtype:
+        """
+
+        budgets = json.loads(BENCHMARK_BUDGET.read_text(encoding="utf-8"))
+        report = {}
+        violations = []
+
+        for size in BENCHMARK_SIZES:
+            # Each dataset is rolled back after it has been benchmarked
+            with transaction.atomic():
+                dataset = seed_dataset(request_count=size)
+                cache.clear()
+
+                report[size] = self._benchmark(context=BenchmarkContext(dataset))
+
+                transaction.set_rollback(True)
+
+            for url_name, metrics in report[size].items():
+                print(
+                    f"{size:>8} {url_name:<48} {metrics['queries']:>5} queries "
+                    f"{metrics['wall_time_ms']:>10.1f} ms "
+                    f"{metrics['response_bytes']:>10} bytes"
+                )
+
+                for metric, value in metrics.items():
+                    limit = get_budget_limit(
+                        budget=budgets[url_name], metric=metric, size=size
+                    )
+
+                    if limit is not None and value > limit:
+                        violations.append(
+                            f"{url_name} ({size} SRP requests): "
+                            f"{metric} {value} > {limit}"
+                        )
+
+        if BENCHMARK_REPORT:
+            Path(BENCHMARK_REPORT).write_text(
+                json.dumps(report, indent=2), encoding="utf-8"
+            )
+
+        if violations:
+            self.fail("Budget exceeded:\n" + "\n".join(violations))
@@ -0,0 +1,77 @@
+"""
+Benchmarks of the compiled HTML fragments against the template engine.
+
+The benchmarks are skipped unless `AASRP_BENCHMARK` is set. The number of renderings
+is configured with `AASRP_BENCHMARK_FRAGMENT_RENDERINGS` (default: 10000).
+
+Example:
+
+    AASRP_BENCHMARK=1 python runtests.py aasrp.tests.benchmarks.test_html_fragments
+"""
+
+# Standard Library
+import os
+import time
+from unittest import skipUnless
+
+# Django
+from django.template.loader import render_to_string
+from django.utils.translation import gettext_lazy as _
+
+# AA SRP
+from aasrp.helper.html_fragments import render_html_fragment
+from aasrp.tests import BaseTestCase
+from aasrp.tests.benchmarks.test_ajax_endpoints import BENCHMARK_ENABLED
+
+RENDERINGS = int(os.environ.get("AASRP_BENCHMARK_FRAGMENT_RENDERINGS", 10000))
+
+COPY_TO_CLIPBOARD_ICON = "aasrp/partials/common/copy-to-clipboard-icon.html"
+
+
+@skipUnless(BENCHMARK_ENABLED, "Set AASRP_BENCHMARK to run the benchmarks")
+class TestHtmlFragmentBenchmarks(BaseTestCase):
+    """
+    Benchmarks of the compiled HTML fragments
+    """
+
+    def test_compiled_fragment_is_faster_than_the_template_engine(self):
+        """
+        Test rendering the copy to clipboard icon as compiled fragment is faster than
+        rendering it with the template engine
+
+        :return:
+        :rtype:
+        """
+
+        title = _("Copy request code to clipboard")
+        renderers = {
+            "template engine": lambda index: render_to_string(
+                template_name=COPY_TO_CLIPBOARD_ICON,
+                context={"data": f"request-{index}", "title": title},
+            ),
+            "compiled fragment": lambda index: render_html_fragment(
+                template_name=COPY_TO_CLIPBOARD_ICON,
+                data=f"request-{index}",
+                title=title,
+            ),
+        }
+        timings = {}
+
+        for name, render in renderers.items():
+            # Warm up the template loaders and the fragment cache
+            render(0)
+
+            start = time.perf_counter()
+
+            for index in range(RENDERINGS):
+                render(index)
+
+            timings[name] = time.perf_counter() - start
+
+            print(
+                f"{name:<18} {RENDERINGS:>8} renderings "
+                f"{timings[name] * 1000:>10.1f} ms "
+                f"{timings[name] / RENDERINGS * 1_000_000:>8.2f} µs/rendering"
+            )
+
+        self.assertLess(timings["compiled fragment"], timings["template engine"])
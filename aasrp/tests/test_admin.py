@@ -74,6 +74,52 @@ class TestSrpLinkAdmin(BaseTestCase):
 
         self.assertEqual(creator_name, "deleted")
 
+    def test_queues_killmails_of_selected_srp_links_for_caching(self):
+        """
+        Tests that the prewarm_killmails action queues the unique killmail IDs of the selected SRP links.
+
+        :return:
+        :rtype:
+        """
+
+        ship = ItemType.objects.create(name="Rifter", id=587)
+
+        for request_code, killboard_link in (
+            ("REQ001", "https://zkillboard.com/kill/111/"),
+            ("REQ002", "https://zkillboard.com/kill/222/"),
+        ):
+            SrpRequest.objects.create(
+                request_code=request_code,
+                creator=self.user,
+                srp_link=self.srp_link,
+                ship=ship,
+                killboard_link=killboard_link,
+            )
+
+        # Duplicate from before killmail IDs were unique, so it has no killmail ID
+        SrpRequest.objects.bulk_create(
+            [
+                SrpRequest(
+                    request_code="REQ003",
+                    creator=self.user,
+                    srp_link=self.srp_link,
+                    ship=ship,
+                    killboard_link="https://zkillboard.com/kill/111/",
+                )
+            ]
+        )
+
+        queryset = SrpLink.objects.filter(pk=self.srp_link.pk)
+
+        with (
+            mock.patch("aasrp.admin.prewarm_killmail_cache.delay") as mock_delay,
+            mock.patch("aasrp.admin.messages.success") as mock_success,
+        ):
+            SrpLinkAdmin.prewarm_killmails(None, SimpleNamespace(), queryset)
+
+        mock_delay.assert_called_once_with(killmail_ids=[111, 222])
+        mock_success.assert_called_once()
+
 
 class TestSrpRequestAdminTests(BaseTestCase):
     """
@@ -393,3 +439,30 @@ class TestFleetTypeAdmin(BaseTestCase):
         fleet_type.refresh_from_db()
 
         self.assertTrue(fleet_type.is_enabled)
+
+    def test_activation_and_deactivation_invalidate_the_enabled_fleet_types(self):
+        """
+        Tests that activating and deactivating fleet types updates the cached enabled
+        fleet types.
+
+        :return:
+        :rtype:
+        """
+
+        fleet_type = FleetType.objects.create(name="Fleet G", is_enabled=False)
+        queryset = FleetType.objects.filter(pk=fleet_type.pk)
+        request = SimpleNamespace()
+
+        self.assertEqual(FleetType.objects.enabled(), [])
+
+        with (
+            mock.patch("aasrp.admin.messages.success"),
+            mock.patch("aasrp.admin.messages.error"),
+        ):
+            FleetTypeAdmin.activate(None, request, queryset)
+
+            self.assertEqual(FleetType.objects.enabled(), [fleet_type])
+
+            FleetTypeAdmin.deactivate(None, request, queryset)
+
+            self.assertEqual(FleetType.objects.enabled(), [])
@@ -11,7 +11,6 @@ from django.utils import timezone
 from django.utils.safestring import SafeString
 
 # AA SRP
-from aasrp.constants import KILLBOARD_DATA
 from aasrp.form import (
     SrpLinkForm,
     SrpLinkUpdateForm,
@@ -24,7 +23,8 @@ from aasrp.form import (
     get_mandatory_form_label_text,
     sanitize_cleaned_data,
 )
-from aasrp.models import FleetType, SrpLink
+from aasrp.helper.killboard import KILLBOARDS
+from aasrp.models import FleetType, SrpLink, SrpRequest
 from aasrp.tests import BaseTestCase
 from aasrp.tests.utils import create_fake_user, random_id
 
@@ -283,6 +283,53 @@ class TestSrpLinkForm(BaseTestCase):
 
         self.assertTrue(form.is_valid())
 
+    def test_only_offers_enabled_fleet_types(self):
+        """
+        Test that the form only offers and accepts enabled fleet types.
+
+        :return:
+        :rtype:
+        """
+
+        fleet_type_enabled = FleetType.objects.create(name="Fleet A", is_enabled=True)
+        fleet_type_disabled = FleetType.objects.create(name="Fleet B", is_enabled=False)
+
+        choices = [
+            value for value, _label in SrpLinkForm().fields["fleet_type"].choices
+        ]
+
+        self.assertEqual(choices, ["", fleet_type_enabled.pk])
+
+        form = SrpLinkForm(
+            data={
+                "srp_name": "Test Fleet",
+                "fleet_time": "2023-10-01 12:00:00",
+                "fleet_type": fleet_type_disabled.pk,
+                "fleet_doctrine": "Test Doctrine",
+            }
+        )
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("fleet_type", form.errors)
+
+    def test_renders_fleet_types_without_queries(self):
+        """
+        Test that the fleet types are rendered from the configuration cache.
+
+        :return:
+        :rtype:
+        """
+
+        FleetType.objects.create(name="Fleet A", is_enabled=True)
+
+        # Warm up the configuration cache
+        str(SrpLinkForm()["fleet_type"])
+
+        with self.assertNumQueries(0):
+            rendered = str(SrpLinkForm()["fleet_type"])
+
+        self.assertIn("Fleet A", rendered)
+
 
 class TestSrpLinkUpdateForm(BaseFormTestCase):
     """
@@ -329,8 +376,8 @@ class TestSrpRequestForm(BaseFormTestCase):
         form.cleaned_data = {"killboard_link": "https://zkillboard.com/kill/123456/"}
 
         with patch(
-            "aasrp.form.KILLBOARD_DATA",
-            {"zKillboard": KILLBOARD_DATA.get("zKillboard")},
+            "aasrp.helper.killboard.KILLBOARDS",
+            tuple(kb for kb in KILLBOARDS if kb.name == "zKillboard"),
         ):
             self.assertEqual(
                 form.clean_killboard_link(), "https://zkillboard.com/kill/123456/"
@@ -353,8 +400,8 @@ class TestSrpRequestForm(BaseFormTestCase):
         form.cleaned_data = {"killboard_link": "https://zkillboard.com/kill/123456"}
 
         with patch(
-            "aasrp.form.KILLBOARD_DATA",
-            {"zKillboard": KILLBOARD_DATA.get("zKillboard")},
+            "aasrp.helper.killboard.KILLBOARDS",
+            tuple(kb for kb in KILLBOARDS if kb.name == "zKillboard"),
         ):
             self.assertEqual(
                 form.clean_killboard_link(), "https://zkillboard.com/kill/123456/"
@@ -377,8 +424,8 @@ class TestSrpRequestForm(BaseFormTestCase):
         form.cleaned_data = {"killboard_link": "https://invalid.com/kill/123456/"}
 
         with patch(
-            "aasrp.form.KILLBOARD_DATA",
-            {"zKillboard": KILLBOARD_DATA.get("zKillboard")},
+            "aasrp.helper.killboard.KILLBOARDS",
+            tuple(kb for kb in KILLBOARDS if kb.name == "zKillboard"),
         ):
             with self.assertRaises(ValidationError) as cm:
                 form.clean_killboard_link()
@@ -402,8 +449,8 @@ class TestSrpRequestForm(BaseFormTestCase):
         form.cleaned_data = {"killboard_link": "https://zkillboard.com/ship/123456/"}
 
         with patch(
-            "aasrp.form.KILLBOARD_DATA",
-            {"zKillboard": KILLBOARD_DATA.get("zKillboard")},
+            "aasrp.helper.killboard.KILLBOARDS",
+            tuple(kb for kb in KILLBOARDS if kb.name == "zKillboard"),
         ):
             with self.assertRaises(ValidationError) as cm:
                 form.clean_killboard_link()
@@ -438,6 +485,35 @@ class TestSrpRequestForm(BaseFormTestCase):
                 "There is already an SRP request for this kill mail.", str(cm.exception)
             )
 
+    def test_rejects_killmail_already_requested_via_another_killboard(self):
+        """
+        Test that the form rejects a killmail that was requested with a link to another killboard.
+
+        :return:
+        :rtype:
+        """
+
+        SrpRequest.objects.create(
+            creator=self.user_jean_luc_picard,
+            srp_link=self.srp_link,
+            killboard_link="https://kb.evetools.org/kill/123456",
+        )
+
+        form = SrpRequestForm(
+            data={
+                "killboard_link": "https://zkillboard.com/kill/123456/",
+                "additional_info": "Details",
+            }
+        )
+        form.cleaned_data = {"killboard_link": "https://zkillboard.com/kill/123456/"}
+
+        with self.assertRaises(ValidationError) as cm:
+            form.clean_killboard_link()
+
+        self.assertIn(
+            "There is already an SRP request for this kill mail.", str(cm.exception)
+        )
+
 
 class TestSrpRequestPayoutForm(BaseTestCase):
     """
@@ -0,0 +1,116 @@
+"""
+Unit tests for the helper.config_cache helper.
+"""
+
+# Standard Library
+from unittest.mock import MagicMock, patch
+
+# Django
+from django.core.cache import cache
+
+# AA SRP
+from aasrp.helper.config_cache import (
+    clear_local_config_cache,
+    get_cached_config,
+    get_config_cache_key,
+    invalidate_cached_config,
+)
+from aasrp.tests import BaseTestCase
+
+
+class TestConfigCache(BaseTestCase):
+    """
+    Test the two tier configuration cache
+    """
+
+    def setUp(self):
+        """
+        Start with an empty configuration entry
+
+        :return:
+        :rtype:
+        """
+
+        invalidate_cached_config("test")
+
+    def test_loads_a_configuration_entry_once(self):
+        """
+        Test the loader is only called on a cache miss
+
+        :return:
+        :rtype:
+        """
+
+        loader = MagicMock(return_value={"value": 1})
+
+        for _index in range(3):
+            self.assertEqual(
+                get_cached_config(name="test", loader=loader), {"value": 1}
+            )
+
+        loader.assert_called_once_with()
+        self.assertEqual(cache.get(get_config_cache_key(name="test")), {"value": 1})
+
+    def test_caches_none(self):
+        """
+        Test None is cached like any other value
+
+        :return:
+        :rtype:
+        """
+
+        loader = MagicMock(return_value=None)
+
+        get_cached_config(name="test", loader=loader)
+        clear_local_config_cache()
+
+        self.assertIsNone(get_cached_config(name="test", loader=loader))
+        loader.assert_called_once_with()
+
+    def test_reads_the_shared_cache_when_the_local_copy_is_missing(self):
+        """
+        Test a process without a local copy reads the shared cache
+
+        :return:
+        :rtype:
+        """
+
+        get_cached_config(name="test", loader=lambda: "shared")
+        clear_local_config_cache()
+
+        with patch("aasrp.helper.config_cache.cache.get", wraps=cache.get) as mock_get:
+            self.assertEqual(
+                get_cached_config(name="test", loader=lambda: "reloaded"), "shared"
+            )
+            get_cached_config(name="test", loader=lambda: "reloaded")
+
+        mock_get.assert_called_once()
+
+    def test_reads_the_shared_cache_when_the_local_copy_is_expired(self):
+        """
+        Test the local copy is only used within its TTL
+
+        :return:
+        :rtype:
+        """
+
+        get_cached_config(name="test", loader=lambda: "old")
+        cache.set(get_config_cache_key(name="test"), "new")
+
+        with patch("aasrp.helper.config_cache.AASRP_CONFIG_LOCAL_CACHE_TTL", 0):
+            self.assertEqual(get_cached_config(name="test", loader=lambda: ""), "new")
+
+    def test_invalidate_deletes_both_tiers(self):
+        """
+        Test invalidating a configuration entry reloads it
+
+        :return:
+        :rtype:
+        """
+
+        get_cached_config(name="test", loader=lambda: "old")
+
+        invalidate_cached_config("test")
+
+        self.assertIsNone(cache.get(get_config_cache_key(name="test")))
+        self.assertEqual(get_cached_config(name="test", loader=lambda: "new"), "new")
@@ -0,0 +1,230 @@
+"""
+Unit tests for the helper.fake_data helper and the aasrp_generate_fake_data command.
+"""
+
+# Standard Library
+from io import StringIO
+
+# Django
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import transaction
+
+# Alliance Auth
+from allianceauth.authentication.models import CharacterOwnership, User
+
+# AA SRP
+from aasrp.helper.fake_data import INSURANCE_LEVELS, generate_fake_data
+from aasrp.models import Insurance, RequestComment, SrpLink, SrpRequest
+from aasrp.tests import BaseTestCase
+
+
+def _snapshot() -> list[tuple]:
+    """
+    Get the generated SRP requests, without their primary keys and times
+
+    :return:
+    :rtype:
+    """
+
+    return list(
+        SrpRequest.objects.order_by("killmail_id").values_list(
+            "request_code",
+            "srp_link__srp_code",
+            "creator__username",
+            "character__character_id",
+            "ship_id",
+            "loss_amount",
+            "payout_amount",
+            "request_status",
+        )
+    )
+
+
+class TestGenerateFakeData(BaseTestCase):
+    """
+    Test the fake data generation
+    """
+
+    def test_generates_the_requested_data(self):
+        """
+        Test the requested numbers of rows are generated
+
+        :return:
+        :rtype:
+        """
+
+        result = generate_fake_data(
+            users=10, alts=2, fleet_types=3, srp_links=5, srp_requests=200, seed=1
+        )
+
+        self.assertEqual(len(result.users), 10)
+        self.assertEqual(len(result.fleet_types), 3)
+        self.assertEqual(len(result.srp_links), 5)
+        self.assertEqual(result.srp_requests, 200)
+        self.assertEqual(SrpRequest.objects.count(), 200)
+        self.assertEqual(CharacterOwnership.objects.count(), 30)
+        self.assertEqual(RequestComment.objects.count(), result.comments)
+        self.assertEqual(Insurance.objects.count(), 200 * len(INSURANCE_LEVELS))
+        self.assertEqual(Insurance.objects.count(), result.insurances)
+
+        for user in User.objects.filter(pk__in=[user.pk for user in result.users]):
+            self.assertIsNotNone(user.profile.main_character)
+
+    def test_statuses_and_payouts_are_consistent(self):
+        """
+        Test the statuses, payouts and comment histories of the SRP requests match
+
+        :return:
+        :rtype:
+        """
+
+        result = generate_fake_data(users=10, srp_links=10, srp_requests=300, seed=2)
+
+        self.assertEqual(result.srp_links[0].srp_status, SrpLink.Status.ACTIVE)
+        self.assertFalse(
+            SrpRequest.objects.filter(
+                srp_link__srp_status=SrpLink.Status.COMPLETED,
+                request_status=SrpRequest.Status.PENDING,
+            ).exists()
+        )
+        self.assertFalse(
+            SrpRequest.objects.exclude(request_status=SrpRequest.Status.APPROVED)
+            .exclude(payout_amount=0)
+            .exists()
+        )
+        self.assertFalse(
+            SrpRequest.objects.filter(
+                request_status=SrpRequest.Status.APPROVED, payout_amount=0
+            ).exists()
+        )
+        self.assertEqual(
+            RequestComment.objects.filter(
+                comment_type=RequestComment.Type.REQUEST_ADDED
+            ).count(),
+            300,
+        )
+
+        for srp_request in SrpRequest.objects.exclude(
+            request_status=SrpRequest.Status.PENDING
+        )[:20]:
+            self.assertTrue(
+                srp_request.srp_request_comments.filter(
+                    comment_type=RequestComment.Type.STATUS_CHANGE,
+                    new_status=srp_request.request_status,
+                ).exists()
+            )
+
+    def test_updates_the_request_stats_of_the_srp_links(self):
+        """
+        Test the stored request statistics of the SRP links are up to date
+
+        :return:
+        :rtype:
+        """
+
+        result = generate_fake_data(users=5, srp_links=3, srp_requests=100, seed=3)
+
+        self.assertEqual(
+            sum(
+                srp_link.stats_total_requests
+                for srp_link in SrpLink.objects.filter(
+                    pk__in=[srp_link.pk for srp_link in result.srp_links]
+                )
+            ),
+            100,
+        )
+
+    def test_same_seed_generates_the_same_data(self):
+        """
+        Test the same seed generates the same data
+
+        :return:
+        :rtype:
+        """
+
+        snapshots = []
+
+        for _ in range(2):
+            with transaction.atomic():
+                generate_fake_data(
+                    users=5, srp_links=3, srp_requests=50, seed=4, batch_size=7
+                )
+                snapshots.append(_snapshot())
+
+                transaction.set_rollback(True)
+
+        self.assertEqual(len(snapshots[0]), 50)
+        self.assertEqual(snapshots[0], snapshots[1])
+
+    def test_refuses_to_generate_the_same_seed_twice(self):
+        """
+        Test the same prefix and seed can't be generated twice
+
+        :return:
+        :rtype:
+        """
+
+        generate_fake_data(users=1, srp_links=1, srp_requests=1, seed=5)
+
+        with self.assertRaises(ValueError):
+            generate_fake_data(users=1, srp_links=1, srp_requests=1, seed=5)
+
+        generate_fake_data(users=1, srp_links=1, srp_requests=1, seed=6)
+
+        self.assertEqual(SrpRequest.objects.count(), 2)
+
+
+class TestGenerateFakeDataCommand(BaseTestCase):
+    """
+    Test the aasrp_generate_fake_data management command
+    """
+
+    def test_generates_fake_data(self):
+        """
+        Test the command generates fake data
+
+        :return:
+        :rtype:
+        """
+
+        out = StringIO()
+
+        call_command(
+            "aasrp_generate_fake_data",
+            "--users=3",
+            "--srp-links=2",
+            "--srp-requests=10",
+            stdout=out,
+        )
+
+        self.assertEqual(SrpRequest.objects.count(), 10)
+        self.assertIn("10 SRP requests", out.getvalue())
+
+    def test_fails_for_the_same_seed(self):
+        """
+        Test the command fails when the seed has been used before
+
+        :return:
+        :rtype:
+        """
+
+        call_command("aasrp_generate_fake_data", "--srp-requests=1", stdout=StringIO())
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "aasrp_generate_fake_data", "--srp-requests=1", stdout=StringIO()
+            )
+
+    def test_fails_for_invalid_numbers(self):
+        """
+        Test the command fails for invalid numbers
+
+        :return:
+        :rtype:
+        """
+
+        with self.assertRaises(CommandError):
+            call_command("aasrp_generate_fake_data", "--users=0", stdout=StringIO())
+
+        self.assertFalse(SrpRequest.objects.exists())
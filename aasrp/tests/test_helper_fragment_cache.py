@@ -0,0 +1,187 @@
+"""
+Unit tests for the helper.fragment_cache helper.
+"""
+
+# Standard Library
+from unittest.mock import MagicMock
+
+# Third Party
+from eve_sde.models import ItemType
+
+# Django
+from django.utils import timezone
+from django.utils.translation import override
+
+# AA SRP
+from aasrp.helper.fragment_cache import (
+    get_fragment_cache_key,
+    get_permission_tier,
+    render_cached_fragments,
+)
+from aasrp.models import SrpLink, SrpRequest
+from aasrp.tests import BaseTestCase
+from aasrp.tests.utils import create_fake_user, random_id
+
+
+class TestFragmentCache(BaseTestCase):
+    """
+    Test the fragment cache for SRP requests
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Set up test data
+
+        :return:
+        :rtype:
+        """
+
+        super().setUpClass()
+
+        cls.user = create_fake_user(
+            character_id=random_id(), character_name="Jean Luc Picard"
+        )
+        cls.ship = ItemType.objects.create(id=587, name="Rifter", published=True)
+
+    def setUp(self) -> None:
+        """
+        Set up an SRP link with an SRP request
+
+        :return:
+        :rtype:
+        """
+
+        self.srp_link = SrpLink.objects.create(
+            srp_name="Test SRP", fleet_time=timezone.now()
+        )
+        self.srp_request = SrpRequest.objects.create(
+            creator=self.user,
+            character=self.user.profile.main_character,
+            ship=self.ship,
+            srp_link=self.srp_link,
+        )
+
+    def _cache_key(self, permission_tier: str = "manage_srp") -> str:
+        """
+        Get the cache key of the test SRP request as stored in the database
+
+        :return:
+        :rtype:
+        """
+
+        return get_fragment_cache_key(
+            namespace="test",
+            srp_request=SrpRequest.objects.get(pk=self.srp_request.pk),
+            permission_tier=permission_tier,
+        )
+
+    def test_permission_tier(self):
+        """
+        Test the permission tier follows the highest SRP permission of the user
+
+        :return:
+        :rtype:
+        """
+
+        for permissions, expected in (
+            ({"aasrp.manage_srp", "aasrp.manage_srp_requests"}, "manage_srp"),
+            ({"aasrp.manage_srp_requests"}, "manage_srp_requests"),
+            (set(), "basic_access"),
+        ):
+            with self.subTest(permissions=permissions):
+                user = MagicMock()
+                user.has_perm.side_effect = lambda perm, perms=permissions: (
+                    perm in perms
+                )
+
+                self.assertEqual(get_permission_tier(user=user), expected)
+
+    def test_cache_key_changes_with_the_rendering_context(self):
+        """
+        Test the cache key changes when the SRP request, the status of its SRP link,
+        its character, the permission tier or the language changes
+
+        :return:
+        :rtype:
+        """
+
+        cache_key = self._cache_key()
+
+        self.assertNotEqual(self._cache_key(permission_tier="basic_access"), cache_key)
+
+        with override("de"):
+            self.assertNotEqual(self._cache_key(), cache_key)
+
+        self.srp_request.request_status = SrpRequest.Status.APPROVED
+        self.srp_request.save()
+        cache_key_saved = self._cache_key()
+
+        self.assertNotEqual(cache_key_saved, cache_key)
+
+        SrpRequest.objects.filter(pk=self.srp_request.pk).update(payout_amount=1000)
+        cache_key_updated = self._cache_key()
+
+        self.assertNotEqual(cache_key_updated, cache_key_saved)
+
+        srp_request = SrpRequest.objects.get(pk=self.srp_request.pk)
+        srp_request.payout_amount = 2000
+        SrpRequest.objects.bulk_update([srp_request], ["payout_amount"])
+
+        cache_key_bulk_updated = self._cache_key()
+
+        self.assertNotEqual(cache_key_bulk_updated, cache_key_updated)
+
+        self.srp_link.srp_status = SrpLink.Status.CLOSED
+        self.srp_link.save()
+        cache_key_closed = self._cache_key()
+
+        self.assertNotEqual(cache_key_closed, cache_key_bulk_updated)
+
+        character = self.srp_request.character
+        character.corporation_ticker = "NEW"
+        character.save()
+
+        self.assertNotEqual(self._cache_key(), cache_key_closed)
+
+    def test_renders_missing_fragments_only(self):
+        """
+        Test fragments are only rendered when they are not cached yet
+
+        :return:
+        :rtype:
+        """
+
+        render = MagicMock(side_effect=lambda srp_request: srp_request.version)
+
+        for _ in range(2):
+            fragments = render_cached_fragments(
+                namespace="test",
+                srp_requests=[self.srp_request],
+                permission_tier="manage_srp",
+                render=render,
+            )
+
+        self.assertEqual(fragments, {self.srp_request.pk: 1})
+        self.assertEqual(render.call_count, 1)
+
+        self.srp_request.save()
+
+        fragments = render_cached_fragments(
+            namespace="test",
+            srp_requests=[self.srp_request],
+            permission_tier="manage_srp",
+            render=render,
+        )
+
+        self.assertEqual(fragments, {self.srp_request.pk: 2})
+        self.assertEqual(render.call_count, 2)
+        self.assertEqual(
+            render_cached_fragments(
+                namespace="test",
+                srp_requests=[],
+                permission_tier="manage_srp",
+                render=render,
+            ),
+            {},
+        )
@@ -0,0 +1,162 @@
+"""
+Unit tests for the helper.html_fragments helper.
+"""
+
+# Standard Library
+from unittest.mock import patch
+
+# Django
+from django.template.loader import get_template, render_to_string
+from django.test import override_settings
+from django.utils import translation
+from django.utils.safestring import SafeString, mark_safe
+from django.utils.translation import gettext_lazy as _
+
+# AA SRP
+from aasrp.helper.html_fragments import (
+    HtmlFragment,
+    get_html_fragment,
+    render_html_fragment,
+)
+from aasrp.tests import BaseTestCase
+
+COPY_TO_CLIPBOARD_ICON = "aasrp/partials/common/copy-to-clipboard-icon.html"
+
+LOCMEM_TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "OPTIONS": {
+            "loaders": [
+                (
+                    "django.template.loaders.locmem.Loader",
+                    {
+                        "plain.html": '<b title="{{ title }}">{{ value }}</b>',
+                        "filter.html": "{{ value|upper }}",
+                        "lookup.html": "{{ row.value }}",
+                        "tag.html": "{% if value %}{{ value }}{% endif %}",
+                        "translate.html": '{{ _("Title") }}',
+                    },
+                )
+            ]
+        },
+    }
+]
+
+
+class TestRenderHtmlFragment(BaseTestCase):
+    """
+    Test the compiled rendering matches the template engine
+    """
+
+    def test_matches_the_template_engine(self):
+        """
+        Test the rendering matches the template engine, incl. escaping
+
+        :return:
+        :rtype:
+        """
+
+        for data, title in (
+            ("Sample data", "Copy this data"),
+            ("", ""),
+            ("<script>alert('test');</script>", 'Copy "<script>" tag & more'),
+            (mark_safe("<b>safe</b>"), "Safe data"),
+        ):
+            with self.subTest(data=data):
+                result = render_html_fragment(
+                    template_name=COPY_TO_CLIPBOARD_ICON, data=data, title=title
+                )
+
+                self.assertIsInstance(result, SafeString)
+                self.assertEqual(
+                    result,
+                    render_to_string(
+                        template_name=COPY_TO_CLIPBOARD_ICON,
+                        context={"data": data, "title": title},
+                    ),
+                )
+
+    def test_renders_lazy_translations_in_the_active_language(self):
+        """
+        Test lazy translations are rendered in the active language
+
+        :return:
+        :rtype:
+        """
+
+        title = _("Copy request code to clipboard")
+
+        for language in ("en", "de"):
+            with self.subTest(language=language), translation.override(language):
+                self.assertEqual(
+                    render_html_fragment(
+                        template_name=COPY_TO_CLIPBOARD_ICON, data=1, title=title
+                    ),
+                    render_to_string(
+                        template_name=COPY_TO_CLIPBOARD_ICON,
+                        context={"data": 1, "title": title},
+                    ),
+                )
+
+    def test_compiles_a_partial_once(self):
+        """
+        Test a partial is only loaded once
+
+        :return:
+        :rtype:
+        """
+
+        get_html_fragment.cache_clear()
+
+        with patch(
+            "aasrp.helper.html_fragments.get_template",
+            wraps=get_template,
+        ) as mock_get_template:
+            for _index in range(3):
+                render_html_fragment(
+                    template_name=COPY_TO_CLIPBOARD_ICON, data="data", title="title"
+                )
+
+        mock_get_template.assert_called_once_with(template_name=COPY_TO_CLIPBOARD_ICON)
+
+
+@override_settings(TEMPLATES=LOCMEM_TEMPLATES)
+class TestHtmlFragment(BaseTestCase):
+    """
+    Test the compilation of partials
+    """
+
+    def test_renders_missing_values_as_empty_strings(self):
+        """
+        Test missing values are rendered as empty strings, like the template engine
+
+        :return:
+        :rtype:
+        """
+
+        fragment = HtmlFragment(template_name="plain.html")
+
+        self.assertEqual(fragment.render(value=42), '<b title="">42</b>')
+        self.assertEqual(
+            fragment.render(value=42), render_to_string("plain.html", {"value": 42})
+        )
+
+    def test_rejects_partials_with_more_than_plain_variables(self):
+        """
+        Test partials with filters, lookups, tags or translations are rejected
+
+        :return:
+        :rtype:
+        """
+
+        for template_name in (
+            "filter.html",
+            "lookup.html",
+            "tag.html",
+            "translate.html",
+        ):
+            with (
+                self.subTest(template_name=template_name),
+                self.assertRaises(ValueError),
+            ):
+                HtmlFragment(template_name=template_name)
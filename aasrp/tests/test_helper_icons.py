@@ -1,3 +1,6 @@
+# Standard Library
+from unittest.mock import Mock
+
 # Django
 from django.template.loader import render_to_string
 from django.urls import reverse
@@ -14,6 +17,7 @@ from aasrp.helper.icons import (
     get_srp_request_action_icons,
     get_srp_request_status_icon,
 )
+from aasrp.helper.viewer import ViewerCapabilities
 from aasrp.models import SrpLink, SrpRequest
 from aasrp.tests import BaseTestCase
 from aasrp.tests.utils import get_permission_content_type
@@ -633,6 +637,7 @@ class TestDashboardActionIcons(BaseTestCase):
         self.assertIn("fa-solid fa-hand-holding-dollar", result)
         self.assertIn("fa-solid fa-eye", result)
         self.assertIn("fa-regular fa-newspaper", result)
+        self.assertIn("fa-solid fa-file-import", result)
         self.assertIn("fa-solid fa-ban", result)
         self.assertIn("fa-regular fa-trash-can", result)
 
@@ -664,6 +669,7 @@ class TestDashboardActionIcons(BaseTestCase):
         self.assertIn("fa-solid fa-hand-holding-dollar", result)
         self.assertNotIn("fa-solid fa-eye", result)
         self.assertNotIn("fa-regular fa-newspaper", result)
+        self.assertNotIn("fa-solid fa-file-import", result)
         self.assertNotIn("fa-solid fa-ban", result)
         self.assertNotIn("fa-regular fa-trash-can", result)
 
@@ -727,5 +733,93 @@ class TestDashboardActionIcons(BaseTestCase):
 
         self.assertIn("fa-solid fa-eye", result)
         self.assertNotIn("fa-regular fa-newspaper", result)
+        self.assertNotIn("fa-solid fa-file-import", result)
         self.assertNotIn("fa-solid fa-ban", result)
         self.assertNotIn("fa-regular fa-trash-can", result)
+
+
+class TestActionIconsWithViewerCapabilities(BaseTestCase):
+    """
+    Test cases for the action icons with precomputed viewer capabilities.
+    """
+
+    def test_srp_request_action_icons_without_permission_lookups(self):
+        """
+        Test that the action icons of several SRP requests don't look up the user's
+        permissions when the capabilities are given, and only differ in their codes.
+
+        :return:
+        :rtype:
+        """
+
+        capabilities = ViewerCapabilities(can_manage_srp=True)
+        srp_link = SrpLink(srp_code="SRPCODE1", srp_status=SrpLink.Status.ACTIVE)
+        request = Mock()
+
+        results = [
+            get_srp_request_action_icons(
+                request=request,
+                srp_link=srp_link,
+                srp_request=SrpRequest(
+                    request_code=request_code,
+                    request_status=SrpRequest.Status.PENDING,
+                ),
+                capabilities=capabilities,
+            )
+            for request_code in ("REQUEST1", "REQUEST2")
+        ]
+
+        request.user.has_perm.assert_not_called()
+        self.assertIn(
+            reverse(
+                "aasrp:ajax_srp_request_remove",
+                kwargs={"srp_code": "SRPCODE1", "srp_request_code": "REQUEST1"},
+            ),
+            results[0],
+        )
+        self.assertNotIn("REQUEST2", results[0])
+        self.assertEqual(results[0].replace("REQUEST1", "REQUEST2"), results[1])
+
+    def test_srp_request_action_icons_without_capability(self):
+        """
+        Test that viewers who can't view SRP requests get no action icons.
+
+        :return:
+        :rtype:
+        """
+
+        result = get_srp_request_action_icons(
+            request=Mock(),
+            srp_link=SrpLink(srp_code="SRPCODE1", srp_status=SrpLink.Status.ACTIVE),
+            srp_request=SrpRequest(request_code="REQUEST1"),
+            capabilities=ViewerCapabilities(),
+        )
+
+        self.assertEqual(result, "")
+
+    def test_dashboard_action_icons_substitute_srp_link(self):
+        """
+        Test that the dashboard action icons contain the code and escaped name of the SRP link.
+
+        :return:
+        :rtype:
+        """
+
+        request = Mock()
+
+        result = dashboard_action_icons(
+            request=request,
+            srp_link=SrpLink(
+                srp_code="SRPCODE1",
+                srp_name='Fleet "Alpha" <1>',
+                srp_status=SrpLink.Status.ACTIVE,
+            ),
+            capabilities=ViewerCapabilities(can_manage_srp=True),
+        )
+
+        request.user.has_perm.assert_not_called()
+        self.assertIn(reverse("aasrp:request_srp", args=["SRPCODE1"]), result)
+        self.assertIn(
+            'data-name="Fleet &quot;Alpha&quot; &lt;1&gt; (SRPCODE1)"', result
+        )
+        self.assertNotIn("aasrp_placeholder", result)
@@ -0,0 +1,151 @@
+"""
+Unit tests for the helper.killboard helper.
+"""
+
+# Standard Library
+from unittest.mock import patch
+
+# AA SRP
+from aasrp.helper.killboard import (
+    KillboardLink,
+    _build_registry,
+    get_killboard,
+    get_killboard_base_urls,
+    parse_killboard_link,
+)
+from aasrp.models import SrpRequest
+from aasrp.tests import BaseTestCase
+
+
+class TestParseKillboardLink(BaseTestCase):
+    """
+    Test parse_killboard_link helper
+    """
+
+    def test_parses_links_of_all_built_in_killboards(self):
+        """
+        Test parses links of all built-in killboards
+
+        :return:
+        :rtype:
+        """
+
+        for killboard_link, provider in (
+            ("https://zkillboard.com/kill/128743453/", "zKillboard"),
+            ("https://kb.evetools.org/kill/128743453", "EveTools"),
+            ("https://eve-kill.com/kill/128743453", "EVE-KILL"),
+        ):
+            with self.subTest(killboard_link=killboard_link):
+                self.assertEqual(
+                    parse_killboard_link(killboard_link=killboard_link),
+                    KillboardLink(provider=provider, killmail_id=128743453),
+                )
+
+    def test_ignores_digits_outside_of_the_killmail_id(self):
+        """
+        Test ignores digits outside of the killmail ID, e.g. in query strings
+
+        :return:
+        :rtype:
+        """
+
+        result = parse_killboard_link(
+            killboard_link="https://eve-kill.com/kill/128743453?page=2"
+        )
+
+        self.assertEqual(result.killmail_id, 128743453)
+
+    def test_returns_none_for_non_killmail_link(self):
+        """
+        Test returns None for a link to an accepted killboard that isn't a killmail
+
+        :return:
+        :rtype:
+        """
+
+        self.assertIsNone(
+            parse_killboard_link(killboard_link="https://zkillboard.com/ship/587/")
+        )
+        self.assertIsNone(
+            parse_killboard_link(killboard_link="https://eve-kill.com/kill/123abc")
+        )
+
+    def test_returns_none_for_unknown_killboard(self):
+        """
+        Test returns None for a link to an unknown killboard
+
+        :return:
+        :rtype:
+        """
+
+        self.assertIsNone(
+            parse_killboard_link(killboard_link="https://example.com/kill/123/")
+        )
+        self.assertIsNone(get_killboard(killboard_link="https://example.com/kill/123/"))
+
+    def test_supports_additional_killboards(self):
+        """
+        Test supports additional killboards, including the killmail hash
+
+        :return:
+        :rtype:
+        """
+
+        killboards = _build_registry(
+            killboard_data={
+                "ESI": {
+                    "base_url": "https://esi.evetech.net/",
+                    "base_url_regex": r"^https:\/\/esi\.evetech\.net\/",
+                    "killmail_url_regex": (
+                        r"^https:\/\/esi\.evetech\.net\/latest\/killmails\/"
+                        r"(?P<killmail_id>\d+)\/(?P<killmail_hash>[0-9a-f]+)\/"
+                    ),
+                }
+            }
+        )
+
+        with patch("aasrp.helper.killboard.KILLBOARDS", killboards):
+            result = parse_killboard_link(
+                killboard_link="https://esi.evetech.net/latest/killmails/123/abc123/"
+            )
+
+            self.assertEqual(
+                result,
+                KillboardLink(provider="ESI", killmail_id=123, killmail_hash="abc123"),
+            )
+            self.assertIn("https://esi.evetech.net/", get_killboard_base_urls())
+            self.assertIn("https://zkillboard.com/", get_killboard_base_urls())
+
+
+class TestGetKillId(BaseTestCase):
+    """
+    Test SrpRequestManager.get_kill_id
+    """
+
+    def test_returns_killmail_id_as_string(self):
+        """
+        Test returns the killmail ID as string
+
+        :return:
+        :rtype:
+        """
+
+        self.assertEqual(
+            SrpRequest.objects.get_kill_id(
+                killboard_link="https://zkillboard.com/kill/128743453/"
+            ),
+            "128743453",
+        )
+
+    def test_returns_empty_string_for_invalid_link(self):
+        """
+        Test returns an empty string for a link that isn't a killmail
+
+        :return:
+        :rtype:
+        """
+
+        self.assertEqual(
+            SrpRequest.objects.get_kill_id(killboard_link="https://example.com/1/"),
+            "",
+        )
@@ -0,0 +1,226 @@
+"""
+Unit tests for the helper.killmail_import helper.
+"""
+
+# Standard Library
+from unittest.mock import patch
+
+# Third Party
+from eve_sde.models import ItemType
+
+# Django
+from django.utils import timezone
+
+# Alliance Auth
+from allianceauth.eveonline.models import EveCharacter
+
+# AA SRP
+from aasrp.helper.killmail_import import import_killmails, parse_killmail_references
+from aasrp.managers import InsurancePriceManager
+from aasrp.models import (
+    Insurance,
+    InsurancePrice,
+    Killmail,
+    RequestComment,
+    SrpLink,
+    SrpRequest,
+)
+from aasrp.tests import BaseTestCase
+from aasrp.tests.utils import create_fake_user
+
+
+class TestParseKillmailReferences(BaseTestCase):
+    """
+    Test parse_killmail_references helper
+    """
+
+    def test_parses_links_and_killmail_ids(self):
+        """
+        Test parses killboard links and killmail IDs, and skips duplicates
+
+        :return:
+        :rtype:
+        """
+
+        killboard_links, invalid_entries = parse_killmail_references(
+            entries=[
+                "https://zkillboard.com/kill/123",
+                " 456 ",
+                "https://eve-kill.com/kill/123",
+                "",
+                "https://example.com/kill/789/",
+            ]
+        )
+
+        self.assertEqual(
+            killboard_links,
+            {
+                123: "https://zkillboard.com/kill/123/",
+                456: "https://zkillboard.com/kill/456/",
+            },
+        )
+        self.assertEqual(invalid_entries, ["https://example.com/kill/789/"])
+
+
+class TestImportKillmails(BaseTestCase):
+    """
+    Test import_killmails helper
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Set up test data
+
+        :return:
+        :rtype:
+        """
+
+        super().setUpClass()
+
+        cls.user = create_fake_user(character_id=1001, character_name="Pilot One")
+        cls.character = EveCharacter.objects.get(character_id=1001)
+        cls.user.character_ownerships.create(character=cls.character)
+        cls.ship = ItemType.objects.create(id=587, name="Rifter", published=True)
+
+    def setUp(self) -> None:
+        """
+        Set up an SRP link, cached killmails and insurance prices
+
+        :return:
+        :rtype:
+        """
+
+        self.srp_link = SrpLink.objects.create(
+            srp_name="Test SRP", fleet_time=timezone.now()
+        )
+
+        for killmail_id, character_id, ship_type_id in (
+            (1, 1001, 587),
+            (2, 1001, 587),
+            (3, 9999, 587),
+            (4, 1001, 123456),
+        ):
+            Killmail.objects.create(
+                killmail_id=killmail_id,
+                killmail_hash="hash",
+                victim_character_id=character_id,
+                ship_type_id=ship_type_id,
+                zkb={"totalValue": 1000000, "fittedValue": 500000},
+            )
+
+        InsurancePrice.objects.create(
+            type_id=587,
+            levels=[{"name": "Platinum", "cost": 1000.0, "payout": 5000.0}],
+        )
+        InsurancePriceManager.clear_price_table()
+
+    def tearDown(self) -> None:
+        """
+        Clear the in-memory insurance price table
+
+        :return:
+        :rtype:
+        """
+
+        InsurancePriceManager.clear_price_table()
+
+    @patch("aasrp.managers.SrpRequestManager.get_zkillboard_data")
+    def test_creates_srp_requests(self, mock_get_zkillboard_data):
+        """
+        Test creates the SRP requests with comments and insurance
+
+        :return:
+        :rtype:
+        """
+
+        result = import_killmails(
+            srp_link=self.srp_link,
+            entries=["1", "https://zkillboard.com/kill/2/"],
+            additional_info="Fleet fight",
+        )
+
+        self.assertEqual(len(result.created), 2)
+        self.assertEqual(result.duplicates, [])
+        self.assertEqual(result.failed, {})
+        mock_get_zkillboard_data.assert_not_called()
+
+        srp_request = SrpRequest.objects.get(killmail_id=1)
+
+        self.assertEqual(srp_request.creator, self.user)
+        self.assertEqual(srp_request.character, self.character)
+        self.assertEqual(srp_request.ship, self.ship)
+        self.assertEqual(srp_request.loss_amount, 1000000)
+        self.assertEqual(srp_request.killboard_link, "https://zkillboard.com/kill/1/")
+        self.assertEqual(srp_request.request_status, SrpRequest.Status.PENDING)
+        self.assertEqual(
+            set(
+                RequestComment.objects.filter(srp_request=srp_request).values_list(
+                    "comment_type", flat=True
+                )
+            ),
+            {RequestComment.Type.REQUEST_ADDED, RequestComment.Type.REQUEST_INFO},
+        )
+        self.assertEqual(Insurance.objects.filter(srp_request=srp_request).count(), 1)
+
+        self.srp_link.refresh_from_db()
+
+        self.assertEqual(self.srp_link.total_requests_count, 2)
+        self.assertEqual(self.srp_link.pending_requests_count, 2)
+
+    def test_skips_duplicates_and_reports_failures(self):
+        """
+        Test skips killmails that already have an SRP request, and reports killmails
+        of unknown characters and ships
+
+        :return:
+        :rtype:
+        """
+
+        import_killmails(srp_link=self.srp_link, entries=["1"])
+
+        result = import_killmails(
+            srp_link=self.srp_link,
+            entries=["1", "3", "4", "https://example.com/kill/5/"],
+        )
+
+        self.assertEqual(result.created, [])
+        self.assertEqual(result.duplicates, [1])
+        self.assertEqual(set(result.failed), {"3", "4", "https://example.com/kill/5/"})
+        self.assertEqual(SrpRequest.objects.count(), 1)
+
+    def test_reports_killmails_filed_during_the_import_as_duplicates(self):
+        """
+        Test a killmail that gets an SRP request between the duplicate check and
+        the insert is reported as a duplicate instead of failing the import
+
+        :return:
+        :rtype:
+        """
+
+        get_or_fetch_many = Killmail.objects.get_or_fetch_many
+
+        def file_killmail_during_fetch(*args, **kwargs):
+            SrpRequest.objects.create(
+                request_code="FILED",
+                creator=self.user,
+                character=self.character,
+                ship=self.ship,
+                killboard_link="https://zkillboard.com/kill/1/",
+                srp_link=self.srp_link,
+            )
+
+            return get_or_fetch_many(*args, **kwargs)
+
+        with patch.object(
+            Killmail.objects,
+            "get_or_fetch_many",
+            side_effect=file_killmail_during_fetch,
+        ):
+            result = import_killmails(srp_link=self.srp_link, entries=["1", "2"])
+
+        self.assertEqual(
+            [srp_request.killmail_id for srp_request in result.created], [2]
+        )
+        self.assertEqual(result.duplicates, [1])
+        self.assertEqual(SrpRequest.objects.filter(killmail_id=1).count(), 1)
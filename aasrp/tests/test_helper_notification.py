@@ -5,7 +5,17 @@ from unittest.mock import ANY, MagicMock, patch
 from django.conf import settings
 
 # AA SRP
-from aasrp.helper.notification import notify_requester, notify_srp_team
+from aasrp.helper.killmail_import import KillmailImportResult
+from aasrp.helper.notification import (
+    KILLMAIL_IMPORT_NOTIFICATION_MAX_FAILED,
+    NOTIFICATION_DIGEST_MAX_REQUESTS,
+    group_requester_notifications,
+    notify_killmail_import,
+    notify_requester,
+    notify_requester_digest,
+    notify_srp_team,
+    queue_requester_notifications,
+)
 from aasrp.models import SrpRequest
 from aasrp.tests import BaseTestCase
 
@@ -245,3 +255,359 @@ class TestNotifyRequester(BaseTestCase):
                 "discord": "discord_notification",
             },
         )
+
+
+class TestNotifyRequesterDigest(BaseTestCase):
+    """
+    Test the notify_requester_digest function
+    """
+
+    @patch("aasrp.helper.notification.send_user_notification")
+    @patch(
+        "aasrp.helper.notification.get_main_character_name_from_user",
+        return_value="Reviser Character",
+    )
+    def test_sends_one_notification_for_all_requests(
+        self, mock_get_main_character_name, mock_send_user_notification
+    ):
+        """
+        Test that a single notification lists all SRP requests
+
+        :param mock_get_main_character_name:
+        :type mock_get_main_character_name:
+        :param mock_send_user_notification:
+        :type mock_send_user_notification:
+        :return:
+        :rtype:
+        """
+
+        requester = MagicMock()
+        srp_requests = []
+
+        for index in range(3):
+            srp_request = MagicMock(
+                request_status=SrpRequest.Status.APPROVED,
+                request_code=f"REQ{index}",
+            )
+            srp_request.ship.name_en = f"Ship {index}"
+            srp_request.srp_link.srp_name = "Test Fleet"
+            srp_request.srp_link.srp_code = "SRP123"
+            srp_requests.append(srp_request)
+
+        notify_requester_digest(
+            requester=requester,
+            reviser=MagicMock(),
+            srp_requests=srp_requests,
+            comment="Fly safe",
+        )
+
+        mock_send_user_notification.assert_called_once_with(
+            user=requester,
+            level="success",
+            title="3 SRP Requests Approved",
+            message=ANY,
+        )
+
+        message = mock_send_user_notification.call_args.kwargs["message"]
+
+        for notification in message.values():
+            self.assertIn("3 SRP requests of yours have been approved", notification)
+            self.assertIn("Reviser Character", notification)
+            self.assertIn("Fly safe", notification)
+
+            for index in range(3):
+                self.assertIn(f"Ship {index}", notification)
+                self.assertIn(f"REQ{index}", notification)
+
+
+class TestNotifyKillmailImport(BaseTestCase):
+    """
+    Test the notify_killmail_import function
+    """
+
+    def setUp(self):
+        """
+        Set up the SRP link and importer
+
+        :return:
+        :rtype:
+        """
+
+        self.importer = MagicMock()
+        self.srp_link = MagicMock(srp_name="Test Fleet", srp_code="SRP123")
+
+    @patch("aasrp.helper.notification.send_user_notification")
+    def test_sends_the_import_result(self, mock_send_user_notification):
+        """
+        Test that the notification lists the imported, skipped and failed killmails
+
+        :param mock_send_user_notification:
+        :type mock_send_user_notification:
+        :return:
+        :rtype:
+        """
+
+        notify_killmail_import(
+            importer=self.importer,
+            srp_link=self.srp_link,
+            result=KillmailImportResult(
+                created=[MagicMock(), MagicMock()],
+                duplicates=[123, 124],
+                failed={"456": "Unknown ship type 1."},
+            ),
+        )
+
+        mock_send_user_notification.assert_called_once_with(
+            user=self.importer,
+            level="warning",
+            title="Killmail Import: 2 SRP Requests Imported",
+            message=ANY,
+        )
+
+        message = mock_send_user_notification.call_args.kwargs["message"]
+
+        for notification in message.values():
+            self.assertIn("Your killmail import into Test Fleet", notification)
+            self.assertIn("SRP123", notification)
+            self.assertIn("123, 124", notification)
+            self.assertIn("456: Unknown ship type 1.", notification)
+
+    @patch("aasrp.helper.notification.send_user_notification")
+    def test_limits_the_listed_failures(self, mock_send_user_notification):
+        """
+        Test that only the first failures are listed, so the notification stays
+        within Discord's message length limit
+
+        :param mock_send_user_notification:
+        :type mock_send_user_notification:
+        :return:
+        :rtype:
+        """
+
+        notify_killmail_import(
+            importer=self.importer,
+            srp_link=self.srp_link,
+            result=KillmailImportResult(
+                created=[],
+                duplicates=[],
+                failed={
+                    str(index): "Not found"
+                    for index in range(KILLMAIL_IMPORT_NOTIFICATION_MAX_FAILED + 5)
+                },
+            ),
+        )
+
+        message = mock_send_user_notification.call_args.kwargs["message"]
+
+        for notification in message.values():
+            self.assertEqual(
+                notification.count(": Not found"),
+                KILLMAIL_IMPORT_NOTIFICATION_MAX_FAILED,
+            )
+            self.assertIn("… and 5 more", notification)
+
+    @patch("aasrp.helper.notification.send_user_notification")
+    def test_sends_success_without_failures(self, mock_send_user_notification):
+        """
+        Test that an import without failures is reported as a success
+
+        :param mock_send_user_notification:
+        :type mock_send_user_notification:
+        :return:
+        :rtype:
+        """
+
+        notify_killmail_import(
+            importer=self.importer,
+            srp_link=self.srp_link,
+            result=KillmailImportResult(
+                created=[MagicMock()], duplicates=[], failed={}
+            ),
+        )
+
+        self.assertEqual(
+            mock_send_user_notification.call_args.kwargs["level"], "success"
+        )
+
+
+class TestGroupRequesterNotifications(BaseTestCase):
+    """
+    Test the group_requester_notifications function
+    """
+
+    @staticmethod
+    def _notification(creator_id: int, request_status: str, comment: str = ""):
+        """
+        Build a notification with its SRP request
+
+        :param creator_id:
+        :type creator_id:
+        :param request_status:
+        :type request_status:
+        :param comment:
+        :type comment:
+        :return:
+        :rtype:
+        """
+
+        return (
+            {"comment": comment},
+            MagicMock(creator_id=creator_id, request_status=request_status),
+        )
+
+    def test_sends_every_notification_on_its_own_without_digest(self):
+        """
+        Test that every notification is its own group without digest
+
+        :return:
+        :rtype:
+        """
+
+        notifications = [
+            self._notification(creator_id=1, request_status=SrpRequest.Status.APPROVED)
+            for _ in range(3)
+        ]
+
+        self.assertEqual(
+            group_requester_notifications(notifications=notifications, digest=False),
+            [[notification] for notification in notifications],
+        )
+
+    def test_groups_per_requester_status_and_comment(self):
+        """
+        Test that the notifications are grouped per requester, status and comment
+
+        :return:
+        :rtype:
+        """
+
+        notifications = [
+            self._notification(creator_id=1, request_status=SrpRequest.Status.APPROVED),
+            self._notification(creator_id=2, request_status=SrpRequest.Status.APPROVED),
+            self._notification(creator_id=1, request_status=SrpRequest.Status.APPROVED),
+            self._notification(creator_id=1, request_status=SrpRequest.Status.REJECTED),
+            self._notification(
+                creator_id=1,
+                request_status=SrpRequest.Status.APPROVED,
+                comment="Fly safe",
+            ),
+        ]
+
+        self.assertEqual(
+            group_requester_notifications(notifications=notifications, digest=True),
+            [
+                [notifications[0], notifications[2]],
+                [notifications[1]],
+                [notifications[3]],
+                [notifications[4]],
+            ],
+        )
+
+    def test_limits_the_size_of_a_digest(self):
+        """
+        Test that a digest lists at most NOTIFICATION_DIGEST_MAX_REQUESTS SRP requests
+
+        :return:
+        :rtype:
+        """
+
+        notifications = [
+            self._notification(creator_id=1, request_status=SrpRequest.Status.APPROVED)
+            for _ in range(NOTIFICATION_DIGEST_MAX_REQUESTS + 1)
+        ]
+
+        groups = group_requester_notifications(notifications=notifications, digest=True)
+
+        self.assertEqual(
+            [len(group) for group in groups], [NOTIFICATION_DIGEST_MAX_REQUESTS, 1]
+        )
+
+
+class TestQueueRequesterNotifications(BaseTestCase):
+    """
+    Test the queue_requester_notifications function
+    """
+
+    @patch("aasrp.tasks.send_requester_notifications.delay")
+    def test_queues_one_task_for_all_requests_after_commit(self, mock_delay):
+        """
+        Test that a single task is queued for all SRP requests once the transaction is committed
+
+        :param mock_delay:
+        :type mock_delay:
+        :return:
+        :rtype:
+        """
+
+        reviser = MagicMock(pk=42)
+        srp_requests = [
+            MagicMock(pk=1, request_status=SrpRequest.Status.APPROVED),
+            MagicMock(pk=2, request_status=SrpRequest.Status.APPROVED),
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            queue_requester_notifications(
+                srp_requests=srp_requests, reviser=reviser, comment="Fly safe"
+            )
+
+            mock_delay.assert_not_called()
+
+        self.assertEqual(len(callbacks), 1)
+        mock_delay.assert_called_once()
+
+        kwargs = mock_delay.call_args.kwargs
+        notifications = kwargs["notifications"]
+
+        self.assertEqual(kwargs["reviser_id"], 42)
+        self.assertEqual(kwargs["message_level"], "success")
+        self.assertEqual([n["srp_request_id"] for n in notifications], [1, 2])
+        self.assertEqual([n["comment"] for n in notifications], ["Fly safe"] * 2)
+        self.assertEqual(
+            len({n["idempotency_key"] for n in notifications}), len(notifications)
+        )
+
+    @patch("aasrp.tasks.send_requester_notifications.delay")
+    def test_uses_new_idempotency_keys_for_every_status_change(self, mock_delay):
+        """
+        Test that each status change of the same SRP request gets its own idempotency key
+
+        :param mock_delay:
+        :type mock_delay:
+        :return:
+        :rtype:
+        """
+
+        srp_request = MagicMock(pk=1, request_status=SrpRequest.Status.APPROVED)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_requester_notifications(
+                srp_requests=[srp_request], reviser=MagicMock(pk=42)
+            )
+            queue_requester_notifications(
+                srp_requests=[srp_request], reviser=MagicMock(pk=42)
+            )
+
+        keys = [
+            call.kwargs["notifications"][0]["idempotency_key"]
+            for call in mock_delay.call_args_list
+        ]
+
+        self.assertEqual(len(keys), 2)
+        self.assertNotEqual(keys[0], keys[1])
+
+    @patch("aasrp.tasks.send_requester_notifications.delay")
+    def test_does_not_queue_a_task_without_requests(self, mock_delay):
+        """
+        Test that no task is queued when there are no SRP requests
+
+        :param mock_delay:
+        :type mock_delay:
+        :return:
+        :rtype:
+        """
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            queue_requester_notifications(srp_requests=[], reviser=MagicMock(pk=42))
+
+        self.assertEqual(len(callbacks), 0)
+        mock_delay.assert_not_called()
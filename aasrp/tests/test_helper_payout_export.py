@@ -0,0 +1,156 @@
+"""
+Unit tests for the helper.payout_export helper.
+"""
+
+# Standard Library
+import datetime as dt
+import json
+
+# Third Party
+from eve_sde.models import ItemType
+
+# Django
+from django.utils import timezone
+
+# AA SRP
+from aasrp.helper.payout_export import (
+    PAYOUT_EXPORT_FIELDS,
+    PayoutExportFormat,
+    get_payout_export_queryset,
+    stream_payout_export,
+)
+from aasrp.models import SrpLink, SrpRequest
+from aasrp.tests import BaseTestCase
+from aasrp.tests.utils import create_fake_user, random_id
+
+
+class TestPayoutExport(BaseTestCase):
+    """
+    Test the payout export
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Set up test data
+
+        :return:
+        :rtype:
+        """
+
+        super().setUpClass()
+
+        cls.user = create_fake_user(
+            character_id=random_id(), character_name="Jean Luc Picard"
+        )
+        cls.ship = ItemType.objects.create(id=587, name="Rifter", published=True)
+        cls.srp_link_january = SrpLink.objects.create(
+            srp_name="January",
+            fleet_time=dt.datetime(2024, 1, 15, 20, 0, tzinfo=dt.timezone.utc),
+            srp_status=SrpLink.Status.COMPLETED,
+        )
+        cls.srp_link_february = SrpLink.objects.create(
+            srp_name="February",
+            fleet_time=dt.datetime(2024, 2, 15, 20, 0, tzinfo=dt.timezone.utc),
+        )
+
+        for srp_link, request_status, payout_amount in (
+            (cls.srp_link_january, SrpRequest.Status.APPROVED, 1000),
+            (cls.srp_link_january, SrpRequest.Status.REJECTED, 0),
+            (cls.srp_link_february, SrpRequest.Status.APPROVED, 2000),
+            (cls.srp_link_february, SrpRequest.Status.PENDING, 3000),
+        ):
+            SrpRequest.objects.create(
+                creator=cls.user,
+                character=cls.user.profile.main_character,
+                ship=cls.ship,
+                srp_link=srp_link,
+                request_status=request_status,
+                payout_amount=payout_amount,
+            )
+
+    def test_exports_approved_requests_only(self):
+        """
+        Test only approved SRP requests are exported, in fleet time order
+
+        :return:
+        :rtype:
+        """
+
+        rows = list(get_payout_export_queryset())
+
+        self.assertEqual([row["payout_amount"] for row in rows], [1000, 2000])
+        self.assertEqual(list(rows[0]), list(PAYOUT_EXPORT_FIELDS))
+        self.assertEqual(
+            rows[0]["creator__profile__main_character__character_name"],
+            "Jean Luc Picard",
+        )
+
+    def test_filters_by_scope(self):
+        """
+        Test the SRP link, date range and unpaid filters
+
+        :return:
+        :rtype:
+        """
+
+        for kwargs, expected in (
+            ({"srp_link": self.srp_link_january}, [1000]),
+            ({"date_from": dt.date(2024, 2, 1)}, [2000]),
+            ({"date_to": dt.date(2024, 1, 31)}, [1000]),
+            ({"unpaid_only": True}, [2000]),
+        ):
+            with self.subTest(kwargs=kwargs):
+                self.assertEqual(
+                    [
+                        row["payout_amount"]
+                        for row in get_payout_export_queryset(**kwargs)
+                    ],
+                    expected,
+                )
+
+    def test_streams_csv(self):
+        """
+        Test the CSV export has a header and one line per SRP request
+
+        :return:
+        :rtype:
+        """
+
+        lines = list(
+            stream_payout_export(
+                queryset=get_payout_export_queryset(),
+                export_format=PayoutExportFormat.CSV,
+            )
+        )
+
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[0].strip(), ",".join(PAYOUT_EXPORT_FIELDS.values()))
+        self.assertIn("2024-01-15T20:00:00+00:00", lines[1])
+
+    def test_streams_ndjson(self):
+        """
+        Test the NDJSON export has one JSON document per line
+
+        :return:
+        :rtype:
+        """
+
+        lines = list(
+            stream_payout_export(
+                queryset=get_payout_export_queryset(unpaid_only=True),
+                export_format=PayoutExportFormat.NDJSON,
+            )
+        )
+
+        self.assertEqual(len(lines), 1)
+
+        row = json.loads(lines[0])
+
+        self.assertEqual(row["srp_name"], "February")
+        self.assertEqual(row["payout_amount"], 2000)
+        self.assertEqual(row["ship"], "Rifter")
+        self.assertEqual(
+            timezone.datetime.fromisoformat(row["fleet_time"]),
+            self.srp_link_february.fleet_time,
+        )
@@ -3,15 +3,21 @@ Test the helper functions in aasrp/helper/user.py
 """
 
 # Standard Library
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 # Alliance Auth
 from allianceauth.authentication.models import User
 
 # AA SRP
-from aasrp.helper.user import get_pending_requests_count_for_user, get_user_settings
+from aasrp.helper.user import (
+    get_main_character_names,
+    get_pending_requests_count_for_user,
+    get_user_settings,
+    get_user_settings_for_users,
+)
 from aasrp.models import UserSetting
 from aasrp.tests import BaseTestCase
+from aasrp.tests.utils import create_fake_user
 
 
 class TestGetUserSettings(BaseTestCase):
@@ -62,6 +68,61 @@ class TestGetUserSettings(BaseTestCase):
         self.assertEqual(first_call_settings, second_call_settings)
 
 
+class TestGetUserSettingsForUsers(BaseTestCase):
+    """
+    Test the get_user_settings_for_users function
+    """
+
+    def test_returns_existing_and_creates_missing_settings_with_two_queries(self):
+        """
+        Test that existing settings are fetched and missing ones are created in bulk
+
+        :return:
+        :rtype:
+        """
+
+        users = [User.objects.create(username=f"user{index}") for index in range(4)]
+        existing_settings = UserSetting.objects.create(
+            user=users[0], disable_notifications=True
+        )
+
+        with self.assertNumQueries(2):
+            user_settings = get_user_settings_for_users(users=users + users[:2])
+
+        self.assertEqual(set(user_settings), {user.pk for user in users})
+        self.assertEqual(user_settings[users[0].pk], existing_settings)
+        self.assertTrue(user_settings[users[0].pk].disable_notifications)
+        self.assertFalse(user_settings[users[1].pk].disable_notifications)
+        self.assertEqual(UserSetting.objects.filter(user__in=users).count(), 4)
+
+    def test_returns_the_first_settings_of_a_user(self):
+        """
+        Test that the first settings are used, like get_user_settings does
+
+        :return:
+        :rtype:
+        """
+
+        user = User.objects.create(username="duplicateuser")
+        first_settings = UserSetting.objects.create(user=user)
+        UserSetting.objects.create(user=user, disable_notifications=True)
+
+        with self.assertNumQueries(1):
+            user_settings = get_user_settings_for_users(users=[user])
+
+        self.assertEqual(user_settings, {user.pk: first_settings})
+
+    def test_no_users(self):
+        """
+        Test that no settings are returned for no users
+
+        :return:
+        :rtype:
+        """
+
+        self.assertEqual(get_user_settings_for_users(users=[]), {})
+
+
 class TestPendingRequestsCount(BaseTestCase):
     """
     Test the get_pending_requests_count_for_user function
@@ -106,3 +167,71 @@ class TestPendingRequestsCount(BaseTestCase):
 
             self.assertIsNone(result)
             mock_pending.assert_called_once_with(user=user)
+
+
+class TestGetMainCharacterNames(BaseTestCase):
+    """
+    Test the get_main_character_names function
+    """
+
+    def test_resolves_main_character_names_with_one_query(self):
+        """
+        Test that the main character names of several users are resolved with one
+        query, falling back to the username for users without a main character
+
+        :return:
+        :rtype:
+        """
+
+        user_1 = create_fake_user(character_id=1001, character_name="Main One")
+        user_2 = create_fake_user(character_id=1002, character_name="Main Two")
+        user_3 = User.objects.create(username="nomain")
+
+        with self.assertNumQueries(1):
+            names = get_main_character_names(
+                user_ids=[user_1.pk, user_2.pk, user_3.pk, user_1.pk]
+            )
+
+        self.assertEqual(
+            names,
+            {user_1.pk: "Main One", user_2.pk: "Main Two", user_3.pk: "nomain"},
+        )
+
+    def test_resolves_missing_user_to_sentinel_user(self):
+        """
+        Test that a missing user is resolved to the sentinel user
+
+        :return:
+        :rtype:
+        """
+
+        names = get_main_character_names(user_ids=[None])
+
+        self.assertEqual(names, {None: "deleted"})
+
+    def test_memoizes_names_on_the_request(self):
+        """
+        Test that resolved names are memoized on the request
+
+        :return:
+        :rtype:
+        """
+
+        user_1 = create_fake_user(character_id=1001, character_name="Main One")
+        user_2 = create_fake_user(character_id=1002, character_name="Main Two")
+        request = Mock(spec=[])
+
+        get_main_character_names(user_ids=[user_1.pk], request=request)
+
+        with self.assertNumQueries(0):
+            names = get_main_character_names(user_ids=[user_1.pk], request=request)
+
+        self.assertEqual(names, {user_1.pk: "Main One"})
+
+        # Only the users that are not memoized yet are queried
+        with self.assertNumQueries(1):
+            names = get_main_character_names(
+                user_ids=[user_1.pk, user_2.pk], request=request
+            )
+
+        self.assertEqual(names, {user_1.pk: "Main One", user_2.pk: "Main Two"})
@@ -0,0 +1,63 @@
+"""
+Unit tests for the helper.viewer helper.
+"""
+
+# Standard Library
+from unittest.mock import Mock
+
+# AA SRP
+from aasrp.helper.viewer import ViewerCapabilities, get_viewer_capabilities
+from aasrp.tests import BaseTestCase
+
+
+class TestViewerCapabilities(BaseTestCase):
+    """
+    Test ViewerCapabilities
+    """
+
+    def test_permission_tier(self):
+        """
+        Test the permission tier of the capabilities
+
+        :return:
+        :rtype:
+        """
+
+        for capabilities, can_view_srp_requests, permission_tier in (
+            (ViewerCapabilities(), False, "basic_access"),
+            (
+                ViewerCapabilities(can_manage_srp_requests=True),
+                True,
+                "manage_srp_requests",
+            ),
+            (
+                ViewerCapabilities(can_manage_srp=True, can_manage_srp_requests=True),
+                True,
+                "manage_srp",
+            ),
+        ):
+            with self.subTest(capabilities=capabilities):
+                self.assertEqual(
+                    capabilities.can_view_srp_requests, can_view_srp_requests
+                )
+                self.assertEqual(capabilities.permission_tier, permission_tier)
+
+    def test_evaluates_permissions_once_per_request(self):
+        """
+        Test the permissions of the user are only looked up once per request
+
+        :return:
+        :rtype:
+        """
+
+        request = Mock(spec=["user"])
+        request.user.has_perm.side_effect = lambda perm: perm == "aasrp.manage_srp"
+
+        capabilities = get_viewer_capabilities(request=request)
+
+        self.assertEqual(
+            capabilities,
+            ViewerCapabilities(can_manage_srp=True, can_manage_srp_requests=False),
+        )
+        self.assertIs(get_viewer_capabilities(request=request), capabilities)
+        self.assertEqual(request.user.has_perm.call_count, 2)
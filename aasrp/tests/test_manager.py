@@ -3,14 +3,35 @@ Unit tests for the SrpRequestManager class.
 """
 
 # Standard Library
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 # Third Party
 import requests
+from eve_sde.models import ItemType
+
+# Django
+from django.utils import timezone
 
 # AA SRP
-from aasrp.managers import SettingManager, SettingQuerySet, SrpRequestManager
+from aasrp.managers import (
+    FleetTypeQuerySet,
+    InsurancePriceManager,
+    SettingManager,
+    SettingQuerySet,
+    SrpLinkQuerySet,
+    SrpRequestManager,
+)
+from aasrp.models import (
+    FleetType,
+    InsurancePrice,
+    Killmail,
+    Setting,
+    SrpLink,
+    SrpRequest,
+)
 from aasrp.tests import BaseTestCase
+from aasrp.tests.utils import create_fake_user, random_id
 
 
 class TestSrpRequestManagerGetZkillboardData(BaseTestCase):
@@ -32,7 +53,10 @@ class TestSrpRequestManagerGetZkillboardData(BaseTestCase):
         ]
         mock_response.raise_for_status.return_value = None
 
-        with patch("requests.get", return_value=mock_response):
+        with patch(
+            "aasrp.providers.zkillboard.requests.Session.get",
+            return_value=mock_response,
+        ):
             result = SrpRequestManager.get_zkillboard_data("12345")
 
             self.assertEqual(result["killmail_id"], 12345)
@@ -50,7 +74,10 @@ class TestSrpRequestManagerGetZkillboardData(BaseTestCase):
         mock_response.json.return_value = []
         mock_response.raise_for_status.return_value = None
 
-        with patch("requests.get", return_value=mock_response):
+        with patch(
+            "aasrp.providers.zkillboard.requests.Session.get",
+            return_value=mock_response,
+        ):
             with self.assertRaises(ValueError) as cm:
                 SrpRequestManager.get_zkillboard_data("12345")
 
@@ -68,13 +95,16 @@ class TestSrpRequestManagerGetZkillboardData(BaseTestCase):
         mock_response.json.return_value = [{"killmail_id": 12345, "zkb": {}}]
         mock_response.raise_for_status.return_value = None
 
-        with patch("requests.get", return_value=mock_response):
+        with patch(
+            "aasrp.providers.zkillboard.requests.Session.get",
+            return_value=mock_response,
+        ):
             with self.assertRaises(ValueError) as cm:
                 SrpRequestManager.get_zkillboard_data("12345")
 
             self.assertIn("Invalid Kill ID or Hash.", str(cm.exception))
 
-    @patch("aasrp.managers.requests.get")
+    @patch("aasrp.providers.zkillboard.requests.Session.get")
     @patch("aasrp.managers.logger.warning")
     def test_raises_value_error_for_http_error(
         self, mock_logger_warning, mock_requests_get
@@ -97,10 +127,12 @@ class TestSrpRequestManagerGetZkillboardData(BaseTestCase):
 
         self.assertIn("HTTP error occurred", str(context.exception))
         mock_logger_warning.assert_called_once_with(
-            "Error fetching kill mail details: HTTP error occurred", exc_info=True
+            "Error fetching kill mail details: %s",
+            mock_requests_get.side_effect,
+            exc_info=True,
         )
 
-    @patch("aasrp.managers.requests.get")
+    @patch("aasrp.providers.zkillboard.requests.Session.get")
     @patch("aasrp.managers.logger.warning")
     def test_raises_value_error_for_timeout_error(
         self, mock_logger_warning, mock_requests_get
@@ -123,7 +155,9 @@ class TestSrpRequestManagerGetZkillboardData(BaseTestCase):
 
         self.assertIn("Request timed out", str(context.exception))
         mock_logger_warning.assert_called_once_with(
-            "Error fetching kill mail details: Request timed out", exc_info=True
+            "Error fetching kill mail details: %s",
+            mock_requests_get.side_effect,
+            exc_info=True,
         )
 
 
@@ -132,38 +166,113 @@ class TestSrpRequestManagerGetInsuranceForShipType(BaseTestCase):
     Test cases for SrpRequestManager.get_insurance_for_ship_type method.
     """
 
+    def setUp(self):
+        """
+        Set up the insurance price table
+
+        :return:
+        :rtype:
+        """
+
+        InsurancePrice.objects.create(
+            type_id=123,
+            levels=[{"name": "Platinum", "cost": 1000.0, "payout": 5000.0}],
+        )
+        InsurancePrice.objects.create(
+            type_id=456, levels=[{"name": "Gold", "cost": 800.0, "payout": 4000.0}]
+        )
+        InsurancePriceManager.clear_price_table()
+
+    def tearDown(self):
+        """
+        Clear the in-memory insurance price table
+
+        :return:
+        :rtype:
+        """
+
+        InsurancePriceManager.clear_price_table()
+
     @patch("aasrp.managers.ESIHandler.result")
-    @patch("aasrp.managers.esi")
-    def test_returns_insurance_details_for_valid_ship_type(
-        self, mock_esi, mock_esi_result
-    ):
+    def test_returns_insurance_details_for_valid_ship_type(self, mock_esi_result):
         """
-        Test that get_insurance_for_ship_type returns correct insurance details for a valid ship type.
+        Test that get_insurance_for_ship_type returns the insurance levels from the local table without calling ESI.
 
-        :param mock_esi:
-        :type mock_esi:
         :param mock_esi_result:
         :type mock_esi_result:
         :return:
         :rtype:
         """
 
-        mock_insurance_data = [
-            MagicMock(type_id=123, insurance="Platinum"),
-            MagicMock(type_id=456, insurance="Gold"),
-        ]
-        mock_esi_result.return_value = mock_insurance_data
-        mock_esi.client.Insurance.GetInsurancePrices.return_value = MagicMock()
+        result = SrpRequestManager.get_insurance_for_ship_type(123)
+
+        self.assertEqual(
+            result, [{"name": "Platinum", "cost": 1000.0, "payout": 5000.0}]
+        )
+        mock_esi_result.assert_not_called()
+
+    def test_returns_empty_list_for_invalid_ship_type(self):
+        """
+        Test that get_insurance_for_ship_type returns an empty list for an unknown ship type.
+
+        :return:
+        :rtype:
+        """
+
+        result = SrpRequestManager.get_insurance_for_ship_type(789)
+
+        self.assertEqual(result, [])
+
+    def test_serves_lookups_from_memory(self):
+        """
+        Test that only the first lookup hits the database.
+
+        :return:
+        :rtype:
+        """
+
+        with self.assertNumQueries(1):
+            SrpRequestManager.get_insurance_for_ship_type(123)
+            SrpRequestManager.get_insurance_for_ship_type(456)
+            SrpRequestManager.get_insurance_for_ship_type(789)
+
+    @patch("aasrp.managers.AASRP_INSURANCE_PRICE_TABLE_TTL", -1)
+    def test_reloads_table_when_expired(self):
+        """
+        Test that the in-memory table is reloaded from the database when it has expired.
+
+        :return:
+        :rtype:
+        """
+
+        SrpRequestManager.get_insurance_for_ship_type(123)
+        InsurancePrice.objects.filter(type_id=123).update(levels=[])
 
         result = SrpRequestManager.get_insurance_for_ship_type(123)
 
-        self.assertEqual(result.insurance, "Platinum")
+        self.assertEqual(result, [])
+
+
+class TestInsurancePriceManagerUpdateFromEsi(BaseTestCase):
+    """
+    Test cases for InsurancePriceManager.update_from_esi method.
+    """
+
+    def tearDown(self):
+        """
+        Clear the in-memory insurance price table
+
+        :return:
+        :rtype:
+        """
+
+        InsurancePriceManager.clear_price_table()
 
     @patch("aasrp.managers.ESIHandler.result")
     @patch("aasrp.managers.esi")
-    def test_returns_none_for_invalid_ship_type(self, mock_esi, mock_esi_result):
+    def test_replaces_insurance_price_table(self, mock_esi, mock_esi_result):
         """
-        Test that get_insurance_for_ship_type returns None for an invalid ship type.
+        Test that the insurance price table is replaced with the prices from ESI.
 
         :param mock_esi:
         :type mock_esi:
@@ -173,22 +282,33 @@ class TestSrpRequestManagerGetInsuranceForShipType(BaseTestCase):
         :rtype:
         """
 
-        mock_insurance_data = [
-            MagicMock(type_id=123, insurance="Platinum"),
-            MagicMock(type_id=456, insurance="Gold"),
-        ]
-        mock_esi_result.return_value = mock_insurance_data
-        mock_esi.client.Insurance.GetInsurancePrices.return_value = MagicMock()
+        InsurancePrice.objects.create(type_id=999, levels=[])
+        platinum = MagicMock(cost=1000.0, payout=5000.0)
+        platinum.name = "Platinum"
+        mock_esi_result.return_value = [MagicMock(type_id=123, levels=[platinum])]
 
-        result = SrpRequestManager.get_insurance_for_ship_type(789)
+        # Load the in-memory table, so we can check it is invalidated
+        self.assertEqual(InsurancePrice.objects.get_levels(type_id=999), [])
 
-        self.assertIsNone(result)
+        result = InsurancePrice.objects.update_from_esi()
+
+        self.assertEqual(result, 1)
+        self.assertFalse(InsurancePrice.objects.filter(type_id=999).exists())
+        self.assertEqual(
+            InsurancePrice.objects.get_levels(type_id=123),
+            [{"name": "Platinum", "cost": 1000.0, "payout": 5000.0}],
+        )
+        mock_esi_result.assert_called_once_with(
+            operation=mock_esi.client.Insurance.GetInsurancePrices.return_value,
+            use_etag=True,
+            force_refresh=False,
+        )
 
     @patch("aasrp.managers.ESIHandler.result")
     @patch("aasrp.managers.esi")
-    def test_handles_empty_insurance_data(self, mock_esi, mock_esi_result):
+    def test_keeps_table_when_not_modified(self, mock_esi, mock_esi_result):
         """
-        Test that get_insurance_for_ship_type handles empty insurance data.
+        Test that the insurance price table is kept when ESI returns nothing (304 Not Modified or error).
 
         :param mock_esi:
         :type mock_esi:
@@ -198,12 +318,13 @@ class TestSrpRequestManagerGetInsuranceForShipType(BaseTestCase):
         :rtype:
         """
 
-        mock_esi_result.return_value = []
-        mock_esi.client.Insurance.GetInsurancePrices.return_value = MagicMock()
+        InsurancePrice.objects.create(type_id=123, levels=[])
+        mock_esi_result.return_value = None
 
-        result = SrpRequestManager.get_insurance_for_ship_type(123)
+        result = InsurancePrice.objects.update_from_esi()
 
         self.assertIsNone(result)
+        self.assertTrue(InsurancePrice.objects.filter(type_id=123).exists())
 
 
 class TestSrpRequestManagerKetKillData(BaseTestCase):
@@ -224,7 +345,14 @@ class TestSrpRequestManagerKetKillData(BaseTestCase):
             "zkb": {"hash": "test_hash", "loss_value": 5000000}
         }
         mock_esi_result.return_value = MagicMock(
-            victim=MagicMock(ship_type_id=123, character_id=456)
+            killmail_time=None,
+            victim=MagicMock(
+                ship_type_id=123,
+                character_id=456,
+                corporation_id=789,
+                alliance_id=None,
+                items=[],
+            ),
         )
 
         mock_operation = MagicMock()
@@ -292,7 +420,14 @@ class TestSrpRequestManagerKetKillData(BaseTestCase):
     ):
         mock_get_zkillboard_data.return_value = {"zkb": {"hash": "test_hash"}}
         mock_esi_result.return_value = MagicMock(
-            victim=MagicMock(ship_type_id=123, character_id=456)
+            killmail_time=None,
+            victim=MagicMock(
+                ship_type_id=123,
+                character_id=456,
+                corporation_id=789,
+                alliance_id=None,
+                items=[],
+            ),
         )
 
         mock_operation = MagicMock()
@@ -307,6 +442,210 @@ class TestSrpRequestManagerKetKillData(BaseTestCase):
         )
 
 
+class TestKillmailManager(BaseTestCase):
+    """
+    Test cases for the KillmailManager class.
+    """
+
+    @staticmethod
+    def _esi_killmail() -> MagicMock:
+        """
+        Build an ESI killmail result
+
+        :return:
+        :rtype:
+        """
+
+        return MagicMock(
+            killmail_time=timezone.now(),
+            victim=MagicMock(
+                ship_type_id=587,
+                character_id=456,
+                corporation_id=789,
+                alliance_id=None,
+                items=[{"item_type_id": 2048, "flag": 27}],
+            ),
+        )
+
+    @patch("aasrp.managers.esi")
+    @patch("aasrp.managers.SrpRequestManager.get_zkillboard_data")
+    @patch("aasrp.managers.ESIHandler.result")
+    def test_stores_fetched_killmail(
+        self, mock_esi_result, mock_get_zkillboard_data, mock_esi
+    ):
+        """
+        Test that a killmail that is not cached yet is fetched and stored.
+        """
+
+        mock_get_zkillboard_data.return_value = {
+            "zkb": {"hash": "test_hash", "totalValue": 1000}
+        }
+        mock_esi_result.return_value = self._esi_killmail()
+
+        killmail = Killmail.objects.get_or_fetch(killmail_id="12345")
+
+        self.assertEqual(killmail.killmail_id, 12345)
+        self.assertEqual(killmail.killmail_hash, "test_hash")
+        self.assertEqual(killmail.ship_type_id, 587)
+        self.assertEqual(killmail.victim_character_id, 456)
+        self.assertEqual(killmail.victim_corporation_id, 789)
+        self.assertIsNone(killmail.victim_alliance_id)
+        self.assertEqual(killmail.items, [{"item_type_id": 2048, "flag": 27}])
+        self.assertEqual(killmail.zkb, {"hash": "test_hash", "totalValue": 1000})
+        self.assertTrue(Killmail.objects.filter(killmail_id=12345).exists())
+        mock_esi.client.Killmails.GetKillmailsKillmailIdKillmailHash.assert_called_once_with(
+            killmail_id=12345, killmail_hash="test_hash"
+        )
+
+    @patch("aasrp.managers.SrpRequestManager.get_zkillboard_data")
+    @patch("aasrp.managers.ESIHandler.result")
+    def test_returns_cached_killmail_without_external_calls(
+        self, mock_esi_result, mock_get_zkillboard_data
+    ):
+        """
+        Test that a cached killmail is returned without calling zKillboard or ESI.
+        """
+
+        Killmail.objects.create(
+            killmail_id=12345,
+            killmail_hash="test_hash",
+            ship_type_id=587,
+            victim_character_id=456,
+            zkb={"loss_value": 5000000},
+        )
+
+        with self.assertNumQueries(1):
+            killmail = Killmail.objects.get_or_fetch(killmail_id=12345)
+
+        self.assertEqual(killmail.ship_type_id, 587)
+        mock_get_zkillboard_data.assert_not_called()
+        mock_esi_result.assert_not_called()
+
+    @patch("aasrp.managers.esi")
+    @patch("aasrp.managers.SrpRequestManager.get_zkillboard_data")
+    @patch("aasrp.managers.ESIHandler.result")
+    def test_raises_value_error_when_esi_returns_nothing(
+        self, mock_esi_result, mock_get_zkillboard_data, mock_esi
+    ):
+        """
+        Test that nothing is cached when ESI doesn't return the killmail.
+        """
+
+        mock_get_zkillboard_data.return_value = {"zkb": {"hash": "test_hash"}}
+        mock_esi_result.return_value = None
+
+        with self.assertRaises(ValueError):
+            Killmail.objects.get_or_fetch(killmail_id=12345)
+
+        self.assertFalse(Killmail.objects.exists())
+
+    @patch("aasrp.managers.esi")
+    @patch("aasrp.managers.SrpRequestManager.get_zkillboard_data")
+    @patch("aasrp.managers.ESIHandler.result")
+    def test_get_or_fetch_many_fetches_missing_killmails(
+        self, mock_esi_result, mock_get_zkillboard_data, mock_esi
+    ):
+        """
+        Test that get_or_fetch_many returns cached killmails, fetches and caches the
+        missing ones, and reports the ones that couldn't be fetched.
+        """
+
+        Killmail.objects.create(killmail_id=1, killmail_hash="hash", ship_type_id=587)
+
+        def _get_zkillboard_data(kill_id):
+            if kill_id == "3":
+                raise ValueError("Not found")
+
+            return {"zkb": {"hash": f"hash_{kill_id}"}}
+
+        mock_get_zkillboard_data.side_effect = _get_zkillboard_data
+        mock_esi_result.return_value = self._esi_killmail()
+
+        killmails, errors = Killmail.objects.get_or_fetch_many(
+            killmail_ids=[1, 2, 2, 3], max_workers=2
+        )
+
+        self.assertEqual(sorted(killmails), [1, 2])
+        self.assertEqual(killmails[2].killmail_hash, "hash_2")
+        self.assertEqual(errors, {3: "Not found"})
+        self.assertEqual(mock_get_zkillboard_data.call_count, 2)
+        self.assertEqual(
+            sorted(Killmail.objects.values_list("killmail_id", flat=True)), [1, 2]
+        )
+
+    @patch("aasrp.managers.connections.close_all")
+    @patch("aasrp.managers.esi")
+    @patch("aasrp.managers.SrpRequestManager.get_zkillboard_data")
+    @patch("aasrp.managers.ESIHandler.result")
+    def test_get_or_fetch_keeps_the_database_connections_open(
+        self, mock_esi_result, mock_get_zkillboard_data, mock_esi, mock_close_all
+    ):
+        """
+        Test that fetching a single killmail doesn't close the database connections
+        of the calling thread, which might be in the middle of a transaction.
+        """
+
+        mock_get_zkillboard_data.return_value = {"zkb": {"hash": "test_hash"}}
+        mock_esi_result.return_value = self._esi_killmail()
+
+        Killmail.objects.get_or_fetch(killmail_id=12345)
+
+        mock_close_all.assert_not_called()
+
+    @patch("aasrp.managers.connections.close_all")
+    @patch("aasrp.managers.KillmailManager._fetch_killmail_data")
+    def test_get_or_fetch_many_closes_the_connections_of_its_workers(
+        self, mock_fetch_killmail_data, mock_close_all
+    ):
+        """
+        Test that the worker threads of get_or_fetch_many close their database
+        connections, also when a fetch fails.
+        """
+
+        mock_fetch_killmail_data.side_effect = ValueError("Not found")
+
+        _, errors = Killmail.objects.get_or_fetch_many(
+            killmail_ids=[1, 2], max_workers=2
+        )
+
+        self.assertEqual(errors, {1: "Not found", 2: "Not found"})
+        self.assertEqual(mock_close_all.call_count, 2)
+
+    @patch("aasrp.managers.SrpRequestManager.get_zkillboard_data")
+    def test_get_or_fetch_many_without_missing_killmails(
+        self, mock_get_zkillboard_data
+    ):
+        """
+        Test that get_or_fetch_many doesn't fetch anything when all killmails are cached.
+        """
+
+        Killmail.objects.create(killmail_id=1, killmail_hash="hash", ship_type_id=587)
+
+        with self.assertNumQueries(1):
+            killmails, errors = Killmail.objects.get_or_fetch_many(killmail_ids=[1])
+
+        self.assertEqual(list(killmails), [1])
+        self.assertEqual(errors, {})
+        mock_get_zkillboard_data.assert_not_called()
+
+    @patch("aasrp.managers.KillmailManager.get_or_fetch")
+    def test_prewarm_only_fetches_missing_killmails(self, mock_get_or_fetch):
+        """
+        Test that prewarm skips cached and duplicate killmails and counts failures.
+        """
+
+        Killmail.objects.create(killmail_id=1, killmail_hash="hash", ship_type_id=587)
+        mock_get_or_fetch.side_effect = [None, ValueError("Not found")]
+
+        result = Killmail.objects.prewarm(killmail_ids=[1, 2, 2, 3])
+
+        self.assertEqual(result, (1, 1))
+        self.assertEqual(
+            [call.kwargs["killmail_id"] for call in mock_get_or_fetch.call_args_list],
+            [2, 3],
+        )
+
+
 class TestSettingQuerySet(BaseTestCase):
     """
     Test cases for the SettingQuerySet class.
@@ -353,7 +692,7 @@ class TestSettingManager(BaseTestCase):
     def test_retrieves_setting_value_by_key(self):
         manager = SettingManager()
         mock_queryset = MagicMock()
-        mock_queryset.first.return_value = MagicMock(my_setting="value")
+        mock_queryset.first.return_value = SimpleNamespace(my_setting="value")
         with patch.object(manager, "get_queryset", return_value=mock_queryset):
             result = manager.get_setting("my_setting")
             self.assertEqual(result, "value")
@@ -370,3 +709,692 @@ class TestSettingManager(BaseTestCase):
         manager = SettingManager()
         queryset = manager.get_queryset()
         self.assertIsInstance(queryset, SettingQuerySet)
+
+    def test_caches_the_settings(self):
+        """
+        Test that the settings are only loaded once.
+
+        :return:
+        :rtype:
+        """
+
+        Setting.objects.update(loss_value_source=Setting.LossValueSource.FITTED_VALUE)
+
+        self.assertEqual(
+            Setting.objects.get_setting("loss_value_source"),
+            Setting.LossValueSource.FITTED_VALUE,
+        )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                Setting.objects.get_setting("loss_value_source"),
+                Setting.LossValueSource.FITTED_VALUE,
+            )
+
+    def test_saving_the_settings_invalidates_the_cache(self):
+        """
+        Test that saving the settings invalidates the cached settings.
+
+        :return:
+        :rtype:
+        """
+
+        Setting.objects.update(loss_value_source=Setting.LossValueSource.FITTED_VALUE)
+        Setting.objects.get_setting("loss_value_source")
+
+        setting = Setting.get_solo()
+
+        setting.loss_value_source = Setting.LossValueSource.TOTAL_VALUE
+        setting.save()
+
+        self.assertEqual(
+            Setting.objects.get_setting("loss_value_source"),
+            Setting.LossValueSource.TOTAL_VALUE,
+        )
+
+        Setting.objects.update(loss_value_source=Setting.LossValueSource.FITTED_VALUE)
+
+        self.assertEqual(
+            Setting.objects.get_setting("loss_value_source"),
+            Setting.LossValueSource.FITTED_VALUE,
+        )
+
+
+class TestFleetTypeManager(BaseTestCase):
+    """
+    Test cases for the FleetTypeManager class.
+    """
+
+    def test_returns_custom_queryset_instance(self):
+        """
+        Test that the manager returns the custom queryset.
+
+        :return:
+        :rtype:
+        """
+
+        self.assertIsInstance(FleetType.objects.all(), FleetTypeQuerySet)
+
+    def test_caches_the_enabled_fleet_types(self):
+        """
+        Test that the enabled fleet types are cached, ordered by name.
+
+        :return:
+        :rtype:
+        """
+
+        fleet_type_b = FleetType.objects.create(name="Fleet B")
+        fleet_type_a = FleetType.objects.create(name="Fleet A")
+        FleetType.objects.create(name="Fleet C", is_enabled=False)
+
+        self.assertEqual(FleetType.objects.enabled(), [fleet_type_a, fleet_type_b])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(FleetType.objects.enabled(), [fleet_type_a, fleet_type_b])
+
+    def test_changes_invalidate_the_enabled_fleet_types(self):
+        """
+        Test that saving, updating and removing fleet types invalidates the cache.
+
+        :return:
+        :rtype:
+        """
+
+        fleet_type = FleetType.objects.create(name="Fleet A")
+
+        self.assertEqual(FleetType.objects.enabled(), [fleet_type])
+
+        fleet_type.is_enabled = False
+        fleet_type.save()
+
+        self.assertEqual(FleetType.objects.enabled(), [])
+
+        FleetType.objects.update(is_enabled=True)
+
+        self.assertEqual(FleetType.objects.enabled(), [fleet_type])
+
+        fleet_type.delete()
+
+        self.assertEqual(FleetType.objects.enabled(), [])
+
+
+class TestSrpLinkRequestStats(BaseTestCase):
+    """
+    Test cases for the stored request statistics of SRP links.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Set up test data
+
+        :return:
+        :rtype:
+        """
+
+        super().setUpClass()
+
+        cls.user = create_fake_user(
+            character_id=random_id(), character_name="Jean Luc Picard"
+        )
+        cls.ship = ItemType.objects.create(id=587, name="Rifter", published=True)
+
+    def setUp(self) -> None:
+        """
+        Set up an SRP link with some SRP requests
+
+        :return:
+        :rtype:
+        """
+
+        self.srp_link = SrpLink.objects.create(
+            srp_name="Test SRP", fleet_time=timezone.now()
+        )
+        self.srp_link_empty = SrpLink.objects.create(
+            srp_name="Empty SRP", fleet_time=timezone.now()
+        )
+        self.srp_requests = [
+            self._create_srp_request(
+                request_status=request_status, payout_amount=payout_amount
+            )
+            for request_status, payout_amount in (
+                (SrpRequest.Status.APPROVED, 1000),
+                (SrpRequest.Status.APPROVED, 2500),
+                (SrpRequest.Status.PENDING, 5000),
+                (SrpRequest.Status.PENDING, 0),
+                (SrpRequest.Status.REJECTED, 7000),
+            )
+        ]
+
+    def _create_srp_request(self, request_status: str, payout_amount: int):
+        """
+        Create an SRP request for the test SRP link
+
+        :param request_status:
+        :type request_status:
+        :param payout_amount:
+        :type payout_amount:
+        :return:
+        :rtype:
+        """
+
+        return SrpRequest.objects.create(
+            creator=self.user,
+            character=self.user.profile.main_character,
+            ship=self.ship,
+            srp_link=self.srp_link,
+            request_status=request_status,
+            payout_amount=payout_amount,
+        )
+
+    def _assert_stats(  # pylint: disable=too-many-arguments
+        self,
+        srp_link: SrpLink,
+        total_cost: int,
+        total: int,
+        pending: int,
+        approved: int,
+        rejected: int,
+    ):
+        """
+        Assert the stored request statistics of an SRP link
+
+        :return:
+        :rtype:
+        """
+
+        srp_link = SrpLink.objects.get(pk=srp_link.pk)
+
+        self.assertEqual(srp_link.total_cost, total_cost)
+        self.assertEqual(srp_link.total_requests_count, total)
+        self.assertEqual(srp_link.pending_requests_count, pending)
+        self.assertEqual(srp_link.approved_requests_count, approved)
+        self.assertEqual(srp_link.rejected_requests_count, rejected)
+
+    def test_returns_custom_queryset_instance(self):
+        """
+        Test that the SrpLink manager returns a SrpLinkQuerySet.
+
+        :return:
+        :rtype:
+        """
+
+        self.assertIsInstance(SrpLink.objects.all(), SrpLinkQuerySet)
+
+    def test_reads_request_stats_in_a_single_query(self):
+        """
+        Test that all request statistics are available after a single query.
+
+        :return:
+        :rtype:
+        """
+
+        with self.assertNumQueries(1):
+            srp_links = {srp_link.pk: srp_link for srp_link in SrpLink.objects.all()}
+
+            srp_link = srp_links[self.srp_link.pk]
+
+            self.assertEqual(srp_link.total_cost, 3500)
+            self.assertEqual(srp_link.total_requests_count, 5)
+            self.assertEqual(srp_link.pending_requests_count, 2)
+            self.assertEqual(srp_link.approved_requests_count, 2)
+            self.assertEqual(srp_link.rejected_requests_count, 1)
+
+            srp_link_empty = srp_links[self.srp_link_empty.pk]
+
+            self.assertEqual(srp_link_empty.total_cost, 0)
+            self.assertEqual(srp_link_empty.total_requests_count, 0)
+            self.assertEqual(srp_link_empty.pending_requests_count, 0)
+
+    def test_updates_stats_on_status_change(self):
+        """
+        Test that approving an SRP request updates the statistics.
+
+        :return:
+        :rtype:
+        """
+
+        srp_request = self.srp_requests[2]
+        srp_request.request_status = SrpRequest.Status.APPROVED
+        srp_request.save()
+
+        self._assert_stats(self.srp_link, 8500, 5, 1, 3, 1)
+
+    def test_updates_stats_on_payout_change(self):
+        """
+        Test that changing the payout of an approved SRP request updates the total cost.
+
+        :return:
+        :rtype:
+        """
+
+        srp_request = self.srp_requests[0]
+        srp_request.payout_amount = 3000
+        srp_request.save(update_fields=["payout_amount"])
+
+        self._assert_stats(self.srp_link, 5500, 5, 2, 2, 1)
+
+    def test_updates_stats_on_bulk_update(self):
+        """
+        Test that bulk updating SRP requests updates the statistics.
+
+        :return:
+        :rtype:
+        """
+
+        srp_requests = self.srp_requests[2:4]
+
+        for srp_request in srp_requests:
+            srp_request.request_status = SrpRequest.Status.APPROVED
+            srp_request.payout_amount = 100
+
+        SrpRequest.objects.bulk_update(
+            srp_requests, ["payout_amount", "request_status"]
+        )
+
+        self._assert_stats(self.srp_link, 3700, 5, 0, 4, 1)
+
+    def test_updates_stats_of_both_srp_links_when_moving_a_request(self):
+        """
+        Test that moving an SRP request to another SRP link updates the statistics of both.
+
+        :return:
+        :rtype:
+        """
+
+        srp_request = self.srp_requests[0]
+        srp_request.srp_link = self.srp_link_empty
+        srp_request.save()
+
+        self._assert_stats(self.srp_link, 2500, 4, 2, 1, 1)
+        self._assert_stats(self.srp_link_empty, 1000, 1, 0, 1, 0)
+
+        srp_request.srp_link = self.srp_link
+        srp_request.save(update_fields=["srp_link"])
+
+        self._assert_stats(self.srp_link, 3500, 5, 2, 2, 1)
+        self._assert_stats(self.srp_link_empty, 0, 0, 0, 0, 0)
+
+    def test_updates_stats_of_both_srp_links_when_bulk_moving_requests(self):
+        """
+        Test that bulk moving SRP requests to another SRP link updates the statistics of both.
+
+        :return:
+        :rtype:
+        """
+
+        srp_requests = self.srp_requests[:2]
+
+        for srp_request in srp_requests:
+            srp_request.srp_link = self.srp_link_empty
+
+        SrpRequest.objects.bulk_update(srp_requests, ["srp_link"])
+
+        self._assert_stats(self.srp_link, 0, 3, 2, 0, 1)
+        self._assert_stats(self.srp_link_empty, 3500, 2, 0, 2, 0)
+
+    def test_bulk_update_increments_versions_in_the_database(self):
+        """
+        Test that bulk updating outdated SRP request instances gives every update its own version.
+
+        :return:
+        :rtype:
+        """
+
+        srp_request = self.srp_requests[0]
+        outdated_srp_request = SrpRequest.objects.get(pk=srp_request.pk)
+
+        srp_request.save()
+        SrpRequest.objects.bulk_update([outdated_srp_request], ["payout_amount"])
+
+        srp_request.refresh_from_db()
+
+        self.assertEqual(outdated_srp_request.version, 3)
+        self.assertEqual(srp_request.version, 3)
+
+    def test_updates_stats_on_queryset_update(self):
+        """
+        Test that updating SRP requests via a queryset updates the statistics.
+
+        :return:
+        :rtype:
+        """
+
+        SrpRequest.objects.filter(request_status=SrpRequest.Status.PENDING).update(
+            request_status=SrpRequest.Status.REJECTED
+        )
+
+        self._assert_stats(self.srp_link, 3500, 5, 0, 2, 3)
+
+    def test_updates_stats_on_delete(self):
+        """
+        Test that deleting SRP requests updates the statistics.
+
+        :return:
+        :rtype:
+        """
+
+        self.srp_requests[0].delete()
+
+        self._assert_stats(self.srp_link, 2500, 4, 2, 1, 1)
+
+        SrpRequest.objects.filter(request_status=SrpRequest.Status.PENDING).delete()
+
+        self._assert_stats(self.srp_link, 2500, 2, 0, 1, 1)
+
+    def test_saving_srp_link_keeps_stats(self):
+        """
+        Test that saving an outdated SRP link instance doesn't overwrite the statistics.
+
+        :return:
+        :rtype:
+        """
+
+        srp_link = SrpLink.objects.get(pk=self.srp_link.pk)
+
+        self._create_srp_request(
+            request_status=SrpRequest.Status.APPROVED, payout_amount=500
+        )
+
+        srp_link.srp_status = SrpLink.Status.CLOSED
+        srp_link.save()
+
+        self._assert_stats(self.srp_link, 4000, 6, 2, 3, 1)
+        self.assertEqual(
+            SrpLink.objects.get(pk=self.srp_link.pk).srp_status, SrpLink.Status.CLOSED
+        )
+
+    def test_update_request_stats_repairs_drift(self):
+        """
+        Test that update_request_stats recalculates the statistics from the SRP requests.
+
+        :return:
+        :rtype:
+        """
+
+        SrpLink.objects.filter(pk=self.srp_link.pk).update(
+            stats_total_cost=1, stats_pending_requests=42
+        )
+
+        with self.assertNumQueries(1):
+            updated = SrpLink.objects.update_request_stats()
+
+        self.assertEqual(updated, 2)
+        self._assert_stats(self.srp_link, 3500, 5, 2, 2, 1)
+        self._assert_stats(self.srp_link_empty, 0, 0, 0, 0, 0)
+
+
+class TestSrpRequestManagerPendingRequestsCount(BaseTestCase):
+    """
+    Test cases for the cached number of pending SRP requests.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Set up test data
+
+        :return:
+        :rtype:
+        """
+
+        super().setUpClass()
+
+        cls.user = create_fake_user(
+            character_id=random_id(), character_name="Jean Luc Picard"
+        )
+        cls.ship = ItemType.objects.create(id=587, name="Rifter", published=True)
+        cls.srp_link = SrpLink.objects.create(
+            srp_name="Test SRP", fleet_time=timezone.now()
+        )
+
+    def setUp(self) -> None:
+        """
+        Set up two pending SRP requests
+
+        :return:
+        :rtype:
+        """
+
+        self.srp_requests = [self._create_srp_request() for _ in range(2)]
+
+    def tearDown(self) -> None:
+        """
+        Don't leak the cached number into other tests
+
+        :return:
+        :rtype:
+        """
+
+        SrpRequest.objects.invalidate_pending_requests_count()
+
+    def _create_srp_request(self) -> SrpRequest:
+        """
+        Create a pending SRP request
+
+        :return:
+        :rtype:
+        """
+
+        return SrpRequest.objects.create(
+            creator=self.user,
+            character=self.user.profile.main_character,
+            ship=self.ship,
+            srp_link=self.srp_link,
+        )
+
+    def test_caches_pending_requests_count(self):
+        """
+        Test that the number of pending SRP requests is only counted once.
+
+        :return:
+        :rtype:
+        """
+
+        self.assertEqual(SrpRequest.objects.pending_requests_count(), 2)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(SrpRequest.objects.pending_requests_count(), 2)
+
+    def test_invalidates_on_create(self):
+        """
+        Test that adding an SRP request invalidates the cached number.
+
+        :return:
+        :rtype:
+        """
+
+        SrpRequest.objects.pending_requests_count()
+
+        self._create_srp_request()
+
+        self.assertEqual(SrpRequest.objects.pending_requests_count(), 3)
+
+    def test_invalidates_on_status_change(self):
+        """
+        Test that changing the status of an SRP request invalidates the cached number.
+
+        :return:
+        :rtype:
+        """
+
+        SrpRequest.objects.pending_requests_count()
+
+        srp_request = self.srp_requests[0]
+        srp_request.request_status = SrpRequest.Status.APPROVED
+        srp_request.save()
+
+        self.assertEqual(SrpRequest.objects.pending_requests_count(), 1)
+
+    def test_invalidates_on_bulk_update(self):
+        """
+        Test that bulk updating the status of SRP requests invalidates the cached number.
+
+        :return:
+        :rtype:
+        """
+
+        SrpRequest.objects.pending_requests_count()
+
+        for srp_request in self.srp_requests:
+            srp_request.request_status = SrpRequest.Status.REJECTED
+
+        SrpRequest.objects.bulk_update(self.srp_requests, ["request_status"])
+
+        self.assertEqual(SrpRequest.objects.pending_requests_count(), 0)
+
+    def test_invalidates_on_delete(self):
+        """
+        Test that removing SRP requests invalidates the cached number.
+
+        :return:
+        :rtype:
+        """
+
+        SrpRequest.objects.pending_requests_count()
+
+        SrpRequest.objects.filter(pk=self.srp_requests[0].pk).delete()
+
+        self.assertEqual(SrpRequest.objects.pending_requests_count(), 1)
+
+    def test_invalidates_again_after_commit(self):
+        """
+        Test that the cached number is invalidated again when the transaction is committed.
+
+        :return:
+        :rtype:
+        """
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            srp_request = self.srp_requests[0]
+            srp_request.request_status = SrpRequest.Status.APPROVED
+            srp_request.save()
+
+            # A concurrent request caches the number before the commit
+            SrpRequest.objects.pending_requests_count()
+
+        self.assertTrue(callbacks)
+        self.assertEqual(SrpRequest.objects.pending_requests_count(), 1)
+
+
+class TestSrpRequestTableQuerySets(BaseTestCase):
+    """
+    Test cases for the querysets of the SRP request tables and details.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Set up test data
+
+        :return:
+        :rtype:
+        """
+
+        super().setUpClass()
+
+        cls.user = create_fake_user(
+            character_id=random_id(), character_name="Jean Luc Picard"
+        )
+        cls.ship = ItemType.objects.create(id=587, name="Rifter", published=True)
+        cls.srp_link = SrpLink.objects.create(
+            srp_name="Test SRP", srp_code="TEST001", fleet_time=timezone.now()
+        )
+        cls.srp_request = SrpRequest.objects.create(
+            request_code="REQ001",
+            srp_link=cls.srp_link,
+            creator=cls.user,
+            character=cls.user.profile.main_character,
+            ship=cls.ship,
+            additional_info="Long text",
+        )
+
+    def _assert_loaded_without_queries(self, srp_request: SrpRequest) -> None:
+        """
+        Assert that the columns shown in the tables are loaded
+
+        :param srp_request:
+        :type srp_request:
+        :return:
+        :rtype:
+        """
+
+        with self.assertNumQueries(0):
+            self.assertEqual(srp_request.request_code, "REQ001")
+            self.assertEqual(srp_request.srp_link.srp_code, "TEST001")
+            self.assertEqual(srp_request.ship.name, "Rifter")
+            self.assertEqual(srp_request.character.character_name, "Jean Luc Picard")
+
+    def test_for_manager_table(self):
+        """
+        Test the SRP requests table of an SRP link joins its relations and prunes columns
+
+        :return:
+        :rtype:
+        """
+
+        with self.assertNumQueries(1):
+            srp_request = SrpRequest.objects.for_manager_table().get()
+
+        self._assert_loaded_without_queries(srp_request)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(srp_request.srp_link.srp_status, SrpLink.Status.ACTIVE)
+            self.assertEqual(srp_request.creator_id, self.user.pk)
+
+        self.assertIn("additional_info", srp_request.get_deferred_fields())
+
+    def test_for_own_table(self):
+        """
+        Test the table of own SRP requests joins its relations and prunes columns
+
+        :return:
+        :rtype:
+        """
+
+        with self.assertNumQueries(1):
+            srp_request = SrpRequest.objects.for_own_table().get()
+
+        self._assert_loaded_without_queries(srp_request)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(srp_request.srp_link.srp_name, "Test SRP")
+
+        self.assertIn("additional_info", srp_request.get_deferred_fields())
+
+    def test_for_detail(self):
+        """
+        Test the SRP request details join the requester's main character
+
+        :return:
+        :rtype:
+        """
+
+        with self.assertNumQueries(1):
+            srp_request = SrpRequest.objects.for_detail().get()
+
+        self._assert_loaded_without_queries(srp_request)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                srp_request.creator.profile.main_character.character_name,
+                "Jean Luc Picard",
+            )
+
+    def test_for_dashboard(self):
+        """
+        Test the dashboard joins the fleet type and prunes columns
+
+        :return:
+        :rtype:
+        """
+
+        with self.assertNumQueries(1):
+            srp_link = SrpLink.objects.for_dashboard().get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(srp_link.srp_code, "TEST001")
+            self.assertIsNone(srp_link.fleet_type)
+            self.assertEqual(srp_link.total_cost, 0)
+
+        self.assertIn("fleet_commander_id", srp_link.get_deferred_fields())
@@ -3,7 +3,7 @@ Unit tests for the SrpLink model.
 """
 
 # Standard Library
-from unittest.mock import MagicMock, PropertyMock, patch
+from unittest.mock import PropertyMock, patch
 
 # Django
 from django.utils import timezone
@@ -26,22 +26,15 @@ class TestSrpLink(BaseTestCase):
         :rtype:
         """
 
+        srp_link = SrpLink(stats_total_cost=300)
+
         with patch.object(
             SrpLink, "srp_requests", new_callable=PropertyMock
         ) as mock_rels:
-            mock_rels.return_value.filter.return_value = [
-                MagicMock(payout_amount=100),
-                MagicMock(payout_amount=200),
-            ]
-
-            srp_link = SrpLink()
-
             result = srp_link.total_cost
 
             self.assertEqual(result, 300)
-            mock_rels.return_value.filter.assert_called_with(
-                request_status=SrpRequest.Status.APPROVED
-            )
+            mock_rels.assert_not_called()
 
     def test_returns_zero_total_cost_when_no_approved_requests_exist(self):
         """
@@ -51,19 +44,9 @@ class TestSrpLink(BaseTestCase):
         :rtype:
         """
 
-        with patch.object(
-            SrpLink, "srp_requests", new_callable=PropertyMock
-        ) as mock_rels:
-            mock_rels.return_value.filter.return_value = []
-
-            srp_link = SrpLink()
-
-            result = srp_link.total_cost
+        srp_link = SrpLink()
 
-            self.assertEqual(result, 0)
-            mock_rels.return_value.filter.assert_called_with(
-                request_status=SrpRequest.Status.APPROVED
-            )
+        self.assertEqual(srp_link.total_cost, 0)
 
     def test_counts_requests_by_status_correctly(self):
         """
@@ -73,20 +56,11 @@ class TestSrpLink(BaseTestCase):
         :rtype:
         """
 
-        with patch.object(
-            SrpLink, "srp_requests", new_callable=PropertyMock
-        ) as mock_rels:
-            mock_rels.return_value.filter.return_value.count.return_value = 5
+        srp_link = SrpLink(stats_pending_requests=5)
 
-            srp_link = SrpLink()
-            srp_link.pk = 1
+        result = srp_link._count_requests_by_status(SrpRequest.Status.PENDING)
 
-            result = srp_link._count_requests_by_status(SrpRequest.Status.PENDING)
-
-            self.assertEqual(result, 5)
-            mock_rels.return_value.filter.assert_called_with(
-                request_status=SrpRequest.Status.PENDING
-            )
+        self.assertEqual(result, 5)
 
     def test_returns_zero_for_status_with_no_requests(self):
         """
@@ -96,19 +70,11 @@ class TestSrpLink(BaseTestCase):
         :rtype:
         """
 
-        with patch.object(
-            SrpLink, "srp_requests", new_callable=PropertyMock
-        ) as mock_rels:
-            mock_rels.return_value.filter.return_value.count.return_value = 0
-
-            srp_link = SrpLink()
+        srp_link = SrpLink()
 
-            result = srp_link._count_requests_by_status(SrpRequest.Status.REJECTED)
+        result = srp_link._count_requests_by_status(SrpRequest.Status.REJECTED)
 
-            self.assertEqual(result, 0)
-            mock_rels.return_value.filter.assert_called_with(
-                request_status=SrpRequest.Status.REJECTED
-            )
+        self.assertEqual(result, 0)
 
     def test_returns_all_requests_linked_to_srp_link(self):
         """
@@ -187,17 +153,11 @@ class TestSrpLink(BaseTestCase):
         :rtype:
         """
 
-        with patch.object(
-            SrpLink, "srp_requests", new_callable=PropertyMock
-        ) as mock_rels:
-            mock_rels.return_value.count.return_value = 5
-
-            srp_link = SrpLink()
+        srp_link = SrpLink(stats_total_requests=5)
 
-            result = srp_link.total_requests_count
+        result = srp_link.total_requests_count
 
-            self.assertEqual(result, 5)
-            mock_rels.return_value.count.assert_called_once()
+        self.assertEqual(result, 5)
 
     def test_returns_zero_when_no_requests_exist(self):
         """
@@ -207,17 +167,11 @@ class TestSrpLink(BaseTestCase):
         :rtype:
         """
 
-        with patch.object(
-            SrpLink, "srp_requests", new_callable=PropertyMock
-        ) as mock_rels:
-            mock_rels.return_value.count.return_value = 0
-
-            srp_link = SrpLink()
+        srp_link = SrpLink()
 
-            result = srp_link.total_requests_count
+        result = srp_link.total_requests_count
 
-            self.assertEqual(result, 0)
-            mock_rels.return_value.count.assert_called_once()
+        self.assertEqual(result, 0)
 
     def test_returns_pending_requests_count_when_requests_exist(self):
         """
@@ -227,19 +181,11 @@ class TestSrpLink(BaseTestCase):
         :rtype:
         """
 
-        with patch.object(
-            SrpLink, "srp_requests", new_callable=PropertyMock
-        ) as mock_rels:
-            mock_rels.return_value.filter.return_value.count.return_value = 3
-
-            srp_link = SrpLink()
+        srp_link = SrpLink(stats_pending_requests=3)
 
-            result = srp_link.pending_requests_count
+        result = srp_link.pending_requests_count
 
-            self.assertEqual(result, 3)
-            mock_rels.return_value.filter.assert_called_with(
-                request_status=SrpRequest.Status.PENDING
-            )
+        self.assertEqual(result, 3)
 
     def test_returns_zero_when_no_pending_requests_exist(self):
         """
@@ -249,19 +195,11 @@ class TestSrpLink(BaseTestCase):
         :rtype:
         """
 
-        with patch.object(
-            SrpLink, "srp_requests", new_callable=PropertyMock
-        ) as mock_rels:
-            mock_rels.return_value.filter.return_value.count.return_value = 0
-
-            srp_link = SrpLink()
+        srp_link = SrpLink()
 
-            result = srp_link.pending_requests_count
+        result = srp_link.pending_requests_count
 
-            self.assertEqual(result, 0)
-            mock_rels.return_value.filter.assert_called_with(
-                request_status=SrpRequest.Status.PENDING
-            )
+        self.assertEqual(result, 0)
 
     def test_returns_approved_requests_count_when_requests_exist(self):
         """
@@ -271,19 +209,11 @@ class TestSrpLink(BaseTestCase):
         :rtype:
         """
 
-        with patch.object(
-            SrpLink, "srp_requests", new_callable=PropertyMock
-        ) as mock_rels:
-            mock_rels.return_value.filter.return_value.count.return_value = 4
-
-            srp_link = SrpLink()
+        srp_link = SrpLink(stats_approved_requests=4)
 
-            result = srp_link.approved_requests_count
+        result = srp_link.approved_requests_count
 
-            self.assertEqual(result, 4)
-            mock_rels.return_value.filter.assert_called_with(
-                request_status=SrpRequest.Status.APPROVED
-            )
+        self.assertEqual(result, 4)
 
     def test_returns_zero_when_no_approved_requests_exist(self):
         """
@@ -293,19 +223,11 @@ class TestSrpLink(BaseTestCase):
         :rtype:
         """
 
-        with patch.object(
-            SrpLink, "srp_requests", new_callable=PropertyMock
-        ) as mock_rels:
-            mock_rels.return_value.filter.return_value.count.return_value = 0
-
-            srp_link = SrpLink()
+        srp_link = SrpLink()
 
-            result = srp_link.approved_requests_count
+        result = srp_link.approved_requests_count
 
-            self.assertEqual(result, 0)
-            mock_rels.return_value.filter.assert_called_with(
-                request_status=SrpRequest.Status.APPROVED
-            )
+        self.assertEqual(result, 0)
 
     def test_returns_rejected_requests_count_when_requests_exist(self):
         """
@@ -315,19 +237,11 @@ class TestSrpLink(BaseTestCase):
         :rtype:
         """
 
-        with patch.object(
-            SrpLink, "srp_requests", new_callable=PropertyMock
-        ) as mock_rels:
-            mock_rels.return_value.filter.return_value.count.return_value = 2
+        srp_link = SrpLink(stats_rejected_requests=2)
 
-            srp_link = SrpLink()
-
-            result = srp_link.rejected_requests_count
+        result = srp_link.rejected_requests_count
 
-            self.assertEqual(result, 2)
-            mock_rels.return_value.filter.assert_called_with(
-                request_status=SrpRequest.Status.REJECTED
-            )
+        self.assertEqual(result, 2)
 
     def test_returns_zero_when_no_rejected_requests_exist(self):
         """
@@ -337,19 +251,11 @@ class TestSrpLink(BaseTestCase):
         :rtype:
         """
 
-        with patch.object(
-            SrpLink, "srp_requests", new_callable=PropertyMock
-        ) as mock_rels:
-            mock_rels.return_value.filter.return_value.count.return_value = 0
-
-            srp_link = SrpLink()
+        srp_link = SrpLink()
 
-            result = srp_link.rejected_requests_count
+        result = srp_link.rejected_requests_count
 
-            self.assertEqual(result, 0)
-            mock_rels.return_value.filter.assert_called_with(
-                request_status=SrpRequest.Status.REJECTED
-            )
+        self.assertEqual(result, 0)
 
     def test_saves_srp_link_with_empty_code_generates_unique_code(self):
         """
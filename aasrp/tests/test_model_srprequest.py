@@ -177,6 +177,7 @@ class TestSrpRequest(BaseTestCase):
         user = MagicMock()
         user.has_perm.side_effect = lambda perm: perm in ["aasrp.manage_srp"]
         mock_filter.return_value.count.return_value = 5
+        SrpRequest.objects.invalidate_pending_requests_count()
 
         result = SrpRequest.pending_requests_count_for_user(user)
 
@@ -224,6 +225,27 @@ class TestSrpRequest(BaseTestCase):
         self.assertNotEqual(srp_request.request_code, "")
         self.assertEqual(len(srp_request.request_code), 16)
 
+    def test_saves_request_extracts_killmail_id_from_killboard_link(self):
+        """
+        Test that saving a new SrpRequest sets the killmail ID from the killboard link.
+
+        :return:
+        :rtype:
+        """
+
+        srp_request = SrpRequest(
+            creator=self.user,
+            character=self.character,
+            ship=self.ship_type,
+            srp_link=self.srp_link_1,
+            killboard_link="https://eve-kill.com/kill/128743453",
+        )
+        srp_request.save()
+
+        srp_request.refresh_from_db()
+
+        self.assertEqual(srp_request.killmail_id, 128743453)
+
     def test_saves_request_with_existing_code_preserves_code(self):
         """
         Test that saving an SrpRequest with an existing request_code preserves the code.
@@ -267,3 +289,29 @@ class TestSrpRequest(BaseTestCase):
         self.assertNotEqual(srp_request1.request_code, srp_request2.request_code)
         self.assertEqual(len(srp_request1.request_code), 16)
         self.assertEqual(len(srp_request2.request_code), 16)
+
+    def test_saves_request_increments_version_in_the_database(self):
+        """
+        Test that saving outdated instances of an SrpRequest gives every save its own version.
+
+        :return:
+        :rtype:
+        """
+
+        srp_request = SrpRequest.objects.create(
+            creator=self.user,
+            character=self.character,
+            ship=self.ship_type,
+            srp_link=self.srp_link_1,
+        )
+        srp_request_1 = SrpRequest.objects.get(pk=srp_request.pk)
+        srp_request_2 = SrpRequest.objects.get(pk=srp_request.pk)
+
+        srp_request_1.save()
+        srp_request_2.save(update_fields=["request_status"])
+
+        srp_request.refresh_from_db()
+
+        self.assertEqual(srp_request_1.version, 2)
+        self.assertEqual(srp_request_2.version, 3)
+        self.assertEqual(srp_request.version, 3)
@@ -4,6 +4,7 @@ Test for the providers module.
 
 # Standard Library
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 # Third Party
@@ -14,7 +15,9 @@ from esi.exceptions import HTTPClientError, HTTPNotModified
 
 # AA SRP
 from aasrp import __title__
-from aasrp.providers.applogger import AppLogger
+from aasrp.constants import UserAgent
+from aasrp.providers import zkillboard
+from aasrp.providers.applogger import AppLogger, LazyValue
 from aasrp.providers.esi import ESIHandler
 from aasrp.tests import BaseTestCase
 
@@ -56,6 +59,42 @@ class TestAppLogger(BaseTestCase):
 
         self.assertIn(f"[{__title__}] ", log.output[0])
 
+    def test_formats_arguments_with_prefix(self):
+        """
+        Tests that the AppLogger formats %-style arguments into the prefixed message.
+
+        :return:
+        :rtype:
+        """
+
+        logger = logging.getLogger("test_logger")
+        app_logger = AppLogger(logger)
+
+        with self.assertLogs("test_logger", level="INFO") as log:
+            app_logger.info("Found %d SRP requests for %s", 3, "abc")
+
+        self.assertIn(f"[{__title__}] Found 3 SRP requests for abc", log.output[0])
+
+    def test_lazy_value_is_computed_once_when_formatted(self):
+        """
+        Tests that a lazy argument is computed when the message is formatted, once.
+
+        :return:
+        :rtype:
+        """
+
+        logger = logging.getLogger("test_logger")
+        app_logger = AppLogger(logger)
+        expensive = MagicMock(return_value=42)
+        lazy_value = LazyValue(expensive, "arg", key="value")
+
+        with self.assertLogs("test_logger", level="DEBUG") as log:
+            app_logger.debug("Found %s SRP requests", lazy_value)
+
+        self.assertIn(f"[{__title__}] Found 42 SRP requests", log.output[0])
+        self.assertEqual(repr(lazy_value), "42")
+        expensive.assert_called_once_with("arg", key="value")
+
 
 class TestESIHandlerResult(BaseTestCase):
     """
@@ -218,3 +257,56 @@ class TestESIHandlerResult(BaseTestCase):
             use_cache=False,
             foo="bar",
         )
+
+
+class TestZKillboardSession(BaseTestCase):
+    """
+    Test the HTTP sessions for the zKillboard API.
+    """
+
+    def test_session_sends_user_agent_header(self):
+        """
+        Test that the session sends the app's User-Agent header with every request.
+
+        :return:
+        :rtype:
+        """
+
+        self.assertEqual(
+            zkillboard.get_session().headers["User-Agent"], UserAgent.REQUESTS.value
+        )
+
+    def test_session_pools_https_connections(self):
+        """
+        Test that the session keeps a pool of HTTPS connections alive.
+
+        :return:
+        :rtype:
+        """
+
+        adapter = zkillboard.get_session().get_adapter("https://zkillboard.com/api/")
+
+        self.assertEqual(adapter._pool_maxsize, 10)
+
+    def test_session_is_reused_within_a_thread(self):
+        """
+        Test that a thread gets the same session for all of its requests.
+
+        :return:
+        :rtype:
+        """
+
+        self.assertIs(zkillboard.get_session(), zkillboard.get_session())
+
+    def test_threads_get_their_own_session(self):
+        """
+        Test that every thread gets its own session, since sessions aren't thread-safe.
+
+        :return:
+        :rtype:
+        """
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            thread_session = executor.submit(zkillboard.get_session).result()
+
+        self.assertIsNot(thread_session, zkillboard.get_session())
@@ -0,0 +1,519 @@
+"""
+Unit tests for the Celery tasks.
+"""
+
+# Standard Library
+from unittest.mock import patch
+
+# Third Party
+from eve_sde.models import ItemType
+
+# Django
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.translation import get_language
+
+# AA SRP
+from aasrp.models import Setting, SrpLink, SrpRequest, UserSetting
+from aasrp.tasks import (
+    import_srp_link_killmails,
+    prewarm_killmail_cache,
+    send_requester_notifications,
+    update_insurance_prices,
+)
+from aasrp.tests import BaseTestCase
+from aasrp.tests.utils import create_fake_user, random_id
+
+
+class TestSendRequesterNotifications(BaseTestCase):
+    """
+    Test the send_requester_notifications task
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Set up test data
+
+        :return:
+        :rtype:
+        """
+
+        super().setUpClass()
+
+        cls.reviser = create_fake_user(
+            character_id=random_id(), character_name="Jean Luc Picard"
+        )
+        cls.requester = create_fake_user(
+            character_id=random_id(), character_name="Wesley Crusher"
+        )
+        cls.ship = ItemType.objects.create(id=587, name="Rifter")
+        cls.srp_link = SrpLink.objects.create(
+            srp_name="Test SRP", fleet_time=timezone.now()
+        )
+        cls.srp_requests = [
+            SrpRequest.objects.create(
+                creator=cls.requester,
+                character=cls.requester.profile.main_character,
+                ship=cls.ship,
+                srp_link=cls.srp_link,
+                request_status=SrpRequest.Status.APPROVED,
+            )
+            for _ in range(2)
+        ]
+
+    def setUp(self) -> None:
+        """
+        Clear the cache, so idempotency keys of other tests don't interfere
+
+        :return:
+        :rtype:
+        """
+
+        cache.clear()
+
+    def _notifications(self, key_suffix: str = "test") -> list[dict]:
+        """
+        Build the notifications payload for the test SRP requests
+
+        :param key_suffix:
+        :type key_suffix:
+        :return:
+        :rtype:
+        """
+
+        return [
+            {
+                "srp_request_id": srp_request.pk,
+                "comment": "",
+                "idempotency_key": f"aasrp-test-notification-{srp_request.pk}-{key_suffix}",
+            }
+            for srp_request in self.srp_requests
+        ]
+
+    @patch("aasrp.tasks.notify_requester")
+    def test_sends_one_notification_per_request(self, mock_notify):
+        """
+        Test that every requester is notified
+
+        :param mock_notify:
+        :type mock_notify:
+        :return:
+        :rtype:
+        """
+
+        send_requester_notifications(
+            reviser_id=self.reviser.pk, notifications=self._notifications()
+        )
+
+        self.assertEqual(mock_notify.call_count, 2)
+        self.assertEqual(mock_notify.call_args.kwargs["reviser"], self.reviser)
+        self.assertEqual(mock_notify.call_args.kwargs["message_level"], "success")
+
+    @patch("aasrp.tasks.notify_requester")
+    def test_does_not_send_the_same_notification_twice(self, mock_notify):
+        """
+        Test that a notification with an already used idempotency key is skipped
+
+        :param mock_notify:
+        :type mock_notify:
+        :return:
+        :rtype:
+        """
+
+        notifications = self._notifications()
+
+        send_requester_notifications(
+            reviser_id=self.reviser.pk, notifications=notifications
+        )
+        send_requester_notifications(
+            reviser_id=self.reviser.pk, notifications=notifications
+        )
+
+        self.assertEqual(mock_notify.call_count, 2)
+
+    @patch("aasrp.tasks.notify_requester")
+    def test_respects_disabled_notifications(self, mock_notify):
+        """
+        Test that requesters who disabled notifications are not notified
+
+        :param mock_notify:
+        :type mock_notify:
+        :return:
+        :rtype:
+        """
+
+        UserSetting.objects.update_or_create(
+            user=self.requester, defaults={"disable_notifications": True}
+        )
+
+        send_requester_notifications(
+            reviser_id=self.reviser.pk, notifications=self._notifications()
+        )
+
+        mock_notify.assert_not_called()
+
+    @patch("aasrp.tasks.notify_requester")
+    def test_prepares_notifications_with_a_constant_number_of_queries(
+        self, mock_notify
+    ):
+        """
+        Test that the number of queries doesn't grow with the number of requesters
+
+        :param mock_notify:
+        :type mock_notify:
+        :return:
+        :rtype:
+        """
+
+        def access_notification_data(requester, reviser, srp_request, **kwargs):
+            # What notify_requester reads
+            str(reviser.profile.main_character)
+            str(requester)
+            str(srp_request.ship.name)
+            str(srp_request.srp_link.srp_name)
+
+        mock_notify.side_effect = access_notification_data
+
+        def notifications_for(requesters: list) -> list[dict]:
+            return [
+                {
+                    "srp_request_id": SrpRequest.objects.create(
+                        creator=requester,
+                        character=requester.profile.main_character,
+                        ship=self.ship,
+                        srp_link=self.srp_link,
+                        request_status=SrpRequest.Status.APPROVED,
+                    ).pk,
+                    "comment": "",
+                    "idempotency_key": f"aasrp-test-notification-{requester.pk}",
+                }
+                for requester in requesters
+            ]
+
+        requesters = [
+            create_fake_user(character_id=random_id(), character_name=f"Pilot {index}")
+            for index in range(6)
+        ]
+        # Settings of some requesters exist already, the others are created
+        UserSetting.objects.create(user=requesters[3])
+        # The settings are read from the configuration cache
+        Setting.objects.get_cached()
+
+        for batch in (requesters[:1], requesters[1:]):
+            notifications = notifications_for(requesters=batch)
+
+            with self.assertNumQueries(4):
+                send_requester_notifications(
+                    reviser_id=self.reviser.pk, notifications=notifications
+                )
+
+        self.assertEqual(mock_notify.call_count, 6)
+        self.assertEqual(UserSetting.objects.filter(user__in=requesters).count(), 6)
+
+    @patch("aasrp.tasks.notify_requester_digest")
+    @patch("aasrp.tasks.notify_requester")
+    def test_sends_one_digest_per_requester(self, mock_notify, mock_notify_digest):
+        """
+        Test that the notifications of a requester are sent as one with digest enabled
+
+        :param mock_notify:
+        :type mock_notify:
+        :param mock_notify_digest:
+        :type mock_notify_digest:
+        :return:
+        :rtype:
+        """
+
+        Setting.objects.update(notification_digest=True)
+
+        other_requester = create_fake_user(
+            character_id=random_id(), character_name="Deanna Troi"
+        )
+        other_srp_request = SrpRequest.objects.create(
+            creator=other_requester,
+            character=other_requester.profile.main_character,
+            ship=self.ship,
+            srp_link=self.srp_link,
+            request_status=SrpRequest.Status.APPROVED,
+        )
+        notifications = self._notifications() + [
+            {
+                "srp_request_id": other_srp_request.pk,
+                "comment": "",
+                "idempotency_key": "aasrp-test-notification-other",
+            }
+        ]
+
+        send_requester_notifications(
+            reviser_id=self.reviser.pk, notifications=notifications
+        )
+
+        mock_notify_digest.assert_called_once()
+        self.assertEqual(
+            mock_notify_digest.call_args.kwargs["requester"], self.requester
+        )
+        self.assertEqual(
+            mock_notify_digest.call_args.kwargs["srp_requests"], self.srp_requests
+        )
+        mock_notify.assert_called_once()
+        self.assertEqual(mock_notify.call_args.kwargs["requester"], other_requester)
+
+        # All notifications have been sent
+        send_requester_notifications(
+            reviser_id=self.reviser.pk, notifications=notifications
+        )
+
+        self.assertEqual(mock_notify_digest.call_count, 1)
+        self.assertEqual(mock_notify.call_count, 1)
+
+    @patch("aasrp.tasks.send_requester_notifications.retry")
+    @patch("aasrp.tasks.notify_requester_digest")
+    def test_retries_a_failed_digest(self, mock_notify_digest, mock_retry):
+        """
+        Test that a failed digest is sent again on retry
+
+        :param mock_notify_digest:
+        :type mock_notify_digest:
+        :param mock_retry:
+        :type mock_retry:
+        :return:
+        :rtype:
+        """
+
+        Setting.objects.update(notification_digest=True)
+
+        mock_retry.side_effect = RuntimeError("retry")
+        mock_notify_digest.side_effect = [ConnectionError("Discord is down"), None]
+
+        notifications = self._notifications()
+
+        with self.assertRaises(RuntimeError):
+            send_requester_notifications(
+                reviser_id=self.reviser.pk, notifications=notifications
+            )
+
+        send_requester_notifications(
+            reviser_id=self.reviser.pk, notifications=notifications
+        )
+
+        self.assertEqual(mock_notify_digest.call_count, 2)
+        self.assertEqual(
+            mock_notify_digest.call_args.kwargs["srp_requests"], self.srp_requests
+        )
+
+    @patch("aasrp.tasks.notify_requester")
+    def test_skips_removed_requests(self, mock_notify):
+        """
+        Test that notifications for removed SRP requests are skipped
+
+        :param mock_notify:
+        :type mock_notify:
+        :return:
+        :rtype:
+        """
+
+        notifications = self._notifications()
+        notifications[0]["srp_request_id"] = 0
+
+        send_requester_notifications(
+            reviser_id=self.reviser.pk, notifications=notifications
+        )
+
+        mock_notify.assert_called_once()
+
+    @patch("aasrp.tasks.send_requester_notifications.retry")
+    @patch("aasrp.tasks.notify_requester")
+    def test_retries_only_failed_notifications(self, mock_notify, mock_retry):
+        """
+        Test that the task is retried when a notification fails, and the retry only
+        sends the notifications that have not been sent yet
+
+        :param mock_notify:
+        :type mock_notify:
+        :param mock_retry:
+        :type mock_retry:
+        :return:
+        :rtype:
+        """
+
+        mock_retry.side_effect = RuntimeError("retry")
+        mock_notify.side_effect = [None, ConnectionError("Discord is down"), None]
+
+        notifications = self._notifications()
+
+        with self.assertRaises(RuntimeError):
+            send_requester_notifications(
+                reviser_id=self.reviser.pk, notifications=notifications
+            )
+
+        mock_retry.assert_called_once()
+        self.assertIsInstance(mock_retry.call_args.kwargs["exc"], ConnectionError)
+        self.assertEqual(mock_retry.call_args.kwargs["countdown"], 60)
+
+        # The retry only sends the failed notification
+        send_requester_notifications(
+            reviser_id=self.reviser.pk, notifications=notifications
+        )
+
+        self.assertEqual(mock_notify.call_count, 3)
+        self.assertEqual(
+            mock_notify.call_args.kwargs["srp_request"], self.srp_requests[1]
+        )
+
+
+class TestImportSrpLinkKillmails(BaseTestCase):
+    """
+    Test the import_srp_link_killmails task
+    """
+
+    def setUp(self):
+        """
+        Set up the SRP link and importer
+
+        :return:
+        :rtype:
+        """
+
+        self.importer = create_fake_user(
+            character_id=random_id(), character_name="Importer"
+        )
+        self.srp_link = SrpLink.objects.create(
+            srp_name="Test Fleet", fleet_time=timezone.now()
+        )
+
+    @patch("aasrp.tasks.notify_killmail_import")
+    @patch("aasrp.tasks.import_killmails")
+    def test_imports_killmails_and_notifies_the_importer(
+        self, mock_import_killmails, mock_notify_killmail_import
+    ):
+        """
+        Test that the task imports the killmails and notifies the importer
+
+        :param mock_import_killmails:
+        :type mock_import_killmails:
+        :param mock_notify_killmail_import:
+        :type mock_notify_killmail_import:
+        :return:
+        :rtype:
+        """
+
+        import_srp_link_killmails(
+            srp_link_id=self.srp_link.pk,
+            entries=["123", "https://zkillboard.com/kill/456/"],
+            importer_id=self.importer.pk,
+            additional_info="Fleet fight",
+            language="de",
+        )
+
+        mock_import_killmails.assert_called_once_with(
+            srp_link=self.srp_link,
+            entries=["123", "https://zkillboard.com/kill/456/"],
+            importer=self.importer,
+            additional_info="Fleet fight",
+        )
+        mock_notify_killmail_import.assert_called_once_with(
+            importer=self.importer,
+            srp_link=self.srp_link,
+            result=mock_import_killmails.return_value,
+        )
+
+    @patch("aasrp.tasks.notify_killmail_import")
+    @patch("aasrp.tasks.import_killmails")
+    def test_translates_the_result_to_the_importers_language(
+        self, mock_import_killmails, mock_notify_killmail_import
+    ):
+        """
+        Test that the import runs in the language of the importer
+
+        :param mock_import_killmails:
+        :type mock_import_killmails:
+        :param mock_notify_killmail_import:
+        :type mock_notify_killmail_import:
+        :return:
+        :rtype:
+        """
+
+        languages = []
+        mock_import_killmails.side_effect = lambda **kwargs: languages.append(
+            get_language()
+        )
+
+        import_srp_link_killmails(
+            srp_link_id=self.srp_link.pk,
+            entries=["123"],
+            importer_id=self.importer.pk,
+            language="de",
+        )
+
+        self.assertEqual(languages, ["de"])
+
+    @patch("aasrp.tasks.notify_killmail_import")
+    @patch("aasrp.tasks.import_killmails")
+    def test_skips_a_removed_srp_link(
+        self, mock_import_killmails, mock_notify_killmail_import
+    ):
+        """
+        Test that nothing is imported when the SRP link has been removed in the meantime
+
+        :param mock_import_killmails:
+        :type mock_import_killmails:
+        :param mock_notify_killmail_import:
+        :type mock_notify_killmail_import:
+        :return:
+        :rtype:
+        """
+
+        srp_link_id = self.srp_link.pk
+        self.srp_link.delete()
+
+        import_srp_link_killmails(
+            srp_link_id=srp_link_id, entries=["123"], importer_id=self.importer.pk
+        )
+
+        mock_import_killmails.assert_not_called()
+        mock_notify_killmail_import.assert_not_called()
+
+
+class TestPrewarmKillmailCache(BaseTestCase):
+    """
+    Test the prewarm_killmail_cache task
+    """
+
+    @patch("aasrp.tasks.Killmail.objects.prewarm")
+    def test_prewarms_killmail_cache(self, mock_prewarm):
+        """
+        Test that the task hands the killmail IDs to the killmail manager
+
+        :param mock_prewarm:
+        :type mock_prewarm:
+        :return:
+        :rtype:
+        """
+
+        mock_prewarm.return_value = (2, 0)
+
+        prewarm_killmail_cache(killmail_ids=[1, 2])
+
+        mock_prewarm.assert_called_once_with(killmail_ids=[1, 2])
+
+
+class TestUpdateInsurancePrices(BaseTestCase):
+    """
+    Test the update_insurance_prices task
+    """
+
+    @patch("aasrp.tasks.InsurancePrice.objects.update_from_esi")
+    def test_updates_insurance_prices(self, mock_update_from_esi):
+        """
+        Test that the task updates the insurance price table from ESI
+
+        :param mock_update_from_esi:
+        :type mock_update_from_esi:
+        :return:
+        :rtype:
+        """
+
+        update_insurance_prices()
+
+        mock_update_from_esi.assert_called_once_with()
@@ -11,6 +11,8 @@ from unittest.mock import MagicMock, patch
 from eve_sde.models import ItemType
 
 # Django
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.crypto import get_random_string
@@ -173,6 +175,7 @@ class TestSrpRequestsBulkRemove(BaseViewsTestCase):
                 "success": True,
                 "message": "SRP requests have been removed",
                 "pending_requests": 0,
+                "removed_request_codes": ["code1", "code2"],
             },
         )
 
@@ -263,6 +266,7 @@ class TestSrpRequestRemove(BaseViewsTestCase):
                 "success": True,
                 "message": "SRP request has been removed",
                 "pending_requests": 1,
+                "removed_request_codes": ["valid_request_code"],
             },
         )
 
@@ -287,18 +291,15 @@ class TestSrpRequestDeny(BaseViewsTestCase):
 
     @patch("aasrp.models.SrpRequest.objects.get")
     @patch("aasrp.views.ajax.SrpRequestRejectForm")
-    @patch("aasrp.views.ajax.get_user_settings")
-    @patch("aasrp.views.ajax.notify_requester")
+    @patch("aasrp.views.ajax.queue_requester_notifications")
     def test_returns_success_when_request_is_denied(
-        self, mock_notify, mock_get_user_settings, mock_form, mock_get
+        self, mock_queue_notifications, mock_form, mock_get
     ):
         """
         Test that the view returns success when the SRP request is denied.
 
-        :param mock_notify:
-        :type mock_notify:
-        :param mock_get_user_settings:
-        :type mock_get_user_settings:
+        :param mock_queue_notifications:
+        :type mock_queue_notifications:
         :param mock_form:
         :type mock_form:
         :param mock_get:
@@ -315,7 +316,6 @@ class TestSrpRequestDeny(BaseViewsTestCase):
         mock_get.return_value = srp_request
         mock_form.return_value.is_valid.return_value = True
         mock_form.return_value.cleaned_data = {"comment": "Rejection reason"}
-        mock_get_user_settings.return_value.disable_notifications = False
 
         request = MagicMock(
             method="POST", body=json.dumps({"comment": "Rejection reason"})
@@ -333,9 +333,10 @@ class TestSrpRequestDeny(BaseViewsTestCase):
                 "success": True,
                 "message": "SRP request has been rejected",
                 "pending_requests": 1,
+                "request_codes": [srp_request.request_code],
             },
         )
-        mock_notify.assert_called_once()
+        mock_queue_notifications.assert_called_once()
 
     @patch("aasrp.models.SrpRequest.objects.get")
     def test_returns_error_when_request_does_not_exist(self, mock_get):
@@ -419,12 +420,10 @@ class TestSrpRequestsBulkApprove(BaseViewsTestCase):
     @patch("aasrp.models.SrpRequest.objects.filter")
     @patch("aasrp.models.SrpRequest.objects.bulk_update")
     @patch("aasrp.models.RequestComment.objects.bulk_create")
-    @patch("aasrp.views.ajax.get_user_settings")
-    @patch("aasrp.views.ajax.notify_requester")
+    @patch("aasrp.views.ajax.queue_requester_notifications")
     def test_returns_success_when_bulk_approval_is_successful(
         self,
-        mock_notify,
-        mock_get_user_settings,
+        mock_queue_notifications,
         mock_bulk_create,
         mock_bulk_update,
         mock_filter,
@@ -432,10 +431,8 @@ class TestSrpRequestsBulkApprove(BaseViewsTestCase):
         """
         Test that the view returns success when bulk approval is successful.
 
-        :param mock_notify:
-        :type mock_notify:
-        :param mock_get_user_settings:
-        :type mock_get_user_settings:
+        :param mock_queue_notifications:
+        :type mock_queue_notifications:
         :param mock_bulk_create:
         :type mock_bulk_create:
         :param mock_bulk_update:
@@ -450,7 +447,6 @@ class TestSrpRequestsBulkApprove(BaseViewsTestCase):
             method="POST", body=json.dumps({"srp_request_codes": ["code1", "code2"]})
         )
         mock_request.user = self.user_jean_luc_picard
-        mock_get_user_settings.return_value.disable_notifications = False
 
         srp_request_1 = SrpRequest.objects.create(
             srp_link=self.srp_link_active,
@@ -475,11 +471,19 @@ class TestSrpRequestsBulkApprove(BaseViewsTestCase):
                 "success": True,
                 "message": "SRP requests have been approved",
                 "pending_requests": 2,
+                "request_codes": [
+                    srp_request_1.request_code,
+                    srp_request_2.request_code,
+                ],
             },
         )
         mock_bulk_update.assert_called_once()
         mock_bulk_create.assert_called_once()
-        mock_notify.assert_called()
+        # All notifications of the bulk action are queued at once
+        mock_queue_notifications.assert_called_once_with(
+            srp_requests=[srp_request_1, srp_request_2],
+            reviser=self.user_jean_luc_picard,
+        )
 
     @patch("aasrp.models.SrpRequest.objects.filter")
     def test_returns_error_when_no_matching_requests_found(self, mock_filter):
@@ -544,18 +548,15 @@ class TestSrpRequestApprove(BaseViewsTestCase):
 
     @patch("aasrp.models.SrpRequest.objects.get")
     @patch("aasrp.models.RequestComment.objects.bulk_create")
-    @patch("aasrp.views.ajax.get_user_settings")
-    @patch("aasrp.views.ajax.notify_requester")
+    @patch("aasrp.views.ajax.queue_requester_notifications")
     def test_returns_success_when_request_is_approved(
-        self, mock_notify, mock_get_user_settings, mock_bulk_create, mock_get
+        self, mock_queue_notifications, mock_bulk_create, mock_get
     ):
         """
         Test that the view returns success when the SRP request is approved.
 
-        :param mock_notify:
-        :type mock_notify:
-        :param mock_get_user_settings:
-        :type mock_get_user_settings:
+        :param mock_queue_notifications:
+        :type mock_queue_notifications:
         :param mock_bulk_create:
         :type mock_bulk_create:
         :param mock_get:
@@ -568,7 +569,6 @@ class TestSrpRequestApprove(BaseViewsTestCase):
             method="POST", body=json.dumps({"comment": "Approval comment"})
         )
         mock_request.user = self.user_jean_luc_picard
-        mock_get_user_settings.return_value.disable_notifications = False
 
         srp_request = self.srp_request_pending
         mock_get.return_value = srp_request
@@ -584,10 +584,11 @@ class TestSrpRequestApprove(BaseViewsTestCase):
                 "success": True,
                 "message": "SRP request has been approved",
                 "pending_requests": 0,
+                "request_codes": [srp_request.request_code],
             },
         )
         mock_bulk_create.assert_called_once()
-        mock_notify.assert_called_once()
+        mock_queue_notifications.assert_called_once()
 
     @patch("aasrp.models.SrpRequest.objects.get")
     def test_returns_error_when_request_does_not_exist(self, mock_get):
@@ -677,7 +678,13 @@ class TestSrpRequestChangePayout(BaseViewsTestCase):
 
         self.srp_request_pending.refresh_from_db()
         self.assertEqual(response.status_code, HTTPStatus.OK)
-        self.assertEqual(response.json(), {"success": True})
+        self.assertEqual(
+            response.json(),
+            {
+                "success": True,
+                "request_codes": [self.srp_request_pending.request_code],
+            },
+        )
         self.assertEqual(self.srp_request_pending.payout_amount, 1000)
 
     @patch("aasrp.views.ajax.SrpRequestPayoutForm")
@@ -858,3 +865,137 @@ class TestSrpLinkViewRequestsData(BaseViewsTestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), [])
+
+
+class TestAjaxViewsQueryCounts(BaseViewsTestCase):
+    """
+    Tests for the number of queries of the AJAX views.
+
+    The number of queries must not depend on the number of rows.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up an SRP link with SRP requests of different requesters
+
+        :return:
+        :rtype:
+        """
+
+        self.srp_link = SrpLink.objects.create(
+            srp_name="Query Count Fleet",
+            srp_code=get_random_string(length=16),
+            fleet_time=timezone.now(),
+            creator=self.user_wesley_crusher,
+        )
+
+        for i in range(5):
+            requester = create_fake_user(
+                character_id=random_id(), character_name=f"Requester {i}"
+            )
+            srp_request = SrpRequest.objects.create(
+                request_code=get_random_string(length=16),
+                srp_link=self.srp_link,
+                character=requester.profile.main_character,
+                ship=self.ship_test,
+                killboard_link=f"https://zkillboard.com/kill/{1000 + i}/",
+                creator=requester,
+            )
+            RequestComment.objects.create(
+                srp_request=srp_request,
+                creator=requester,
+                comment_type=RequestComment.Type.REQUEST_ADDED,
+            )
+            RequestComment.objects.create(
+                srp_request=srp_request,
+                creator=self.user_jean_luc_picard,
+                comment_type=RequestComment.Type.STATUS_CHANGE,
+                new_status=SrpRequest.Status.APPROVED,
+            )
+
+        self.client.force_login(self.user_jean_luc_picard)
+
+    def test_dashboard_srp_links_data(self):
+        """
+        Test the number of queries of the dashboard SRP links data
+
+        :return:
+        :rtype:
+        """
+
+        with self.assertNumQueries(12):
+            response = self.client.get(
+                reverse("aasrp:ajax_dashboard_srp_links_all_data")
+            )
+
+        self.assertEqual(len(response.json()), 3)
+
+    def test_srp_link_view_requests_data(self):
+        """
+        Test the number of queries of the SRP requests data of an SRP link
+
+        :return:
+        :rtype:
+        """
+
+        with self.assertNumQueries(12):
+            response = self.client.get(
+                reverse(
+                    "aasrp:ajax_srp_link_view_requests_data",
+                    args=[self.srp_link.srp_code],
+                )
+            )
+
+        self.assertEqual(len(response.json()), 5)
+
+    def test_srp_request_additional_information(self):
+        """
+        Test the number of queries of the SRP request details
+
+        :return:
+        :rtype:
+        """
+
+        srp_request = self.srp_link.srp_requests.first()
+
+        with self.assertNumQueries(14):
+            response = self.client.get(
+                reverse(
+                    "aasrp:ajax_srp_request_additional_information",
+                    args=[self.srp_link.srp_code, srp_request.request_code],
+                )
+            )
+
+        self.assertContains(response, "Requester")
+
+    def test_srp_requests_bulk_remove_doesnt_count_without_debug_logging(self):
+        """
+        Test the SRP requests to remove are not counted for the log message when
+        debug logging is disabled
+
+        :return:
+        :rtype:
+        """
+
+        srp_request = self.srp_link.srp_requests.first()
+
+        with (
+            patch("aasrp.views.ajax.logger.isEnabledFor", return_value=False),
+            CaptureQueriesContext(connection) as queries,
+        ):
+            response = self.client.post(
+                reverse(
+                    "aasrp:ajax_srp_requests_bulk_remove",
+                    args=[self.srp_link.srp_code],
+                ),
+                data=json.dumps({"srp_request_codes": [srp_request.request_code]}),
+                content_type="application/json",
+            )
+
+        self.assertTrue(response.json()["success"])
+        self.assertFalse(
+            any(
+                "__count" in query["sql"] and "request_code" in query["sql"]
+                for query in queries.captured_queries
+            )
+        )
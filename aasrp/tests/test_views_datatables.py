@@ -1,22 +1,24 @@
 """
-Unit tests for the OwnSrpRequestsView datatable view.
+Unit tests for the datatable views.
 """
 
 # Standard Library
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 # Third Party
 from eve_sde.models import ItemType
 
 # Django
+from django.core.cache import cache
 from django.http import QueryDict
+from django.urls import reverse
 from django.utils import timezone
 
 # AA SRP
 from aasrp.models import SrpLink, SrpRequest
 from aasrp.tests import BaseTestCase
 from aasrp.tests.utils import create_fake_user, random_id
-from aasrp.views.datatables import OwnSrpRequestsView
+from aasrp.views.datatables import OwnSrpRequestsView, SrpLinkRequestsView
 
 
 class TestOwnSrpRequestsView(BaseTestCase):
@@ -152,3 +154,387 @@ class TestOwnSrpRequestsView(BaseTestCase):
         self.request.GET = QueryDict("filter_request_status=pending")
         queryset = self.view.get_model_qs(self.request)
         self.assertEqual(queryset.count(), 0)
+
+    def test_number_of_queries(self):
+        """
+        Test that the number of queries doesn't depend on the number of rows.
+
+        :return:
+        :rtype:
+        """
+
+        ship = ItemType.objects.create(pk=587, name="Rifter")
+
+        for i in range(5):
+            SrpRequest.objects.create(
+                creator=self.user,
+                character=self.user.profile.main_character,
+                ship=ship,
+                srp_link=self.srp_link,
+                request_code=f"REQ{i:03d}",
+            )
+
+        params = {
+            "draw": 1,
+            "start": 0,
+            "length": 10,
+            "search[value]": "",
+            "search[regex]": "false",
+            "order[0][column]": 0,
+            "order[0][dir]": "asc",
+        }
+
+        for index in range(len(OwnSrpRequestsView.columns)):
+            params[f"columns[{index}][searchable]"] = "true"
+            params[f"columns[{index}][orderable]"] = "true"
+            params[f"columns[{index}][search][value]"] = ""
+            params[f"columns[{index}][search][regex]"] = "false"
+
+        self.client.force_login(self.user)
+
+        with self.assertNumQueries(13):
+            response = self.client.get(
+                reverse("aasrp:ajax_dashboard_user_srp_requests_data"), params
+            )
+
+        self.assertEqual(len(response.json()["data"]), 5)
+
+
+class TestSrpLinkRequestsView(BaseTestCase):
+    """
+    Test case for SrpLinkRequestsView datatable view.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Set up test data for SrpLinkRequestsView tests.
+
+        :return:
+        :rtype:
+        """
+
+        super().setUpClass()
+
+        cls.user_manager = create_fake_user(
+            character_id=random_id(),
+            character_name="Jean Luc Picard",
+            permissions=["aasrp.basic_access", "aasrp.manage_srp_requests"],
+        )
+        cls.user_basic = create_fake_user(
+            character_id=random_id(),
+            character_name="Wesley Crusher",
+            permissions=["aasrp.basic_access"],
+        )
+        cls.ship = ItemType.objects.create(pk=587, name="Rifter")
+        cls.srp_link = SrpLink.objects.create(
+            srp_code="TEST001", creator=cls.user_manager, fleet_time=timezone.now()
+        )
+        cls.srp_link_other = SrpLink.objects.create(
+            srp_code="TEST002", creator=cls.user_manager, fleet_time=timezone.now()
+        )
+
+        for i in range(15):
+            SrpRequest.objects.create(
+                creator=cls.user_basic,
+                character=cls.user_basic.profile.main_character,
+                ship=cls.ship,
+                srp_link=cls.srp_link,
+                request_code=f"REQ{i:03d}",
+                request_status=(
+                    SrpRequest.Status.APPROVED
+                    if i % 3 == 0
+                    else SrpRequest.Status.PENDING
+                ),
+                payout_amount=1000 * i,
+                killboard_link=f"https://zkillboard.com/kill/{i + 1}/",
+            )
+
+        SrpRequest.objects.create(
+            creator=cls.user_basic,
+            character=cls.user_basic.profile.main_character,
+            ship=cls.ship,
+            srp_link=cls.srp_link_other,
+            request_code="OTHER001",
+        )
+
+        cls.url = reverse(
+            "aasrp:ajax_srp_link_view_requests_server_side_data",
+            args=[cls.srp_link.srp_code],
+        )
+
+    @staticmethod
+    def _datatables_params(
+        start: int = 0, length: int = 10, search: str = "", **kwargs
+    ) -> dict:
+        """
+        Build the query parameters DataTables sends in server-side mode.
+
+        :param start:
+        :type start:
+        :param length:
+        :type length:
+        :param search:
+        :type search:
+        :param kwargs:
+        :type kwargs:
+        :return:
+        :rtype:
+        """
+
+        params = {
+            "draw": 1,
+            "start": start,
+            "length": length,
+            "search[value]": search,
+            "search[regex]": "false",
+            "order[0][column]": 3,
+            "order[0][dir]": "asc",
+        }
+
+        for index in range(len(SrpLinkRequestsView.columns)):
+            params[f"columns[{index}][searchable]"] = (
+                "false" if index in (7, 8, 9, 10, 11) else "true"
+            )
+            params[f"columns[{index}][orderable]"] = (
+                "false" if index in (7, 8, 9) else "true"
+            )
+            params[f"columns[{index}][search][value]"] = ""
+            params[f"columns[{index}][search][regex]"] = "false"
+
+        params.update(kwargs)
+
+        return params
+
+    def test_returns_only_requests_of_the_srp_link(self):
+        """
+        Test that get_model_qs only returns the requests of the given SRP link.
+
+        :return:
+        :rtype:
+        """
+
+        request = MagicMock(user=self.user_manager, GET=QueryDict())
+
+        queryset = SrpLinkRequestsView().get_model_qs(
+            request, srp_code=self.srp_link.srp_code
+        )
+
+        self.assertEqual(queryset.count(), 15)
+        self.assertFalse(queryset.filter(request_code="OTHER001").exists())
+
+    def test_returns_queryset_filtered_by_request_status(self):
+        """
+        Test that get_model_qs applies the request status filter.
+
+        :return:
+        :rtype:
+        """
+
+        request = MagicMock(
+            user=self.user_manager, GET=QueryDict("filter_request_status=Approved")
+        )
+
+        queryset = SrpLinkRequestsView().get_model_qs(
+            request, srp_code=self.srp_link.srp_code
+        )
+
+        self.assertEqual(queryset.count(), 5)
+
+    def test_returns_paged_and_ordered_rows(self):
+        """
+        Test that the view returns only the requested page, ordered in the database.
+
+        :return:
+        :rtype:
+        """
+
+        self.client.force_login(self.user_manager)
+
+        response = self.client.get(
+            self.url, self._datatables_params(start=10, length=10)
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+
+        self.assertEqual(data["recordsTotal"], 15)
+        self.assertEqual(data["recordsFiltered"], 15)
+        self.assertEqual(len(data["data"]), 5)
+        self.assertEqual(
+            [row[9] for row in data["data"]],
+            ["REQ010", "REQ011", "REQ012", "REQ013", "REQ014"],
+        )
+
+    def test_searches_in_the_database(self):
+        """
+        Test that the global search is applied in the database.
+
+        :return:
+        :rtype:
+        """
+
+        self.client.force_login(self.user_manager)
+
+        response = self.client.get(self.url, self._datatables_params(search="REQ00"))
+
+        data = response.json()
+
+        self.assertEqual(data["recordsFiltered"], 10)
+
+    def test_returns_srp_link_stats(self):
+        """
+        Test that the response contains the statistics of the whole SRP link.
+
+        :return:
+        :rtype:
+        """
+
+        self.client.force_login(self.user_manager)
+
+        response = self.client.get(self.url, self._datatables_params(length=1))
+
+        self.assertEqual(
+            response.json()["srp_link_stats"],
+            {
+                "total_cost": 30000,
+                "requests_total": 15,
+                "requests_pending": 10,
+                "requests_approved": 5,
+                "requests_rejected": 0,
+            },
+        )
+
+    def test_returns_only_the_requested_rows(self):
+        """
+        Test that only the rows of the given request codes are returned, keyed by request code.
+
+        :return:
+        :rtype:
+        """
+
+        self.client.force_login(self.user_manager)
+
+        response = self.client.get(self.url, {"codes": "REQ001,REQ003,OTHER001"})
+
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+
+        self.assertEqual(sorted(data["rows"]), ["REQ001", "REQ003"])
+        self.assertEqual(len(data["rows"]["REQ003"]), len(SrpLinkRequestsView.columns))
+        self.assertEqual(data["rows"]["REQ003"][9], "REQ003")
+        self.assertEqual(data["rows"]["REQ003"][10], SrpRequest.Status.APPROVED)
+        self.assertEqual(data["srp_link_stats"]["requests_total"], 15)
+        self.assertNotIn("data", data)
+
+    def test_renders_unchanged_rows_from_the_fragment_cache(self):
+        """
+        Test that unchanged rows are served from the fragment cache and changed rows
+        are rendered again.
+
+        :return:
+        :rtype:
+        """
+
+        # Start without fragments cached by other tests
+        cache.clear()
+
+        self.client.force_login(self.user_manager)
+        self.client.get(self.url, {"codes": "REQ001,REQ003"})
+
+        srp_request = SrpRequest.objects.get(request_code="REQ001")
+        srp_request.payout_amount = 1234
+        srp_request.save()
+
+        with patch.object(
+            SrpLinkRequestsView,
+            "render_template",
+            autospec=True,
+            side_effect=SrpLinkRequestsView.render_template,
+        ) as mock_render_template:
+            response = self.client.get(self.url, {"codes": "REQ001,REQ003"})
+
+        # The requester column is rendered outside the fragment cache
+        rendered_rows = {
+            call.args[3]["row"].request_code
+            for call in mock_render_template.call_args_list
+            if call.args[2] != SrpLinkRequestsView.columns[1][1]
+        }
+
+        self.assertEqual(rendered_rows, {"REQ001"})
+        self.assertEqual(response.json()["rows"]["REQ001"][11], "1234")
+
+    def test_renders_a_changed_requester_of_a_cached_row(self):
+        """
+        Test that cached rows show the current main character of the requester
+        and the current name of the character.
+
+        :return:
+        :rtype:
+        """
+
+        self.client.force_login(self.user_manager)
+        self.client.get(self.url, {"codes": "REQ001"})
+
+        main_character = self.user_basic.profile.main_character
+        main_character.character_name = "Wesley Crusher Renamed"
+        main_character.save()
+
+        try:
+            row = self.client.get(self.url, {"codes": "REQ001"}).json()["rows"][
+                "REQ001"
+            ]
+        finally:
+            main_character.character_name = "Wesley Crusher"
+            main_character.save()
+
+        self.assertIn("Wesley Crusher Renamed", row[1])
+        self.assertIn("Wesley Crusher Renamed", row[2])
+
+    def test_renders_action_icons_according_to_permissions(self):
+        """
+        Test that the delete icon is only rendered for users with the manage_srp permission.
+
+        :return:
+        :rtype:
+        """
+
+        self.client.force_login(self.user_manager)
+
+        response = self.client.get(self.url, self._datatables_params(length=1))
+
+        actions = response.json()["data"][0][8]
+
+        self.assertIn("#srp-request-accept", actions)
+        self.assertNotIn("#srp-request-remove", actions)
+
+    def test_denies_access_without_permission(self):
+        """
+        Test that users without manage permissions are denied access.
+
+        :return:
+        :rtype:
+        """
+
+        self.client.force_login(self.user_basic)
+
+        response = self.client.get(self.url, self._datatables_params())
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_number_of_queries(self):
+        """
+        Test that the number of queries doesn't depend on the number of rows.
+
+        :return:
+        :rtype:
+        """
+
+        self.client.force_login(self.user_manager)
+
+        with self.assertNumQueries(14):
+            response = self.client.get(self.url, self._datatables_params(length=15))
+
+        self.assertEqual(len(response.json()["data"]), 15)
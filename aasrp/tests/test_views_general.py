@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, patch
 from eve_sde.models import ItemType
 
 # Django
+from django.db import IntegrityError
 from django.test import Client
 from django.urls import reverse
 from django.utils import timezone
@@ -343,6 +344,164 @@ class TestSrpLinkEditView(BaseTestCase):
         self.assertEqual(self.srp_link.aar_link, "https://example.com/aar")
 
 
+class TestSrpLinkImportKillmailsView(BaseTestCase):
+    """
+    Tests for the srp_link_import_killmails view.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up test data for the srp_link_import_killmails view tests.
+
+        :return:
+        :rtype:
+        """
+
+        cls.user = AuthUtils.create_user("test_user")
+
+        AuthUtils.add_permission_to_user_by_name("aasrp.basic_access", cls.user)
+        AuthUtils.add_permission_to_user_by_name("aasrp.manage_srp", cls.user)
+        AuthUtils.add_main_character_2(
+            cls.user, name="Test Character", character_id=random_id()
+        )
+
+        cls.srp_link = SrpLink.objects.create(
+            srp_name="Test Fleet",
+            fleet_time="2024-01-01 12:00:00",
+            fleet_doctrine="Test Doctrine",
+            srp_code="TESTCODE1234",
+            creator=cls.user,
+        )
+
+    def setUp(self):
+        """
+        Set up the test client and log in the test user.
+
+        :return:
+        :rtype:
+        """
+
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def test_get_renders(self):
+        """
+        Test that the killmail import GET view renders correctly.
+
+        :return:
+        :rtype:
+        """
+
+        response = self.client.get(
+            reverse("aasrp:import_killmails", args=[self.srp_link.srp_code])
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "aasrp/link-import-killmails.html")
+
+    def test_invalid_code_redirects(self):
+        """
+        Test that an invalid SRP code redirects with an error.
+
+        :return:
+        :rtype:
+        """
+
+        response = self.client.get(
+            reverse("aasrp:import_killmails", args=["INVALIDCODE"])
+        )
+
+        self.assertRedirects(response, reverse("aasrp:srp_links"))
+
+    def test_inactive_srp_link_redirects(self):
+        """
+        Test that killmails can't be imported into an SRP link that isn't active.
+
+        :return:
+        :rtype:
+        """
+
+        srp_link = SrpLink.objects.create(
+            srp_name="Closed Fleet",
+            fleet_time="2024-01-01 12:00:00",
+            srp_code="TESTCODE5678",
+            srp_status=SrpLink.Status.CLOSED,
+        )
+
+        response = self.client.get(
+            reverse("aasrp:import_killmails", args=[srp_link.srp_code])
+        )
+
+        self.assertRedirects(response, reverse("aasrp:srp_links"))
+
+    def test_requires_manage_srp(self):
+        """
+        Test that users who can only create SRP links can't import killmails,
+        since the dashboard only shows the import button to SRP managers.
+
+        :return:
+        :rtype:
+        """
+
+        user = AuthUtils.create_user("fc_user")
+
+        AuthUtils.add_permission_to_user_by_name("aasrp.basic_access", user)
+        AuthUtils.add_permission_to_user_by_name("aasrp.create_srp", user)
+
+        self.client.force_login(user)
+
+        response = self.client.get(
+            reverse("aasrp:import_killmails", args=[self.srp_link.srp_code])
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertNotIn(
+            reverse("aasrp:import_killmails", args=[self.srp_link.srp_code]),
+            response.url,
+        )
+
+    @patch("aasrp.views.general.import_srp_link_killmails.delay")
+    def test_post_queues_the_import(self, mock_delay):
+        """
+        Test that a valid POST queues the import of the killmails.
+
+        :param mock_delay:
+        :type mock_delay:
+        :return:
+        :rtype:
+        """
+
+        response = self.client.post(
+            reverse("aasrp:import_killmails", args=[self.srp_link.srp_code]),
+            data={
+                "killmails": "https://zkillboard.com/kill/123/\r\n456\r\n",
+                "additional_info": "Fleet fight",
+            },
+        )
+
+        self.assertRedirects(
+            response,
+            reverse("aasrp:view_srp_requests", args=[self.srp_link.srp_code]),
+            fetch_redirect_response=False,
+        )
+        mock_delay.assert_called_once_with(
+            srp_link_id=self.srp_link.pk,
+            entries=["https://zkillboard.com/kill/123/", "456"],
+            importer_id=self.user.pk,
+            additional_info="Fleet fight",
+            language="en",
+        )
+
+        messages = [str(message) for message in response.wsgi_request._messages]
+
+        self.assertIn(
+            "The killmails are being imported. You will get a notification "
+            "with the result once the import has finished.",
+            messages,
+        )
+
+
 class TestCompleteSrpLinkView(BaseTestCase):
     """
     Tests for the complete_srp_link view.
@@ -988,8 +1147,9 @@ class TestSaveSrpRequest(BaseTestCase):
         srp_request_instance = SrpRequest()
         mock_srp_request_create.return_value = srp_request_instance
 
-        mock_insurance = MagicMock()
-        mock_get_insurance.return_value.levels = [mock_insurance]
+        mock_get_insurance.return_value = [
+            {"name": "Platinum", "cost": 1000.0, "payout": 5000.0}
+        ]
 
         result = _save_srp_request(
             request=self.request,
@@ -1149,6 +1309,52 @@ class TestRequestSrp(BaseViewsTestCase):
         mock_save_srp_request.assert_called_once()
         mock_notify_srp_team.assert_called_once()
 
+    @patch("aasrp.managers.SrpRequestManager.get_kill_data")
+    @patch("aasrp.views.general._save_srp_request")
+    @patch("aasrp.views.general.notify_srp_team")
+    def test_shows_error_when_killmail_was_requested_in_the_meantime(
+        self, mock_notify_srp_team, mock_save_srp_request, mock_get_kill_data
+    ):
+        """
+        Test that a concurrent SRP request for the same killmail shows an error message.
+
+        :param mock_notify_srp_team:
+        :type mock_notify_srp_team:
+        :param mock_save_srp_request:
+        :type mock_save_srp_request:
+        :param mock_get_kill_data:
+        :type mock_get_kill_data:
+        :return:
+        :rtype:
+        """
+
+        mock_get_kill_data.return_value = {
+            "victim_id": 456,
+            "ship_type_id": 123,
+            "ship_value": 1000000,
+        }
+        mock_save_srp_request.side_effect = IntegrityError
+
+        victim_char = EveCharacter.objects.create(
+            character_id=456,
+            character_name="Victim Character",
+            corporation_id=789,
+            corporation_name="Victim Corp",
+        )
+        self.user.character_ownerships.create(character=victim_char)
+
+        response = self.client.post(
+            self.url,
+            {
+                "killboard_link": "https://zkillboard.com/kill/12345678/",
+                "additional_info": "Test additional info",
+            },
+        )
+
+        self.assertRedirects(response, reverse("aasrp:srp_links"))
+        mock_save_srp_request.assert_called_once()
+        mock_notify_srp_team.assert_not_called()
+
     @patch("aasrp.models.SrpRequest.objects.get_kill_id")
     @patch("aasrp.models.SrpRequest.objects.get_kill_data")
     def test_shows_error_when_character_not_owned(
@@ -1165,7 +1371,7 @@ class TestRequestSrp(BaseViewsTestCase):
         :rtype:
         """
 
-        mock_get_kill_id.return_value = "kill_id_123"
+        mock_get_kill_id.return_value = "123"
         mock_get_kill_data.return_value = {
             "victim_id": 1,
             "ship_value": "1000000",
@@ -1278,3 +1484,137 @@ class TestRequestSrp(BaseViewsTestCase):
         )
 
         self.assertRedirects(response, reverse("aasrp:srp_links"))
+
+
+class TestExportPayoutsView(BaseTestCase):
+    """
+    Tests for the export_payouts view.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up test data for the export_payouts view tests.
+
+        :return:
+        :rtype:
+        """
+
+        cls.user = AuthUtils.create_user("test_user")
+
+        AuthUtils.add_permission_to_user_by_name("aasrp.basic_access", cls.user)
+        AuthUtils.add_permission_to_user_by_name("aasrp.manage_srp", cls.user)
+        cls.character = AuthUtils.add_main_character_2(
+            cls.user, name="Test Character", character_id=random_id()
+        )
+
+        cls.ship = ItemType.objects.create(id=587, name="Rifter", published=True)
+        cls.srp_link = SrpLink.objects.create(
+            srp_name="Test Fleet",
+            fleet_time="2024-01-01 12:00:00",
+            srp_code="TESTCODE1234",
+            creator=cls.user,
+        )
+        SrpRequest.objects.create(
+            request_code="REQUEST1",
+            creator=cls.user,
+            character=cls.character,
+            ship=cls.ship,
+            srp_link=cls.srp_link,
+            request_status=SrpRequest.Status.APPROVED,
+            payout_amount=1000000,
+        )
+
+    def setUp(self):
+        """
+        Set up the test client and log in the test user.
+
+        :return:
+        :rtype:
+        """
+
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def test_streams_csv_export_of_srp_link(self):
+        """
+        Test that the payouts of an SRP link are streamed as CSV.
+
+        :return:
+        :rtype:
+        """
+
+        response = self.client.get(
+            reverse(
+                "aasrp:export_srp_link_payouts", args=[self.srp_link.srp_code, "csv"]
+            )
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="aasrp-payouts-TESTCODE1234.csv"',
+        )
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("srp_code,srp_name,fleet_time"))
+        self.assertIn("REQUEST1", lines[1])
+
+    def test_streams_ndjson_export_for_date_range(self):
+        """
+        Test that the payouts for a period are streamed as NDJSON.
+
+        :return:
+        :rtype:
+        """
+
+        response = self.client.get(
+            reverse("aasrp:export_payouts", args=["ndjson"]),
+            data={"date_from": "2024-01-01", "date_to": "2024-01-31"},
+        )
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="aasrp-payouts-all-from-2024-01-01-to-2024-01-31.ndjson"',
+        )
+        self.assertEqual(len(b"".join(response.streaming_content).splitlines()), 1)
+
+    def test_invalid_parameters_redirect(self):
+        """
+        Test that an unknown export format, SRP code or date redirects with an error.
+
+        :return:
+        :rtype:
+        """
+
+        for url, data in (
+            (reverse("aasrp:export_payouts", args=["xlsx"]), {}),
+            (reverse("aasrp:export_srp_link_payouts", args=["INVALID", "csv"]), {}),
+            (reverse("aasrp:export_payouts", args=["csv"]), {"date_from": "2024-13"}),
+        ):
+            with self.subTest(url=url, data=data):
+                response = self.client.get(url, data=data)
+
+                self.assertRedirects(response, reverse("aasrp:srp_links"))
+
+    def test_requires_manage_srp_permission(self):
+        """
+        Test that the export requires the manage_srp permission.
+
+        :return:
+        :rtype:
+        """
+
+        user = AuthUtils.create_user("basic_user")
+        AuthUtils.add_permission_to_user_by_name("aasrp.basic_access", user)
+        self.client.force_login(user)
+
+        response = self.client.get(reverse("aasrp:export_unpaid_payouts", args=["csv"]))
+
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        self.assertNotIn("Content-Disposition", response)
@@ -34,6 +34,11 @@ urls = [
         ajax.srp_link_view_requests_data,
         name="ajax_srp_link_view_requests_data",
     ),
+    path(
+        "srp-link/<str:srp_code>/view-srp-requests-data/server-side/",
+        datatables.SrpLinkRequestsView.as_view(),
+        name="ajax_srp_link_view_requests_server_side_data",
+    ),
     path(
         "srp-link/<str:srp_code>/srp-request/<str:srp_request_code>/view-additional-information-data/",
         ajax.srp_request_additional_information,
@@ -38,6 +38,12 @@ urls = [
         view=general.srp_link_edit,
         name="edit_srp_link",
     ),
+    # Route for importing killmails into an SRP link identified by its code
+    path(
+        route="srp-link/<str:srp_code>/import-killmails/",
+        view=general.srp_link_import_killmails,
+        name="import_killmails",
+    ),
     # Route for viewing SRP requests associated with a specific SRP link
     path(
         route="srp-link/<str:srp_code>/view-srp-requests/",
@@ -68,6 +74,25 @@ urls = [
         view=general.request_srp,
         name="request_srp",
     ),
+    # Route for exporting the payouts of an SRP link
+    path(
+        route="srp-link/<str:srp_code>/export/<str:export_format>/",
+        view=general.export_payouts,
+        name="export_srp_link_payouts",
+    ),
+    # Route for exporting the payouts of SRP links that are not completed yet
+    path(
+        route="export/unpaid/<str:export_format>/",
+        view=general.export_payouts,
+        kwargs={"unpaid_only": True},
+        name="export_unpaid_payouts",
+    ),
+    # Route for exporting the payouts of all SRP links (optionally for a period)
+    path(
+        route="export/<str:export_format>/",
+        view=general.export_payouts,
+        name="export_payouts",
+    ),
     # Route for marking an SRP link as complete
     path(
         route="srp-link/<str:srp_code>/complete/",
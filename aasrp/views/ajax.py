@@ -37,15 +37,19 @@ from aasrp.helper.icons import (
     get_srp_request_action_icons,
     get_srp_request_status_icon,
 )
-from aasrp.helper.notification import notify_requester
+from aasrp.helper.notification import queue_requester_notifications
 from aasrp.helper.srp_data import (
     payout_amount_html,
     request_code_html,
 )
 from aasrp.helper.urls import reverse_absolute
-from aasrp.helper.user import get_pending_requests_count_for_user, get_user_settings
+from aasrp.helper.user import (
+    get_main_character_names,
+    get_pending_requests_count_for_user,
+)
+from aasrp.helper.viewer import get_viewer_capabilities
 from aasrp.models import RequestComment, SrpLink, SrpRequest
-from aasrp.providers.applogger import AppLogger
+from aasrp.providers.applogger import AppLogger, LazyValue
 
 # Initialize a logger with a custom tag for the AA SRP application
 logger = AppLogger(my_logger=get_extension_logger(__name__))
@@ -73,18 +77,24 @@ def dashboard_srp_links_data(
 
     data = []
 
-    # Retrieve all SRP links with related data preloaded for efficiency
-    srp_links = SrpLink.objects.prefetch_related(
-        "fleet_commander",
-        "creator",
-        "creator__profile__main_character",
-        "srp_requests",
-    ).all()
+    # Retrieve all SRP links with related data preloaded for efficiency.
+    # The request statistics are stored on the SRP link itself.
+    srp_links = SrpLink.objects.for_dashboard()
 
     # Filter to include only active SRP links if `show_all_links` is False
     if not show_all_links:
         srp_links = srp_links.filter(srp_status=SrpLink.Status.ACTIVE)
 
+    srp_links = list(srp_links)
+
+    # Evaluate the user's permissions once, not per SRP link
+    capabilities = get_viewer_capabilities(request=request)
+
+    # Resolve the creators' main character names with a single query
+    creator_names = get_main_character_names(
+        user_ids=(srp_link.creator_id for srp_link in srp_links), request=request
+    )
+
     # Iterate through each SRP link and prepare its data for the response
     for srp_link in srp_links:
         # Generate a localized "Link" text and create an AAR link if available
@@ -112,7 +122,7 @@ def dashboard_srp_links_data(
         data.append(
             {
                 "srp_name": srp_link.srp_name,
-                "creator": get_main_character_name_from_user(user=srp_link.creator),
+                "creator": creator_names[srp_link.creator_id],
                 "fleet_time": srp_link.fleet_time,
                 "fleet_type": fleet_type,
                 "fleet_doctrine": srp_link.fleet_doctrine,
@@ -121,7 +131,9 @@ def dashboard_srp_links_data(
                 "srp_costs": srp_link.total_cost,
                 "srp_status": srp_link.srp_status,
                 "pending_requests": srp_link.pending_requests_count,
-                "actions": dashboard_action_icons(request=request, srp_link=srp_link),
+                "actions": dashboard_action_icons(
+                    request=request, srp_link=srp_link, capabilities=capabilities
+                ),
             }
         )
 
@@ -147,18 +159,23 @@ def srp_link_view_requests_data(request: WSGIRequest, srp_code: str) -> JsonResp
 
     data = []
 
-    # Retrieve all SRP requests associated with the given SRP code, prefetching related data for efficiency
-    srp_requests = SrpRequest.objects.filter(
+    # Retrieve all SRP requests associated with the given SRP code, joining the related data shown in the table
+    srp_requests = SrpRequest.objects.for_manager_table().filter(
         srp_link__srp_code__iexact=srp_code
-    ).prefetch_related(
-        "srp_link",
-        "srp_link__creator",
-        "srp_link__creator__profile__main_character",
-        "character",
-        "ship",
     )
 
-    logger.debug(f"Found {srp_requests.count()} SRP requests for SRP code: {srp_code}")
+    # Evaluate the user's permissions once, not per SRP request
+    capabilities = get_viewer_capabilities(request=request)
+
+    srp_requests = list(srp_requests)
+
+    logger.debug("Found %d SRP requests for SRP code: %s", len(srp_requests), srp_code)
+
+    # Resolve the requesters' main character names with a single query
+    requester_names = get_main_character_names(
+        user_ids=(srp_request.creator_id for srp_request in srp_requests),
+        request=request,
+    )
 
     # Iterate through each SRP request and prepare its data for the response
     for srp_request in srp_requests:
@@ -183,9 +200,9 @@ def srp_link_view_requests_data(request: WSGIRequest, srp_code: str) -> JsonResp
         data.append(
             {
                 "request_time": srp_request.post_time,  # Time the request was posted
-                "requester": get_main_character_name_from_user(
-                    srp_request.creator
-                ),  # Requester's main character name
+                "requester": requester_names[
+                    srp_request.creator_id
+                ],  # Requester's main character name
                 "character_html": {
                     "display": get_formatted_character_name(
                         character=srp_request.character,
@@ -203,7 +220,10 @@ def srp_link_view_requests_data(request: WSGIRequest, srp_code: str) -> JsonResp
                 },
                 "request_code": srp_request.request_code,
                 "srp_code": srp_request.srp_link.srp_code,
-                "ship_html": {"display": killboard_link, "sort": srp_request.ship.name},
+                "ship_html": {
+                    "display": killboard_link,
+                    "sort": srp_request.ship.name,
+                },
                 "ship": srp_request.ship.name,
                 "zkb_link": killboard_link,
                 "zbk_loss_amount": srp_request.loss_amount,
@@ -221,6 +241,7 @@ def srp_link_view_requests_data(request: WSGIRequest, srp_code: str) -> JsonResp
                     request=request,
                     srp_link=srp_request.srp_link,
                     srp_request=srp_request,
+                    capabilities=capabilities,
                 ),  # Available actions for the request
                 "request_status_translated": srp_request.get_request_status_display(),  # Translated request status
                 "request_status": srp_request.request_status,  # Request status
@@ -253,9 +274,9 @@ def srp_request_additional_information(
 
     # Retrieve the SRP request based on the provided SRP code and request code
     try:
-        srp_request = SrpRequest.objects.prefetch_related(
-            "insurance", "character", "ship"
-        ).get(srp_link__srp_code=srp_code, request_code=srp_request_code)
+        srp_request = SrpRequest.objects.for_detail().get(
+            srp_link__srp_code=srp_code, request_code=srp_request_code
+        )
     except SrpRequest.DoesNotExist:
         return HttpResponseNotFound("SRP request not found")
 
@@ -288,10 +309,14 @@ def srp_request_additional_information(
     additional_info = additional_info.comment if additional_info else ""
 
     # Retrieve the history of comments for the SRP request
-    request_history = RequestComment.objects.filter(
-        ~Q(comment_type=RequestComment.Type.REQUEST_INFO),
-        srp_request=srp_request,
-    ).order_by("pk")
+    request_history = (
+        RequestComment.objects.filter(
+            ~Q(comment_type=RequestComment.Type.REQUEST_INFO),
+            srp_request=srp_request,
+        )
+        .select_related("creator__profile__main_character")
+        .order_by("pk")
+    )
 
     # Prepare the data to be passed to the template
     data = {
@@ -350,7 +375,10 @@ def srp_request_change_payout(
                 srp_request.save()
 
                 # Return a success response
-                return JsonResponse(data={"success": True}, safe=False)
+                return JsonResponse(
+                    data={"success": True, "request_codes": [srp_request_code]},
+                    safe=False,
+                )
         except SrpRequest.DoesNotExist:
             # If the SRP request does not exist, handle the exception silently
             pass
@@ -409,7 +437,6 @@ def srp_request_approve(  # pylint: disable=too-many-locals
                 data={"success": False, "message": _("Invalid form data")}, safe=False
             )
 
-        requester = srp_request.creator
         # Set the payout amount to the loss amount if not already set
         srp_request.payout_amount = srp_request.payout_amount or srp_request.loss_amount
 
@@ -442,16 +469,10 @@ def srp_request_approve(  # pylint: disable=too-many-locals
         srp_request.request_status = SrpRequest.Status.APPROVED
         srp_request.save()
 
-        # Send a notification to the requester if notifications are enabled
-        if not get_user_settings(user=requester).disable_notifications:
-            logger.info(msg="Sending approval message to user")
-
-            notify_requester(
-                requester=requester,
-                reviser=request.user,
-                srp_request=srp_request,
-                comment=reviser_comment,
-            )
+        # Queue the notification to the requester
+        queue_requester_notifications(
+            srp_requests=[srp_request], reviser=request.user, comment=reviser_comment
+        )
 
         # Return a success response
         return JsonResponse(
@@ -461,6 +482,7 @@ def srp_request_approve(  # pylint: disable=too-many-locals
                 "pending_requests": get_pending_requests_count_for_user(
                     user=request.user
                 ),
+                "request_codes": [srp_request.request_code],
             },
             safe=False,
         )
@@ -513,21 +535,23 @@ def srp_requests_bulk_approve(request: WSGIRequest, srp_code: str) -> JsonRespon
             & Q(request_status=SrpRequest.Status.PENDING)
         )
 
+        # Fetched once, for the check, the log message and the bulk update
+        srp_request_list = list(srp_requests)
+
         logger.debug(
             "Found %d SRP requests to approve for code: %s",
-            srp_requests.count(),
+            len(srp_request_list),
             srp_code,
         )
 
         # If no matching requests are found, return an error response
-        if not srp_requests.exists():
+        if not srp_request_list:
             return JsonResponse(
                 data={"success": False, "message": _("No matching SRP requests found")},
                 safe=False,
             )
 
         # Prepare the SRP requests for bulk update
-        srp_request_list = list(srp_requests)
         for srp_request in srp_request_list:
             srp_request.payout_amount = (
                 srp_request.payout_amount or srp_request.loss_amount
@@ -551,17 +575,10 @@ def srp_requests_bulk_approve(request: WSGIRequest, srp_code: str) -> JsonRespon
         ]
         RequestComment.objects.bulk_create(comments)
 
-        # Send notifications to the requesters
-        for srp_request in srp_request_list:
-            requester = srp_request.creator
-            if not get_user_settings(user=requester).disable_notifications:
-                logger.info(msg="Sending approval message to user")
-                notify_requester(
-                    requester=requester,
-                    reviser=request.user,
-                    srp_request=srp_request,
-                    comment="",
-                )
+        # Queue the notifications to the requesters in a single task
+        queue_requester_notifications(
+            srp_requests=srp_request_list, reviser=request.user
+        )
 
         # Return a success response
         return JsonResponse(
@@ -571,6 +588,9 @@ def srp_requests_bulk_approve(request: WSGIRequest, srp_code: str) -> JsonRespon
                 "pending_requests": get_pending_requests_count_for_user(
                     user=request.user
                 ),
+                "request_codes": [
+                    srp_request.request_code for srp_request in srp_request_list
+                ],
             },
             safe=False,
         )
@@ -627,7 +647,6 @@ def srp_request_deny(
 
         # Extract the rejection comment from the form
         reject_info = form.cleaned_data["comment"]
-        requester = srp_request.creator
 
         # Update the SRP request status to rejected and set the payout amount to zero
         srp_request.payout_amount = 0
@@ -652,17 +671,13 @@ def srp_request_deny(
             ]
         )
 
-        # Send a notification to the requester if notifications are enabled
-        if not get_user_settings(user=requester).disable_notifications:
-            logger.info("Sending reject message to user")
-
-            notify_requester(
-                requester=requester,
-                reviser=request.user,
-                srp_request=srp_request,
-                comment=reject_info,
-                message_level="danger",
-            )
+        # Queue the notification to the requester
+        queue_requester_notifications(
+            srp_requests=[srp_request],
+            reviser=request.user,
+            comment=reject_info,
+            message_level="danger",
+        )
 
         # Return a success response
         return JsonResponse(
@@ -672,6 +687,7 @@ def srp_request_deny(
                 "pending_requests": get_pending_requests_count_for_user(
                     user=request.user
                 ),
+                "request_codes": [srp_request.request_code],
             },
             safe=False,
         )
@@ -717,6 +733,7 @@ def srp_request_remove(
             "success": True,
             "message": _("SRP request has been removed"),
             "pending_requests": get_pending_requests_count_for_user(user=request.user),
+            "removed_request_codes": [srp_request_code],
         }
     except SrpRequest.DoesNotExist:
         # Prepare a failure response if the SRP request does not exist
@@ -766,8 +783,8 @@ def srp_requests_bulk_remove(request: WSGIRequest, srp_code: str) -> JsonRespons
         )
 
         logger.debug(
-            "Found %d SRP requests to remove for code: %s",
-            srp_requests.count(),
+            "Found %s SRP requests to remove for code: %s",
+            LazyValue(srp_requests.count),
             srp_code,
         )
 
@@ -789,6 +806,7 @@ def srp_requests_bulk_remove(request: WSGIRequest, srp_code: str) -> JsonRespons
                 "pending_requests": get_pending_requests_count_for_user(
                     user=request.user
                 ),
+                "removed_request_codes": srp_request_codes,
             },
             safe=False,
         )
@@ -2,22 +2,57 @@
 Datatables views for AA-SRP app.
 """
 
+# Standard Library
+from collections.abc import Iterable
+
 # Django
 from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.db.models import QuerySet
-from django.http import HttpRequest
+from django.http import HttpRequest, JsonResponse
 
 # Alliance Auth
 from allianceauth.framework.datatables import DataTablesView
 from allianceauth.services.hooks import get_extension_logger
 
 # AA SRP
-from aasrp.models import SrpRequest
+from aasrp.helper.fragment_cache import render_cached_fragments
+from aasrp.helper.viewer import get_viewer_capabilities
+from aasrp.models import SrpLink, SrpRequest
 from aasrp.providers.applogger import AppLogger
 
 logger = AppLogger(my_logger=get_extension_logger(name=__name__))
 
 
+def _apply_custom_filters(qs: QuerySet, request: HttpRequest) -> QuerySet:
+    """
+    Apply the custom request status, character and ship filters to a queryset of SRP requests.
+
+    :param qs: The queryset of SRP requests to filter.
+    :type qs: QuerySet
+    :param request: The HTTP request object containing the filter values.
+    :type request: HttpRequest
+    :return: The filtered queryset.
+    :rtype: QuerySet
+    """
+
+    get_params = request.GET.dict()
+
+    filter_request_status = get_params.get("filter_request_status", None)
+    filter_character = get_params.get("filter_character", None)
+    filter_ship = get_params.get("filter_ship", None)
+
+    if filter_request_status:
+        qs = qs.filter(request_status=filter_request_status)
+
+    if filter_character:
+        qs = qs.filter(character__character_id=filter_character)
+
+    if filter_ship:
+        qs = qs.filter(ship__pk=filter_ship)
+
+    return qs
+
+
 class OwnSrpRequestsView(PermissionRequiredMixin, DataTablesView):
     """
     Datatables view for own SRP requests.
@@ -66,30 +101,275 @@ class OwnSrpRequestsView(PermissionRequiredMixin, DataTablesView):
         :rtype:
         """
 
-        qs = self.model.objects.filter(creator=request.user).prefetch_related(
-            "creator",
-            "creator__profile__main_character",
-            "character",
-            "srp_link",
-            "srp_link__creator",
-            "srp_link__creator__profile__main_character",
-            "ship",
+        qs = self.model.objects.for_own_table().filter(creator=request.user)
+
+        # Custom filters
+        return _apply_custom_filters(qs=qs, request=request)
+
+
+class SrpLinkRequestsView(PermissionRequiredMixin, DataTablesView):
+    """
+    Datatables view for the SRP requests of an SRP link.
+
+    Ordering, paging and searching are done in the database, so the response size
+    only depends on the page length and not on the number of requests of the SRP link.
+    """
+
+    permission_required = ("aasrp.manage_srp", "aasrp.manage_srp_requests")
+    model = SrpRequest
+    visible_columns = [
+        ("post_time", "{{ row.post_time.isoformat }}"),
+        (
+            "creator__profile__main_character__character_name",
+            "aasrp/partials/datatables/view-requests/column-requester.html",
+        ),
+        (
+            "character__character_name",
+            "aasrp/partials/datatables/view-requests/column-character.html",
+        ),
+        (
+            "request_code",
+            "aasrp/partials/datatables/view-requests/column-request-code.html",
+        ),
+        ("ship__name", "aasrp/partials/datatables/view-own-requests/column-ship.html"),
+        ("loss_amount", "{{ row.loss_amount }}"),
+        (
+            "payout_amount",
+            "aasrp/partials/datatables/view-requests/column-payout.html",
+        ),
+        ("", "aasrp/partials/datatables/view-requests/column-status.html"),
+        ("", "aasrp/partials/datatables/view-requests/column-actions.html"),
+        ("", "{{ row.request_code }}"),
+    ]
+    invisible_columns = [
+        ("request_status", "{{ row.request_status }}"),
+        ("payout_amount", "{{ row.payout_amount }}"),
+    ]
+    columns = visible_columns + invisible_columns
+
+    def has_permission(self) -> bool:
+        """
+        Check if the user has any of the required permissions.
+
+        :return: True if the user has at least one of the required permissions, False otherwise.
+        :rtype: bool
+        """
+
+        return any(
+            self.request.user.has_perm(perm) for perm in self.get_permission_required()
+        )
+
+    def get_model_qs(
+        self, request: HttpRequest, *args, **kwargs  # pylint: disable=unused-argument
+    ) -> QuerySet:
+        """
+        Get the queryset for the model.
+
+        :param request:
+        :type request:
+        :param args:
+        :type args:
+        :param kwargs:
+        :type kwargs:
+        :return:
+        :rtype:
+        """
+
+        qs = (
+            self.model.objects.for_manager_table()
+            .select_related("creator__profile__main_character")
+            .filter(srp_link__srp_code__iexact=kwargs.get("srp_code"))
         )
 
         # Custom filters
-        get_params = request.GET.dict()
+        return _apply_custom_filters(qs=qs, request=request)
+
+    def get_srp_link_stats(self, srp_code: str) -> dict | None:
+        """
+        Get the request statistics of an SRP link.
+
+        :param srp_code: The SRP code of the SRP link.
+        :type srp_code: str
+        :return: The request statistics, or None if the SRP link doesn't exist.
+        :rtype: dict | None
+        """
+
+        srp_link = SrpLink.objects.filter(srp_code__iexact=srp_code).first()
+
+        if srp_link is None:
+            return None
+
+        return {
+            "total_cost": srp_link.total_cost,
+            "requests_total": srp_link.total_requests_count,
+            "requests_pending": srp_link.pending_requests_count,
+            "requests_approved": srp_link.approved_requests_count,
+            "requests_rejected": srp_link.rejected_requests_count,
+        }
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        """
+        Handle a GET request.
+
+        With `?codes=<request code>,<request code>,…` only the rows of the given
+        SRP requests are returned, so the client can patch them in place after an action.
+
+        :param request:
+        :type request:
+        :param args:
+        :type args:
+        :param kwargs:
+        :type kwargs:
+        :return:
+        :rtype:
+        """
+
+        request_codes = [
+            request_code
+            for request_code in request.GET.get("codes", "").split(",")
+            if request_code
+        ]
+
+        if request_codes:
+            return self.handle_rows_request(request, request_codes, *args, **kwargs)
+
+        return super().get(request, *args, **kwargs)
+
+    def render_rows(
+        self, request: HttpRequest, srp_requests: Iterable[SrpRequest]
+    ) -> dict[int, list[str]]:
+        """
+        Render the table rows of the given SRP requests.
+
+        Rendered rows are cached per SRP request version and permission tier of the
+        viewer, so unchanged rows are not rendered again on the next refetch.
+        The requester column is rendered outside the cache, since the requester's
+        main character can change without the SRP request changing.
+
+        :param request:
+        :type request:
+        :param srp_requests:
+        :type srp_requests:
+        :return: The rendered columns by SRP request primary key.
+        :rtype: dict[int, list[str]]
+        """
+
+        srp_requests = list(srp_requests)
+        requester_column = next(
+            index
+            for index, column in enumerate(self.columns)
+            if column[0] == "creator__profile__main_character__character_name"
+        )
+
+        rows = render_cached_fragments(
+            namespace="srp-link-requests-table",
+            srp_requests=srp_requests,
+            permission_tier=get_viewer_capabilities(request=request).permission_tier,
+            render=lambda srp_request: [
+                (
+                    ""
+                    if index == requester_column
+                    else self.render_template(request, column[1], {"row": srp_request})
+                )
+                for index, column in enumerate(self.columns)
+            ],
+        )
+
+        for srp_request in srp_requests:
+            rows[srp_request.pk][requester_column] = self.render_template(
+                request, self.columns[requester_column][1], {"row": srp_request}
+            )
+
+        return rows
+
+    def handle_rows_request(
+        self, request: HttpRequest, request_codes: list[str], *args, **kwargs
+    ) -> JsonResponse:
+        """
+        Render the rows of the given SRP requests.
+
+        Request codes without a row in the response no longer exist.
+
+        :param request:
+        :type request:
+        :param request_codes:
+        :type request_codes:
+        :param args:
+        :type args:
+        :param kwargs:
+        :type kwargs:
+        :return:
+        :rtype:
+        """
+
+        srp_requests = list(
+            self.get_model_qs(request, *args, **kwargs).filter(
+                request_code__in=request_codes
+            )
+        )
+        rows = self.render_rows(request=request, srp_requests=srp_requests)
+
+        return JsonResponse(
+            {
+                "rows": {
+                    srp_request.request_code: rows[srp_request.pk]
+                    for srp_request in srp_requests
+                },
+                "srp_link_stats": self.get_srp_link_stats(kwargs.get("srp_code")),
+            }
+        )
+
+    def handle_request(
+        self, request: HttpRequest, params: dict, *args, **kwargs
+    ) -> JsonResponse:
+        """
+        Handle the datatables request and add the SRP link statistics to the response.
+
+        Follows `DataTablesView.handle_request`, but renders the rows of the page
+        through the fragment cache.
+        The statistics cover all requests of the SRP link, not only the current page,
+        so the overview card can be kept up to date without loading every request.
+
+        :param request:
+        :type request:
+        :param params:
+        :type params:
+        :param args:
+        :type args:
+        :param kwargs:
+        :type kwargs:
+        :return:
+        :rtype:
+        """
+
+        table_conf = self.get_table_config(params)
+        start = int(table_conf["start"])
+        length = int(table_conf["length"])
+
+        qs = (
+            self.get_model_qs(request, *args, **kwargs)
+            .filter(self.filter_qs(table_conf))
+            .exclude(self.except_qs(table_conf))
+            .order_by(*self.get_order(table_conf))
+        )
+        qs_count = qs.count()
+
+        if length > 0:
+            qs = qs[start : start + length]
 
-        filter_request_status = get_params.get("filter_request_status", None)
-        filter_character = get_params.get("filter_character", None)
-        filter_ship = get_params.get("filter_ship", None)
+        srp_requests = list(qs)
+        rows = self.render_rows(request=request, srp_requests=srp_requests)
 
-        if filter_request_status:
-            qs = qs.filter(request_status=filter_request_status)
+        datatables_data = {
+            "draw": int(table_conf["draw"]),
+            "recordsTotal": self.get_model_qs(request, *args, **kwargs).count(),
+            "recordsFiltered": qs_count,
+            "data": [rows[srp_request.pk] for srp_request in srp_requests],
+        }
 
-        if filter_character:
-            qs = qs.filter(character__character_id=filter_character)
+        srp_link_stats = self.get_srp_link_stats(kwargs.get("srp_code"))
 
-        if filter_ship:
-            qs = qs.filter(ship__pk=filter_ship)
+        if srp_link_stats is not None:
+            datatables_data["srp_link_stats"] = srp_link_stats
 
-        return qs
+        return JsonResponse(datatables_data)
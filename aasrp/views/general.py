@@ -13,10 +13,13 @@ from eve_sde.models import ItemType
 from django.contrib import messages
 from django.contrib.auth.decorators import permission_required
 from django.core.handlers.wsgi import WSGIRequest
+from django.db import IntegrityError
 from django.db.models import Sum
-from django.http import HttpResponse, HttpResponseRedirect
+from django.http import HttpResponse, HttpResponseRedirect, StreamingHttpResponse
 from django.shortcuts import redirect, render
 from django.utils import timezone
+from django.utils.dateparse import parse_date
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
 # Alliance Auth
@@ -25,9 +28,9 @@ from allianceauth.eveonline.models import EveCharacter
 from allianceauth.services.hooks import get_extension_logger
 
 # AA SRP
-from aasrp.constants import KILLBOARD_DATA
 from aasrp.form import (
     SrpLinkForm,
+    SrpLinkKillmailImportForm,
     SrpLinkUpdateForm,
     SrpRequestAcceptForm,
     SrpRequestAcceptRejectedForm,
@@ -35,10 +38,17 @@ from aasrp.form import (
     SrpRequestRejectForm,
     UserSettingsForm,
 )
+from aasrp.helper.killboard import get_killboard_base_urls
 from aasrp.helper.notification import notify_srp_team
+from aasrp.helper.payout_export import (
+    PayoutExportFormat,
+    get_payout_export_queryset,
+    stream_payout_export,
+)
 from aasrp.helper.user import get_user_settings
 from aasrp.models import Insurance, RequestComment, Setting, SrpLink, SrpRequest
-from aasrp.providers.applogger import AppLogger
+from aasrp.providers.applogger import AppLogger, LazyValue
+from aasrp.tasks import import_srp_link_killmails
 
 # Initialize a logger with a custom tag for the AA SRP application
 logger = AppLogger(my_logger=get_extension_logger(__name__))
@@ -95,7 +105,7 @@ def view_own_requests(request: WSGIRequest) -> HttpResponse:
     :rtype: HttpResponse
     """
 
-    logger.info(msg=f"Own SRP requests view called by {request.user}")
+    logger.info("Own SRP requests view called by %s", request.user)
 
     qs = SrpRequest.objects.filter(creator=request.user)
 
@@ -160,7 +170,7 @@ def user_settings(request: WSGIRequest) -> HttpResponse:
         user_settings_form = UserSettingsForm(instance=current_user_settings)
 
     # Log the access to the user settings view
-    logger.info(f"User settings view called by {request.user}")
+    logger.info("User settings view called by %s", request.user)
 
     # Prepare the context for rendering the template
     context = {"user_settings_form": user_settings_form}
@@ -186,7 +196,7 @@ def srp_link_add(request: WSGIRequest) -> HttpResponse:
 
     request_user = request.user
 
-    logger.info(msg=f"Add SRP link form called by {request_user}")
+    logger.info("Add SRP link form called by %s", request_user)
 
     # If this is a POST request, process the form data.
     if request.method == "POST":
@@ -253,17 +263,18 @@ def srp_link_edit(request: WSGIRequest, srp_code: str) -> HttpResponse:
 
     request_user = request.user
 
-    logger.info(f"Edit SRP link form for SRP code {srp_code} called by {request_user}")
+    logger.info(
+        "Edit SRP link form for SRP code %s called by %s", srp_code, request_user
+    )
 
     # Check if the provided SRP code is valid
     try:
         srp_link = SrpLink.objects.get(srp_code=srp_code)
     except SrpLink.DoesNotExist:
         logger.error(
-            msg=(
-                f"Unable to locate SRP link using SRP code {srp_code} for "
-                f"user {request_user}"
-            )
+            "Unable to locate SRP link using SRP code %s for user %s",
+            srp_code,
+            request_user,
         )
 
         messages.error(
@@ -294,6 +305,88 @@ def srp_link_edit(request: WSGIRequest, srp_code: str) -> HttpResponse:
     return render(request, "aasrp/link-edit.html", context)
 
 
+@permission_required("aasrp.manage_srp")
+def srp_link_import_killmails(request: WSGIRequest, srp_code: str) -> HttpResponse:
+    """
+    Render and handle the form for importing killmails into an SRP link.
+
+    This view allows SRP managers to file SRP requests for a whole fleet's losses at
+    once. Each killmail is filed on behalf of the owner of the victim character. The
+    import runs in a Celery task, which notifies the importer of the result.
+
+    :param request: The HTTP request object containing metadata about the request.
+    :type request: WSGIRequest
+    :param srp_code: The unique code identifying the SRP link to import into.
+    :type srp_code: str
+    :return: The rendered form view or a redirect after importing the killmails.
+    :rtype: HttpResponse
+    """
+
+    request_user = request.user
+
+    logger.info(
+        "Killmail import form for SRP code %s called by %s", srp_code, request_user
+    )
+
+    # Check if the provided SRP code is valid
+    try:
+        srp_link = SrpLink.objects.get(srp_code=srp_code)
+    except SrpLink.DoesNotExist:
+        logger.error(
+            "Unable to locate SRP link using SRP code %s for user %s",
+            srp_code,
+            request_user,
+        )
+
+        messages.error(
+            request=request,
+            message=_("Unable to locate SRP link using SRP code {srp_code}").format(
+                srp_code=srp_code
+            ),
+        )
+
+        return redirect("aasrp:srp_links")
+
+    # Check if the SRP link is still open
+    if srp_link.srp_status != SrpLink.Status.ACTIVE:
+        messages.error(
+            request=request,
+            message=_("This SRP link is no longer available for SRP requests."),
+        )
+
+        return redirect(to="aasrp:srp_links")
+
+    # If this is a POST request, we need to process the form data.
+    if request.method == "POST":
+        form = SrpLinkKillmailImportForm(data=request.POST)
+
+        if form.is_valid():
+            # Fetching the killmails can take a while, so it runs in a Celery task
+            import_srp_link_killmails.delay(
+                srp_link_id=srp_link.pk,
+                entries=form.cleaned_data["killmails"].splitlines(),
+                importer_id=request_user.pk,
+                additional_info=form.cleaned_data["additional_info"],
+                language=get_language(),
+            )
+
+            messages.info(
+                request=request,
+                message=_(
+                    "The killmails are being imported. You will get a notification "
+                    "with the result once the import has finished."
+                ),
+            )
+
+            return redirect("aasrp:view_srp_requests", srp_code=srp_code)
+    else:
+        form = SrpLinkKillmailImportForm()
+
+    context = {"srp_code": srp_code, "form": form}
+
+    return render(request, "aasrp/link-import-killmails.html", context)
+
+
 def _save_srp_request(  # pylint: disable=too-many-arguments, too-many-positional-arguments
     request: WSGIRequest,
     srp_link: SrpLink,
@@ -339,7 +432,7 @@ def _save_srp_request(  # pylint: disable=too-many-arguments, too-many-positiona
     # Get ship information from SDE based on the ship type ID
     srp_request__ship = ItemType.objects.get(id=ship_type_id)
 
-    logger.debug(msg=f"Ship type {srp_request__ship.name}")
+    logger.debug("Ship type %s", srp_request__ship.name)
 
     # Create the SRP request object
     srp_request = SrpRequest.objects.create(
@@ -380,21 +473,22 @@ def _save_srp_request(  # pylint: disable=too-many-arguments, too-many-positiona
         [
             Insurance(
                 srp_request=srp_request,
-                insurance_level=level.name,
-                insurance_cost=level.cost,
-                insurance_payout=level.payout,
+                insurance_level=level["name"],
+                insurance_cost=level["cost"],
+                insurance_payout=level["payout"],
             )
-            for level in insurance_information.levels
+            for level in insurance_information
         ]
     )
 
     # Log the creation of the SRP request
     logger.info(
-        msg=(
-            f"Created SRP request on behalf of user {creator} "
-            f"(character: {srp_request__character}) for fleet name {srp_link.srp_name} "
-            f"with SRP code {srp_link.srp_code}"
-        )
+        "Created SRP request on behalf of user %s (character: %s) for fleet name %s "
+        "with SRP code %s",
+        creator,
+        srp_request__character,
+        srp_link.srp_name,
+        srp_link.srp_code,
     )
 
     # Display a success message to the user
@@ -426,19 +520,16 @@ def request_srp(request: WSGIRequest, srp_code: str) -> HttpResponse:
     :rtype: HttpResponse
     """
 
-    logger.info(
-        msg=f"SRP request form for SRP code {srp_code} called by {request.user}"
-    )
+    logger.info("SRP request form for SRP code %s called by %s", srp_code, request.user)
 
     # Check if the provided SRP code is valid
     try:
         srp_link = SrpLink.objects.get(srp_code=srp_code)
     except SrpLink.DoesNotExist:
         logger.error(
-            msg=(
-                f"Unable to locate SRP Fleet using SRP code {srp_code} for "
-                f"user {request.user}"
-            )
+            "Unable to locate SRP Fleet using SRP code %s for user %s",
+            srp_code,
+            request.user,
         )
 
         messages.error(
@@ -466,7 +557,9 @@ def request_srp(request: WSGIRequest, srp_code: str) -> HttpResponse:
         # Create a form instance and populate it with data from the request.
         form = SrpRequestForm(data=request.POST)
 
-        logger.debug(msg=f"Request type POST contains valid form: {form.is_valid()}")
+        logger.debug(
+            "Request type POST contains valid form: %s", LazyValue(form.is_valid)
+        )
 
         if form.is_valid():
             submitted_killmail_link = form.cleaned_data["killboard_link"]
@@ -495,13 +588,10 @@ def request_srp(request: WSGIRequest, srp_code: str) -> HttpResponse:
                     else (
                         "Your kill mail link ({submitted_killmail_link}) is invalid or "
                         "the zKillboard API is not answering at the moment. "
-                        "Please make sure you are using either {zkillboard_base_url}, "
-                        "{evekb_base_url} or {evekill_base_url}"
+                        "Please make sure you are using one of {killboard_base_urls}"
                     ).format(  # pylint: disable=consider-using-f-string
                         submitted_killmail_link=submitted_killmail_link,
-                        zkillboard_base_url=KILLBOARD_DATA["zKillboard"]["base_url"],
-                        evekb_base_url=KILLBOARD_DATA["EveTools"]["base_url"],
-                        evekill_base_url=KILLBOARD_DATA["EVE-KILL"]["base_url"],
+                        killboard_base_urls=", ".join(get_killboard_base_urls()),
                     )
                 )
 
@@ -513,15 +603,27 @@ def request_srp(request: WSGIRequest, srp_code: str) -> HttpResponse:
                 character__character_id=killmail_info["victim_id"]
             ).exists():
                 # Save the SRP request
-                srp_request = _save_srp_request(
-                    request=request,
-                    srp_link=srp_link,
-                    killmail_link=submitted_killmail_link,
-                    ship_type_id=killmail_info["ship_type_id"],
-                    ship_value=killmail_info["ship_value"],
-                    victim_id=killmail_info["victim_id"],
-                    additional_info=srp_request_additional_info,
-                )
+                try:
+                    srp_request = _save_srp_request(
+                        request=request,
+                        srp_link=srp_link,
+                        killmail_link=submitted_killmail_link,
+                        ship_type_id=killmail_info["ship_type_id"],
+                        ship_value=killmail_info["ship_value"],
+                        victim_id=killmail_info["victim_id"],
+                        additional_info=srp_request_additional_info,
+                    )
+                except IntegrityError:
+                    # The same killmail has been requested in the meantime
+                    messages.error(
+                        request=request,
+                        message=_(
+                            "There is already an SRP request for this kill mail. "
+                            "Please check if you got the right one."
+                        ),
+                    )
+
+                    return redirect(to="aasrp:srp_links")
 
                 # Send a message to the srp team in their discord channel.
                 notify_srp_team(srp_request=srp_request)
@@ -540,7 +642,7 @@ def request_srp(request: WSGIRequest, srp_code: str) -> HttpResponse:
 
     # If a GET (or any other method) we'll create a blank form.
     else:
-        logger.debug(msg=f"Returning blank SRP request form for {request.user}")
+        logger.debug("Returning blank SRP request form for %s", request.user)
 
         form = SrpRequestForm()
 
@@ -569,7 +671,7 @@ def complete_srp_link(request: WSGIRequest, srp_code: str) -> HttpResponseRedire
     """
 
     logger.info(
-        f"Complete SRP link form for SRP link {srp_code} called by {request.user}"
+        "Complete SRP link form for SRP link %s called by %s", srp_code, request.user
     )
 
     try:
@@ -584,7 +686,9 @@ def complete_srp_link(request: WSGIRequest, srp_code: str) -> HttpResponseRedire
     except SrpLink.DoesNotExist:
         # Log an error and display an error message if the SRP link is not found
         logger.error(
-            f"Unable to locate SRP link using code {srp_code} for user {request.user}"
+            "Unable to locate SRP link using code %s for user %s",
+            srp_code,
+            request.user,
         )
 
         messages.error(
@@ -615,14 +719,18 @@ def srp_link_view_requests(request: WSGIRequest, srp_code: str) -> HttpResponse:
     :rtype: HttpResponse
     """
 
-    logger.info(f"View SRP requests for SRP link {srp_code} called by {request.user}")
+    logger.info(
+        "View SRP requests for SRP link %s called by %s", srp_code, request.user
+    )
 
     # Check if the provided SRP code is valid
     try:
         srp_link = SrpLink.objects.get(srp_code=srp_code)
     except SrpLink.DoesNotExist:
         logger.error(
-            f"Unable to locate SRP link using code {srp_code} for user {request.user}"
+            "Unable to locate SRP link using code %s for user %s",
+            srp_code,
+            request.user,
         )
 
         messages.error(
@@ -665,7 +773,7 @@ def enable_srp_link(request: WSGIRequest, srp_code: str) -> HttpResponseRedirect
     :rtype: HttpResponseRedirect
     """
 
-    logger.info(msg=f"Enable SRP link {srp_code} called by {request.user}")
+    logger.info("Enable SRP link %s called by %s", srp_code, request.user)
 
     try:
         # Retrieve the SRP link using the provided code
@@ -682,7 +790,9 @@ def enable_srp_link(request: WSGIRequest, srp_code: str) -> HttpResponseRedirect
     except SrpLink.DoesNotExist:
         # Log an error and display an error message if the SRP link is not found
         logger.error(
-            msg=f"Unable to locate SRP link using code {srp_code} for user {request.user}"
+            "Unable to locate SRP link using code %s for user %s",
+            srp_code,
+            request.user,
         )
 
         messages.error(
@@ -713,7 +823,7 @@ def disable_srp_link(request: WSGIRequest, srp_code: str) -> HttpResponseRedirec
     :rtype: HttpResponseRedirect
     """
 
-    logger.info(msg=f"Disable SRP link {srp_code} called by {request.user}")
+    logger.info("Disable SRP link %s called by %s", srp_code, request.user)
 
     try:
         # Retrieve the SRP link using the provided code
@@ -730,7 +840,9 @@ def disable_srp_link(request: WSGIRequest, srp_code: str) -> HttpResponseRedirec
     except SrpLink.DoesNotExist:
         # Log an error and display an error message if the SRP link is not found
         logger.error(
-            msg=f"Unable to locate SRP link using code {srp_code} for user {request.user}"
+            "Unable to locate SRP link using code %s for user %s",
+            srp_code,
+            request.user,
         )
 
         messages.error(
@@ -761,7 +873,7 @@ def delete_srp_link(request: WSGIRequest, srp_code: str) -> HttpResponseRedirect
     :rtype: HttpResponseRedirect
     """
 
-    logger.info(msg=f"Delete SRP link {srp_code} called by {request.user}")
+    logger.info("Delete SRP link %s called by %s", srp_code, request.user)
 
     try:
         # Retrieve the SRP link using the provided code
@@ -777,7 +889,9 @@ def delete_srp_link(request: WSGIRequest, srp_code: str) -> HttpResponseRedirect
     except SrpLink.DoesNotExist:
         # Log an error and display an error message if the SRP link is not found
         logger.error(
-            msg=f"Unable to locate SRP link using code {srp_code} for user {request.user}"
+            "Unable to locate SRP link using code %s for user %s",
+            srp_code,
+            request.user,
         )
 
         messages.error(
@@ -789,3 +903,120 @@ def delete_srp_link(request: WSGIRequest, srp_code: str) -> HttpResponseRedirect
 
     # Redirect the user to the SRP links page
     return redirect(to="aasrp:srp_links")
+
+
+@permission_required("aasrp.manage_srp")
+def export_payouts(
+    request: WSGIRequest,
+    export_format: str,
+    srp_code: str | None = None,
+    unpaid_only: bool = False,
+) -> HttpResponse:
+    """
+    Export the payouts of approved SRP requests as CSV or NDJSON.
+
+    The export is streamed, so it doesn't need to be built in memory. It covers
+    either a single SRP link (`srp_code`), all SRP links that are not completed yet
+    (`unpaid_only`), or all SRP links, optionally limited to a period of fleet times
+    with the `date_from` and `date_to` (YYYY-MM-DD) query parameters.
+
+    :param request: The HTTP request object containing metadata about the request.
+    :type request: WSGIRequest
+    :param export_format: The export format, `csv` or `ndjson`.
+    :type export_format: str
+    :param srp_code: The unique code identifying the SRP link to export, if any.
+    :type srp_code: str | None
+    :param unpaid_only: Only export SRP links that are not completed yet.
+    :type unpaid_only: bool
+    :return: The streamed export, or a redirect if the export parameters are invalid.
+    :rtype: HttpResponse
+    """
+
+    logger.info(
+        "Payout export (%s) for %s called by %s",
+        export_format,
+        srp_code or ("unpaid SRP links" if unpaid_only else "all SRP links"),
+        request.user,
+    )
+
+    try:
+        export_format = PayoutExportFormat(export_format)
+    except ValueError:
+        messages.error(
+            request=request,
+            message=_("Unknown export format {export_format}").format(
+                export_format=export_format
+            ),
+        )
+
+        return redirect("aasrp:srp_links")
+
+    srp_link = None
+
+    if srp_code is not None:
+        try:
+            srp_link = SrpLink.objects.get(srp_code=srp_code)
+        except SrpLink.DoesNotExist:
+            logger.error(
+                "Unable to locate SRP link using code %s for user %s",
+                srp_code,
+                request.user,
+            )
+
+            messages.error(
+                request=request,
+                message=_("Unable to locate SRP link with ID {srp_code}").format(
+                    srp_code=srp_code
+                ),
+            )
+
+            return redirect("aasrp:srp_links")
+
+    date_range = {}
+
+    for param in ("date_from", "date_to"):
+        value = request.GET.get(param, "")
+
+        try:
+            date_range[param] = parse_date(value) if value else None
+        except ValueError:
+            date_range[param] = None
+
+        if value and date_range[param] is None:
+            messages.error(
+                request=request,
+                message=_("Invalid date {value}, expected YYYY-MM-DD").format(
+                    value=value
+                ),
+            )
+
+            return redirect("aasrp:srp_links")
+
+    date_from, date_to = date_range["date_from"], date_range["date_to"]
+    queryset = get_payout_export_queryset(
+        srp_link=srp_link, date_from=date_from, date_to=date_to, unpaid_only=unpaid_only
+    )
+
+    filename = "-".join(
+        filter(
+            None,
+            [
+                "aasrp-payouts",
+                srp_code or ("unpaid" if unpaid_only else "all"),
+                date_from and f"from-{date_from}",
+                date_to and f"to-{date_to}",
+            ],
+        )
+    )
+
+    response = StreamingHttpResponse(
+        streaming_content=stream_payout_export(
+            queryset=queryset, export_format=export_format
+        ),
+        content_type=export_format.content_type,
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{filename}.{export_format.value}"'
+    )
+
+    return response